@@ -141,7 +141,7 @@ if os.getenv('USE_CELERY', 'false').lower() == 'true':
         },
         'rollup-analytics': {
             'task': 'core.tasks.rollup_analytics',
-            'schedule': crontab(hour=1, minute=0),  # 1:00 AM daily
+            'schedule': crontab(minute='*/5'),  # incremental, every 5 minutes
         },
     }
 else:
@@ -268,3 +268,20 @@ TWILIO_AUTH_TOKEN = config('TWILIO_AUTH_TOKEN', default='')
 TWILIO_WHATSAPP_FROM = config('TWILIO_WHATSAPP_FROM', default='whatsapp:+14155238886')
 SUPPORT_SLACK_WEBHOOK = os.getenv("SUPPORT_SLACK_WEBHOOK", "")
 SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
+
+# Analytics events are buffered in-process and written in batches.
+# ANALYTICS_SYNC writes each event immediately (used by the test suite).
+ANALYTICS_SYNC = os.getenv("ANALYTICS_SYNC", "false").lower() == "true"
+ANALYTICS_BUFFER_SIZE = int(os.getenv("ANALYTICS_BUFFER_SIZE", "10000"))
+ANALYTICS_BATCH_SIZE = int(os.getenv("ANALYTICS_BATCH_SIZE", "500"))
+ANALYTICS_FLUSH_INTERVAL = float(os.getenv("ANALYTICS_FLUSH_INTERVAL", "2.0"))
+
+# Render report PDFs in Celery (or a background thread pool without a
+# broker) instead of on the request thread.
+REPORTS_ASYNC = os.getenv("REPORTS_ASYNC", "true").lower() == "true"
+
+# Hand report PDFs to the web server instead of streaming them from Python:
+# "x-accel-redirect" (nginx, internal location at REPORTS_ACCEL_PREFIX that
+# aliases the reports directory) or "x-sendfile" (Apache, lighttpd).
+REPORTS_SENDFILE = os.getenv("REPORTS_SENDFILE", "").lower()
+REPORTS_ACCEL_PREFIX = os.getenv("REPORTS_ACCEL_PREFIX", "/protected-reports/")
@@ -1,15 +1,139 @@
 """Analytics helper utilities."""
-from datetime import timedelta
-from typing import Optional, Dict, Any
+import atexit
+import logging
+import os
+import queue
+import threading
+from collections import Counter
+from datetime import datetime, time, timedelta
+from typing import Optional, Dict, Any, Iterable
 import uuid
 
-from django.db import models
+from django.conf import settings
+from django.db import close_old_connections, models, transaction
+from django.db.models.fields.json import KeyTextTransform
+from django.db.models.functions import Cast
 from django.utils import timezone
-from django.db.models import Avg, Count, Q
+from django.db.models import Avg, Case, Count, F, Q, Sum, Value, When
 
 from .models import AnalyticsEvent, AnalyticsDaily, UserSession, PageView
 
 
+logger = logging.getLogger(__name__)
+
+
+class EventBuffer:
+    """In-process queue of analytics events written in batches.
+
+    ``put`` never blocks: when the queue is full the event is dropped and
+    counted in ``dropped``. A daemon worker flushes the queue every
+    ``flush_interval`` seconds, or as soon as ``batch_size`` events are
+    waiting, using one ``bulk_create`` per batch.
+    """
+
+    def __init__(self, max_size: int = 10000, batch_size: int = 500, flush_interval: float = 2.0):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._queue: "queue.Queue[AnalyticsEvent]" = queue.Queue(maxsize=max_size)
+        self._wake = threading.Event()
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_pid: Optional[int] = None
+
+    def put(self, event: AnalyticsEvent) -> bool:
+        """Queue ``event`` for the next flush. Returns ``False`` if it was dropped."""
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+                dropped = self.dropped
+            if dropped == 1 or dropped % 1000 == 0:
+                logger.warning("Analytics buffer full, %d events dropped so far", dropped)
+            return False
+        if self._queue.qsize() >= self.batch_size:
+            self._wake.set()
+        return True
+
+    def qsize(self) -> int:
+        return self._queue.qsize()
+
+    def flush(self) -> int:
+        """Write every queued event now and return how many were stored."""
+        written = 0
+        while True:
+            batch = []
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if not batch:
+                return written
+            written += self._write(batch)
+
+    def _write(self, batch) -> int:
+        try:
+            AnalyticsEvent.objects.bulk_create(batch, batch_size=self.batch_size)
+        except Exception:
+            with self._lock:
+                self.dropped += len(batch)
+            logger.exception("Failed to write %d analytics events", len(batch))
+            return 0
+        return len(batch)
+
+    def _ensure_worker(self) -> None:
+        # Threads do not survive a fork, so pre-forking servers need a worker per process
+        if self._worker is not None and self._worker_pid == os.getpid() and self._worker.is_alive():
+            return
+        with self._lock:
+            if self._worker is not None and self._worker_pid == os.getpid() and self._worker.is_alive():
+                return
+            self._worker = threading.Thread(target=self._run, name="analytics-flush", daemon=True)
+            self._worker_pid = os.getpid()
+            self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            close_old_connections()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Analytics flush failed")
+
+
+_buffer: Optional[EventBuffer] = None
+_buffer_lock = threading.Lock()
+
+
+def get_event_buffer() -> EventBuffer:
+    """Return the process-wide analytics event buffer."""
+    global _buffer
+    if _buffer is None:
+        with _buffer_lock:
+            if _buffer is None:
+                _buffer = EventBuffer(
+                    max_size=getattr(settings, "ANALYTICS_BUFFER_SIZE", 10000),
+                    batch_size=getattr(settings, "ANALYTICS_BATCH_SIZE", 500),
+                    flush_interval=getattr(settings, "ANALYTICS_FLUSH_INTERVAL", 2.0),
+                )
+    return _buffer
+
+
+def flush_events() -> int:
+    """Write any buffered analytics events immediately."""
+    if _buffer is None:
+        return 0
+    return _buffer.flush()
+
+
+atexit.register(flush_events)
+
+
 def track(
     event: str,
     *,
@@ -21,10 +145,13 @@ def track(
 ) -> None:
     """Store a raw analytics event.
 
+    Events are buffered and written in batches off the calling thread unless
+    ``ANALYTICS_SYNC`` is enabled, in which case they are inserted right away.
     Fails silently to avoid interfering with application flow.
     """
     try:
-        AnalyticsEvent.objects.create(
+        record = AnalyticsEvent(
+            created_at=timezone.now(),
             event=event,
             user=user,
             asset_id=asset_id,
@@ -32,16 +159,23 @@ def track(
             error_code=error_code,
             meta=meta or {},
         )
+        if getattr(settings, "ANALYTICS_SYNC", False):
+            record.save()
+        else:
+            get_event_buffer().put(record)
     except Exception:
         # Do not raise analytics errors
         pass
 
 
+FAILURE_EVENTS = ['collector_fail', 'report_fail', 'alert_fail', 'asset_sync_fail']
+
+
 def get_top_failures(days: int = 30, limit: int = 10):
     start = timezone.now().date() - timedelta(days=days - 1)
     return list(
         AnalyticsEvent.objects.filter(
-            event__in=['collector_fail', 'report_fail', 'alert_fail', 'asset_sync_fail'],
+            event__in=FAILURE_EVENTS,
             created_at__date__gte=start,
         )
         .values('source', 'error_code')
@@ -50,6 +184,65 @@ def get_top_failures(days: int = 30, limit: int = 10):
     )
 
 
+def record_page_views(views: Iterable[Dict[str, Any]], *, user=None) -> int:
+    """Store a batch of page views in a constant number of queries.
+
+    Each view needs ``session_id`` and ``page_path`` and may carry
+    ``page_title``, ``load_time``, ``duration`` and ``meta``; views missing
+    either key are skipped. Sessions are created on first sight from the
+    meta of their first view and their ``page_view_count`` is incremented in
+    place. Returns the number of page views stored.
+    """
+    views = [v for v in views if v.get('session_id') and v.get('page_path')]
+    if not views:
+        return 0
+
+    session_meta: Dict[str, Dict[str, Any]] = {}
+    for view in views:
+        session_meta.setdefault(view['session_id'], view.get('meta') or {})
+    counts = Counter(view['session_id'] for view in views)
+
+    with transaction.atomic():
+        UserSession.objects.bulk_create(
+            [
+                UserSession(
+                    session_id=session_id,
+                    user=user,
+                    ip_address=meta.get('ip_address'),
+                    user_agent=meta.get('user_agent', ''),
+                    referrer=meta.get('referrer', ''),
+                )
+                for session_id, meta in session_meta.items()
+            ],
+            ignore_conflicts=True,
+        )
+        sessions = UserSession.objects.filter(session_id__in=session_meta)
+        if user is not None:
+            # Attach sessions started anonymously once the user signs in
+            sessions.filter(user__isnull=True).update(user=user)
+        session_ids = dict(sessions.values_list('session_id', 'id'))
+
+        PageView.objects.bulk_create([
+            PageView(
+                session_id=session_ids[view['session_id']],
+                user=user,
+                page_path=view['page_path'],
+                page_title=view.get('page_title') or '',
+                load_time=view.get('load_time') or 0.0,
+                duration=view.get('duration') or 0.0,
+                meta=view.get('meta') or {},
+            )
+            for view in views
+        ])
+        sessions.update(
+            page_view_count=F('page_view_count') + Case(
+                *(When(session_id=session_id, then=Value(count)) for session_id, count in counts.items()),
+                default=Value(0),
+            )
+        )
+    return len(views)
+
+
 def track_page_view(
     session_id: str,
     page_path: str,
@@ -62,37 +255,17 @@ def track_page_view(
 ) -> None:
     """Track a page view with session management."""
     try:
-        # Get or create session
-        session, created = UserSession.objects.get_or_create(
-            session_id=session_id,
-            defaults={
-                'user': user,
-                'ip_address': meta.get('ip_address') if meta else None,
-                'user_agent': meta.get('user_agent', '') if meta else '',
-                'referrer': meta.get('referrer', '') if meta else '',
-            }
-        )
-        
-        # Update session if user is now authenticated
-        if user and not session.user:
-            session.user = user
-            session.save()
-        
-        # Create page view
-        PageView.objects.create(
-            session=session,
+        record_page_views(
+            [{
+                'session_id': session_id,
+                'page_path': page_path,
+                'page_title': page_title,
+                'load_time': load_time,
+                'duration': duration,
+                'meta': meta,
+            }],
             user=user,
-            page_path=page_path,
-            page_title=page_title,
-            load_time=load_time,
-            duration=duration,
-            meta=meta or {},
         )
-        
-        # Update session page count
-        session.page_view_count = PageView.objects.filter(session=session).count()
-        session.save()
-        
     except Exception:
         # Do not raise analytics errors
         pass
@@ -250,80 +423,116 @@ def track_calculator_export(
     )
 
 
-def rollup_day(date):
-    """Enhanced rollup function with comprehensive metrics."""
-    events = AnalyticsEvent.objects.filter(created_at__date=date)
-    sessions = UserSession.objects.filter(started_at__date=date)
-    page_views = PageView.objects.filter(viewed_at__date=date)
-    
-    daily, _ = AnalyticsDaily.objects.get_or_create(date=date)
-    
-    # Core metrics
-    daily.users = events.filter(event='user_signup').count()
-    daily.assets = events.filter(event='asset_create').count()
-    daily.reports = events.filter(event='report_success').count()
-    daily.alerts = events.filter(event='alert_rule_create').count()
-    daily.errors = events.filter(
-        event__in=['report_fail', 'alert_fail', 'collector_fail', 'asset_sync_fail']
-    ).count()
-    
-    # User engagement metrics
-    daily.page_views = page_views.count()
-    daily.unique_visitors = sessions.values('user').distinct().count()
-    
-    # Calculate average session duration
-    session_durations = sessions.filter(ended_at__isnull=False).values_list('duration', flat=True)
-    daily.session_duration_avg = sum(session_durations) / len(session_durations) if session_durations else 0.0
-    
-    # Calculate bounce rate
-    total_sessions = sessions.count()
-    bounce_sessions = sessions.filter(is_bounce=True).count()
-    daily.bounce_rate = (bounce_sessions / total_sessions * 100) if total_sessions > 0 else 0.0
-    
-    # Feature usage metrics
-    daily.marketing_messages_created = events.filter(
-        event='marketing_message_create'
-    ).count() + events.filter(
-        event='feature_usage', 
-        meta__feature='marketing_message'
-    ).count()
-    daily.searches_performed = events.filter(event='search_performed').count()
-    daily.filters_applied = events.filter(event='feature_usage', meta__feature='filter').count()
-    daily.exports_downloaded = events.filter(event='feature_usage', meta__feature='export').count()
-    
-    # Calculator usage metrics
-    daily.mortgage_calculator_usage = events.filter(
-        event='calculator_usage', 
-        meta__calculator_type='mortgage'
-    ).count()
-    daily.expense_calculator_usage = events.filter(
-        event='calculator_usage', 
-        meta__calculator_type='expense'
-    ).count()
-    daily.calculator_calculations = events.filter(event='calculator_calculation').count()
-    daily.calculator_exports = events.filter(event='calculator_export').count()
-    
-    # Conversion metrics
-    daily.signup_conversions = events.filter(event='user_signup').count()
-    daily.asset_creation_conversions = events.filter(event='asset_create').count()
-    daily.report_generation_conversions = events.filter(event='report_success').count()
-    daily.alert_setup_conversions = events.filter(event='alert_rule_create').count()
-    
-    # Performance metrics
-    performance_events = events.filter(event='performance_metric')
-    if performance_events.exists():
-        page_load_times = performance_events.filter(meta__metric='page_load_time').values_list('meta__value', flat=True)
-        daily.avg_page_load_time = sum(page_load_times) / len(page_load_times) if page_load_times else 0.0
-        
-        api_response_times = performance_events.filter(meta__metric='api_response_time').values_list('meta__value', flat=True)
-        daily.api_response_time_avg = sum(api_response_times) / len(api_response_times) if api_response_times else 0.0
-    
-    # Calculate error rate
-    total_events = events.count()
-    error_events = events.filter(
-        event__in=['report_fail', 'alert_fail', 'collector_fail', 'asset_sync_fail']
-    ).count()
-    daily.error_rate = (error_events / total_events * 100) if total_events > 0 else 0.0
-    
-    daily.save()
+# Events created less than this long ago may still be sitting in another
+# process's buffer, so incremental rollups leave them for the next run.
+ROLLUP_LAG = timedelta(seconds=60)
+
+# AnalyticsDaily counters and the events each one counts
+_EVENT_COUNTERS = {
+    'users': Q(event='user_signup'),
+    'assets': Q(event='asset_create'),
+    'reports': Q(event='report_success'),
+    'alerts': Q(event='alert_rule_create'),
+    'errors': Q(event__in=FAILURE_EVENTS),
+    'marketing_messages_created': (
+        Q(event='marketing_message_create')
+        | Q(event='feature_usage', meta__feature='marketing_message')
+    ),
+    'searches_performed': Q(event='search_performed'),
+    'filters_applied': Q(event='feature_usage', meta__feature='filter'),
+    'exports_downloaded': Q(event='feature_usage', meta__feature='export'),
+}
+
+# Timing metrics averaged from performance_metric events: (total, samples, average)
+_TIMING_METRICS = {
+    'page_load_time': ('page_load_time_total', 'page_load_time_samples', 'avg_page_load_time'),
+    'api_response_time': ('api_response_time_total', 'api_response_time_samples', 'api_response_time_avg'),
+}
+
+_CONVERSIONS = {
+    'signup_conversions': 'users',
+    'asset_creation_conversions': 'assets',
+    'report_generation_conversions': 'reports',
+    'alert_setup_conversions': 'alerts',
+}
+
+
+def _day_bounds(date):
+    start = timezone.make_aware(datetime.combine(date, time.min))
+    end = timezone.make_aware(datetime.combine(date + timedelta(days=1), time.min))
+    return start, end
+
+
+def _aggregate_events(start, end) -> Dict[str, float]:
+    """Count and sum everything AnalyticsDaily needs from events in one query."""
+    aggregates = {field: Count('id', filter=q) for field, q in _EVENT_COUNTERS.items()}
+    aggregates['event_count'] = Count('id')
+    value = Cast(KeyTextTransform('value', 'meta'), models.FloatField())
+    for metric, (total, samples, _) in _TIMING_METRICS.items():
+        q = Q(event='performance_metric', meta__metric=metric)
+        aggregates[total] = Sum(value, filter=q)
+        aggregates[samples] = Count('id', filter=q)
+    totals = AnalyticsEvent.objects.filter(
+        created_at__gte=start, created_at__lt=end
+    ).aggregate(**aggregates)
+    return {field: value or 0 for field, value in totals.items()}
+
+
+def rollup_day(date, incremental: bool = False):
+    """Aggregate one day of analytics into its AnalyticsDaily row.
+
+    A full rollup recomputes the row from all of the day's events. An
+    incremental rollup only aggregates events created since the row's
+    ``events_through`` watermark and adds them to the stored counters.
+    Session and page view metrics are recomputed either way because sessions
+    are updated after they start.
+    """
+    start, end = _day_bounds(date)
+
+    with transaction.atomic():
+        AnalyticsDaily.objects.get_or_create(date=date)
+        # Lock the row so overlapping runs cannot count the same events twice
+        daily = AnalyticsDaily.objects.select_for_update().get(date=date)
+
+        now = timezone.now()
+        upper = min(now - ROLLUP_LAG, end) if incremental else end
+        if incremental and daily.events_through:
+            lower = daily.events_through
+        else:
+            lower = start
+            for field in (*_EVENT_COUNTERS, 'event_count'):
+                setattr(daily, field, 0)
+            for total, samples, _ in _TIMING_METRICS.values():
+                setattr(daily, total, 0.0)
+                setattr(daily, samples, 0)
+
+        if upper > lower:
+            for field, value in _aggregate_events(lower, upper).items():
+                setattr(daily, field, getattr(daily, field) + value)
+            daily.events_through = upper if incremental else min(now, end)
+
+        for field, counter in _CONVERSIONS.items():
+            setattr(daily, field, getattr(daily, counter))
+        for total, samples, average in _TIMING_METRICS.values():
+            count = getattr(daily, samples)
+            setattr(daily, average, getattr(daily, total) / count if count else 0.0)
+        daily.error_rate = (daily.errors / daily.event_count * 100) if daily.event_count else 0.0
+
+        # User engagement metrics
+        sessions = UserSession.objects.filter(started_at__gte=start, started_at__lt=end).aggregate(
+            total=Count('id'),
+            bounces=Count('id', filter=Q(is_bounce=True)),
+            users=Count('user', distinct=True),
+            anonymous=Count('id', filter=Q(user__isnull=True)),
+            duration=Avg('duration', filter=Q(ended_at__isnull=False)),
+        )
+        # All anonymous sessions together count as a single visitor
+        daily.unique_visitors = sessions['users'] + (1 if sessions['anonymous'] else 0)
+        daily.session_duration_avg = sessions['duration'] or 0.0
+        daily.bounce_rate = (
+            sessions['bounces'] / sessions['total'] * 100 if sessions['total'] else 0.0
+        )
+        daily.page_views = PageView.objects.filter(viewed_at__gte=start, viewed_at__lt=end).count()
+
+        daily.save()
     return daily
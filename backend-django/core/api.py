@@ -1,6 +1,7 @@
 from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.response import Response
+from django.db.models import Prefetch
 from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter
 from drf_spectacular.types import OpenApiTypes
 from .models import Asset, Permit, Plan, Document, PlanningMetrics
@@ -12,12 +13,19 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+FIELDS_PARAMETER = OpenApiParameter(
+    "fields",
+    OpenApiTypes.STR,
+    description="Comma-separated fields to return (e.g. id,address,price); omit documents and meta to skip them",
+)
+
 
 @extend_schema_view(
     list=extend_schema(
         summary="List all assets",
         description="Retrieve a list of all real estate assets",
         tags=["Assets"],
+        parameters=[FIELDS_PARAMETER],
     ),
     create=extend_schema(
         summary="Create a new asset",
@@ -28,6 +36,7 @@ logger = logging.getLogger(__name__)
         summary="Retrieve an asset",
         description="Get details of a specific asset by ID",
         tags=["Assets"],
+        parameters=[FIELDS_PARAMETER],
     ),
     update=extend_schema(
         summary="Update an asset",
@@ -55,6 +64,15 @@ class AssetViewSet(viewsets.ModelViewSet):
     serializer_class = AssetSerializer
     permission_classes = [permissions.AllowAny]
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        fields = self.request.query_params.get("fields") if self.request else None
+        if not fields or "documents" in {name.strip() for name in fields.split(",")}:
+            queryset = queryset.prefetch_related(
+                Prefetch("documents", queryset=Document.objects.select_related("user"))
+            )
+        return queryset
+
     def perform_create(self, serializer):
         asset = serializer.save()
         logger.info("Asset created with id %s", asset.id)
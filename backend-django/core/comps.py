@@ -0,0 +1,354 @@
+"""Comparable-sales engine over every stored RealEstateTransaction.
+
+Transactions are loaded once per process into NumPy arrays and indexed by a
+lat/lon grid and by block, so radius, time and size-window queries only touch
+nearby deals. Results for an asset are cached until the asset changes.
+
+Deals carry no coordinates of their own: a deal is placed at the asset it was
+collected for, and only when the deal's own block (when known) is that
+asset's block. Distances are therefore between tracked assets.
+"""
+import hashlib
+import json
+import logging
+import math
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+from django.core.cache import cache
+from django.db import connection
+from django.utils import timezone
+
+from .models import Asset, RealEstateTransaction
+
+logger = logging.getLogger(__name__)
+
+COMPS_DEFAULT_RADIUS_M = 1000
+COMPS_MAX_RADIUS_M = 10_000
+COMPS_DEFAULT_MONTHS = 36
+COMPS_MAX_MONTHS = 240
+COMPS_DEFAULT_AREA_TOLERANCE = 0.3  # +/- share of the asset's area
+COMPS_TRIM = 0.1  # share cut from each end for the trimmed mean
+COMPS_MAX_RESULTS = 50
+COMPS_INDEX_TTL = 15 * 60  # seconds before the in-process index is rebuilt
+COMPS_CACHE_TTL = 60 * 60  # seconds a per-asset result stays cached
+
+GRID_CELL_DEG = 0.01  # roughly 1.1 km of latitude
+EARTH_RADIUS_M = 6_371_000
+METERS_PER_DEG_LAT = 111_320
+
+
+def trimmed_mean(values: np.ndarray, proportion: float = COMPS_TRIM) -> Optional[float]:
+    """Mean of ``values`` after cutting ``proportion`` from each end."""
+    if not len(values):
+        return None
+    ordered = np.sort(values)
+    cut = int(len(ordered) * proportion)
+    return float(ordered[cut:len(ordered) - cut].mean())
+
+
+def comps_stats(prices: np.ndarray, ppsqm: np.ndarray) -> Dict[str, Any]:
+    """Robust price statistics for a set of comparable deals."""
+    if not len(prices):
+        return {"transaction_count": 0}
+    p25, p75 = np.percentile(ppsqm, [25, 75])
+    return {
+        "transaction_count": int(len(prices)),
+        "avg_price": float(prices.mean()),
+        "min_price": int(prices.min()),
+        "max_price": int(prices.max()),
+        "median_price": float(np.median(prices)),
+        "avg_price_per_sqm": float(ppsqm.mean()),
+        "min_price_per_sqm": float(ppsqm.min()),
+        "max_price_per_sqm": float(ppsqm.max()),
+        "median_price_per_sqm": float(np.median(ppsqm)),
+        "trimmed_mean_price_per_sqm": trimmed_mean(ppsqm),
+        "p25_price_per_sqm": float(p25),
+        "p75_price_per_sqm": float(p75),
+    }
+
+
+def parse_comps_params(params: Mapping[str, Any]) -> Tuple[float, int]:
+    """Return the ``radius`` (meters) and ``months`` of a comps request.
+
+    The radius is capped at ``COMPS_MAX_RADIUS_M`` and months at
+    ``COMPS_MAX_MONTHS``.
+
+    Raises:
+        ValueError: If the radius is not a positive finite number or months is not a positive integer
+    """
+    try:
+        radius_m = float(params.get("radius", COMPS_DEFAULT_RADIUS_M))
+        months = int(params.get("months", COMPS_DEFAULT_MONTHS))
+    except (TypeError, ValueError):
+        raise ValueError("radius and months must be numbers")
+    if not math.isfinite(radius_m) or radius_m <= 0:
+        raise ValueError("radius must be a positive number of meters")
+    if months <= 0:
+        raise ValueError("months must be a positive integer")
+    return min(radius_m, COMPS_MAX_RADIUS_M), min(months, COMPS_MAX_MONTHS)
+
+
+class CompsIndex:
+    """Columnar, location-indexed view of priced transactions."""
+
+    def __init__(self, rows: List[Dict[str, Any]]):
+        self.built_at = time.monotonic()
+        self._rows = rows
+        self.lat = np.array([r["lat"] if r["lat"] is not None else np.nan for r in rows], dtype=float)
+        self.lon = np.array([r["lon"] if r["lon"] is not None else np.nan for r in rows], dtype=float)
+        self.timestamp = np.array(
+            [r["date"].timestamp() if r["date"] else np.nan for r in rows], dtype=float
+        )
+        self.price = np.array([r["price"] for r in rows], dtype=float)
+        self.area = np.array([r["area"] for r in rows], dtype=float)
+        self.ppsqm = self.price / self.area
+
+        cells: Dict[tuple, List[int]] = {}
+        blocks: Dict[str, List[int]] = {}
+        for i, row in enumerate(rows):
+            if row["lat"] is not None and row["lon"] is not None:
+                cells.setdefault(self._cell(row["lat"], row["lon"]), []).append(i)
+            if row["block"]:
+                blocks.setdefault(str(row["block"]), []).append(i)
+        self._cells = {key: np.array(idx) for key, idx in cells.items()}
+        self._blocks = {key: np.array(idx) for key, idx in blocks.items()}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @classmethod
+    def from_db(cls) -> "CompsIndex":
+        """Build the index from every transaction with a price and an area.
+
+        Transactions reach the table once per asset they were collected
+        for, so repeated deal ids are kept only once. A deal takes its block
+        from its own record when it has one; it only takes the collecting
+        asset's coordinates when that block is the asset's.
+        """
+        rows, seen = [], set()
+        queryset = RealEstateTransaction.objects.filter(price__gt=0, area__gt=0).values(
+            "id", "deal_id", "date", "price", "area", "rooms", "floor", "address",
+            "asset_id", "asset__lat", "asset__lon", "asset__block", "raw__parcel_block",
+        ).order_by("id")
+        for row in queryset.iterator(chunk_size=5000):
+            if row["deal_id"]:
+                if row["deal_id"] in seen:
+                    continue
+                seen.add(row["deal_id"])
+            deal_block = row.pop("raw__parcel_block") or None
+            asset_block = row.pop("asset__block")
+            row["lat"] = row.pop("asset__lat")
+            row["lon"] = row.pop("asset__lon")
+            if deal_block and asset_block and str(deal_block) != str(asset_block):
+                # Collected for an asset elsewhere, so the deal's position is unknown
+                row["lat"] = row["lon"] = None
+            row["block"] = deal_block or asset_block
+            rows.append(row)
+        return cls(rows)
+
+    @staticmethod
+    def _cell(lat: float, lon: float) -> tuple:
+        return (math.floor(lat / GRID_CELL_DEG), math.floor(lon / GRID_CELL_DEG))
+
+    def _near(self, lat: float, lon: float, radius_m: float):
+        """Indexes within ``radius_m`` of a point and their distances."""
+        dlat = radius_m / METERS_PER_DEG_LAT
+        dlon = radius_m / (METERS_PER_DEG_LAT * max(math.cos(math.radians(lat)), 0.01))
+        (i0, j0), (i1, j1) = self._cell(lat - dlat, lon - dlon), self._cell(lat + dlat, lon + dlon)
+        parts = [
+            self._cells[(i, j)]
+            for i in range(i0, i1 + 1)
+            for j in range(j0, j1 + 1)
+            if (i, j) in self._cells
+        ]
+        if not parts:
+            return np.empty(0, dtype=int), np.empty(0)
+        candidates = np.concatenate(parts)
+        lat1, lon1 = math.radians(lat), math.radians(lon)
+        lat2, lon2 = np.radians(self.lat[candidates]), np.radians(self.lon[candidates])
+        a = np.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+        distance = 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(a))
+        keep = distance <= radius_m
+        return candidates[keep], distance[keep]
+
+    def query(
+        self,
+        *,
+        lat: Optional[float] = None,
+        lon: Optional[float] = None,
+        block: Optional[str] = None,
+        radius_m: float = COMPS_DEFAULT_RADIUS_M,
+        since: Optional[datetime] = None,
+        min_area: Optional[float] = None,
+        max_area: Optional[float] = None,
+    ):
+        """Return matching indexes and their distances, nearest and newest first.
+
+        Searches around ``lat``/``lon`` when given and falls back to every
+        deal in ``block`` otherwise; distances are NaN for block matches.
+        """
+        if lat is not None and lon is not None:
+            idx, distance = self._near(lat, lon, radius_m)
+        elif block and str(block) in self._blocks:
+            idx = self._blocks[str(block)]
+            distance = np.full(len(idx), np.nan)
+        else:
+            return np.empty(0, dtype=int), np.empty(0)
+
+        keep = np.ones(len(idx), dtype=bool)
+        if since is not None:
+            keep &= self.timestamp[idx] >= since.timestamp()
+        if min_area is not None:
+            keep &= self.area[idx] >= min_area
+        if max_area is not None:
+            keep &= self.area[idx] <= max_area
+        idx, distance = idx[keep], distance[keep]
+
+        order = np.lexsort((-np.nan_to_num(self.timestamp[idx]), np.nan_to_num(distance)))
+        return idx[order], distance[order]
+
+    def rows(self, idx: np.ndarray, distance: np.ndarray) -> List[Dict[str, Any]]:
+        result = []
+        for i, d in zip(idx.tolist(), distance.tolist()):
+            row = self._rows[i]
+            result.append({
+                "id": row["id"],
+                "deal_id": row["deal_id"],
+                "date": row["date"].isoformat() if row["date"] else None,
+                "price": row["price"],
+                "rooms": row["rooms"],
+                "area": row["area"],
+                "floor": row["floor"],
+                "address": row["address"],
+                "price_per_sqm": round(float(self.ppsqm[i]), 2),
+                "distance_m": None if math.isnan(d) else round(d),
+                "asset_id": row["asset_id"],
+            })
+        return result
+
+
+_index: Optional[CompsIndex] = None
+_index_lock = threading.Lock()
+
+
+def _rebuild_index() -> None:
+    """Replace the process-wide index; runs with ``_index_lock`` held."""
+    global _index
+    try:
+        _index = CompsIndex.from_db()
+    except Exception:
+        logger.exception("Rebuilding the comps index failed")
+    finally:
+        _index_lock.release()
+        connection.close()
+
+
+def get_comps_index(max_age: float = COMPS_INDEX_TTL) -> CompsIndex:
+    """Return the process-wide comps index.
+
+    Only the first call builds it on the calling thread. Once it is stale
+    a single background thread rebuilds it while callers keep using the
+    current one.
+    """
+    global _index
+    index = _index
+    if index is None:
+        with _index_lock:
+            if _index is None:
+                _index = CompsIndex.from_db()
+            return _index
+    if time.monotonic() - index.built_at > max_age and _index_lock.acquire(blocking=False):
+        threading.Thread(target=_rebuild_index, name="comps-index", daemon=True).start()
+    return index
+
+
+def _own_transactions(asset: Asset, limit: int) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """Every transaction collected for ``asset`` itself, newest first."""
+    transactions = list(RealEstateTransaction.objects.filter(asset=asset).order_by("-date", "-id"))
+    rows = [
+        {
+            "id": t.id,
+            "deal_id": t.deal_id,
+            "date": t.date.isoformat() if t.date else None,
+            "price": t.price,
+            "rooms": t.rooms,
+            "area": t.area,
+            "floor": t.floor,
+            "address": t.address,
+            "price_per_sqm": round(t.price / t.area, 2) if t.price and t.area else None,
+            "distance_m": None,
+            "asset_id": t.asset_id,
+        }
+        for t in transactions[:limit]
+    ]
+    priced = [t for t in transactions if t.price and t.price > 0 and t.area and t.area > 0]
+    prices = np.array([t.price for t in priced], dtype=float)
+    stats = comps_stats(prices, prices / np.array([t.area for t in priced], dtype=float))
+    return rows, stats
+
+
+def find_comparables(
+    asset: Asset,
+    *,
+    radius_m: float = COMPS_DEFAULT_RADIUS_M,
+    months: int = COMPS_DEFAULT_MONTHS,
+    area_tolerance: Optional[float] = COMPS_DEFAULT_AREA_TOLERANCE,
+    limit: int = COMPS_MAX_RESULTS,
+) -> Dict[str, Any]:
+    """Comparable deals and robust statistics for ``asset``.
+
+    Deals are taken from every stored transaction within ``radius_m`` of
+    the asset (or in its block when it has no coordinates), from the last
+    ``months`` months and, when the asset's area is known, within
+    ``area_tolerance`` of it. Statistics cover every match; ``limit`` only
+    caps the deals returned. When nothing matches, the asset's own
+    transactions are returned unfiltered.
+    """
+    query = {
+        "radius_m": radius_m,
+        "months": months,
+        "area_tolerance": area_tolerance,
+        "limit": limit,
+    }
+    digest = hashlib.md5(json.dumps(query, sort_keys=True).encode()).hexdigest()[:12]
+    cache_key = f"comps:{asset.id}:{asset.listing_version}:{digest}"
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    window = {}
+    if asset.area and area_tolerance is not None:
+        window = {
+            "min_area": asset.area * (1 - area_tolerance),
+            "max_area": asset.area * (1 + area_tolerance),
+        }
+    index = get_comps_index()
+    idx, distance = index.query(
+        lat=asset.lat,
+        lon=asset.lon,
+        block=asset.block,
+        radius_m=radius_m,
+        since=timezone.now() - timedelta(days=months * 30),
+        **window,
+    )
+    by = "radius" if asset.lat is not None and asset.lon is not None else "block"
+    if len(idx):
+        comparables = index.rows(idx[:limit], distance[:limit])
+        stats = comps_stats(index.price[idx], index.ppsqm[idx])
+    else:
+        comparables, stats = _own_transactions(asset, limit)
+        by = "own_transactions"
+    result = {
+        "comparables": comparables,
+        "stats": stats,
+        "query": {**query, **window, "by": by},
+    }
+    if by == "radius":
+        # Deals are placed at the asset they were collected for
+        result["query"]["distance_from"] = "collecting_asset"
+    cache.set(cache_key, result, COMPS_CACHE_TTL)
+    return result
@@ -0,0 +1,126 @@
+"""Serve stored files with conditional and byte-range request support.
+
+Files can instead be handed to the front web server through
+``X-Accel-Redirect`` (nginx) or ``X-Sendfile`` (Apache, lighttpd), in which
+case their bytes never pass through a Python worker.
+"""
+import os
+import re
+from typing import Iterator, Optional, Tuple
+
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe, quote_etag
+
+SENDFILE_X_ACCEL = "x-accel-redirect"
+SENDFILE_X_SENDFILE = "x-sendfile"
+
+RANGE_CHUNK_SIZE = 64 * 1024
+
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """Return the inclusive ``(start, end)`` of a single-range ``Range`` header.
+
+    Returns None when the header should be ignored (malformed or several
+    ranges) so the whole file is served.
+
+    Raises:
+        ValueError: If the range is well-formed but cannot be satisfied
+    """
+    match = _RANGE_RE.match(header.strip())
+    if not match or match.groups() == ("", ""):
+        return None
+    first, last = match.groups()
+    if not first:
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length == 0 or size == 0:
+            raise ValueError("Unsatisfiable range")
+        return max(size - length, 0), size - 1
+    start = int(first)
+    if start >= size:
+        raise ValueError("Unsatisfiable range")
+    end = int(last) if last else size - 1
+    if end < start:
+        return None
+    return start, min(end, size - 1)
+
+
+def _read_range(path: str, start: int, length: int) -> Iterator[bytes]:
+    with open(path, "rb") as f:
+        f.seek(start)
+        while length > 0:
+            chunk = f.read(min(RANGE_CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+
+
+def serve_file(
+    request,
+    path: str,
+    content_type: str,
+    *,
+    sendfile: str = "",
+    accel_url: Optional[str] = None,
+):
+    """Respond with the file at ``path``.
+
+    Answers ``If-None-Match``/``If-Modified-Since`` with 304 and a single
+    ``Range`` (honouring ``If-Range``) with 206. With ``sendfile`` set to
+    :data:`SENDFILE_X_ACCEL` (redirecting to ``accel_url``) or
+    :data:`SENDFILE_X_SENDFILE`, the body is left to the web server, which
+    then also handles ranges.
+
+    Raises:
+        FileNotFoundError: If ``path`` does not exist
+    """
+    stat = os.stat(path)
+    etag = quote_etag(f"{stat.st_size:x}-{stat.st_mtime_ns:x}")
+    last_modified = int(stat.st_mtime)
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        if sendfile == SENDFILE_X_ACCEL:
+            response = HttpResponse(content_type=content_type)
+            response["X-Accel-Redirect"] = accel_url
+        elif sendfile == SENDFILE_X_SENDFILE:
+            response = HttpResponse(content_type=content_type)
+            response["X-Sendfile"] = os.path.abspath(path)
+        else:
+            response = _file_response(request, path, content_type, stat.st_size, etag, last_modified)
+
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    response["Accept-Ranges"] = "bytes"
+    return response
+
+
+def _file_response(request, path, content_type, size, etag, last_modified):
+    range_header = request.headers.get("Range")
+    if_range = request.headers.get("If-Range")
+    if range_header and if_range and if_range != etag:
+        # A stale If-Range means the client's partial copy is outdated
+        if parse_http_date_safe(if_range) != last_modified:
+            range_header = None
+
+    try:
+        byte_range = parse_range(range_header, size) if range_header else None
+    except ValueError:
+        response = HttpResponse(status=416, content_type=content_type)
+        response["Content-Range"] = f"bytes */{size}"
+        return response
+
+    if byte_range is None:
+        return FileResponse(open(path, "rb"), content_type=content_type)
+
+    start, end = byte_range
+    response = StreamingHttpResponse(
+        _read_range(path, start, end - start + 1), status=206, content_type=content_type
+    )
+    response["Content-Length"] = str(end - start + 1)
+    response["Content-Range"] = f"bytes {start}-{end}/{size}"
+    return response
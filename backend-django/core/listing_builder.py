@@ -1,6 +1,48 @@
-from typing import Dict, Any, Optional, Iterable
+import base64
+import json
+from datetime import datetime
+from typing import Dict, Any, List, Mapping, Optional, Iterable, Tuple
 
-from .models import Asset, SourceRecord
+from django.db.models import F, Prefetch, Q, QuerySet, prefetch_related_objects
+from django.utils.dateparse import parse_datetime
+
+from .models import Asset, AssetListing, SourceRecord
+
+ASSET_LIST_DEFAULT_LIMIT = 50
+ASSET_LIST_MAX_LIMIT = 200
+ASSET_LIST_DEFAULT_SORT = "-created_at"
+
+# ``sort`` query values (optionally prefixed with "-") -> Asset fields
+ASSET_LIST_SORTS = {
+    "created_at": "created_at",
+    "price": "price",
+    "price_per_sqm": "price_per_sqm",
+    "area": "area",
+    "rooms": "rooms",
+    "city": "city",
+}
+
+# Query parameters pushed down to SQL as exact matches
+ASSET_LIST_EXACT_FILTERS = {
+    "city": "city",
+    "neighborhood": "neighborhood",
+    "street": "street",
+    "block": "block",
+    "parcel": "parcel",
+    "status": "status",
+    "scope_type": "scope_type",
+    "type": "building_type",
+}
+
+# Query parameters pushed down to SQL as numeric bounds
+ASSET_LIST_RANGE_FILTERS = {
+    "min_price": ("price__gte", int),
+    "max_price": ("price__lte", int),
+    "min_rooms": ("rooms__gte", int),
+    "max_rooms": ("rooms__lte", int),
+    "min_area": ("area__gte", float),
+    "max_area": ("area__lte", float),
+}
 
 
 def _first_nonempty(*vals):
@@ -91,7 +133,7 @@ def build_listing(
     # Process unified metadata structure
     _meta = {}
     for key, value in meta.items():
-        if key not in ['gis_data', 'government_data', 'rami_plans', 'mavat_plans', 'yad2_listings', 'market_data', 'last_enrichment']:
+        if key not in Asset.ENRICHMENT_SOURCES and key != 'last_enrichment':
             if isinstance(value, dict) and "value" in value:
                 # This is a unified metadata entry
                 listing_data[key] = value.get("value")
@@ -140,3 +182,166 @@ def build_listing(
     })
     
     return listing_data
+
+
+def _latest_source_records() -> QuerySet:
+    """The newest source record of each asset, with the only field build_listing reads."""
+    return SourceRecord.objects.only("id", "asset_id", "raw").order_by("-fetched_at", "-id")[:1]
+
+
+def _store_listings(assets: List[Asset], rows: List[Dict[str, Any]]) -> None:
+    """Upsert the listing rows of ``assets`` in a single query."""
+    listings = [
+        AssetListing(asset=asset, data=data, version=asset.listing_version)
+        for asset, data in zip(assets, rows)
+    ]
+    AssetListing.objects.bulk_create(
+        listings,
+        update_conflicts=True,
+        unique_fields=["asset"],
+        update_fields=["data", "version", "updated_at"],
+    )
+    for asset, listing in zip(assets, listings):
+        asset.listing = listing
+
+
+def refresh_listing(
+    asset: Asset, source_records: Optional[Iterable[SourceRecord]] = None
+) -> Dict[str, Any]:
+    """Rebuild and store the materialized listing row of ``asset``; returns the row data."""
+    if source_records is None:
+        source_records = SourceRecord.objects.filter(asset_id=asset.id).order_by("-fetched_at", "-id")[:1]
+    data = build_listing(asset, source_records)
+    _store_listings([asset], [data])
+    return data
+
+
+def _current_listing(asset: Asset) -> Optional[Dict[str, Any]]:
+    try:
+        listing = asset.listing
+    except AssetListing.DoesNotExist:
+        return None
+    return listing.data if listing.version == asset.listing_version else None
+
+
+def get_listing(asset: Asset) -> Dict[str, Any]:
+    """Return the listing row of ``asset`` from the read model, rebuilding it if stale."""
+    data = _current_listing(asset)
+    return data if data is not None else refresh_listing(asset)
+
+
+def get_listings(assets: List[Asset]) -> List[Dict[str, Any]]:
+    """Return the listing rows of ``assets`` (ideally loaded with ``select_related("listing")``).
+
+    Stale or missing rows are rebuilt with one query for their source records
+    and one to store them.
+    """
+    rows = [_current_listing(asset) for asset in assets]
+    stale = [asset for asset, row in zip(assets, rows) if row is None]
+    if stale:
+        prefetch_related_objects(
+            stale,
+            Prefetch("source_records", queryset=_latest_source_records(), to_attr="latest_source_records"),
+        )
+        rebuilt = [build_listing(asset, asset.latest_source_records) for asset in stale]
+        _store_listings(stale, rebuilt)
+        rebuilt_by_id = {asset.id: data for asset, data in zip(stale, rebuilt)}
+        rows = [row if row is not None else rebuilt_by_id[asset.id] for asset, row in zip(assets, rows)]
+    return rows
+
+
+def _encode_cursor(value: Any, asset_id: int) -> str:
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    raw = json.dumps([value, asset_id]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str, field: str) -> Tuple[Any, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        value, asset_id = json.loads(raw)
+        asset_id = int(asset_id)
+    except (TypeError, ValueError):
+        raise ValueError("Invalid cursor")
+    if field == "created_at" and value is not None:
+        value = parse_datetime(value)
+        if value is None:
+            raise ValueError("Invalid cursor")
+    return value, asset_id
+
+
+def _after_cursor(field: str, descending: bool, value: Any, asset_id: int) -> Q:
+    """Rows that sort after ``(value, asset_id)``; NULL sort values always come last."""
+    past_id = Q(id__lt=asset_id) if descending else Q(id__gt=asset_id)
+    if value is None:
+        return Q(**{f"{field}__isnull": True}) & past_id
+    past_value = Q(**{f"{field}__lt" if descending else f"{field}__gt": value})
+    return past_value | (Q(**{field: value}) & past_id) | Q(**{f"{field}__isnull": True})
+
+
+def filter_assets(queryset: QuerySet, params: Mapping[str, Any]) -> QuerySet:
+    """Apply the asset list filters in ``params`` (e.g. request query params) to ``queryset``.
+
+    Raises:
+        ValueError: If a numeric bound is not a number
+    """
+    for param, field in ASSET_LIST_EXACT_FILTERS.items():
+        if params.get(param):
+            queryset = queryset.filter(**{field: params[param]})
+    for param, (lookup, cast) in ASSET_LIST_RANGE_FILTERS.items():
+        if params.get(param) not in (None, ""):
+            try:
+                queryset = queryset.filter(**{lookup: cast(params[param])})
+            except (TypeError, ValueError):
+                raise ValueError(f"Invalid {param}")
+    if params.get("q"):
+        queryset = queryset.filter(
+            Q(normalized_address__icontains=params["q"]) | Q(street__icontains=params["q"])
+        )
+    return queryset
+
+
+def list_asset_listings(
+    params: Mapping[str, Any], queryset: Optional[QuerySet] = None
+) -> Dict[str, Any]:
+    """Return one keyset-paginated page of assets in listing format.
+
+    Supported ``params``: the filters of :func:`filter_assets`, ``sort`` (a key
+    of ``ASSET_LIST_SORTS``, "-" for descending), ``limit`` and ``cursor`` (the
+    ``next_cursor`` of the previous page). Rows come from the materialized
+    AssetListing read model, so a page whose rows are current costs a single
+    query whatever its size.
+
+    Raises:
+        ValueError: On an unknown sort, a bad limit or cursor, or a bad filter value
+    """
+    sort = params.get("sort") or ASSET_LIST_DEFAULT_SORT
+    descending = sort.startswith("-")
+    field = ASSET_LIST_SORTS.get(sort.lstrip("-"))
+    if field is None:
+        raise ValueError(f"Unsupported sort: {sort}")
+    try:
+        limit = int(params.get("limit") or ASSET_LIST_DEFAULT_LIMIT)
+    except (TypeError, ValueError):
+        raise ValueError("Invalid limit")
+    limit = max(1, min(limit, ASSET_LIST_MAX_LIMIT))
+
+    queryset = filter_assets(queryset if queryset is not None else Asset.objects.all(), params)
+    if params.get("cursor"):
+        queryset = queryset.filter(_after_cursor(field, descending, *_decode_cursor(params["cursor"], field)))
+
+    order = F(field).desc(nulls_last=True) if descending else F(field).asc(nulls_last=True)
+    assets: List[Asset] = list(
+        queryset.select_related("listing").order_by(order, "-id" if descending else "id")[: limit + 1]
+    )
+
+    next_cursor = None
+    if len(assets) > limit:
+        assets = assets[:limit]
+        last = assets[-1]
+        next_cursor = _encode_cursor(getattr(last, field), last.id)
+    return {
+        "rows": get_listings(assets),
+        "next_cursor": next_cursor,
+    }
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+from core.tasks import ingest_decisive_block
+
+
+class Command(BaseCommand):
+    help = 'Index the decisive appraisal PDFs of the given blocks'
+
+    def add_arguments(self, parser):
+        parser.add_argument('blocks', nargs='+', help='Block (gush) numbers to index')
+        parser.add_argument(
+            '--async',
+            action='store_true',
+            dest='run_async',
+            help='Queue each block on a Celery worker instead of indexing it here.',
+        )
+
+    def handle(self, *args, **options):
+        for block in options['blocks']:
+            if options['run_async']:
+                ingest_decisive_block.delay(block)
+                self.stdout.write(f'Queued decisive appraisal ingestion for block {block}')
+            else:
+                indexed = ingest_decisive_block.run(block)
+                self.stdout.write(
+                    self.style.SUCCESS(f'Indexed {indexed} decisive appraisal PDFs for block {block}')
+                )
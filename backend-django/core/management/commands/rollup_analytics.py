@@ -11,18 +11,23 @@ class Command(BaseCommand):
             type=str,
             help='Date to rollup (YYYY-MM-DD). Defaults to today.',
         )
+        parser.add_argument(
+            '--incremental',
+            action='store_true',
+            help='Only aggregate events created since the last rollup.',
+        )
 
     def handle(self, *args, **options):
         if options['date']:
             from datetime import datetime
             from core.analytics import rollup_day
             date = datetime.strptime(options['date'], '%Y-%m-%d').date()
-            rollup_day(date)
+            rollup_day(date, incremental=options['incremental'])
             self.stdout.write(
                 self.style.SUCCESS(f'Successfully rolled up analytics for {date}')
             )
         else:
-            rollup_analytics.run()
+            rollup_analytics.run(incremental=options['incremental'])
             self.stdout.write(
                 self.style.SUCCESS('Successfully rolled up analytics for today')
             )
@@ -0,0 +1,35 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0031_user_equity'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='asset',
+            name='listing_version',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.CreateModel(
+            name='AssetListing',
+            fields=[
+                (
+                    'asset',
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name='listing',
+                        serialize=False,
+                        to='core.asset',
+                    ),
+                ),
+                ('data', models.JSONField(default=dict)),
+                ('version', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,33 @@
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0032_assetlisting'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AssetEnrichment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(max_length=50)),
+                ('payload', models.JSONField(default=dict)),
+                ('fetched_at', models.DateTimeField(default=django.utils.timezone.now)),
+                (
+                    'asset',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='enrichments',
+                        to='core.asset',
+                    ),
+                ),
+            ],
+            options={
+                'unique_together': {('asset', 'source')},
+            },
+        ),
+    ]
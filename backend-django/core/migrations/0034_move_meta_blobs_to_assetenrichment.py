@@ -0,0 +1,60 @@
+from django.db import migrations
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+# Mirrors Asset.ENRICHMENT_SOURCES at the time of this migration
+ENRICHMENT_SOURCES = (
+    'gis_data',
+    'govmap_data',
+    'govmap_autocomplete_data',
+    'government_data',
+    'rami_plans',
+    'mavat_plans',
+    'yad2_listings',
+    'market_data',
+    'privilege_page_data',
+)
+
+
+def move_blobs_to_side_table(apps, schema_editor):
+    Asset = apps.get_model('core', 'Asset')
+    AssetEnrichment = apps.get_model('core', 'AssetEnrichment')
+
+    for asset in Asset.objects.only('id', 'meta').iterator(chunk_size=200):
+        meta = asset.meta or {}
+        sources = [source for source in ENRICHMENT_SOURCES if source in meta]
+        if not sources:
+            continue
+        fetched_at = parse_datetime(meta.get('last_enrichment') or '') or timezone.now()
+        AssetEnrichment.objects.bulk_create(
+            [
+                AssetEnrichment(asset_id=asset.id, source=source, payload=meta.pop(source), fetched_at=fetched_at)
+                for source in sources
+            ],
+            ignore_conflicts=True,
+        )
+        Asset.objects.filter(id=asset.id).update(meta=meta)
+
+
+def move_blobs_back_to_meta(apps, schema_editor):
+    Asset = apps.get_model('core', 'Asset')
+    AssetEnrichment = apps.get_model('core', 'AssetEnrichment')
+
+    asset_ids = AssetEnrichment.objects.values_list('asset_id', flat=True).distinct()
+    for asset in Asset.objects.filter(id__in=asset_ids).only('id', 'meta').iterator(chunk_size=200):
+        meta = asset.meta or {}
+        for enrichment in AssetEnrichment.objects.filter(asset_id=asset.id):
+            meta[enrichment.source] = enrichment.payload
+        Asset.objects.filter(id=asset.id).update(meta=meta)
+    AssetEnrichment.objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0033_assetenrichment'),
+    ]
+
+    operations = [
+        migrations.RunPython(move_blobs_to_side_table, move_blobs_back_to_meta),
+    ]
@@ -0,0 +1,41 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0034_move_meta_blobs_to_assetenrichment'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='analyticsdaily',
+            name='events_through',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='analyticsdaily',
+            name='event_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='analyticsdaily',
+            name='page_load_time_total',
+            field=models.FloatField(default=0.0),
+        ),
+        migrations.AddField(
+            model_name='analyticsdaily',
+            name='page_load_time_samples',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='analyticsdaily',
+            name='api_response_time_total',
+            field=models.FloatField(default=0.0),
+        ),
+        migrations.AddField(
+            model_name='analyticsdaily',
+            name='api_response_time_samples',
+            field=models.IntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0035_analyticsdaily_incremental_rollup'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='report',
+            index=models.Index(fields=['user', '-generated_at', '-id'], name='core_report_user_id_556be5_idx'),
+        ),
+    ]
@@ -0,0 +1,57 @@
+from datetime import timedelta
+
+from django.db import migrations
+
+# Reports were created right after their "report_request" event was tracked
+REQUEST_MATCH_WINDOW = timedelta(minutes=1)
+
+
+def backfill_report_owners(apps, schema_editor):
+    """Give ownerless reports the user whose report request preceded them.
+
+    Reports created before they recorded their owner have ``user`` unset;
+    the only trace of who asked for one is the ``report_request`` analytics
+    event tracked just before it. A report is only assigned when every
+    request in that window came from the same user; reports without a
+    match, or with requests from several users, stay ownerless and are not
+    served to anyone.
+    """
+    Report = apps.get_model('core', 'Report')
+    AnalyticsEvent = apps.get_model('core', 'AnalyticsEvent')
+
+    assigned = ambiguous = 0
+    reports = Report.objects.filter(user__isnull=True, asset__isnull=False).only('id', 'asset_id', 'generated_at')
+    for report in reports.iterator(chunk_size=200):
+        user_ids = list(
+            AnalyticsEvent.objects.filter(
+                event='report_request',
+                asset_id=report.asset_id,
+                user__isnull=False,
+                created_at__lte=report.generated_at,
+                created_at__gte=report.generated_at - REQUEST_MATCH_WINDOW,
+            )
+            .order_by()
+            .values_list('user_id', flat=True)
+            .distinct()[:2]
+        )
+        if len(user_ids) == 1:
+            Report.objects.filter(id=report.id).update(user_id=user_ids[0])
+            assigned += 1
+        elif user_ids:
+            ambiguous += 1
+
+    if assigned:
+        print(f"✓ Assigned owners to {assigned} legacy reports")
+    if ambiguous:
+        print(f"⚠ Left {ambiguous} legacy reports ownerless: requested by several users")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0037_analyticsevent_created_at_default'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_report_owners, migrations.RunPython.noop),
+    ]
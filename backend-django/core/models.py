@@ -1,7 +1,7 @@
 import os
 import logging
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth.models import AbstractUser
 from django.contrib.auth import get_user_model
 from django.utils import timezone
@@ -387,6 +387,13 @@ class Snapshot(models.Model):
 
 
 # Asset Enrichment Pipeline Models
+class AssetQuerySet(models.QuerySet):
+    def update(self, **kwargs):
+        """Update the assets and mark their materialized listings stale."""
+        kwargs.setdefault("listing_version", models.F("listing_version") + 1)
+        return super().update(**kwargs)
+
+
 class Asset(models.Model):
     """Asset model for the enrichment pipeline."""
 
@@ -406,6 +413,19 @@ class Asset(models.Model):
         ("failed", "Failed"),
     ]
 
+    # Bulky per-source payloads stored in AssetEnrichment rather than ``meta``
+    ENRICHMENT_SOURCES = (
+        "gis_data",
+        "govmap_data",
+        "govmap_autocomplete_data",
+        "government_data",
+        "rami_plans",
+        "mavat_plans",
+        "yad2_listings",
+        "market_data",
+        "privilege_page_data",
+    )
+
     scope_type = models.CharField(max_length=50, choices=SCOPE_TYPE_CHOICES)
     city = models.CharField(max_length=100, blank=True, null=True)
     neighborhood = models.CharField(max_length=100, blank=True, null=True)
@@ -458,6 +478,10 @@ class Asset(models.Model):
     last_sync_started_at = models.DateTimeField(blank=True, null=True)
     last_enrich_error = models.TextField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    # Bumped on every change that can affect the materialized AssetListing row
+    listing_version = models.PositiveIntegerField(default=0)
+
+    objects = AssetQuerySet.as_manager()
 
     class Meta:
         indexes = [
@@ -497,6 +521,74 @@ class Asset(models.Model):
 
     def __str__(self):
         return f"Asset({self.id}, {self.scope_type}, {self.status})"
+
+    def save(self, *args, **kwargs):
+        """Save the asset and its pending enrichments, and rebuild its listing row."""
+        self.listing_version = (self.listing_version or 0) + 1
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            update_fields = set(update_fields) | {"listing_version"}
+        pending = self.__dict__.pop("_pending_enrichments", set())
+        # Drop legacy copies in ``meta`` that the side table now replaces
+        legacy = [source for source in pending if self.meta and source in self.meta]
+        for source in legacy:
+            del self.meta[source]
+        if legacy and update_fields is not None:
+            update_fields.add("meta")
+        if update_fields is not None:
+            kwargs["update_fields"] = update_fields
+        super().save(*args, **kwargs)
+
+        enrichments = self._enrichment_cache()
+        for source in pending:
+            AssetEnrichment.objects.update_or_create(
+                asset=self,
+                source=source,
+                defaults={"payload": enrichments[source], "fetched_at": timezone.now()},
+            )
+
+        from .listing_builder import refresh_listing
+        try:
+            # A savepoint keeps a failed refresh from aborting the caller's transaction
+            with transaction.atomic():
+                refresh_listing(self)
+        except Exception as e:
+            # The row stays stale and is rebuilt on the next read
+            logger.warning("Could not refresh listing for asset %s: %s", self.id, e)
+
+    def mark_listing_stale(self):
+        """Invalidate the materialized listing without saving the asset."""
+        Asset.objects.filter(pk=self.pk).update(listing_version=models.F("listing_version") + 1)
+
+    def _enrichment_cache(self):
+        return self.__dict__.setdefault("_enrichments", {})
+
+    def get_enrichment(self, source, default=None):
+        """Return the enrichment payload stored for ``source``.
+
+        Payloads are loaded on first access (or from ``prefetch_related("enrichments")``)
+        and fall back to a legacy copy in ``meta``.
+        """
+        cache = self._enrichment_cache()
+        if source not in cache:
+            prefetched = getattr(self, "_prefetched_objects_cache", {}).get("enrichments")
+            if prefetched is not None:
+                rows = [e.payload for e in prefetched if e.source == source]
+            elif self.pk is not None:
+                rows = list(self.enrichments.filter(source=source).values_list("payload", flat=True)[:1])
+            else:
+                rows = []
+            if rows:
+                cache[source] = rows[0]
+            else:
+                cache[source] = self.meta.get(source) if self.meta else None
+        value = cache[source]
+        return default if value is None else value
+
+    def set_enrichment(self, source, payload):
+        """Replace the enrichment payload for ``source``; written on the next ``save()``."""
+        self._enrichment_cache()[source] = payload
+        self.__dict__.setdefault("_pending_enrichments", set()).add(source)
     
     @property
     def address(self):
@@ -531,6 +623,10 @@ class Asset(models.Model):
         """Unified setter that updates both direct fields and metadata."""
         if value is None:
             return
+
+        if key in self.ENRICHMENT_SOURCES:
+            self.set_enrichment(key, value)
+            return
         
         # Initialize meta field if it doesn't exist
         if not self.meta:
@@ -576,6 +672,16 @@ class Asset(models.Model):
             asset.get_property_value('government_data.decisive_appraisals', [])  # Nested
             asset.get_property_value('gis_data.land_use_rights', [])  # Nested
         """
+        # Per-source payloads live in AssetEnrichment
+        root, _, path = key.partition('.')
+        if root in self.ENRICHMENT_SOURCES:
+            current = self.get_enrichment(root)
+            for part in path.split('.') if path else []:
+                if not isinstance(current, dict) or part not in current:
+                    return default
+                current = current[part]
+            return default if current is None else current
+
         # Handle nested access with dot notation
         if '.' in key:
             return self._get_nested_value(key, default)
@@ -650,7 +756,60 @@ class SourceRecord(models.Model):
         is_new = self.pk is None
         super().save(*args, **kwargs)
         if is_new:
+            # Saving the asset also rebuilds its listing from this newest record
             promote_raw_to_asset(self.asset, self.raw or {})
+        else:
+            self.asset.mark_listing_stale()
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        self.asset.mark_listing_stale()
+        return result
+
+
+class AssetEnrichment(models.Model):
+    """Bulky per-source enrichment payload of an asset (see ``Asset.ENRICHMENT_SOURCES``).
+
+    Kept out of ``Asset.meta`` so that loading assets does not de-serialize
+    raw GIS, government and Yad2 payloads; read them with
+    ``Asset.get_enrichment`` or ``Asset.get_property_value``.
+    """
+
+    asset = models.ForeignKey(
+        Asset, on_delete=models.CASCADE, related_name="enrichments"
+    )
+    source = models.CharField(max_length=50)
+    payload = models.JSONField(default=dict)
+    fetched_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        unique_together = ["asset", "source"]
+
+    def __str__(self):
+        return f"AssetEnrichment({self.asset_id}, {self.source})"
+
+
+class AssetListing(models.Model):
+    """Materialized listing row of an asset, as built by ``core.listing_builder``.
+
+    Rebuilt whenever the asset is saved; ``version`` is the asset's
+    ``listing_version`` the row was built from, so a row is stale when the two
+    differ (e.g. after a queryset update or a contribution).
+    """
+
+    asset = models.OneToOneField(
+        Asset, on_delete=models.CASCADE, primary_key=True, related_name="listing"
+    )
+    data = models.JSONField(default=dict)
+    version = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"AssetListing({self.asset_id}, v{self.version})"
+
+    @property
+    def is_stale(self):
+        return self.version != self.asset.listing_version
 
 
 def promote_raw_to_asset(asset: Asset, raw: dict):
@@ -736,6 +895,10 @@ class AssetContribution(models.Model):
     def __str__(self):
         return f"Contribution({self.user.email}, {self.contribution_type}, Asset {self.asset.id})"
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self.asset.mark_listing_stale()
+
 
 class UserProfile(models.Model):
     """Extended user profile with contribution statistics and preferences."""
@@ -889,6 +1052,7 @@ class Report(models.Model):
             models.Index(fields=["report_type"]),
             models.Index(fields=["status"]),
             models.Index(fields=["generated_at"]),
+            models.Index(fields=["user", "-generated_at", "-id"]),
         ]
         ordering = ["-generated_at"]
 
@@ -1132,7 +1296,8 @@ class ShareToken(models.Model):
 class AnalyticsEvent(models.Model):
     """Raw analytics events for tracking system activity."""
 
-    created_at = models.DateTimeField(auto_now_add=True)
+    # Set when the event happens, not when a buffered batch is written
+    created_at = models.DateTimeField(default=timezone.now, editable=False)
     event = models.CharField(max_length=100)
     user = models.ForeignKey(
         get_user_model(),
@@ -1294,6 +1459,16 @@ class AnalyticsDaily(models.Model):
     api_response_time_avg = models.FloatField(default=0.0)  # in seconds
     error_rate = models.FloatField(default=0.0)  # percentage
 
+    # Incremental rollup state: events created before ``events_through`` are
+    # already counted, and the running totals let averages be extended
+    # without rescanning the day.
+    events_through = models.DateTimeField(null=True, blank=True)
+    event_count = models.IntegerField(default=0)
+    page_load_time_total = models.FloatField(default=0.0)
+    page_load_time_samples = models.IntegerField(default=0)
+    api_response_time_total = models.FloatField(default=0.0)
+    api_response_time_samples = models.IntegerField(default=0)
+
     class Meta:
         indexes = [models.Index(fields=["date"])]
 
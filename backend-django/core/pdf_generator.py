@@ -1,10 +1,12 @@
+import functools
+import hashlib
 import os
 import time
 import logging
 from pathlib import Path
 from typing import Optional, List
 
-from django.template.loader import render_to_string
+from django.template.loader import get_template, render_to_string
 from weasyprint import HTML
 from PyPDF2 import PdfReader
 from reportlab.pdfgen import canvas
@@ -12,10 +14,45 @@ from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.lib.pagesizes import A4
 
-from .models import Asset, Report, SourceRecord
-from .listing_builder import build_listing
+from .models import Asset, Report
+from .listing_builder import get_listing
 from .constants import SECTION_TITLES_HE
 
+logger = logging.getLogger(__name__)
+
+REPORT_TEMPLATE = "report_asset.html"
+# Bump when a change to the rendering code alters the generated PDFs
+REPORT_TEMPLATE_VERSION = "1"
+
+
+@functools.lru_cache(maxsize=None)
+def register_hebrew_font(font_path: str) -> str:
+    """Register the Hebrew font with ReportLab once per process.
+
+    Returns the font name to draw with, falling back to Helvetica when the
+    font cannot be loaded.
+    """
+    try:
+        if os.path.exists(font_path):
+            pdfmetrics.registerFont(TTFont("HebrewFont", font_path))
+            logger.info("Successfully registered Hebrew font: %s", font_path)
+            return "HebrewFont"
+        else:
+            logger.warning("Hebrew font not found at: %s", font_path)
+            return "Helvetica"
+    except Exception as e:
+        logger.error("Failed to register Hebrew font: %s", e)
+        return "Helvetica"
+
+
+@functools.lru_cache(maxsize=None)
+def template_version() -> str:
+    """Identify the report template so cached PDFs expire when it changes."""
+    origin = get_template(REPORT_TEMPLATE).origin.name
+    with open(origin, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()[:12]
+    return f"{REPORT_TEMPLATE_VERSION}-{digest}"
+
 
 class HebrewPDFGenerator:
     """Handles PDF generation with Hebrew RTL support and proper layout."""
@@ -30,17 +67,7 @@ class HebrewPDFGenerator:
 
     def _setup_hebrew_font(self) -> str:
         """Setup Hebrew font for PDF generation."""
-        try:
-            if os.path.exists(self.font_path):
-                pdfmetrics.registerFont(TTFont("HebrewFont", self.font_path))
-                self.logger.info("Successfully registered Hebrew font: %s", self.font_path)
-                return "HebrewFont"
-            else:
-                self.logger.warning("Hebrew font not found at: %s", self.font_path)
-                return "Helvetica"
-        except Exception as e:
-            self.logger.error("Failed to register Hebrew font: %s", e)
-            return "Helvetica"
+        return register_hebrew_font(self.font_path)
 
     def reverse_hebrew_text(self, text: str) -> str:
         """Reverse Hebrew text for RTL display."""
@@ -79,8 +106,7 @@ class HebrewPDFGenerator:
             # for unknown asset IDs. The rest of the fields can remain empty and
             # will be filled with defaults by the PDF generator.
             return {"address": "Unknown asset"}
-        srcs = SourceRecord.objects.filter(asset_id=asset.id).order_by("-fetched_at")
-        return build_listing(asset, srcs)
+        return get_listing(asset)
 
     def draw_page_header(self, canvas_obj, title: str, y_position: int = 760):
         """Draw a centered page header."""
@@ -209,7 +235,7 @@ class HebrewPDFGenerator:
             logo_path = (self.base_dir / "core" / "static" / "core" / "nadlaner-logo.svg").resolve()
             context["logo_path"] = logo_path.as_uri()
             
-            html_string = render_to_string("report_asset.html", context)
+            html_string = render_to_string(REPORT_TEMPLATE, context)
             # Use the static files directory as base_url for WeasyPrint to resolve static assets
             static_dir = self.base_dir / "core" / "static"
             HTML(string=html_string, base_url=str(static_dir)).write_pdf(file_path)
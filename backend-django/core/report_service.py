@@ -1,17 +1,52 @@
+import base64
+import glob
+import hashlib
+import json
 import logging
 import os
+import shutil
+import threading
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Mapping, Tuple
+
+from django.conf import settings
+from django.db.models import Q, QuerySet
+from django.utils.dateparse import parse_datetime
+from PyPDF2 import PdfReader
+
 from .models import Asset, Report
-from .pdf_generator import HebrewPDFGenerator
+from .pdf_generator import HebrewPDFGenerator, template_version
 from .constants import DEFAULT_REPORT_SECTIONS
 
 logger = logging.getLogger(__name__)
 
+# Most assets accepted by one bulk report request
+REPORT_BULK_MAX = 50
+
+REPORT_LIST_DEFAULT_LIMIT = 50
+REPORT_LIST_MAX_LIMIT = 200
+
+
+def _encode_cursor(report: Report) -> str:
+    raw = json.dumps([report.generated_at.isoformat(), report.id]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> Tuple[Any, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        generated_at, report_id = json.loads(raw)
+        generated_at, report_id = parse_datetime(generated_at), int(report_id)
+    except (TypeError, ValueError):
+        raise ValueError("Invalid cursor")
+    if generated_at is None:
+        raise ValueError("Invalid cursor")
+    return generated_at, report_id
+
 
 class ReportService:
     """Service class for handling report operations."""
-    
+
     def __init__(self, base_dir: Path):
         self.base_dir = base_dir
 
@@ -25,20 +60,48 @@ class ReportService:
         self.reports_dir = os.environ.get("REPORTS_DIR", str(backend_reports_dir.resolve()))
         logger.info("Reports directory set to %s", self.reports_dir)
         self.pdf_generator = HebrewPDFGenerator(base_dir)
-    
-    def create_report(self, asset_id: int, sections: Optional[List[str]] = None) -> Optional[Report]:
+
+    @property
+    def cache_dir(self) -> str:
+        """Directory holding rendered PDFs keyed by :meth:`render_key`."""
+        return os.path.join(self.reports_dir, "cache")
+
+    def render_key(self, asset: Optional[Asset], sections: List[str]) -> str:
+        """Identify a rendering by asset listing version, planning metrics, sections and template.
+
+        Keys start with the asset id and listing version so renders of
+        older versions can be found and dropped. Planning metrics are
+        saved without touching the asset, so their last update is part of
+        the digest.
+        """
+        asset_id = asset.id if asset else 0
+        version = asset.listing_version if asset else 0
+        planning = getattr(asset, "planning_metrics", None) if asset else None
+        planning_at = planning.updated_at.isoformat() if planning else None
+        payload = json.dumps([asset_id, version, planning_at, list(sections), template_version()])
+        digest = hashlib.sha256(payload.encode()).hexdigest()[:16]
+        return f"a{asset_id}-v{version}-{digest}"
+
+    def _cache_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.pdf")
+
+    def create_report(
+        self, asset_id: int, sections: Optional[List[str]] = None, user=None
+    ) -> Optional[Report]:
         """Create a new report for an asset."""
         asset: Optional[Asset]
         try:
-            asset = Asset.objects.get(id=asset_id)
+            asset = Asset.objects.select_related("listing", "planning_metrics").get(id=asset_id)
         except Asset.DoesNotExist:
             asset = None
             logger.warning("Asset %s not found, generating placeholder report", asset_id)
 
         try:
+            sections = sections or DEFAULT_REPORT_SECTIONS
             listing = self.pdf_generator.create_asset_listing(asset)
             address = listing.get("address", f"Asset {asset_id}")
             report = Report.objects.create(
+                user=user,
                 asset=asset,
                 report_type='asset',
                 status='generating',
@@ -47,7 +110,8 @@ class ReportService:
                 title=address,
                 description=f'Asset report for {address}',
                 pages=1,
-                sections=sections or DEFAULT_REPORT_SECTIONS,
+                sections=sections,
+                meta={"render_key": self.render_key(asset, sections)},
             )
 
             filename = f"r{report.id}.pdf"
@@ -63,9 +127,48 @@ class ReportService:
         except Exception:
             logger.exception("Error creating report for asset %s", asset_id)
             return None
-    
+
+    def render_from_cache(self, report: Report) -> bool:
+        """Complete ``report`` from a cached rendering if one exists."""
+        key = (report.meta or {}).get("render_key")
+        if not key or not os.path.exists(self._cache_path(key)):
+            return False
+        try:
+            shutil.copyfile(self._cache_path(key), report.file_path)
+            pages = len(PdfReader(report.file_path).pages)
+        except Exception:
+            logger.exception("Could not reuse cached PDF %s for report %s", key, report.id)
+            return False
+        report.meta = {**report.meta, "cached": True}
+        report.mark_completed(
+            file_size=os.path.getsize(report.file_path), pages=pages, generation_time=0.0
+        )
+        logger.info("Served report %s from cached PDF %s", report.id, key)
+        return True
+
+    def _store_in_cache(self, report: Report) -> None:
+        key = (report.meta or {}).get("render_key")
+        if not key:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            cached = self._cache_path(key)
+            tmp_path = f"{cached}.{os.getpid()}.{threading.get_ident()}.tmp"
+            shutil.copyfile(report.file_path, tmp_path)
+            os.replace(tmp_path, cached)
+
+            # Renders of an older listing version can never be hit again
+            asset_part, version_part = key.split("-")[:2]
+            for path in glob.glob(os.path.join(self.cache_dir, f"{asset_part}-v*.pdf")):
+                if not os.path.basename(path).startswith(f"{asset_part}-{version_part}-"):
+                    os.remove(path)
+        except OSError:
+            logger.exception("Could not cache PDF for report %s", report.id)
+
     def generate_pdf(self, report: Report) -> bool:
-        """Generate the PDF file for a report."""
+        """Generate the PDF file for a report, reusing a cached rendering when possible."""
+        if self.render_from_cache(report):
+            return True
         try:
             success = self.pdf_generator.generate_report(
                 asset=report.asset,
@@ -76,6 +179,7 @@ class ReportService:
             )
             if success:
                 logger.info("Generated PDF for report %s", report.id)
+                self._store_in_cache(report)
             else:
                 logger.error("PDF generation reported failure for report %s", report.id)
             return success
@@ -83,28 +187,70 @@ class ReportService:
             logger.exception("Error generating PDF for report %s", report.id)
             report.mark_failed(str(e))
             return False
-    
-    def get_reports_list(self) -> list:
-        """Get list of all reports."""
-        reports_list = []
-        for report in Report.objects.all().order_by('-generated_at'):
-            reports_list.append({
-                'id': report.id,
-                'assetId': report.asset.id if report.asset else None,
-                'address': report.title or 'N/A',
-                'filename': report.filename,
-                'createdAt': report.generated_at.isoformat(),
-                'status': report.status,
-                'pages': report.pages,
-                'fileSize': report.file_size,
-                'url': report.file_url,
-            })
-        return reports_list
-    
-    def delete_report(self, report_id: int) -> bool:
-        """Delete a specific report."""
+
+    def serialize_report(self, report: Report) -> Dict[str, Any]:
+        """Report fields returned by the reports API."""
+        return {
+            'id': report.id,
+            'assetId': report.asset_id,
+            'address': report.title or 'N/A',
+            'filename': report.filename,
+            'createdAt': report.generated_at.isoformat(),
+            'status': report.status,
+            'pages': report.pages,
+            'fileSize': report.file_size,
+            'sections': report.sections,
+            'error': report.error_message,
+            'url': report.file_url,
+        }
+
+    def reports_for(self, user) -> QuerySet:
+        """Reports ``user`` may list, poll, download or delete.
+
+        Reports belong to the user who requested them; anonymous callers
+        (``user`` is None or not authenticated) have none.
+        """
+        if user is None or not user.is_authenticated:
+            return Report.objects.none()
+        return Report.objects.filter(user=user)
+
+    def get_reports_list(self, user, params: Optional[Mapping[str, Any]] = None) -> Dict[str, Any]:
+        """Return one keyset-paginated page of ``user``'s reports, newest first.
+
+        Supported ``params``: ``limit`` and ``cursor`` (the ``next_cursor``
+        of the previous page). Anonymous callers get an empty page.
+
+        Raises:
+            ValueError: On a bad limit or cursor
+        """
+        params = params or {}
         try:
-            report = Report.objects.get(id=report_id)
+            limit = int(params.get("limit") or REPORT_LIST_DEFAULT_LIMIT)
+        except (TypeError, ValueError):
+            raise ValueError("Invalid limit")
+        limit = max(1, min(limit, REPORT_LIST_MAX_LIMIT))
+
+        queryset = self.reports_for(user)
+        if params.get("cursor"):
+            generated_at, report_id = _decode_cursor(params["cursor"])
+            queryset = queryset.filter(
+                Q(generated_at__lt=generated_at) | Q(generated_at=generated_at, id__lt=report_id)
+            )
+        reports = list(queryset.order_by("-generated_at", "-id")[: limit + 1])
+
+        next_cursor = None
+        if len(reports) > limit:
+            reports = reports[:limit]
+            next_cursor = _encode_cursor(reports[-1])
+        return {
+            "reports": [self.serialize_report(report) for report in reports],
+            "next_cursor": next_cursor,
+        }
+
+    def delete_report(self, report_id: int, user) -> bool:
+        """Delete one of ``user``'s reports."""
+        try:
+            report = self.reports_for(user).get(id=report_id)
             return report.delete_report()
         except Report.DoesNotExist:
             logger.warning("Report %s not found", report_id)
@@ -112,17 +258,25 @@ class ReportService:
         except Exception:
             logger.exception("Error deleting report %s", report_id)
             return False
-    
-    def get_report_by_id(self, report_id: int) -> Optional[Report]:
-        """Get a report by ID."""
-        try:
-            return Report.objects.get(id=report_id)
-        except Report.DoesNotExist:
-            return None
-    
-    def get_report_by_filename(self, filename: str) -> Optional[Report]:
-        """Get a report by filename."""
-        try:
-            return Report.objects.get(filename=filename)
-        except Report.DoesNotExist:
-            return None
+
+    def get_report_by_id(self, report_id: int, user) -> Optional[Report]:
+        """Get one of ``user``'s reports by ID."""
+        return self.reports_for(user).filter(id=report_id).first()
+
+    def get_report_by_filename(self, filename: str, user) -> Optional[Report]:
+        """Get one of ``user``'s reports by filename."""
+        return self.reports_for(user).filter(filename=filename).first()
+
+
+_report_service: Optional[ReportService] = None
+_report_service_lock = threading.Lock()
+
+
+def get_report_service() -> ReportService:
+    """Return the process-wide report service shared by views and tasks."""
+    global _report_service
+    if _report_service is None:
+        with _report_service_lock:
+            if _report_service is None:
+                _report_service = ReportService(Path(settings.BASE_DIR))
+    return _report_service
@@ -2,16 +2,45 @@ from rest_framework import serializers
 from .models import Asset, Permit, Plan, SupportTicket, ConsultationRequest, AlertRule, AlertEvent, Snapshot, AssetContribution, UserProfile, PlanType, UserPlan, Document
 
 
+class SparseFieldsetMixin:
+    """Restrict the serialized fields with a ``fields`` argument or ``?fields=a,b`` query parameter."""
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop("fields", None)
+        super().__init__(*args, **kwargs)
+        if fields is None:
+            request = self.context.get("request")
+            param = request.query_params.get("fields") if request is not None and hasattr(request, "query_params") else None
+            if param:
+                fields = [name.strip() for name in param.split(",") if name.strip()]
+        self.requested_fields = set(fields) if fields is not None else None
+        if self.requested_fields is not None:
+            for name in set(self.fields) - self.requested_fields:
+                self.fields.pop(name)
+
+
 class MetaSerializerMixin(serializers.ModelSerializer):
     """Adds _meta section with field lineage information for unified metadata structure."""
 
+    # Fields that already merge their own meta entry and must not be overwritten by it
+    meta_merged_fields = ()
+
     def to_representation(self, instance):
         data = super().to_representation(instance)
         meta = getattr(instance, "meta", {}) or {}
+        requested = getattr(self, "requested_fields", None)
+        if requested is not None:
+            # Sparse fieldset: only look at the meta entries that were asked for
+            meta = {key: meta[key] for key in requested if key in meta}
+            with_lineage = "_meta" in requested
+        else:
+            with_lineage = True
         field_meta = {}
         
         # Process unified metadata structure
         for key, value in meta.items():
+            if key in self.meta_merged_fields:
+                continue
             if isinstance(value, dict) and "value" in value:
                 # This is a unified metadata entry
                 actual_value = value.get("value")
@@ -35,16 +64,18 @@ class MetaSerializerMixin(serializers.ModelSerializer):
                 data[key] = value
         
         # Add _meta section if we have attribution data
-        if field_meta:
+        if field_meta and with_lineage:
             data["_meta"] = field_meta
             
         return data
 
 
-class AssetSerializer(MetaSerializerMixin):
+class AssetSerializer(SparseFieldsetMixin, MetaSerializerMixin):
     address = serializers.SerializerMethodField()
     documents = serializers.SerializerMethodField()
     type = serializers.CharField(source='building_type', read_only=True)
+
+    meta_merged_fields = ("documents",)
     
     def get_address(self, obj):
         """Get formatted address for frontend compatibility."""
@@ -66,7 +97,10 @@ class AssetSerializer(MetaSerializerMixin):
             return " ".join(parts) if parts else None
     
     def get_documents(self, obj):
-        """Get documents from both Document model and meta field."""
+        """Get documents from both Document model and meta field.
+
+        Prefetch ``documents`` (with their ``user``) when serializing many assets.
+        """
         documents = []
         
         # Get documents from Document model
@@ -91,10 +125,11 @@ class AssetSerializer(MetaSerializerMixin):
         
         # Get documents from meta field (for backward compatibility)
         if obj.meta and 'documents' in obj.meta:
+            # Use 'id' field for meta documents since they don't have 'external_id'
+            known_ids = {d['external_id'] for d in documents}
             for doc in obj.meta['documents']:
                 # Only add if not already in Document model
-                # Use 'id' field for meta documents since they don't have 'external_id'
-                if not any(d.get('external_id') == doc.get('id') for d in documents):
+                if doc.get('id') not in known_ids:
                     documents.append(doc)
         
         return documents
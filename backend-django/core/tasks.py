@@ -1,16 +1,24 @@
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional
 
 from celery import shared_task
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.db import connection
 from django.utils import timezone
 
-from .analytics import track
+from .analytics import track, track_feature_usage
 from .email import send_email
 
 logger = logging.getLogger(__name__)
 
+# Threads rendering reports when Celery is not available
+REPORT_RENDER_WORKERS = int(os.getenv("REPORT_RENDER_WORKERS", "2"))
+
 
 @shared_task(bind=True, max_retries=3, default_retry_delay=30)
 def send_notification_email(
@@ -86,6 +94,20 @@ def run_data_pipeline(asset_id: int, max_pages: int = 1):
         raise
 
 
+@shared_task
+def ingest_decisive_block(block: str) -> int:
+    """Index the decision PDFs of a block into the local decisive index.
+
+    Queued by the government collector when ``DECISIVE_INDEX_INGEST`` is
+    enabled; ``manage.py ingest_decisive`` runs it for chosen blocks.
+    """
+    from gov.decisive_index import ingest_block
+
+    indexed = ingest_block(str(block))
+    logger.info("Indexed %s decisive appraisal PDFs for block %s", indexed, block)
+    return indexed
+
+
 @shared_task
 def cleanup_demo_data():
     """Delete demo users and assets older than 24 hours."""
@@ -98,13 +120,18 @@ def cleanup_demo_data():
 
 
 @shared_task
-def rollup_analytics():
-    """Aggregate raw analytics events into daily rollups."""
-    from django.utils import timezone
+def rollup_analytics(incremental: bool = True):
+    """Aggregate raw analytics events into daily rollups.
+
+    Incremental runs also close out yesterday, picking up the events that
+    arrived between its last run and midnight.
+    """
     from .analytics import rollup_day
 
-    today = timezone.now().date()
-    rollup_day(today)
+    today = timezone.localdate()
+    if incremental:
+        rollup_day(today - timedelta(days=1), incremental=True)
+    rollup_day(today, incremental=incremental)
 
 
 @shared_task
@@ -128,6 +155,88 @@ def alert_on_spikes():
     return False
 
 
+@shared_task
+def generate_report_pdf(report_id: int) -> bool:
+    """Render a report's PDF and record the outcome."""
+    from .models import Report
+    from .report_service import get_report_service
+
+    report = Report.objects.select_related("asset__listing", "user").filter(id=report_id).first()
+    if report is None:
+        logger.warning("Report %s not found, nothing to render", report_id)
+        return False
+
+    success = get_report_service().generate_pdf(report)
+    record_report_result(report, success)
+    return success
+
+
+def record_report_result(report, success: bool) -> None:
+    """Track a finished report and credit the owner's onboarding step."""
+    from .models import OnboardingProgress
+
+    if not success:
+        track(
+            "report_fail",
+            user=report.user,
+            asset_id=report.asset_id,
+            error_code=(report.error_message or "")[:100] or None,
+        )
+        return
+
+    track("report_success", user=report.user, asset_id=report.asset_id)
+    track_feature_usage("report_generation", user=report.user, asset_id=report.asset_id)
+    if report.user:
+        progress, _ = OnboardingProgress.objects.get_or_create(user=report.user)
+        if not progress.generate_first_report:
+            progress.generate_first_report = True
+            progress.save()
+
+
+_render_pool: Optional[ThreadPoolExecutor] = None
+_render_pool_lock = threading.Lock()
+
+
+def _get_render_pool() -> ThreadPoolExecutor:
+    global _render_pool
+    if _render_pool is None:
+        with _render_pool_lock:
+            if _render_pool is None:
+                _render_pool = ThreadPoolExecutor(
+                    max_workers=REPORT_RENDER_WORKERS, thread_name_prefix="report-render"
+                )
+    return _render_pool
+
+
+def _render_in_pool(report_id: int) -> None:
+    try:
+        generate_report_pdf(report_id)
+    except Exception:
+        logger.exception("Background rendering failed for report %s", report_id)
+    finally:
+        connection.close()
+
+
+def dispatch_report_renders(report_ids: Iterable[int]) -> None:
+    """Render reports off the request thread.
+
+    Reports go to Celery workers when a broker is configured and to a
+    shared thread pool otherwise. With ``REPORTS_ASYNC`` disabled they are
+    rendered before this returns.
+    """
+    report_ids = list(report_ids)
+    if not settings.REPORTS_ASYNC:
+        for report_id in report_ids:
+            generate_report_pdf(report_id)
+    elif getattr(settings, "CELERY_BROKER_URL", None):
+        for report_id in report_ids:
+            generate_report_pdf.delay(report_id)
+    else:
+        pool = _get_render_pool()
+        for report_id in report_ids:
+            pool.submit(_render_in_pool, report_id)
+
+
 @shared_task
 def evaluate_alerts_for_asset(asset_id: int) -> int:
     """Evaluate alert rules for a specific asset after enrichment.
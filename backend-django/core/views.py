@@ -2,13 +2,12 @@
 import json
 import statistics
 import re
-import os
 import secrets
 from decimal import Decimal, InvalidOperation
 from datetime import datetime, timedelta
 from pathlib import Path
 
-from django.http import JsonResponse, FileResponse, Http404
+from django.http import JsonResponse, Http404
 from django.views.decorators.csrf import csrf_exempt
 from django.shortcuts import redirect, render
 from django.conf import settings
@@ -21,6 +20,8 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework_simplejwt.tokens import RefreshToken
 from drf_spectacular.utils import extend_schema, OpenApiExample
 from drf_spectacular.types import OpenApiTypes
@@ -43,7 +44,8 @@ from .models import (
     Plan
 )
 
-from .listing_builder import build_listing
+from .listing_builder import get_listing, list_asset_listings
+from .comps import find_comparables, parse_comps_params
 from .serializers import (
     AlertRuleSerializer,
     AlertEventSerializer,
@@ -71,19 +73,20 @@ except ImportError:
 
 
 # Import tasks
-from .tasks import run_data_pipeline
+from .tasks import dispatch_report_renders, record_report_result, run_data_pipeline
 from .analytics import track, track_search, track_feature_usage
 
 # Import services
 from .auth_service import AuthenticationService
-from .report_service import ReportService
+from .report_service import REPORT_BULK_MAX, get_report_service
+from .file_serving import serve_file
 from .constants import DEFAULT_REPORT_SECTIONS
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 # Initialize services
 auth_service = AuthenticationService(settings)
-report_service = ReportService(BASE_DIR)
+report_service = get_report_service()
 
 logger = logging.getLogger(__name__)
 
@@ -826,13 +829,19 @@ def sync_address(request):
 
 
 @api_view(["GET", "POST", "DELETE"])
-@permission_classes([AllowAny])  # Allow both authenticated and unauthenticated access
+@permission_classes([IsAuthenticated])
 def reports(request):
-    """Create a PDF report for a listing or list existing reports."""
+    """Create a PDF report for a listing or list existing reports.
+
+    Reports belong to the user who requested them; only they can list,
+    poll, download or delete them.
+    """
     if request.method == "GET":
-        # Get all reports using service
-        reports_list = report_service.get_reports_list()
-        return Response({"reports": reports_list})
+        # One page of the caller's reports; query params: cursor, limit
+        try:
+            return Response(report_service.get_reports_list(request.user, request.query_params))
+        except ValueError as e:
+            return Response({"error": str(e)}, status=400)
 
     if request.method == "DELETE":
         # Delete a specific report using service
@@ -842,7 +851,9 @@ def reports(request):
 
         try:
             report_id = int(data["reportId"])
-            success = report_service.delete_report(report_id)
+            if not report_service.get_report_by_id(report_id, request.user):
+                return Response({"error": "Report not found"}, status=404)
+            success = report_service.delete_report(report_id, request.user)
 
             if success:
                 return Response(
@@ -862,78 +873,126 @@ def reports(request):
         return Response({"error": "POST or DELETE required"}, status=405)
 
     data = parse_json(request)
-    if not data or not data.get("assetId"):
+    if not data or not (data.get("assetId") or data.get("assetIds")):
         return Response({"error": "assetId required"}, status=400)
 
-    asset_id = data["assetId"]
+    bulk = "assetIds" in data
+    asset_ids = data["assetIds"] if bulk else [data["assetId"]]
+    if not isinstance(asset_ids, list) or len(asset_ids) > REPORT_BULK_MAX:
+        return Response(
+            {"error": "assetIds must be a list of at most {} assets".format(REPORT_BULK_MAX)},
+            status=400,
+        )
     sections = data.get("sections")
     if sections is None:
         sections = DEFAULT_REPORT_SECTIONS
     elif not sections:
         return Response({"error": "sections required"}, status=400)
 
-    logger.info("Report generation requested for asset %s", asset_id)
-    track("report_request", user=getattr(request, "user", None), asset_id=asset_id)
+    user = request.user
+    logger.info("Report generation requested for assets %s", asset_ids)
+    created = []
+    failed_ids = []
+    dispatched = False
     try:
-        # Create report using service
-        report = report_service.create_report(asset_id, sections)
-
-        if not report:
-            logger.error("Failed to create report for asset %s", asset_id)
+        # Every report is created before any is rendered, so a failure here
+        # never leaves earlier reports waiting for a render that won't come
+        for asset_id in asset_ids:
+            track("report_request", user=user, asset_id=asset_id)
+            report = report_service.create_report(asset_id, sections, user=user)
+            if report:
+                created.append((asset_id, report))
+            else:
+                logger.error("Failed to create report for asset %s", asset_id)
+                failed_ids.append(asset_id)
+        if not created:
             return Response({"error": "Failed to create report"}, status=500)
 
-        # Generate PDF using service
-        success = report_service.generate_pdf(report)
-
-        if not success:
-            logger.error("PDF generation failed for report %s", report.id)
+        # Identical earlier renders are copied; the rest are rendered off the request thread
+        pending = []
+        for _, report in created:
+            if report_service.render_from_cache(report):
+                record_report_result(report, True)
+            else:
+                pending.append(report.id)
+        dispatch_report_renders(pending)
+        dispatched = True
+
+        for _, report in created:
+            if report.id in pending:
+                report.refresh_from_db()
+        if not bulk and created[0][1].status == "failed":
+            logger.error("PDF generation failed for report %s", created[0][1].id)
             return Response({"error": "PDF generation failed"}, status=500)
 
-        _update_onboarding(getattr(request, "user", None), "generate_first_report")
-        track("report_success", user=getattr(request, "user", None), asset_id=asset_id)
-        
-        # Track feature usage
-        track_feature_usage("report_generation", user=getattr(request, "user", None), asset_id=asset_id)
-        logger.info("Report %s successfully generated for asset %s", report.id, asset_id)
-
-        # Return success response
-        return Response(
+        status_code = 202 if any(report.status == "generating" for _, report in created) else 201
+        rows = [
             {
-                "report": {
-                    "id": report.id,
-                    "assetId": asset_id,
-                    "address": report.title,
-                    "filename": report.filename,
-                    "createdAt": report.generated_at.isoformat(),
-                    "status": report.status,
-                    "pages": report.pages,
-                    "fileSize": report.file_size,
-                    "sections": report.sections,
-                    "url": report.file_url,
-                }
-            },
-            status=201,
-        )
+                **report_service.serialize_report(report),
+                "assetId": asset_id,
+                "statusUrl": "/api/reports/{}/".format(report.id),
+            }
+            for asset_id, report in created
+        ]
+        if bulk:
+            errors = [{"assetId": asset_id, "error": "Failed to create report"} for asset_id in failed_ids]
+            return Response({"reports": rows, "errors": errors}, status=status_code)
+        return Response({"report": rows[0]}, status=status_code)
 
     except Exception as e:
+        if not dispatched:
+            for _, report in created:
+                if report.status == "generating":
+                    report.mark_failed(str(e))
         track(
             "report_fail",
-            user=getattr(request, "user", None),
-            asset_id=asset_id,
+            user=user,
+            asset_id=asset_ids[0] if len(asset_ids) == 1 else None,
             error_code=str(e),
         )
-        logger.exception("Report generation failed for asset %s", asset_id)
+        logger.exception("Report generation failed for assets %s", asset_ids)
         return Response(
             {"error": "Report generation failed", "details": str(e)}, status=500
         )
 
 
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def report_detail(request, report_id):
+    """Return a report's generation status so clients can poll for it."""
+    report = report_service.get_report_by_id(report_id, request.user)
+    if not report:
+        return Response({"error": "Report not found"}, status=404)
+    return Response({"report": report_service.serialize_report(report)})
+
+
+def _request_user(request):
+    """Caller of a plain Django view: the user of a JWT bearer token, else the session user."""
+    try:
+        authenticated = JWTAuthentication().authenticate(request)
+    except AuthenticationFailed:
+        authenticated = None
+    return authenticated[0] if authenticated else request.user
+
+
 def report_file(request, filename):
-    """Serve a generated report PDF from the backend."""
-    report = report_service.get_report_by_filename(filename)
-    if not report or not os.path.exists(report.file_path):
+    """Serve one of the caller's report PDFs from the backend."""
+    user = _request_user(request)
+    if not user.is_authenticated:
+        return JsonResponse({"error": "Authentication required"}, status=401)
+    report = report_service.get_report_by_filename(filename, user)
+    if not report:
+        raise Http404("Report not found")
+    try:
+        return serve_file(
+            request,
+            report.file_path,
+            "application/pdf",
+            sendfile=settings.REPORTS_SENDFILE,
+            accel_url=settings.REPORTS_ACCEL_PREFIX + report.filename,
+        )
+    except FileNotFoundError:
         raise Http404("Report not found")
-    return FileResponse(open(report.file_path, "rb"), content_type="application/pdf")
 
 
 def _group_by_month(transactions):
@@ -1095,7 +1154,11 @@ def tabu(request):
 def assets(request):
     """Handle assets - GET (list all) or POST (create new).
 
-    GET: Returns all assets in listing format
+    GET: Returns one page of assets in listing format. Query parameters:
+        cursor (next_cursor of the previous page), limit, sort (e.g. "-price"),
+        and the filters city, neighborhood, street, block, parcel, status,
+        scope_type, type, q, min_price/max_price, min_rooms/max_rooms,
+        min_area/max_area
     POST: Creates a new asset and enqueues enrichment pipeline
 
     Expected JSON payload for POST:
@@ -1115,8 +1178,7 @@ def assets(request):
     }
     """
     if request.method == "GET":
-        # Return all assets in listing format
-        return _get_assets_list()
+        return _get_assets_list(request)
 
     if request.method == "DELETE":
         data = parse_json(request)
@@ -1314,18 +1376,13 @@ def assets(request):
         )
 
 
-def _get_assets_list():
-    """Helper function to get all assets in listing format."""
+def _get_assets_list(request):
+    """Helper function to get a page of assets in listing format."""
 
     try:
-        assets_qs = Asset.objects.all().order_by("-created_at")
-        rows = []
-        for asset in assets_qs:
-            srcs = SourceRecord.objects.filter(asset_id=asset.id).order_by(
-                "-fetched_at"
-            )
-            rows.append(build_listing(asset, srcs))
-        return Response({"rows": rows})
+        return Response(list_asset_listings(request.query_params))
+    except ValueError as e:
+        return Response({"error": str(e)}, status=400)
     except Exception as e:
         logger.error("Error fetching assets: %s", e)
         return Response(
@@ -1501,14 +1558,18 @@ def asset_appraisal(request, asset_id):
             return JsonResponse({"error": "Asset not found"}, status=404)
 
         # Get source records for appraisal data
-        appraisal_records = SourceRecord.objects.filter(
+        appraisal_records = list(SourceRecord.objects.filter(
             asset_id=asset_id,
             source__in=['appraisal_decisive', 'appraisal_rmi', 'decisive', 'rami']
-        )
-        
-        # Get transactions for comparable analysis
-        transactions = RealEstateTransaction.objects.filter(asset_id=asset_id)
-        
+        ))
+
+        # Comparable deals from every stored transaction near the asset
+        try:
+            radius_m, months = parse_comps_params(request.GET)
+        except ValueError as e:
+            return JsonResponse({"error": str(e)}, status=400)
+        comps = find_comparables(asset, radius_m=radius_m, months=months)
+
         # Build appraisal data
         appraisal_data = {
             "appraisal": None,
@@ -1526,7 +1587,7 @@ def asset_appraisal(request, asset_id):
         }
         
         # Process decisive appraisals
-        decisive_records = appraisal_records.filter(source__in=['appraisal_decisive', 'decisive'])
+        decisive_records = [r for r in appraisal_records if r.source in ('appraisal_decisive', 'decisive')]
         for record in decisive_records:
             if record.raw:
                 try:
@@ -1551,7 +1612,7 @@ def asset_appraisal(request, asset_id):
                     })
         
         # Process RAMI appraisals
-        rami_records = appraisal_records.filter(source__in=['appraisal_rmi', 'rami'])
+        rami_records = [r for r in appraisal_records if r.source in ('appraisal_rmi', 'rami')]
         for record in rami_records:
             if record.raw:
                 try:
@@ -1574,36 +1635,10 @@ def asset_appraisal(request, asset_id):
                     })
         
         # Process comparable transactions
-        for trans in transactions:
-            appraisal_data["comparable_transactions"].append({
-                "id": trans.id,
-                "date": trans.date.isoformat() if trans.date else None,
-                "price": trans.price,
-                "rooms": trans.rooms,
-                "area": trans.area,
-                "floor": trans.floor,
-                "address": trans.address,
-                "price_per_sqm": trans.price / trans.area if trans.price and trans.area else None
-            })
-        
-        # Calculate market analysis
-        if appraisal_data["comparable_transactions"]:
-            prices = [t["price"] for t in appraisal_data["comparable_transactions"] if t["price"]]
-            ppsqm_values = [t["price_per_sqm"] for t in appraisal_data["comparable_transactions"] if t["price_per_sqm"]]
-            
-            if prices:
-                appraisal_data["market_analysis"] = {
-                    "avg_price": sum(prices) / len(prices),
-                    "min_price": min(prices),
-                    "max_price": max(prices),
-                    "median_price": sorted(prices)[len(prices) // 2],
-                    "transaction_count": len(prices)
-                }
-            
-            if ppsqm_values:
-                appraisal_data["market_analysis"]["avg_price_per_sqm"] = sum(ppsqm_values) / len(ppsqm_values)
-                appraisal_data["market_analysis"]["min_price_per_sqm"] = min(ppsqm_values)
-                appraisal_data["market_analysis"]["max_price_per_sqm"] = max(ppsqm_values)
+        appraisal_data["comparable_transactions"].extend(comps["comparables"])
+        if comps["stats"]["transaction_count"]:
+            appraisal_data["market_analysis"] = dict(comps["stats"])
+        appraisal_data["market_analysis"]["comps_query"] = comps["query"]
         
         # Get additional data from asset metadata (collected by data pipeline)
         if asset.meta:
@@ -1668,9 +1703,7 @@ def asset_appraisal(request, asset_id):
         # Set primary appraisal (most recent decisive or RAMI)
         all_appraisals = appraisal_data["decisive_appraisals"] + appraisal_data["rami_appraisals"]
         if all_appraisals:
-            # Sort by date and take the most recent
-            sorted_appraisals = sorted(all_appraisals, key=lambda x: x.get("date", ""), reverse=True)
-            appraisal_data["appraisal"] = sorted_appraisals[0]
+            appraisal_data["appraisal"] = max(all_appraisals, key=lambda x: x.get("date") or "")
         
         return JsonResponse(appraisal_data)
 
@@ -1841,8 +1874,7 @@ def asset_share_message(request, asset_id):
     }
     language = supported.get(language_code, "Hebrew")
 
-    srcs = SourceRecord.objects.filter(asset_id=asset.id).order_by("-fetched_at")
-    listing = build_listing(asset, srcs)
+    listing = get_listing(asset)
     logger.info(
         "Generating marketing message for asset %s in %s",
         asset_id,
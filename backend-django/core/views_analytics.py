@@ -9,7 +9,10 @@ import json
 
 from .permissions import IsAdmin
 from .models import AnalyticsDaily, AnalyticsEvent
-from .analytics import track, track_page_view, track_session_end
+from .analytics import record_page_views, track, track_session_end
+
+# Largest number of page views accepted in one analytics_page_view request
+PAGE_VIEW_BATCH_MAX = 200
 
 
 @api_view(["GET"])
@@ -90,21 +93,27 @@ def analytics_track(request):
 @permission_classes([AllowAny])
 @csrf_exempt
 def analytics_page_view(request):
-    """Track page views from frontend."""
+    """Track page views from frontend.
+
+    Accepts a single page view object or a JSON array of them, so the
+    frontend can send views in batches.
+    """
     try:
         data = json.loads(request.body)
-        
-        track_page_view(
-            session_id=data.get("session_id"),
-            page_path=data.get("page_path"),
+        views = data if isinstance(data, list) else [data]
+        if len(views) > PAGE_VIEW_BATCH_MAX:
+            return Response(
+                {"error": f"At most {PAGE_VIEW_BATCH_MAX} page views per request"}, status=400
+            )
+        if not all(isinstance(view, dict) for view in views):
+            return Response({"error": "Page views must be JSON objects"}, status=400)
+
+        recorded = record_page_views(
+            views,
             user=request.user if request.user.is_authenticated else None,
-            page_title=data.get("page_title", ""),
-            load_time=data.get("load_time", 0.0),
-            duration=data.get("duration", 0.0),
-            meta=data.get("meta", {}),
         )
-        
-        return Response({"status": "success"})
+
+        return Response({"status": "success", "recorded": recorded})
     except Exception as e:
         return Response({"error": str(e)}, status=400)
 
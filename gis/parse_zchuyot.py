@@ -20,7 +20,7 @@ import json
 import os
 import re
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import IO, Any, Dict, List, Optional, Union
 
 import pdfplumber
 from bs4 import BeautifulSoup
@@ -52,7 +52,8 @@ def try_date(s: str) -> Optional[str]:
         return None
 
 
-def extract_text(pdf_path: str) -> str:
+def extract_text(pdf_path: Union[str, IO[bytes]]) -> str:
+    """Text of a PDF given as a path or binary file object, OCR'd if it has none."""
     txt_pages = []
     with pdfplumber.open(pdf_path) as pdf:
         for p in pdf.pages:
@@ -1,14 +1,61 @@
 from __future__ import annotations
 
 import json
+import logging
+import math
+import os
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass
+from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from .constants import DEFAULT_TIMEOUT
 
+logger = logging.getLogger(__name__)
+
+# The search API returns a fixed page of 10 decisions per ``skip`` offset
+PAGE_SIZE = 10
+DEFAULT_MAX_WORKERS = int(os.getenv("DECISIVE_MAX_WORKERS", "4"))
+# Concurrent requests allowed per API host, shared by all clients in the process
+MAX_CONCURRENCY_PER_HOST = int(os.getenv("DECISIVE_MAX_CONCURRENCY_PER_HOST", "4"))
+DEFAULT_MAX_RETRIES = int(os.getenv("DECISIVE_MAX_RETRIES", "3"))
+# Upper bound on a single Retry-After wait, in seconds
+MAX_RETRY_AFTER = float(os.getenv("DECISIVE_MAX_RETRY_AFTER", "30"))
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+_host_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+_host_semaphores_lock = threading.Lock()
+
+
+def _host_semaphore(url: str) -> threading.BoundedSemaphore:
+    """Return the process-wide concurrency limiter for the host of ``url``."""
+    host = urlparse(url).netloc
+    with _host_semaphores_lock:
+        if host not in _host_semaphores:
+            _host_semaphores[host] = threading.BoundedSemaphore(MAX_CONCURRENCY_PER_HOST)
+        return _host_semaphores[host]
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
 
 @dataclass
 class DecisiveAppraisal:
@@ -128,8 +175,20 @@ class DecisiveAppraisalClient:
     def __init__(
         self, 
         parser: Optional[DecisiveAppraisalParser] = None,
-        timeout: float = DEFAULT_TIMEOUT
+        timeout: float = DEFAULT_TIMEOUT,
+        session: Optional[requests.Session] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_retries: int = DEFAULT_MAX_RETRIES,
     ):
+        """Initialize the client.
+
+        Args:
+            parser: Parser for API responses
+            timeout: Request timeout in seconds
+            session: HTTP session to reuse (a pooled session is created by default)
+            max_workers: Pages fetched concurrently after the first one
+            max_retries: Retries per page on 429/5xx responses and connection errors
+        """
         self.api_endpoint = (
             "https://pub-justice.openapi.gov.il/pub/moj/portal/rest/searchpredefinedapi/v1/"
             "SearchPredefinedApi/DecisiveAppraiser/SearchDecisions"
@@ -145,71 +204,124 @@ class DecisiveAppraisalClient:
         }
         self.parser = parser or APIDecisiveAppraisalParser()
         self.timeout = timeout
+        self.max_workers = max(1, max_workers)
+        self.max_retries = max(0, max_retries)
+        self.session = session or self._create_session(self.max_workers)
+
+    @staticmethod
+    def _create_session(pool_size: int) -> requests.Session:
+        """Create a session whose connection pool fits the concurrent workers."""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(pool_size, MAX_CONCURRENCY_PER_HOST))
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
     
     def fetch_appraisals(
         self, 
         block: str = "", 
         plot: str = "", 
-        max_pages: int = 1
+        max_pages: Optional[int] = 1
     ) -> List[DecisiveAppraisal]:
         """
         Fetch decisive appraisal decisions from the gov.il API.
+
+        The first page reports the total number of decisions; the remaining
+        pages are then fetched concurrently and returned in page order.
         
         Args:
             block: Block number to search for
             plot: Plot number to search for  
-            max_pages: Maximum number of pages to fetch (each page has 10 results)
+            max_pages: Maximum number of pages to fetch (each page has 10 results);
+                None fetches every page
             
         Returns:
             List of DecisiveAppraisal objects
         """
-        all_appraisals: List[DecisiveAppraisal] = []
-        
-        for page in range(max_pages):
-            # Calculate skip value (10 results per page)
-            skip = page * 10
-            
-            # Prepare request body
-            request_body = {
-                "skip": skip,
-                "Block": block,
-                "Plot": plot
-            }
-            
-            try:
-                # Make API request
-                response = requests.post(
-                    self.api_endpoint,
-                    headers=self.headers,
-                    json=request_body,
-                    timeout=self.timeout
-                )
-                response.raise_for_status()
-                
-                # Parse response
-                response_data = response.json()
-                appraisals = self.parser.parse(response_data)
-                
-                # If no appraisals returned, break the loop
-                if not appraisals:
-                    break
-                    
-                all_appraisals.extend(appraisals)
-                
-                # Check if we've reached the total results
-                total_results = response_data.get("TotalResults", 0)
-                if len(all_appraisals) >= total_results:
-                    break
-                    
-            except requests.exceptions.RequestException as e:
-                print(f"Error fetching decisive appraisals: {e}")
-                break
-            except json.JSONDecodeError as e:
-                print(f"Error parsing API response: {e}")
+        first = self._fetch_page(block, plot, 0)
+        if first is None:
+            return []
+        all_appraisals, total_results = first
+        if not all_appraisals:
+            return []
+
+        pages = math.ceil(total_results / PAGE_SIZE) if total_results else 1
+        if max_pages is not None:
+            pages = min(pages, max_pages)
+        if pages <= 1:
+            return all_appraisals
+
+        skips = [page * PAGE_SIZE for page in range(1, pages)]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(skips))) as executor:
+            results = list(executor.map(lambda skip: self._fetch_page(block, plot, skip), skips))
+
+        for result in results:
+            # Keep the result a contiguous prefix: stop at the first failed or empty page
+            if result is None or not result[0]:
                 break
+            all_appraisals.extend(result[0])
         
         return all_appraisals
 
+    def _fetch_page(self, block: str, plot: str, skip: int) -> Optional[Tuple[List[DecisiveAppraisal], int]]:
+        """Fetch and parse the page at ``skip``.
+
+        Returns:
+            Tuple of (appraisals, total results), or None if the request failed
+        """
+        request_body = {
+            "skip": skip,
+            "Block": block,
+            "Plot": plot
+        }
+        try:
+            response = self._post(request_body)
+            response.raise_for_status()
+            response_data = response.json()
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Error fetching decisive appraisals (skip={skip}): {e}")
+            return None
+        except json.JSONDecodeError as e:
+            logger.error(f"Error parsing API response (skip={skip}): {e}")
+            return None
+
+        try:
+            total_results = int(response_data.get("TotalResults") or 0)
+        except (TypeError, ValueError):
+            total_results = 0
+        return self.parser.parse(response_data), total_results
+
+    def _post(self, request_body: Dict[str, Any]) -> requests.Response:
+        """POST to the search API, retrying 429/5xx responses and connection errors.
+
+        Waits for ``Retry-After`` when the server sends it and backs off
+        exponentially otherwise.
+        """
+        semaphore = _host_semaphore(self.api_endpoint)
+        attempt = 0
+        while True:
+            delay: Optional[float] = None
+            with semaphore:
+                try:
+                    response = self.session.post(
+                        self.api_endpoint,
+                        headers=self.headers,
+                        json=request_body,
+                        timeout=self.timeout
+                    )
+                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                    if attempt >= self.max_retries:
+                        raise
+                else:
+                    if response.status_code not in RETRY_STATUSES or attempt >= self.max_retries:
+                        return response
+                    delay = _retry_after_seconds(response.headers.get("Retry-After"))
+            if delay is None:
+                delay = 0.5 * (2 ** attempt)
+            attempt += 1
+            logger.debug(f"Retrying decisive appraisal request in {delay:.1f}s (attempt {attempt})")
+            time.sleep(min(delay, MAX_RETRY_AFTER))
+
 
 
 
@@ -0,0 +1,398 @@
+# -*- coding: utf-8 -*-
+"""
+gov/decisive_index.py
+---------------------
+
+Local index of decisive-appraisal decision PDFs.
+
+:class:`DecisiveIngestor` downloads the PDFs referenced by
+:class:`~gov.decisive.DecisiveAppraisal` objects concurrently, de-duplicates
+them by SHA-256, extracts their text with
+:func:`gis.parse_zchuyot.extract_text` and parses the key numeric fields
+(appraised value, value per sqm, betterment levy and coefficients).  The
+results go into a SQLite table indexed by block/parcel/date, so comps
+queries never re-open a document.  Ingestion runs as its own job per block
+(``manage.py ingest_decisive`` or the ``ingest_decisive_block`` task), which
+the government collector queues when ``DECISIVE_INDEX_INGEST`` is "true":
+
+::
+
+    ingest_block("6638")
+    rows = get_decisive_index().query(block="6638", since="2020-01-01")
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from gis.parse_zchuyot import extract_text
+
+from .constants import DEFAULT_TIMEOUT, USER_AGENT
+from .decisive import DecisiveAppraisal, DecisiveAppraisalClient
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = os.getenv(
+    "DECISIVE_INDEX_DB",
+    os.path.join(os.path.expanduser("~"), ".cache", "gov", "decisive.sqlite3"),
+)
+DEFAULT_MAX_WORKERS = int(os.getenv("DECISIVE_DOWNLOAD_WORKERS", "4"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    sha256 TEXT PRIMARY KEY,
+    text TEXT NOT NULL,
+    fields TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS decisions (
+    pdf_url TEXT PRIMARY KEY,
+    sha256 TEXT NOT NULL REFERENCES documents (sha256),
+    block TEXT NOT NULL,
+    plot TEXT NOT NULL,
+    decision_date TEXT NOT NULL,
+    title TEXT,
+    appraiser TEXT,
+    committee TEXT,
+    appraisal_type TEXT,
+    appraised_value REAL,
+    value_per_sqm REAL,
+    levy_amount REAL
+);
+CREATE INDEX IF NOT EXISTS decisions_by_parcel ON decisions (block, plot, decision_date);
+CREATE INDEX IF NOT EXISTS decisions_by_date ON decisions (decision_date);
+"""
+
+_BIDI_MARKS = re.compile("[‎‏‪-‮]")
+_WS = re.compile(r"[ \t]+")
+_AMOUNT = r"(\d{1,3}(?:,\d{3})+(?:\.\d+)?|\d{4,}(?:\.\d+)?)"
+_SMALL_AMOUNT = r"(\d{1,3}(?:,\d{3})+(?:\.\d+)?|\d{3,}(?:\.\d+)?)"
+_SHEKEL = r"(?:₪|ש[\"״]ח|שקלים|שקל|NIS)"
+_PER_SQM = r"\s*(?:ל-?|/)\s*מ[\"״]?ר"
+
+_VALUE_PATTERNS = [
+    re.compile(r"שווי[^\n\d]{0,40}?" + _AMOUNT + r"\s*" + _SHEKEL + r"(?!" + _PER_SQM + ")"),
+    re.compile(r"שווי[^\n\d]{0,40}?" + _SHEKEL + r"\s*" + _AMOUNT + r"(?!" + _PER_SQM + ")"),
+]
+_PER_SQM_PATTERNS = [
+    re.compile(_SMALL_AMOUNT + r"\s*" + _SHEKEL + r"?" + _PER_SQM),
+]
+_LEVY_PATTERNS = [
+    re.compile(r"היטל\s+ה?השבחה[^\n\d]{0,40}?" + _AMOUNT),
+]
+_COEFFICIENT = re.compile(r"מקדם\s+([^\d\n:=]{2,30}?)\s*[:=]?\s*(0?\.\d+|1(?:\.0+)?)\b")
+
+
+def _normalize_text(text: str) -> str:
+    text = _BIDI_MARKS.sub("", text or "")
+    return "\n".join(_WS.sub(" ", line).strip() for line in text.splitlines())
+
+
+def _to_number(value: str) -> Optional[float]:
+    try:
+        return float(value.replace(",", ""))
+    except (AttributeError, ValueError):
+        return None
+
+
+def _first_amount(patterns: List[re.Pattern], text: str) -> Optional[float]:
+    for pattern in patterns:
+        match = pattern.search(text)
+        if match:
+            return _to_number(match.group(1))
+    return None
+
+
+def parse_decision_fields(text: str) -> Dict[str, Any]:
+    """Parse the key numeric fields out of a decision's text.
+
+    Returns:
+        Dictionary with ``appraised_value``, ``value_per_sqm``, ``levy_amount``
+        (None when not found) and ``coefficients`` (name -> factor)
+    """
+    text = _normalize_text(text)
+    coefficients: Dict[str, float] = {}
+    for name, factor in _COEFFICIENT.findall(text):
+        coefficients.setdefault(name.strip(), float(factor))
+    return {
+        "appraised_value": _first_amount(_VALUE_PATTERNS, text),
+        "value_per_sqm": _first_amount(_PER_SQM_PATTERNS, text),
+        "levy_amount": _first_amount(_LEVY_PATTERNS, text),
+        "coefficients": coefficients,
+    }
+
+
+def _iso_date(date: str) -> str:
+    """Convert the client's ``DD.MM.YYYY`` dates to ``YYYY-MM-DD``."""
+    parts = (date or "").split(".")
+    if len(parts) == 3 and all(p.isdigit() for p in parts):
+        day, month, year = parts
+        return f"{int(year):04d}-{int(month):02d}-{int(day):02d}"
+    return date or ""
+
+
+class DecisiveIndex:
+    """SQLite index of decision documents and their parsed fields."""
+
+    def __init__(self, path: str = DEFAULT_DB_PATH) -> None:
+        """Initialize the index.
+
+        Args:
+            path: SQLite database file (``":memory:"`` for a transient index)
+        """
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.RLock()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+    def has_url(self, pdf_url: str) -> bool:
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM decisions WHERE pdf_url = ?", (pdf_url,)).fetchone()
+        return row is not None
+
+    def get_document(self, sha256: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Return the (text, fields) of a stored document, if any."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT text, fields FROM documents WHERE sha256 = ?", (sha256,)
+            ).fetchone()
+        return (row[0], json.loads(row[1])) if row else None
+
+    def query(
+        self,
+        block: Optional[str] = None,
+        plot: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return indexed decisions, newest first.
+
+        Args:
+            block: Block number
+            plot: Plot (parcel) number
+            since: Earliest decision date (``YYYY-MM-DD``, inclusive)
+            until: Latest decision date (``YYYY-MM-DD``, inclusive)
+            limit: Maximum number of rows
+        """
+        clauses, params = [], []
+        for column, value in (("block", block), ("plot", plot)):
+            if value:
+                clauses.append(f"d.{column} = ?")
+                params.append(str(value))
+        if since:
+            clauses.append("d.decision_date >= ?")
+            params.append(since)
+        if until:
+            clauses.append("d.decision_date <= ?")
+            params.append(until)
+        sql = (
+            "SELECT d.pdf_url, d.sha256, d.block, d.plot, d.decision_date, d.title, d.appraiser, "
+            "d.committee, d.appraisal_type, d.appraised_value, d.value_per_sqm, d.levy_amount, doc.fields "
+            "FROM decisions d JOIN documents doc ON doc.sha256 = d.sha256"
+        )
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY d.decision_date DESC"
+        if limit is not None and limit > 0:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        columns = (
+            "pdf_url", "sha256", "block", "plot", "decision_date", "title", "appraiser",
+            "committee", "appraisal_type", "appraised_value", "value_per_sqm", "levy_amount",
+        )
+        results = []
+        for row in rows:
+            record = dict(zip(columns, row[:-1]))
+            record["coefficients"] = json.loads(row[-1]).get("coefficients", {})
+            results.append(record)
+        return results
+
+    def search_text(self, term: str, limit: int = 20) -> List[str]:
+        """Return URLs of decisions whose text contains ``term``."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT d.pdf_url FROM decisions d JOIN documents doc ON doc.sha256 = d.sha256 "
+                "WHERE instr(doc.text, ?) > 0 ORDER BY d.decision_date DESC LIMIT ?",
+                (term, int(limit)),
+            ).fetchall()
+        return [url for (url,) in rows]
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+    def add_document(self, sha256: str, text: str, fields: Dict[str, Any]) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO documents (sha256, text, fields) VALUES (?, ?, ?)",
+                (sha256, text, json.dumps(fields, ensure_ascii=False)),
+            )
+
+    def add_decision(self, appraisal: DecisiveAppraisal, pdf_url: str, sha256: str, fields: Dict[str, Any]) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO decisions (pdf_url, sha256, block, plot, decision_date, title, "
+                "appraiser, committee, appraisal_type, appraised_value, value_per_sqm, levy_amount) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    pdf_url,
+                    sha256,
+                    str(appraisal.block or ""),
+                    str(appraisal.plot or ""),
+                    _iso_date(appraisal.date),
+                    appraisal.title,
+                    appraisal.appraiser,
+                    appraisal.committee,
+                    appraisal.appraisal_type,
+                    fields.get("appraised_value"),
+                    fields.get("value_per_sqm"),
+                    fields.get("levy_amount"),
+                ),
+            )
+
+
+class DecisiveIngestor:
+    """Download, de-duplicate, parse and index decision PDFs."""
+
+    def __init__(
+        self,
+        index: DecisiveIndex,
+        session: Optional[requests.Session] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> None:
+        """Initialize the ingestor.
+
+        Args:
+            index: Index to write to
+            session: HTTP session for downloads (a pooled session is created by default)
+            max_workers: Concurrent downloads
+            timeout: Download timeout in seconds
+        """
+        self.index = index
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_maxsize=self.max_workers)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers["User-Agent"] = USER_AGENT
+        self.session = session
+        # Serializes parsing per content hash so duplicates are parsed once
+        self._hash_locks: Dict[str, threading.Lock] = {}
+        self._hash_locks_lock = threading.Lock()
+
+    def ingest(self, appraisals: Iterable[DecisiveAppraisal], refresh: bool = False) -> int:
+        """Index every PDF of the given decisions.
+
+        Args:
+            appraisals: Decisions whose PDFs should be indexed
+            refresh: Re-download PDFs that are already indexed
+
+        Returns:
+            Number of decisions (PDF URLs) newly indexed
+        """
+        jobs: List[Tuple[DecisiveAppraisal, str]] = []
+        seen = set()
+        for appraisal in appraisals:
+            for url in appraisal.get_pdf_urls():
+                if url in seen or (not refresh and self.index.has_url(url)):
+                    continue
+                seen.add(url)
+                jobs.append((appraisal, url))
+        if not jobs:
+            return 0
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(jobs))) as executor:
+            results = list(executor.map(lambda job: self._ingest_one(*job), jobs))
+        indexed = sum(results)
+        logger.info(f"Indexed {indexed} of {len(jobs)} decisive appraisal PDFs")
+        return indexed
+
+    def _ingest_one(self, appraisal: DecisiveAppraisal, url: str) -> bool:
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Failed to download decisive appraisal PDF {url}: {e}")
+            return False
+
+        sha256 = hashlib.sha256(response.content).hexdigest()
+        with self._hash_locks_lock:
+            hash_lock = self._hash_locks.setdefault(sha256, threading.Lock())
+        with hash_lock:
+            document = self.index.get_document(sha256)
+            if document is None:
+                try:
+                    text = extract_text(io.BytesIO(response.content))
+                except Exception as e:
+                    logger.error(f"Failed to extract text from {url}: {e}")
+                    return False
+                fields = parse_decision_fields(text)
+                self.index.add_document(sha256, text, fields)
+            else:
+                fields = document[1]
+        self.index.add_decision(appraisal, url, sha256, fields)
+        return True
+
+
+_shared_index: Optional[DecisiveIndex] = None
+_shared_index_lock = threading.Lock()
+
+
+def get_decisive_index() -> DecisiveIndex:
+    """Return the process-wide decisive appraisal index."""
+    global _shared_index
+    with _shared_index_lock:
+        if _shared_index is None:
+            _shared_index = DecisiveIndex()
+        return _shared_index
+
+
+def ingest_on_collect() -> bool:
+    """Whether the government collector should queue ingestion of the blocks it sees."""
+    return os.getenv("DECISIVE_INDEX_INGEST", "false").lower() == "true"
+
+
+def ingest_block(
+    block: str,
+    client: Optional[DecisiveAppraisalClient] = None,
+    ingestor: Optional[DecisiveIngestor] = None,
+) -> int:
+    """Index the PDFs of every decision listed for a block.
+
+    Args:
+        block: Block number
+        client: Client listing the decisions
+        ingestor: Ingestor writing to the index (the shared index by default)
+
+    Returns:
+        Number of decisions (PDF URLs) newly indexed
+    """
+    client = client or DecisiveAppraisalClient(timeout=120.0)
+    ingestor = ingestor or DecisiveIngestor(get_decisive_index())
+    appraisals = client.fetch_appraisals(block=block, max_pages=None)
+    return ingestor.ingest(appraisals)
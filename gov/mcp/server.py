@@ -1,24 +1,145 @@
 # server.py
 import asyncio
-from typing import Any, Dict, List, Optional
+import json
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
 
+import requests
 from fastmcp import Context, FastMCP
+from requests.adapters import HTTPAdapter
 
 from ..decisive import DecisiveAppraisalClient
 from ..nadlan import NadlanDealsScraper
+from ..nadlan.deals_store import get_deals_store
 from ..rami.rami_client import RamiClient
 
+T = TypeVar("T")
+
+# Seconds a tool result is reused for identical arguments (0 disables caching)
+TOOL_CACHE_TTL = float(os.getenv("GOV_MCP_CACHE_TTL", "300"))
+TOOL_CACHE_MAX_ENTRIES = int(os.getenv("GOV_MCP_CACHE_MAX_ENTRIES", "256"))
+# Blocking calls in flight per upstream service, shared by every connected agent
+UPSTREAM_CONCURRENCY = {
+    "decisive": int(os.getenv("GOV_MCP_DECISIVE_CONCURRENCY", "2")),
+    "nadlan": int(os.getenv("GOV_MCP_NADLAN_CONCURRENCY", "2")),
+    "rami": int(os.getenv("GOV_MCP_RAMI_CONCURRENCY", "4")),
+}
+
 # Create an MCP server
 mcp = FastMCP("DataGovIL", dependencies=["requests", "pandas"])
 
-# Persistent RAMI client for this server process
-_rami_client: Optional[RamiClient] = None
+
+class ToolCache:
+    """LRU of tool results keyed by tool name and arguments, with a fixed TTL."""
+
+    def __init__(self, ttl: float = TOOL_CACHE_TTL, max_entries: int = TOOL_CACHE_MAX_ENTRIES) -> None:
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(tool: str, **arguments: Any) -> str:
+        return json.dumps([tool, arguments], sort_keys=True, ensure_ascii=False, default=str)
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Return ``(hit, value)`` for ``key``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+            return True, entry[1]
+
+    def set(self, key: str, value: Any) -> None:
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared state for this server process: one client per upstream, one result
+# cache and one concurrency limiter per upstream
+_tool_cache = ToolCache()
+_clients: Dict[str, Any] = {}
+_clients_lock = threading.Lock()
+_upstream_limits: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _pooled_session(pool_size: int) -> requests.Session:
+    """Create a session whose connection pool fits the upstream's concurrency limit."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, pool_size))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _shared_client(name: str, factory: Callable[[], T]) -> T:
+    with _clients_lock:
+        if name not in _clients:
+            _clients[name] = factory()
+        return _clients[name]
+
+
+def _get_decisive_client() -> DecisiveAppraisalClient:
+    return _shared_client("decisive", DecisiveAppraisalClient)
+
+
+def _get_nadlan_scraper() -> NadlanDealsScraper:
+    return _shared_client(
+        "nadlan",
+        lambda: NadlanDealsScraper(session=_pooled_session(UPSTREAM_CONCURRENCY["nadlan"])),
+    )
+
 
 def _get_rami_client() -> RamiClient:
-    global _rami_client
-    if _rami_client is None:
-        _rami_client = RamiClient()
-    return _rami_client
+    return _shared_client(
+        "rami",
+        lambda: RamiClient(session=_pooled_session(UPSTREAM_CONCURRENCY["rami"] * 2)),
+    )
+
+
+def _upstream_limit(upstream: str) -> asyncio.Semaphore:
+    """Return the semaphore bounding calls to ``upstream`` on the running loop."""
+    limits = _upstream_limits.setdefault(asyncio.get_running_loop(), {})
+    semaphore = limits.get(upstream)
+    if semaphore is None:
+        semaphore = limits[upstream] = asyncio.Semaphore(max(1, UPSTREAM_CONCURRENCY[upstream]))
+    return semaphore
+
+
+async def _run_blocking(upstream: str, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking client call in a worker thread, within the upstream's concurrency limit."""
+    async with _upstream_limit(upstream):
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+
+async def _cached(key: str, compute: Callable[[], Awaitable[T]], refresh: bool = False) -> T:
+    """Return the cached result for ``key`` or compute and cache it (errors are not cached)."""
+    if not refresh:
+        hit, value = _tool_cache.get(key)
+        if hit:
+            return value
+    value = await compute()
+    _tool_cache.set(key, value)
+    return value
 
 
 @mcp.tool()
@@ -28,7 +149,11 @@ async def decisive_appraisal(ctx: Context, block: str = "", plot: str = "", max_
         await ctx.info("Fetching decisive appraisal decisions...")
     except Exception:
         pass
-    return DecisiveAppraisalClient().fetch_appraisals(block, plot, max_pages=max_pages)
+    client = _get_decisive_client()
+    return await _cached(
+        ToolCache.key("decisive_appraisal", block=block, plot=plot, max_pages=max_pages),
+        lambda: _run_blocking("decisive", client.fetch_appraisals, block, plot, max_pages=max_pages),
+    )
 
 
 @mcp.tool()
@@ -37,10 +162,13 @@ async def fetch_nadlan_transactions(
     address: Optional[str] = None,
     neighborhood_id: Optional[str] = None,
     limit: int = 20,
+    refresh: bool = False,
 ) -> Dict[str, Any]:
     """Fetch real estate transactions from nadlan.gov.il.
 
     This tool can fetch transactions by address (using autocomplete) or directly by neighborhood ID.
+    Deals are served from the local neighborhood deals store, which is refreshed
+    incrementally once it is older than a day (or when ``refresh`` is set).
     
     Examples:
         
@@ -60,6 +188,7 @@ async def fetch_nadlan_transactions(
         address: Free-text address or neighborhood name (will use autocomplete to find neighborhood ID)
         neighborhood_id: Numeric neighborhood ID from nadlan.gov.il (use this if you know the ID)
         limit: Maximum number of deals to return (default: 20)
+        refresh: Force an incremental refresh of the neighborhood's deals
         
     Returns:
         Dict with transaction data
@@ -70,47 +199,55 @@ async def fetch_nadlan_transactions(
     await ctx.info("Fetching nadlan transactions...")
     
     try:
-        scraper = NadlanDealsScraper()
+        scraper = _get_nadlan_scraper()
+        store = get_deals_store()
+        max_deals = limit if limit > 0 else None
         
         if address:
             # Use address search (automatically finds neighborhood ID)
             await ctx.info(f"Searching for address: {address}")
-            deals = await asyncio.to_thread(scraper.get_deals_by_address, address)
-            
-            # Apply limit
-            if limit > 0:
-                deals = deals[:limit]
-            
-            deals_data = [deal.to_dict() for deal in deals]
-            await ctx.info(f"Successfully found {len(deals)} deals for address: {address}")
-            
-            return {
-                "query_type": "address",
-                "address": address,
-                "deals_count": len(deals),
-                "deals": deals_data,
-                "source": "nadlan.gov.il"
-            }
+
+            async def by_address() -> Dict[str, Any]:
+                resolved_id = await _run_blocking("nadlan", scraper.resolve_neighborhood_id, address)
+                deals = await _run_blocking("nadlan", store.sync, resolved_id, scraper, max_deals, refresh)
+                return {
+                    "query_type": "address",
+                    "address": address,
+                    "neighborhood_id": resolved_id,
+                    "deals_count": len(deals),
+                    "deals": [deal.to_dict() for deal in deals],
+                    "source": "nadlan.gov.il"
+                }
+
+            result = await _cached(
+                ToolCache.key("fetch_nadlan_transactions", address=address, limit=limit),
+                by_address,
+                refresh=refresh,
+            )
+            await ctx.info(f"Successfully found {result['deals_count']} deals for address: {address}")
+            return result
             
         elif neighborhood_id:
             # Use neighborhood ID directly
             await ctx.info(f"Fetching deals for neighborhood ID: {neighborhood_id}")
-            deals = await asyncio.to_thread(scraper.get_deals_by_neighborhood_id, neighborhood_id)
-            
-            # Apply limit
-            if limit > 0:
-                deals = deals[:limit]
-            
-            deals_data = [deal.to_dict() for deal in deals]
-            await ctx.info(f"Successfully found {len(deals)} deals for neighborhood ID: {neighborhood_id}")
-            
-            return {
-                "query_type": "neighborhood",
-                "neighborhood_id": neighborhood_id,
-                "deals_count": len(deals),
-                "deals": deals_data,
-                "source": "nadlan.gov.il"
-            }
+
+            async def by_neighborhood() -> Dict[str, Any]:
+                deals = await _run_blocking("nadlan", store.sync, neighborhood_id, scraper, max_deals, refresh)
+                return {
+                    "query_type": "neighborhood",
+                    "neighborhood_id": neighborhood_id,
+                    "deals_count": len(deals),
+                    "deals": [deal.to_dict() for deal in deals],
+                    "source": "nadlan.gov.il"
+                }
+
+            result = await _cached(
+                ToolCache.key("fetch_nadlan_transactions", neighborhood_id=neighborhood_id, limit=limit),
+                by_neighborhood,
+                refresh=refresh,
+            )
+            await ctx.info(f"Successfully found {result['deals_count']} deals for neighborhood ID: {neighborhood_id}")
+            return result
             
         else:
             raise ValueError("Either 'address' or 'neighborhood_id' must be provided")
@@ -169,8 +306,10 @@ async def search_rami_plans(
     await ctx.info(f"Searching RAMI plans with parameters: {search_params}")
     
     try:
-        df = client.fetch_plans(search_params)
-        plans = df.to_dict('records')
+        plans = await _cached(
+            ToolCache.key("search_rami_plans", **search_params),
+            lambda: _run_blocking("rami", client.fetch_plans_records, search_params),
+        )
         
         await ctx.info(f"Found {len(plans)} plans")
         
@@ -190,6 +329,16 @@ async def search_rami_plans(
         }
 
 
+async def _find_rami_plan(client: RamiClient, plan_id: int, plan_number: str) -> Optional[Dict[str, Any]]:
+    """Look up the plan record (with its ``documentsSet``) that the download needs."""
+    search_params = {"planNumber": plan_number}
+    plans = await _cached(
+        ToolCache.key("search_rami_plans", **search_params),
+        lambda: _run_blocking("rami", client.fetch_plans_records, search_params),
+    )
+    return next((plan for plan in plans if str(plan.get("planId")) == str(plan_id)), None)
+
+
 @mcp.tool()
 async def download_rami_plan_documents(
     ctx: Context,
@@ -217,13 +366,24 @@ async def download_rami_plan_documents(
     await ctx.info(f"Downloading documents for plan {plan_number} (ID: {plan_id})")
     
     try:
-        result = client.download_plan_documents(
-            plan_id=plan_id,
-            plan_number=plan_number,
+        plan = await _find_rami_plan(client, plan_id, plan_number)
+        if plan is None:
+            raise ValueError(f"Plan {plan_number} (ID: {plan_id}) was not found")
+        files = await _run_blocking(
+            "rami",
+            client.download_plan_documents,
+            plan,
             base_dir=base_dir,
             doc_types=doc_types,
-            overwrite=overwrite
+            overwrite=overwrite,
         )
+        result = {
+            "success": not files["failed"],
+            "plan_id": plan_id,
+            "plan_number": plan_number,
+            "downloaded": files["success"],
+            "failed": files["failed"],
+        }
         
         await ctx.info(f"Download completed: {result}")
         return result
@@ -10,7 +10,13 @@ High-level API:
 """
 
 from .models import Deal
-from .exceptions import NadlanAPIError, NadlanError, NadlanConfigError, NadlanDecodeError
+from .exceptions import (
+    NadlanAPIError,
+    NadlanAuthError,
+    NadlanConfigError,
+    NadlanDecodeError,
+    NadlanError,
+)
 
 # Import scraper only if selenium is available
 try:
@@ -24,6 +30,7 @@ except ImportError:
 __all__ = [
     "Deal",
     "NadlanAPIError", 
+    "NadlanAuthError",
     "NadlanError",
     "NadlanConfigError",
     "NadlanDecodeError",
@@ -0,0 +1,382 @@
+# -*- coding: utf-8 -*-
+"""
+nadlan/api_client.py
+--------------------
+
+Direct-HTTP access to the nadlan.gov.il deals API.
+
+The website talks to a JSON deals endpoint whose address, headers and
+request body are only discoverable from inside a browser session.  The
+scraper therefore drives a browser once to *bootstrap*: it captures the
+``/api/deal`` request the page makes and stores it as an :class:`ApiBootstrap`.
+Until the bootstrap expires, deals are fetched by replaying that request over
+a pooled :class:`requests.Session`, paging concurrently.  When the API starts
+rejecting the captured credentials (HTTP 401/403) a :class:`NadlanAuthError`
+is raised so the caller can refresh the bootstrap through the browser.
+
+Responses come either as plain JSON or as base64+gzip text (optionally
+wrapped in an API Gateway ``{"body": "..."}`` envelope); both are handled by
+:func:`decode_payload`.
+"""
+
+from __future__ import annotations
+
+import base64
+import copy
+import gzip
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .exceptions import NadlanAPIError, NadlanAuthError, NadlanDecodeError
+from .models import Deal
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BOOTSTRAP_TTL = float(os.getenv("NADLAN_BOOTSTRAP_TTL", "600"))
+DEFAULT_MAX_WORKERS = int(os.getenv("NADLAN_API_MAX_WORKERS", "4"))
+DEFAULT_MAX_PAGES = int(os.getenv("NADLAN_API_MAX_PAGES", "10"))
+
+# Body keys the website uses for the page number of a deals request
+PAGE_KEYS = ("fetch_number", "page", "pageNumber", "page_number")
+# Keys that may carry the total number of deals in a response
+TOTAL_KEYS = ("total_rows", "totalRows", "total", "total_count", "totalCount")
+# Request headers that must not be replayed verbatim
+_SKIP_HEADERS = {"host", "content-length", "connection", "accept-encoding", "cookie"}
+
+
+# ----------------------------------------------------------------------
+# Payload decoding
+# ----------------------------------------------------------------------
+def decode_base64_gzip(b64_text: str) -> Any:
+    """Decode base64+gzipped JSON."""
+    raw = base64.b64decode(b64_text)
+    return json.loads(gzip.decompress(raw).decode("utf-8"))
+
+
+def extract_items(obj: Any) -> Optional[Sequence[Dict[str, Any]]]:
+    """Extract the deal items from a decoded response."""
+    if not isinstance(obj, dict):
+        return None
+    # happy path: {"data":{"items":[...]}}
+    data = obj.get("data") if isinstance(obj.get("data"), dict) else obj
+    items = data.get("items") if isinstance(data, dict) else None
+    if isinstance(items, list):
+        return items
+    return None
+
+
+def extract_total(obj: Any) -> Optional[int]:
+    """Return the total number of deals advertised by a response, if any."""
+    for container in (obj.get("data") if isinstance(obj, dict) else None, obj):
+        if not isinstance(container, dict):
+            continue
+        for key in TOTAL_KEYS:
+            value = container.get(key)
+            if isinstance(value, (int, float)) or (isinstance(value, str) and value.isdigit()):
+                return int(value)
+    return None
+
+
+def decode_payload(body: bytes) -> Dict[str, Any]:
+    """Decode a deals response body into a JSON object containing ``items``.
+
+    Handles plain JSON, API Gateway envelopes and raw base64+gzip text.
+
+    Raises:
+        NadlanDecodeError: If the body is in none of the known formats
+    """
+    # 1) try plain JSON
+    try:
+        data = json.loads(body.decode("utf-8"))
+        if extract_items(data) is not None:
+            return data
+        # maybe {"body": "..."}
+        if isinstance(data, dict) and isinstance(data.get("body"), str):
+            decoded = decode_base64_gzip(data["body"])
+            if extract_items(decoded) is not None:
+                return decoded
+    except Exception:
+        # fallthrough to base64 decode
+        pass
+
+    # 2) try raw base64+gzip text
+    try:
+        txt = body.decode("utf-8").strip().strip('"')
+        if txt.startswith("H4sI"):
+            decoded = decode_base64_gzip(txt)
+            if extract_items(decoded) is not None:
+                return decoded
+    except Exception:
+        pass
+
+    raise NadlanDecodeError("Unrecognized /api/deal payload format")
+
+
+# ----------------------------------------------------------------------
+# Bootstrap
+# ----------------------------------------------------------------------
+@dataclass
+class ApiBootstrap:
+    """A captured deals request that can be replayed over plain HTTP."""
+
+    url: str
+    method: str
+    headers: Dict[str, str]
+    body: Dict[str, Any]
+    id_key: str
+    page_key: Optional[str] = None
+    cookies: Dict[str, str] = field(default_factory=dict)
+    captured_at: float = field(default_factory=time.monotonic)
+
+    @classmethod
+    def from_request(
+        cls,
+        url: str,
+        method: str,
+        headers: Dict[str, str],
+        post_data: Optional[str],
+        base_id: str,
+        cookies: Optional[Dict[str, str]] = None,
+    ) -> "ApiBootstrap":
+        """Build a bootstrap from a deals request observed in the browser.
+
+        Args:
+            url: Request URL
+            method: HTTP method
+            headers: Request headers as sent by the browser
+            post_data: Raw request body
+            base_id: The neighborhood ID the page was loaded for; used to find
+                the body key that has to be substituted on replay
+
+        Raises:
+            NadlanAPIError: If the request body cannot be parameterized
+        """
+        try:
+            body = json.loads(post_data or "")
+        except ValueError:
+            raise NadlanAPIError("Deals request body is not JSON; direct access unavailable")
+        if not isinstance(body, dict):
+            raise NadlanAPIError("Deals request body is not a JSON object")
+
+        id_key = next((k for k, v in body.items() if str(v) == str(base_id)), None)
+        if id_key is None:
+            raise NadlanAPIError("Could not locate the neighborhood ID in the deals request")
+        page_key = next((k for k in PAGE_KEYS if k in body), None)
+
+        replay_headers = {
+            k: v for k, v in headers.items()
+            if not k.startswith(":") and k.lower() not in _SKIP_HEADERS
+        }
+        return cls(
+            url=url,
+            method=method.upper(),
+            headers=replay_headers,
+            body=body,
+            id_key=id_key,
+            page_key=page_key,
+            cookies=dict(cookies or {}),
+        )
+
+    def is_fresh(self, ttl: float) -> bool:
+        return time.monotonic() - self.captured_at < ttl
+
+    def build_body(self, base_id: str, page: int = 1) -> Dict[str, Any]:
+        """Return the request body for ``base_id`` and ``page``."""
+        body = copy.deepcopy(self.body)
+        original = self.body[self.id_key]
+        body[self.id_key] = int(base_id) if isinstance(original, int) else str(base_id)
+        if self.page_key:
+            body[self.page_key] = page
+        return body
+
+
+class BootstrapCache:
+    """Process-wide holder of the current :class:`ApiBootstrap`."""
+
+    def __init__(self, ttl: float = DEFAULT_BOOTSTRAP_TTL) -> None:
+        self.ttl = ttl
+        self._bootstrap: Optional[ApiBootstrap] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> Optional[ApiBootstrap]:
+        with self._lock:
+            if self._bootstrap is not None and self._bootstrap.is_fresh(self.ttl):
+                return self._bootstrap
+            return None
+
+    def set(self, bootstrap: ApiBootstrap) -> None:
+        with self._lock:
+            self._bootstrap = bootstrap
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._bootstrap = None
+
+
+# ----------------------------------------------------------------------
+# HTTP client
+# ----------------------------------------------------------------------
+class NadlanApiClient:
+    """Replays bootstrapped deals requests over a pooled HTTP session."""
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_pages: int = DEFAULT_MAX_PAGES,
+        session: Optional[requests.Session] = None,
+    ) -> None:
+        """Initialize the client.
+
+        Args:
+            max_workers: Maximum number of pages fetched concurrently
+            max_pages: Maximum number of pages fetched per neighborhood
+            session: HTTP session to use (a pooled session is created if omitted)
+        """
+        self.max_workers = max(1, max_workers)
+        self.max_pages = max(1, max_pages)
+        self.http = session or requests.Session()
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=self.max_workers * 2)
+        self.http.mount("https://", adapter)
+        self.http.mount("http://", adapter)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="nadlan-api"
+                )
+            return self._executor
+
+    def fetch_page(
+        self, bootstrap: ApiBootstrap, base_id: str, page: int = 1, timeout: float = 30.0
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """Fetch one page of deals.
+
+        Returns:
+            Tuple of (raw deal items, advertised total or ``None``)
+
+        Raises:
+            NadlanAuthError: If the captured credentials were rejected
+            NadlanAPIError: For any other HTTP failure
+        """
+        body = bootstrap.build_body(base_id, page)
+        resp = self.http.request(
+            bootstrap.method,
+            bootstrap.url,
+            data=json.dumps(body),
+            headers=bootstrap.headers,
+            cookies=bootstrap.cookies,
+            timeout=timeout,
+        )
+        if resp.status_code in (401, 403):
+            raise NadlanAuthError(f"/api/deal HTTP {resp.status_code}")
+        if resp.status_code != 200:
+            raise NadlanAPIError(f"/api/deal HTTP {resp.status_code}")
+
+        data = decode_payload(resp.content)
+        return list(extract_items(data) or []), extract_total(data)
+
+    def fetch_deals(
+        self,
+        bootstrap: ApiBootstrap,
+        base_id: str,
+        timeout: float = 30.0,
+        first_page: Optional[Tuple[List[Dict[str, Any]], Optional[int]]] = None,
+        since: Optional[str] = None,
+    ) -> List[Deal]:
+        """Fetch deals for ``base_id``, paging concurrently.
+
+        When the response advertises a total, the remaining pages are fetched
+        concurrently; otherwise pages are fetched one by one until a short page.
+        With ``since`` only deals on or after that date are returned, and
+        paging stops at the first page reaching older deals (the API lists
+        deals newest first).
+
+        Args:
+            bootstrap: Captured deals request
+            base_id: Neighborhood ID
+            timeout: Per-request timeout in seconds
+            first_page: Already fetched first page (e.g. captured during bootstrap)
+            since: ISO date (``YYYY-MM-DD``) of the oldest deal to return
+
+        Returns:
+            Deals in page order
+        """
+        items, total = first_page or self.fetch_page(bootstrap, base_id, 1, timeout)
+        pages: List[List[Deal]] = [[Deal.from_item(item) for item in items]]
+        page_size = len(items)
+
+        if bootstrap.page_key and page_size:
+            if since is not None:
+                page = 1
+                while (
+                    len(pages[-1]) >= page_size
+                    and not _reaches_before(pages[-1], since)
+                    and page < self.max_pages
+                ):
+                    page += 1
+                    page_items, _ = self.fetch_page(bootstrap, base_id, page, timeout)
+                    if not page_items:
+                        break
+                    pages.append([Deal.from_item(item) for item in page_items])
+            elif total is not None:
+                last_page = min(self.max_pages, -(-total // page_size))
+                remaining = list(range(2, last_page + 1))
+                if remaining:
+                    results = self._pool().map(
+                        lambda p: self.fetch_page(bootstrap, base_id, p, timeout)[0],
+                        remaining,
+                    )
+                    pages.extend([Deal.from_item(item) for item in page_items] for page_items in results)
+            else:
+                page = 1
+                while len(pages[-1]) >= page_size and page < self.max_pages:
+                    page += 1
+                    page_items, _ = self.fetch_page(bootstrap, base_id, page, timeout)
+                    if not page_items:
+                        break
+                    pages.append([Deal.from_item(item) for item in page_items])
+
+        deals = [deal for page_deals in pages for deal in page_deals]
+        return filter_since(deals, since)
+
+
+def _reaches_before(deals: Sequence[Deal], since: str) -> bool:
+    return any((d.iso_date() or "") < since for d in deals if d.iso_date())
+
+
+def filter_since(deals: List[Deal], since: Optional[str]) -> List[Deal]:
+    """Keep deals dated on or after ``since``; deals without a date are dropped."""
+    if since is None:
+        return deals
+    return [d for d in deals if (d.iso_date() or "") >= since]
+
+
+_shared_client: Optional[NadlanApiClient] = None
+_shared_client_lock = threading.Lock()
+_shared_bootstrap = BootstrapCache()
+
+
+def get_api_client() -> NadlanApiClient:
+    """Return the process-wide deals API client."""
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None:
+            _shared_client = NadlanApiClient()
+        return _shared_client
+
+
+def get_bootstrap_cache() -> BootstrapCache:
+    """Return the process-wide bootstrap cache."""
+    return _shared_bootstrap
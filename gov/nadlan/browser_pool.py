@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+"""
+nadlan/browser_pool.py
+----------------------
+
+Long-lived Playwright browser shared by every :class:`NadlanDealsScraper`.
+
+Cold-starting Chromium dominates Nadlan latency, so instead of launching a
+browser per call the pool keeps one Chromium process alive on a dedicated
+event-loop thread.  Callers submit coroutines with :meth:`NadlanBrowserPool.run`
+and borrow pages with :meth:`NadlanBrowserPool.page`:
+
+::
+
+    pool = get_browser_pool()
+
+    async def title():
+        async with pool.page() as page:
+            await page.goto("https://www.nadlan.gov.il/")
+            return await page.title()
+
+    print(pool.run(title(), timeout=60))
+
+Each page gets its own browser context, so cookies never leak between calls.
+The number of concurrently open pages is bounded, and the browser is
+recycled after ``max_uses`` pages or as soon as it disconnects (crash).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import concurrent.futures
+import logging
+import os
+import threading
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Dict, Optional, Set, TypeVar
+
+from .exceptions import NadlanAPIError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_MAX_PAGES = int(os.getenv("NADLAN_BROWSER_POOL_PAGES", "4"))
+DEFAULT_MAX_USES = int(os.getenv("NADLAN_BROWSER_MAX_USES", "50"))
+
+
+class NadlanBrowserPool:
+    """A Chromium instance and page budget living on a background event loop."""
+
+    def __init__(
+        self,
+        headless: bool = True,
+        max_pages: int = DEFAULT_MAX_PAGES,
+        max_uses: int = DEFAULT_MAX_USES,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            headless: Whether to run Chromium in headless mode
+            max_pages: Maximum number of pages open at the same time
+            max_uses: Number of pages served before the browser is recycled
+        """
+        self.headless = headless
+        self.max_pages = max(1, max_pages)
+        self.max_uses = max(1, max_uses)
+        self.launches = 0
+
+        self._thread_lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+        # The attributes below are only touched from the pool's own loop
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._launch_lock: Optional[asyncio.Lock] = None
+        self._playwright: Any = None
+        self._browser: Any = None
+        self._uses = 0
+        self._active: Dict[Any, int] = {}
+        self._retired: Set[Any] = set()
+
+    # ------------------------------------------------------------------
+    # Event loop thread
+    # ------------------------------------------------------------------
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._thread_lock:
+            if self._loop is not None and self._thread is not None and self._thread.is_alive():
+                return self._loop
+
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def _serve() -> None:
+                asyncio.set_event_loop(loop)
+                ready.set()
+                loop.run_forever()
+
+            thread = threading.Thread(target=_serve, name="nadlan-browser-pool", daemon=True)
+            thread.start()
+            ready.wait()
+
+            self._loop, self._thread = loop, thread
+            self._semaphore = None
+            self._launch_lock = None
+            return loop
+
+    def run(self, coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """Run ``coro`` on the pool's event loop and block until it finishes.
+
+        Args:
+            coro: Coroutine to execute
+            timeout: Seconds to wait before cancelling the coroutine
+
+        Raises:
+            NadlanAPIError: If the coroutine does not finish within ``timeout``
+        """
+        loop = self._ensure_loop()
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise NadlanAPIError(f"Browser operation timed out after {timeout} seconds")
+
+    # ------------------------------------------------------------------
+    # Browser lifecycle (runs on the pool loop)
+    # ------------------------------------------------------------------
+    async def _launch(self) -> Any:
+        if self._playwright is None:
+            from playwright.async_api import async_playwright
+
+            self._playwright = await async_playwright().start()
+        browser = await self._playwright.chromium.launch(headless=self.headless)
+        self.launches += 1
+        logger.info("Launched Nadlan browser #%d", self.launches)
+        return browser
+
+    async def _acquire_browser(self) -> Any:
+        assert self._launch_lock is not None
+        async with self._launch_lock:
+            browser = self._browser
+            crashed = browser is not None and not browser.is_connected()
+            worn_out = browser is not None and self._uses >= self.max_uses
+            if browser is None or crashed or worn_out:
+                if browser is not None:
+                    logger.info(
+                        "Recycling Nadlan browser (%s)",
+                        "disconnected" if crashed else f"{self._uses} uses",
+                    )
+                    await self._retire(browser)
+                browser = self._browser = await self._launch()
+                self._uses = 0
+            self._uses += 1
+            self._active[browser] = self._active.get(browser, 0) + 1
+            return browser
+
+    async def _release(self, browser: Any) -> None:
+        remaining = self._active.get(browser, 1) - 1
+        if remaining > 0:
+            self._active[browser] = remaining
+            return
+        self._active.pop(browser, None)
+        if browser in self._retired:
+            await self._close_browser(browser)
+
+    async def _retire(self, browser: Any) -> None:
+        """Close ``browser`` now if idle, otherwise once its last page is released."""
+        if self._active.get(browser):
+            self._retired.add(browser)
+        else:
+            await self._close_browser(browser)
+
+    async def _close_browser(self, browser: Any) -> None:
+        self._retired.discard(browser)
+        try:
+            await browser.close()
+        except Exception as e:  # the browser may already be gone
+            logger.debug("Ignoring error while closing browser: %s", e)
+
+    @asynccontextmanager
+    async def page(self, **context_options: Any) -> AsyncIterator[Any]:
+        """Borrow a page in a fresh browser context.
+
+        Must be used from a coroutine submitted through :meth:`run`.
+
+        Args:
+            **context_options: Keyword arguments for ``browser.new_context``
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_pages)
+            self._launch_lock = asyncio.Lock()
+
+        async with self._semaphore:
+            browser = await self._acquire_browser()
+            context = None
+            try:
+                context = await browser.new_context(**context_options)
+                yield await context.new_page()
+            finally:
+                if context is not None:
+                    try:
+                        await context.close()
+                    except Exception as e:
+                        logger.debug("Ignoring error while closing context: %s", e)
+                await self._release(browser)
+
+    # ------------------------------------------------------------------
+    # Shutdown
+    # ------------------------------------------------------------------
+    async def _shutdown(self) -> None:
+        browsers = set(self._active) | self._retired
+        if self._browser is not None:
+            browsers.add(self._browser)
+        for browser in browsers:
+            await self._close_browser(browser)
+        self._browser = None
+        self._active.clear()
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            finally:
+                self._playwright = None
+
+    def close(self) -> None:
+        """Close the browser and stop the event-loop thread."""
+        with self._thread_lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or thread is None or not thread.is_alive():
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result(30)
+        except Exception as e:
+            logger.warning("Error shutting down Nadlan browser pool: %s", e)
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=5)
+
+
+_pools: Dict[bool, NadlanBrowserPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_browser_pool(headless: bool = True) -> NadlanBrowserPool:
+    """Return the process-wide browser pool for the given headless mode."""
+    with _pools_lock:
+        pool = _pools.get(headless)
+        if pool is None:
+            pool = _pools[headless] = NadlanBrowserPool(headless=headless)
+        return pool
+
+
+@atexit.register
+def _close_pools() -> None:
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+"""
+nadlan/deals_store.py
+---------------------
+
+Local, neighborhood-keyed store of Nadlan deals.
+
+Every asset in a neighborhood needs the same deal history, so instead of
+pulling it from nadlan.gov.il for each asset the deals are kept in a small
+SQLite database keyed by neighborhood ID.  Deals are de-duplicated on
+:meth:`Deal.identity` (date, block, parcel, price) and a refresh only asks
+the scraper for deals on or after the newest stored date:
+
+::
+
+    store = get_deals_store()
+    deals = store.sync("65210036", NadlanDealsScraper())
+
+A neighborhood that was refreshed within ``max_age`` seconds is served
+straight from the store.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
+
+from .models import Deal
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .scraper import NadlanDealsScraper
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = os.getenv(
+    "NADLAN_DEALS_DB",
+    os.path.join(os.path.expanduser("~"), ".cache", "nadlan", "deals.sqlite3"),
+)
+DEFAULT_MAX_AGE = float(os.getenv("NADLAN_DEALS_MAX_AGE", str(24 * 60 * 60)))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS deals (
+    neighborhood_id TEXT NOT NULL,
+    deal_key TEXT NOT NULL,
+    deal_date TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (neighborhood_id, deal_key)
+);
+CREATE INDEX IF NOT EXISTS deals_by_date ON deals (neighborhood_id, deal_date);
+CREATE TABLE IF NOT EXISTS neighborhoods (
+    neighborhood_id TEXT PRIMARY KEY,
+    refreshed_at REAL NOT NULL
+);
+"""
+
+
+class NadlanDealsStore:
+    """SQLite-backed deal history per neighborhood with incremental refresh."""
+
+    def __init__(self, path: str = DEFAULT_DB_PATH, max_age: float = DEFAULT_MAX_AGE) -> None:
+        """Initialize the store.
+
+        Args:
+            path: SQLite database file (``":memory:"`` for a transient store)
+            max_age: Seconds after which a neighborhood is refreshed again
+        """
+        self.path = path
+        self.max_age = max_age
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.RLock()
+        # One refresh per neighborhood at a time
+        self._refresh_locks: Dict[str, threading.Lock] = {}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+    def get_deals(self, neighborhood_id: str, limit: Optional[int] = None) -> List[Deal]:
+        """Return stored deals for a neighborhood, newest first."""
+        sql = "SELECT payload FROM deals WHERE neighborhood_id = ? ORDER BY deal_date DESC"
+        params: tuple = (str(neighborhood_id),)
+        if limit is not None and limit > 0:
+            sql += " LIMIT ?"
+            params += (int(limit),)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [Deal(**json.loads(payload)) for (payload,) in rows]
+
+    def count(self, neighborhood_id: str) -> int:
+        with self._lock:
+            (n,) = self._conn.execute(
+                "SELECT COUNT(*) FROM deals WHERE neighborhood_id = ?", (str(neighborhood_id),)
+            ).fetchone()
+        return n
+
+    def latest_deal_date(self, neighborhood_id: str) -> Optional[str]:
+        """Return the newest stored deal date (``YYYY-MM-DD``) for a neighborhood."""
+        with self._lock:
+            (latest,) = self._conn.execute(
+                "SELECT MAX(deal_date) FROM deals WHERE neighborhood_id = ? AND deal_date != ''",
+                (str(neighborhood_id),),
+            ).fetchone()
+        return latest
+
+    def last_refreshed(self, neighborhood_id: str) -> Optional[float]:
+        """Return the UNIX time of the last refresh of a neighborhood, if any."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT refreshed_at FROM neighborhoods WHERE neighborhood_id = ?",
+                (str(neighborhood_id),),
+            ).fetchone()
+        return row[0] if row else None
+
+    def is_stale(self, neighborhood_id: str) -> bool:
+        refreshed_at = self.last_refreshed(neighborhood_id)
+        return refreshed_at is None or time.time() - refreshed_at >= self.max_age
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+    def add_deals(self, neighborhood_id: str, deals: Iterable[Deal]) -> int:
+        """Insert deals that are not stored yet.
+
+        Returns:
+            Number of newly stored deals
+        """
+        rows = [
+            (
+                str(neighborhood_id),
+                "|".join(deal.identity()),
+                deal.iso_date() or "",
+                json.dumps(deal.to_dict(), ensure_ascii=False, default=str),
+            )
+            for deal in deals
+        ]
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO deals (neighborhood_id, deal_key, deal_date, payload) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            return self._conn.total_changes - before
+
+    def mark_refreshed(self, neighborhood_id: str, when: Optional[float] = None) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO neighborhoods (neighborhood_id, refreshed_at) VALUES (?, ?)",
+                (str(neighborhood_id), time.time() if when is None else when),
+            )
+
+    def refresh(self, neighborhood_id: str, scraper: "NadlanDealsScraper") -> int:
+        """Fetch deals newer than the latest stored one and store them.
+
+        Returns:
+            Number of newly stored deals
+        """
+        since = self.latest_deal_date(neighborhood_id)
+        deals = scraper.get_deals_by_neighborhood_id(neighborhood_id, since=since)
+        added = self.add_deals(neighborhood_id, deals)
+        self.mark_refreshed(neighborhood_id)
+        logger.info(
+            f"Refreshed Nadlan deals for neighborhood {neighborhood_id}: "
+            f"{added} new (since {since or 'beginning'})"
+        )
+        return added
+
+    def sync(
+        self,
+        neighborhood_id: str,
+        scraper: "NadlanDealsScraper",
+        limit: Optional[int] = None,
+        force: bool = False,
+    ) -> List[Deal]:
+        """Return deals for a neighborhood, refreshing them first if stale.
+
+        Args:
+            neighborhood_id: Nadlan neighborhood ID
+            scraper: Scraper used for the incremental refresh
+            limit: Maximum number of deals to return (newest first)
+            force: Refresh even if the neighborhood is fresh
+        """
+        neighborhood_id = str(neighborhood_id)
+        with self._lock:
+            refresh_lock = self._refresh_locks.setdefault(neighborhood_id, threading.Lock())
+        with refresh_lock:
+            if force or self.is_stale(neighborhood_id):
+                self.refresh(neighborhood_id, scraper)
+        return self.get_deals(neighborhood_id, limit=limit)
+
+
+_shared_store: Optional[NadlanDealsStore] = None
+_shared_store_lock = threading.Lock()
+
+
+def get_deals_store() -> NadlanDealsStore:
+    """Return the process-wide deals store."""
+    global _shared_store
+    with _shared_store_lock:
+        if _shared_store is None:
+            _shared_store = NadlanDealsStore()
+        return _shared_store
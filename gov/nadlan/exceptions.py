@@ -10,3 +10,6 @@ class NadlanAPIError(NadlanError):
 
 class NadlanDecodeError(NadlanError):
     """Raised when decoding API responses fails."""
+
+class NadlanAuthError(NadlanAPIError):
+    """Raised when the deals API rejects captured credentials (HTTP 401/403)."""
@@ -1,8 +1,12 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
+import re
 from dataclasses import asdict, dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+_DMY_DATE = re.compile(r"^(\d{1,2})[/.](\d{1,2})[/.](\d{4})")
+_ISO_DATE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})")
 
 
 @dataclass
@@ -118,6 +122,30 @@ class Deal:
             raw=d,
         )
 
+    def iso_date(self) -> Optional[str]:
+        """Return ``deal_date`` as ``YYYY-MM-DD`` (accepts ISO and DD/MM/YYYY)."""
+        if not self.deal_date:
+            return None
+        s = str(self.deal_date).strip()
+        m = _ISO_DATE.match(s)
+        if m:
+            return m.group(0)
+        m = _DMY_DATE.match(s)
+        if m:
+            day, month, year = m.groups()
+            return f"{year}-{int(month):02d}-{int(day):02d}"
+        return None
+
+    def identity(self) -> Tuple[str, str, str, str]:
+        """Key identifying the same deal across fetches: (date, block, parcel, price)."""
+        amount = "" if self.deal_amount is None else f"{self.deal_amount:.0f}"
+        return (
+            self.iso_date() or "",
+            self.parcel_block or "",
+            self.parcel_parcel or "",
+            amount,
+        )
+
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
 
@@ -0,0 +1,394 @@
+# -*- coding: utf-8 -*-
+"""
+nadlan/neighborhoods.py
+-----------------------
+
+Offline resolver from place names and coordinates to Nadlan neighborhood IDs.
+
+Address autocomplete (GovMap) returns names such as ``"רמת החייל"`` or
+``"הברזל תל אביב-יפו"`` but the deals API is keyed by Nadlan neighborhood
+IDs.  :class:`NeighborhoodResolver` keeps normalized names and aliases in a
+hash index (plus a sorted key list for prefix suggestions) and, where
+polygons are known, a grid index for point-in-polygon lookups, so that
+resolving a result is a handful of dictionary lookups rather than a browser
+round trip:
+
+::
+
+    resolver = get_neighborhood_resolver()
+    resolver.resolve_name("הברזל 30 רמת החייל")   # -> "65210036"
+    resolver.resolve_point(183500.0, 668900.0)     # ITM coordinates
+
+The shared resolver is seeded from ``data/neighborhoods.json`` (or the file
+named by ``NADLAN_NEIGHBORHOODS_FILE``) and learns every neighborhood looked
+up through :meth:`NadlanDealsScraper.get_neighborhood_info`.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import logging
+import os
+import re
+import threading
+import unicodedata
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEED_PATH = os.getenv(
+    "NADLAN_NEIGHBORHOODS_FILE",
+    os.path.join(os.path.dirname(__file__), "data", "neighborhoods.json"),
+)
+
+NEIGHBORHOOD = "neighborhood"
+SETTLEMENT = "settlement"
+
+# Grid cell size (meters, ITM) for the polygon index
+GRID_CELL = 2000.0
+
+# Hebrew points (niqqud and cantillation) carry no meaning for matching
+_HEBREW_MARKS = re.compile("[֑-ׇ]")
+_QUOTES = re.compile("[\"'`׳״‘’“”]")
+# Hyphens are kept inside tokens so that "יפו" does not match "תל אביב-יפו"
+_SEPARATORS = re.compile(r"[^\w\-]+")
+_SHAPE_POINT = re.compile(r"POINT\s*\(\s*([-\d.]+)\s+([-\d.]+)\s*\)", re.IGNORECASE)
+
+Point = Tuple[float, float]
+Ring = List[Point]
+
+
+def normalize_name(text: str) -> str:
+    """Normalize a place name for matching.
+
+    Strips niqqud, quotes and geresh, folds case and collapses punctuation and
+    whitespace into single spaces.
+    """
+    if not text:
+        return ""
+    text = unicodedata.normalize("NFC", str(text))
+    text = _HEBREW_MARKS.sub("", text)
+    text = _QUOTES.sub("", text)
+    text = re.sub(r"\s*-\s*", "-", text)
+    return " ".join(t for t in _SEPARATORS.sub(" ", text.casefold()).split() if t.strip("-"))
+
+
+@dataclass
+class Neighborhood:
+    """A Nadlan neighborhood (or settlement) and how to recognize it."""
+
+    id: str
+    name: str
+    kind: str = NEIGHBORHOOD
+    aliases: List[str] = field(default_factory=list)
+    setl_id: Optional[str] = None
+    setl_name: Optional[str] = None
+    # Outer ring in ITM coordinates, if known
+    polygon: Optional[Ring] = None
+
+    def names(self) -> List[str]:
+        return [self.name, *self.aliases]
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        if self.polygon is None:
+            data.pop("polygon")
+        return {k: v for k, v in data.items() if v not in (None, [])}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Neighborhood":
+        polygon = data.get("polygon")
+        return cls(
+            id=str(data["id"]),
+            name=data["name"],
+            kind=data.get("kind", NEIGHBORHOOD),
+            aliases=list(data.get("aliases", [])),
+            setl_id=str(data["setl_id"]) if data.get("setl_id") is not None else None,
+            setl_name=data.get("setl_name"),
+            polygon=[(float(x), float(y)) for x, y in polygon] if polygon else None,
+        )
+
+
+def point_in_polygon(x: float, y: float, ring: Sequence[Point]) -> bool:
+    """Ray-casting point-in-polygon test."""
+    inside = False
+    j = len(ring) - 1
+    for i in range(len(ring)):
+        xi, yi = ring[i]
+        xj, yj = ring[j]
+        if (yi > y) != (yj > y) and x < (xj - xi) * (y - yi) / (yj - yi) + xi:
+            inside = not inside
+        j = i
+    return inside
+
+
+def _bbox(ring: Sequence[Point]) -> Tuple[float, float, float, float]:
+    xs = [p[0] for p in ring]
+    ys = [p[1] for p in ring]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+class NeighborhoodResolver:
+    """Resolve names and ITM points to Nadlan neighborhood IDs without a browser."""
+
+    def __init__(self, neighborhoods: Iterable[Neighborhood] = ()) -> None:
+        self._lock = threading.RLock()
+        self._by_id: Dict[str, Neighborhood] = {}
+        # normalized alias -> neighborhood ID
+        self._index: Dict[str, str] = {}
+        self._sorted_keys: List[str] = []
+        self._max_words = 1
+        # grid cell -> IDs whose polygon bbox touches the cell
+        self._grid: Dict[Tuple[int, int], List[str]] = {}
+        self._bboxes: Dict[str, Tuple[float, float, float, float]] = {}
+        for neighborhood in neighborhoods:
+            self.add(neighborhood)
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, neighborhood_id: object) -> bool:
+        return str(neighborhood_id) in self._by_id
+
+    def get(self, neighborhood_id: str) -> Optional[Neighborhood]:
+        return self._by_id.get(str(neighborhood_id))
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+    def add(self, neighborhood: Neighborhood) -> None:
+        """Add or merge a neighborhood into the index."""
+        with self._lock:
+            existing = self._by_id.get(neighborhood.id)
+            if existing is not None:
+                for alias in neighborhood.names():
+                    if alias not in existing.names():
+                        existing.aliases.append(alias)
+                existing.setl_id = existing.setl_id or neighborhood.setl_id
+                existing.setl_name = existing.setl_name or neighborhood.setl_name
+                if neighborhood.polygon:
+                    self._unindex_polygon(existing.id)
+                    existing.polygon = neighborhood.polygon
+                neighborhood = existing
+            else:
+                self._by_id[neighborhood.id] = neighborhood
+
+            for alias in neighborhood.names():
+                self._index_alias(alias, neighborhood.id)
+            if neighborhood.polygon and neighborhood.id not in self._bboxes:
+                self._index_polygon(neighborhood.id, neighborhood.polygon)
+
+    def add_nadlan_info(self, info: Dict[str, Any]) -> None:
+        """Learn a neighborhood (and its settlement) from a Nadlan ``GetInfo`` result."""
+        if not info.get("neigh_id") or not info.get("neigh_name"):
+            return
+        setl_id = str(info["setl_id"]) if info.get("setl_id") is not None else None
+        self.add(Neighborhood(
+            id=str(info["neigh_id"]),
+            name=info["neigh_name"],
+            setl_id=setl_id,
+            setl_name=info.get("setl_name"),
+        ))
+        if setl_id and info.get("setl_name"):
+            self.add(Neighborhood(id=setl_id, name=info["setl_name"], kind=SETTLEMENT))
+
+    def add_govmap_features(
+        self,
+        features: Iterable[Dict[str, Any]],
+        id_property: str = "neigh_id",
+        name_property: str = "neigh_name",
+    ) -> int:
+        """Load neighborhood polygons from GeoJSON features (ITM coordinates).
+
+        Args:
+            features: GeoJSON features, e.g. from a GovMap WFS neighborhoods layer
+            id_property: Feature property holding the Nadlan neighborhood ID
+            name_property: Feature property holding the neighborhood name
+
+        Returns:
+            Number of features loaded
+        """
+        loaded = 0
+        for feature in features:
+            props = feature.get("properties") or {}
+            geometry = feature.get("geometry") or {}
+            if props.get(id_property) is None or not props.get(name_property):
+                continue
+            ring = None
+            coords = geometry.get("coordinates")
+            if coords and geometry.get("type") == "Polygon":
+                ring = coords[0]
+            elif coords and geometry.get("type") == "MultiPolygon":
+                # Keep the largest part; neighborhoods are essentially single polygons
+                ring = max((part[0] for part in coords), key=len)
+            self.add(Neighborhood(
+                id=str(props[id_property]),
+                name=props[name_property],
+                polygon=[(float(x), float(y)) for x, y, *_ in ring] if ring else None,
+            ))
+            loaded += 1
+        return loaded
+
+    def load_file(self, path: str) -> int:
+        """Load neighborhoods from a JSON seed file.
+
+        The file holds ``{"neighborhoods": [...]}`` with entries in
+        :meth:`Neighborhood.to_dict` form.
+
+        Returns:
+            Number of entries loaded
+        """
+        with open(path, "r", encoding="utf-8") as fh:
+            data = json.load(fh)
+        entries = data.get("neighborhoods", []) if isinstance(data, dict) else data
+        for entry in entries:
+            self.add(Neighborhood.from_dict(entry))
+        return len(entries)
+
+    @classmethod
+    def from_file(cls, path: str) -> "NeighborhoodResolver":
+        resolver = cls()
+        resolver.load_file(path)
+        return resolver
+
+    def save(self, path: str) -> None:
+        """Write all known neighborhoods to a JSON seed file."""
+        with self._lock:
+            entries = [n.to_dict() for n in self._by_id.values()]
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump({"neighborhoods": entries}, fh, ensure_ascii=False, indent=2)
+
+    # ------------------------------------------------------------------
+    # Resolution
+    # ------------------------------------------------------------------
+    def resolve_name(self, text: str) -> Optional[str]:
+        """Resolve free text (a POI, street or address) to a neighborhood ID.
+
+        Every run of consecutive words is looked up in the alias index.
+        Neighborhood matches win over settlement matches and longer matches
+        win over shorter ones.
+
+        Returns:
+            The neighborhood (or settlement) ID, or None if nothing matches
+        """
+        words = normalize_name(text).split()
+        best: Optional[Tuple[int, int, str]] = None
+        for size in range(min(self._max_words, len(words)), 0, -1):
+            for start in range(len(words) - size + 1):
+                neighborhood_id = self._index.get(" ".join(words[start:start + size]))
+                if neighborhood_id is None:
+                    continue
+                rank = (self._by_id[neighborhood_id].kind == NEIGHBORHOOD, size, neighborhood_id)
+                if best is None or rank[:2] > best[:2]:
+                    best = rank
+        return best[2] if best else None
+
+    def resolve_point(self, x: float, y: float) -> Optional[str]:
+        """Return the ID of the neighborhood polygon containing an ITM point."""
+        for neighborhood_id in self._grid.get(self._cell(x, y), ()):
+            min_x, min_y, max_x, max_y = self._bboxes[neighborhood_id]
+            if not (min_x <= x <= max_x and min_y <= y <= max_y):
+                continue
+            if point_in_polygon(x, y, self._by_id[neighborhood_id].polygon or []):
+                return neighborhood_id
+        return None
+
+    def resolve_poi(self, poi_item: Dict[str, Any]) -> Optional[str]:
+        """Resolve a GovMap autocomplete item by name, then by its coordinates."""
+        neighborhood_id = self.resolve_name(poi_item.get("Value", ""))
+        if neighborhood_id:
+            return neighborhood_id
+        point = self._poi_point(poi_item)
+        return self.resolve_point(*point) if point else None
+
+    def suggest(self, prefix: str, limit: int = 10) -> List[Neighborhood]:
+        """Return neighborhoods whose name or alias starts with ``prefix``."""
+        key = normalize_name(prefix)
+        if not key:
+            return []
+        results: List[Neighborhood] = []
+        seen = set()
+        with self._lock:
+            i = bisect.bisect_left(self._sorted_keys, key)
+            while i < len(self._sorted_keys) and self._sorted_keys[i].startswith(key):
+                neighborhood_id = self._index[self._sorted_keys[i]]
+                if neighborhood_id not in seen:
+                    seen.add(neighborhood_id)
+                    results.append(self._by_id[neighborhood_id])
+                    if len(results) >= limit:
+                        break
+                i += 1
+        return results
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _index_alias(self, alias: str, neighborhood_id: str) -> None:
+        key = normalize_name(alias)
+        if not key:
+            return
+        current = self._index.get(key)
+        if current is not None and current != neighborhood_id:
+            # Neighborhood names shadow settlements with the same name
+            if self._by_id[current].kind == NEIGHBORHOOD:
+                return
+        if current is None:
+            bisect.insort(self._sorted_keys, key)
+        self._index[key] = neighborhood_id
+        self._max_words = max(self._max_words, len(key.split()))
+
+    @staticmethod
+    def _cell(x: float, y: float) -> Tuple[int, int]:
+        return int(x // GRID_CELL), int(y // GRID_CELL)
+
+    def _index_polygon(self, neighborhood_id: str, ring: Ring) -> None:
+        bbox = _bbox(ring)
+        self._bboxes[neighborhood_id] = bbox
+        (x0, y0), (x1, y1) = self._cell(bbox[0], bbox[1]), self._cell(bbox[2], bbox[3])
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                self._grid.setdefault((cx, cy), []).append(neighborhood_id)
+
+    def _unindex_polygon(self, neighborhood_id: str) -> None:
+        if self._bboxes.pop(neighborhood_id, None) is None:
+            return
+        for cell, ids in list(self._grid.items()):
+            if neighborhood_id in ids:
+                ids.remove(neighborhood_id)
+                if not ids:
+                    del self._grid[cell]
+
+    @staticmethod
+    def _poi_point(poi_item: Dict[str, Any]) -> Optional[Point]:
+        for x_key, y_key in (("X", "Y"), ("x", "y")):
+            if poi_item.get(x_key) is not None and poi_item.get(y_key) is not None:
+                try:
+                    return float(poi_item[x_key]), float(poi_item[y_key])
+                except (TypeError, ValueError):
+                    return None
+        match = _SHAPE_POINT.search(str(poi_item.get("shape") or poi_item.get("Shape") or ""))
+        if match:
+            return float(match.group(1)), float(match.group(2))
+        return None
+
+
+_shared_resolver: Optional[NeighborhoodResolver] = None
+_shared_resolver_lock = threading.Lock()
+
+
+def get_neighborhood_resolver() -> NeighborhoodResolver:
+    """Return the process-wide resolver, seeded from :data:`DEFAULT_SEED_PATH`."""
+    global _shared_resolver
+    with _shared_resolver_lock:
+        if _shared_resolver is None:
+            resolver = NeighborhoodResolver()
+            try:
+                count = resolver.load_file(DEFAULT_SEED_PATH)
+                logger.debug(f"Loaded {count} neighborhoods from {DEFAULT_SEED_PATH}")
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Could not load neighborhood seed file {DEFAULT_SEED_PATH}: {e}")
+            _shared_resolver = resolver
+        return _shared_resolver
@@ -21,6 +21,14 @@ Notes
 :::::
 
 * This implementation uses Playwright to interact with the real website
+* Browsers come from a process-wide pool (see :mod:`gov.nadlan.browser_pool`), so
+  Chromium is launched once and reused across scrapers and calls
+* Address autocomplete goes to GovMap over plain HTTP - no browser involved
+* Autocomplete results are mapped to neighborhood IDs through an offline index
+  (see :mod:`gov.nadlan.neighborhoods`)
+* The browser is only needed to bootstrap the deals API: the captured request is
+  cached (see :mod:`gov.nadlan.api_client`) and replayed over a pooled HTTP
+  session, paging concurrently, until it expires or is rejected
 * No authentication tokens are required - it uses the same browser session as the website
 * The API is robust and handles various response formats automatically
 * Please be courteous and avoid rapid repeated calls to respect the service
@@ -31,27 +39,78 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
-from typing import Any, Dict, List, Optional, Sequence
-
-from playwright.async_api import async_playwright, Response
+import urllib.parse
+import warnings
+from typing import Any, Awaitable, Dict, List, Optional, Tuple, TypeVar
+
+import requests
+import urllib3
+from playwright.async_api import Response
+
+from .api_client import (
+    ApiBootstrap,
+    BootstrapCache,
+    NadlanApiClient,
+    decode_base64_gzip,
+    decode_payload,
+    extract_items,
+    extract_total,
+    filter_since,
+    get_api_client,
+    get_bootstrap_cache,
+)
+from .browser_pool import NadlanBrowserPool, get_browser_pool
 from .models import Deal
-from .exceptions import NadlanAPIError
+from .neighborhoods import NeighborhoodResolver, get_neighborhood_resolver
+from .exceptions import NadlanAPIError, NadlanAuthError, NadlanDecodeError
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+AUTOCOMPLETE_URL = "https://es.govmap.gov.il/TldSearch/api/AutoComplete"
+
 
 class NadlanDealsScraper:
     """Simple scraper for real estate deals from nadlan.gov.il."""
     
-    def __init__(self, timeout: float = 30.0, headless: bool = True):
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        headless: bool = True,
+        pool: Optional[NadlanBrowserPool] = None,
+        session: Optional[requests.Session] = None,
+        api_client: Optional[NadlanApiClient] = None,
+        bootstrap_cache: Optional[BootstrapCache] = None,
+        fast_path: bool = True,
+        resolver: Optional[NeighborhoodResolver] = None,
+    ):
         """Initialize the scraper.
         
         Args:
             timeout: Request timeout in seconds
             headless: Whether to run browser in headless mode
+            pool: Browser pool to use (defaults to the shared process-wide pool)
+            session: HTTP session for GovMap autocomplete requests
+            api_client: Direct deals API client (defaults to the shared client)
+            bootstrap_cache: Cache of the captured deals request (defaults to the shared cache)
+            fast_path: Whether to replay the deals request over HTTP; when
+                disabled every call goes through the browser and only the
+                first page of deals is returned
+            resolver: Name/point to neighborhood ID index (defaults to the shared resolver)
         """
         self.timeout = timeout
         self.headless = headless
+        self._pool = pool
+        self.api = api_client or get_api_client()
+        self.bootstraps = bootstrap_cache or get_bootstrap_cache()
+        self.fast_path = fast_path
+        self.resolver = resolver or get_neighborhood_resolver()
+        self.http = session or requests.Session()
+        self.http.headers.update({
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120 Safari/537.36",
+            "Accept": "application/json, text/plain, */*",
+        })
     
     def __enter__(self):
         """Context manager entry."""
@@ -59,14 +118,26 @@ class NadlanDealsScraper:
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
-        # Playwright handles its own cleanup
+        # The browser pool is shared and outlives individual scrapers
         pass
+
+    @property
+    def pool(self) -> NadlanBrowserPool:
+        """Browser pool used by this scraper."""
+        if self._pool is None:
+            self._pool = get_browser_pool(self.headless)
+        return self._pool
+
+    def _run(self, coro: Awaitable[T]) -> T:
+        """Run a browser coroutine on the pool's event loop."""
+        return self.pool.run(coro, timeout=self.timeout + 30)
     
-    def get_deals_by_neighborhood_id(self, neighbourhood_id: str) -> List[Deal]:
+    def get_deals_by_neighborhood_id(self, neighbourhood_id: str, since: Optional[str] = None) -> List[Deal]:
         """Retrieve deals using a neighbourhood identifier.
 
         Args:
             neighbourhood_id: The numeric ID as seen in the URL
+            since: Only return deals on or after this ISO date (``YYYY-MM-DD``)
 
         Returns:
             List of Deal objects
@@ -75,8 +146,7 @@ class NadlanDealsScraper:
             NadlanAPIError: If the API call fails
         """
         try:
-            deals = asyncio.run(self._fetch_deals_by_neighborhood(neighbourhood_id))
-            return deals
+            return self._run(self._fetch_deals_by_neighborhood(neighbourhood_id, since=since))
         except Exception as e:
             raise NadlanAPIError(f"Failed to fetch deals for neighborhood {neighbourhood_id}: {e}")
 
@@ -91,11 +161,36 @@ class NadlanDealsScraper:
             List of address suggestions with IDs and names
         """
         try:
-            results = asyncio.run(self._search_address_async(query, limit))
-            return results
+            return self._search_address(query, limit)
         except Exception as e:
             raise NadlanAPIError(f"Failed to search for address '{query}': {e}")
 
+    def resolve_neighborhood_id(self, address_query: str) -> str:
+        """Resolve an address or neighborhood name to a Nadlan neighborhood ID.
+
+        Args:
+            address_query: Address or neighborhood name to search for
+
+        Returns:
+            The neighborhood ID of the most relevant autocomplete match
+
+        Raises:
+            NadlanAPIError: If no match or no neighborhood ID is found
+        """
+        search_results = self.search_address(address_query, limit=5)
+
+        if not search_results:
+            raise NadlanAPIError(f"No addresses found for query: {address_query}")
+
+        # Get the first (most relevant) result
+        best_match = search_results[0]
+        neighborhood_id = best_match.get('neighborhood_id')
+
+        if not neighborhood_id:
+            raise NadlanAPIError(f"Could not determine neighborhood ID for: {best_match['value']}")
+
+        return neighborhood_id
+
     def get_deals_by_address(self, address_query: str) -> List[Deal]:
         """Retrieve deals by searching for an address first, then fetching deals.
 
@@ -109,18 +204,7 @@ class NadlanDealsScraper:
             NadlanAPIError: If the search or fetch fails
         """
         try:
-            # First search for the address
-            search_results = self.search_address(address_query, limit=5)
-            
-            if not search_results:
-                raise NadlanAPIError(f"No addresses found for query: {address_query}")
-            
-            # Get the first (most relevant) result
-            best_match = search_results[0]
-            neighborhood_id = best_match.get('neighborhood_id')
-            
-            if not neighborhood_id:
-                raise NadlanAPIError(f"Could not determine neighborhood ID for: {best_match['value']}")
+            neighborhood_id = self.resolve_neighborhood_id(address_query)
             
             # Fetch deals using the neighborhood ID
             return self.get_deals_by_neighborhood_id(neighborhood_id)
@@ -141,46 +225,41 @@ class NadlanDealsScraper:
             NadlanAPIError: If the API call fails
         """
         try:
-            info = asyncio.run(self._fetch_neighborhood_info(neighbourhood_id))
+            info = self._run(self._fetch_neighborhood_info(neighbourhood_id))
+            # Remember the names so later autocomplete results resolve offline
+            self.resolver.add_nadlan_info(info)
             return info
         except Exception as e:
             raise NadlanAPIError(f"Failed to fetch neighborhood info for {neighbourhood_id}: {e}")
 
     async def _fetch_neighborhood_info(self, neigh_id: str) -> Dict[str, Any]:
         """Fetch neighborhood information using Playwright."""
-        async with async_playwright() as pw:
-            browser = await pw.chromium.launch(headless=self.headless)
-            try:
-                ctx = await browser.new_context()
-                page = await ctx.new_page()
-                
-                # Load the neighborhood page
-                await page.goto(f"https://www.nadlan.gov.il/?view=neighborhood&id={neigh_id}&page=deals", 
-                               timeout=int(self.timeout * 1000))
-                
-                # Get API base from config.json
-                api_base = await self._get_api_base(page)
-                
-                # Make the GetInfo request
-                resp = await page.request.post(
-                    f"{api_base}/GetInfo",
-                    data=json.dumps({"base_name": "neigh_id", "base_id": neigh_id}),
-                    headers={"content-type": "application/json"},
-                    timeout=int(self.timeout * 1000),
-                )
-                
-                if resp.status != 200:
-                    raise NadlanAPIError(f"GetInfo HTTP {resp.status}")
-                
-                data = await resp.json()
-                return {
-                    "neigh_id": data["neigh_id"],
-                    "neigh_name": data["neigh_name"],
-                    "setl_id": str(data["setl_id"]),
-                    "setl_name": data["setl_name"],
-                }
-            finally:
-                await browser.close()
+        async with self.pool.page() as page:
+            # Load the neighborhood page
+            await page.goto(f"https://www.nadlan.gov.il/?view=neighborhood&id={neigh_id}&page=deals", 
+                           timeout=int(self.timeout * 1000))
+            
+            # Get API base from config.json
+            api_base = await self._get_api_base(page)
+            
+            # Make the GetInfo request
+            resp = await page.request.post(
+                f"{api_base}/GetInfo",
+                data=json.dumps({"base_name": "neigh_id", "base_id": neigh_id}),
+                headers={"content-type": "application/json"},
+                timeout=int(self.timeout * 1000),
+            )
+            
+            if resp.status != 200:
+                raise NadlanAPIError(f"GetInfo HTTP {resp.status}")
+            
+            data = await resp.json()
+            return {
+                "neigh_id": data["neigh_id"],
+                "neigh_name": data["neigh_name"],
+                "setl_id": str(data["setl_id"]),
+                "setl_name": data["setl_name"],
+            }
 
     async def _get_api_base(self, page) -> str:
         """Get API base URL from config.json."""
@@ -196,296 +275,242 @@ class NadlanDealsScraper:
             raise NadlanAPIError("config.json missing api_base")
         return api_base
 
-    async def _search_address_async(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+    def _search_address(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
         """Search for addresses using the govmap autocomplete API."""
-        import urllib.parse
-        
         # Encode the query for URL
         encoded_query = urllib.parse.quote(query)
         
         # Construct the autocomplete URL
-        url = f"https://es.govmap.gov.il/TldSearch/api/AutoComplete?query={encoded_query}&ids=276267023&gid=govmap"
+        url = f"{AUTOCOMPLETE_URL}?query={encoded_query}&ids=276267023&gid=govmap"
         
-        async with async_playwright() as pw:
-            browser = await pw.chromium.launch(headless=self.headless)
-            try:
-                # Create context with ignore HTTPS errors
-                ctx = await browser.new_context(ignore_https_errors=True)
-                page = await ctx.new_page()
-                
-                # Make the request to the autocomplete API
-                response = await page.request.get(url, timeout=int(self.timeout * 1000))
-                
-                if response.status != 200:
-                    raise NadlanAPIError(f"Autocomplete API returned status {response.status}")
-                
-                data = await response.json()
-                
-                # Process the results
-                results = []
-                
-                # Process NEIGHBORHOOD results (most important for our use case)
-                if 'res' in data and 'NEIGHBORHOOD' in data['res']:
-                    for item in data['res']['NEIGHBORHOOD']:
-                        # Try to extract neighborhood information
-                        neighborhood_id = self._extract_neighborhood_id_from_poi(item)
-                        if neighborhood_id:
-                            results.append({
-                                'type': 'neighborhood',
-                                'key': item['Key'],
-                                'value': item['Value'],
-                                'neighborhood_id': neighborhood_id,
-                                'rank': item.get('Rank', 0)
-                            })
-                
-                # Process POI_MID_POINT results (neighborhoods, points of interest)
-                if 'res' in data and 'POI_MID_POINT' in data['res']:
-                    for item in data['res']['POI_MID_POINT'][:limit//2]:
-                        # Try to extract neighborhood information
-                        neighborhood_id = self._extract_neighborhood_id_from_poi(item)
-                        if neighborhood_id:
-                            results.append({
-                                'type': 'neighborhood',
-                                'key': item['Key'],
-                                'value': item['Value'],
-                                'neighborhood_id': neighborhood_id,
-                                'rank': item.get('Rank', 0)
-                            })
-                
-                # Process STREET results (street names)
-                if 'res' in data and 'STREET' in data['res']:
-                    for item in data['res']['STREET'][:limit//2]:
-                        # Try to extract neighborhood information from street name
-                        neighborhood_id = self._extract_neighborhood_id_from_poi(item)
-                        results.append({
-                            'type': 'street',
-                            'key': item['Key'],
-                            'value': item['Value'],
-                            'neighborhood_id': neighborhood_id,
-                            'rank': item.get('Rank', 0)
-                        })
+        # GovMap's certificate chain is not always complete; the browser-based
+        # implementation ignored HTTPS errors as well
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", urllib3.exceptions.InsecureRequestWarning)
+            response = self.http.get(url, timeout=self.timeout, verify=False)
+        if response.status_code != 200:
+            raise NadlanAPIError(f"Autocomplete API returned status {response.status_code}")
+        
+        return self._parse_autocomplete_results(response.json(), limit)
 
-                # Process TRANS_NAME results (street names)
-                if 'res' in data and 'TRANS_NAME' in data['res']:
-                    for item in data['res']['TRANS_NAME'][:limit//2]:
-                        # Try to extract neighborhood information from street name
+    def _parse_autocomplete_results(self, data: Dict[str, Any], limit: int = 10) -> List[Dict[str, Any]]:
+        """Convert a GovMap autocomplete response into ranked address suggestions."""
+        # Process the results
+        results = []
+        
+        # Process NEIGHBORHOOD results (most important for our use case)
+        if 'res' in data and 'NEIGHBORHOOD' in data['res']:
+            for item in data['res']['NEIGHBORHOOD']:
+                # Try to extract neighborhood information
+                neighborhood_id = self._extract_neighborhood_id_from_poi(item)
+                if neighborhood_id:
+                    results.append({
+                        'type': 'neighborhood',
+                        'key': item['Key'],
+                        'value': item['Value'],
+                        'neighborhood_id': neighborhood_id,
+                        'rank': item.get('Rank', 0)
+                    })
+        
+        # Process POI_MID_POINT results (neighborhoods, points of interest)
+        if 'res' in data and 'POI_MID_POINT' in data['res']:
+            for item in data['res']['POI_MID_POINT'][:limit//2]:
+                # Try to extract neighborhood information
+                neighborhood_id = self._extract_neighborhood_id_from_poi(item)
+                if neighborhood_id:
+                    results.append({
+                        'type': 'neighborhood',
+                        'key': item['Key'],
+                        'value': item['Value'],
+                        'neighborhood_id': neighborhood_id,
+                        'rank': item.get('Rank', 0)
+                    })
+        
+        # Process STREET results (street names)
+        if 'res' in data and 'STREET' in data['res']:
+            for item in data['res']['STREET'][:limit//2]:
+                # Try to extract neighborhood information from street name
+                neighborhood_id = self._extract_neighborhood_id_from_poi(item)
+                results.append({
+                    'type': 'street',
+                    'key': item['Key'],
+                    'value': item['Value'],
+                    'neighborhood_id': neighborhood_id,
+                    'rank': item.get('Rank', 0)
+                })
+
+        # Process TRANS_NAME results (street names)
+        if 'res' in data and 'TRANS_NAME' in data['res']:
+            for item in data['res']['TRANS_NAME'][:limit//2]:
+                # Try to extract neighborhood information from street name
+                neighborhood_id = self._extract_neighborhood_id_from_poi(item)
+                results.append({
+                    'type': 'street',
+                    'key': item['Key'],
+                    'value': item['Value'],
+                    'neighborhood_id': neighborhood_id,
+                    'rank': item.get('Rank', 0)
+                })
+
+        # Process SETTLEMENT results (cities, towns)
+        if 'res' in data and 'SETTLEMENT' in data['res']:
+            for item in data['res']['SETTLEMENT'][:limit//2]:
+                # Try to extract neighborhood information from settlement name
+                neighborhood_id = self._extract_neighborhood_id_from_poi(item)
+                results.append({
+                    'type': 'settlement',
+                    'key': item['Key'],
+                    'value': item['Value'],
+                    'neighborhood_id': neighborhood_id,
+                    'rank': item.get('Rank', 0)
+                })
+
+        # Process BUILDING results (buildings, addresses)
+        if 'res' in data and 'BUILDING' in data['res']:
+            for item in data['res']['BUILDING'][:limit//2]:
+                # Try to extract neighborhood information from building address
+                neighborhood_id = self._extract_neighborhood_id_from_poi(item)
+                results.append({
+                    'type': 'building',
+                    'key': item['Key'],
+                    'value': item['Value'],
+                    'neighborhood_id': neighborhood_id,
+                    'rank': item.get('Rank', 0)
+                })
+
+        # Process ADDRESS results (specific addresses)
+        if 'res' in data and 'ADDRESS' in data['res']:
+            for item in data['res']['ADDRESS'][:limit//2]:
+                # Try to extract neighborhood information from address
+                neighborhood_id = self._extract_neighborhood_id_from_poi(item)
+                results.append({
+                    'type': 'address',
+                    'key': item['Key'],
+                    'value': item['Value'],
+                    'neighborhood_id': neighborhood_id,
+                    'rank': item.get('Rank', 0)
+                })
+
+        # Process any other result types that might exist
+        for key in data.get('res', {}).keys():
+            if key not in ['NEIGHBORHOOD', 'POI_MID_POINT', 'STREET', 'TRANS_NAME', 'SETTLEMENT', 'BUILDING', 'ADDRESS']:
+                if key in data['res']:
+                    for item in data['res'][key][:limit//4]:  # Limit other types to avoid overwhelming results
+                        # Try to extract neighborhood information
                         neighborhood_id = self._extract_neighborhood_id_from_poi(item)
                         results.append({
-                            'type': 'street',
+                            'type': key.lower(),
                             'key': item['Key'],
                             'value': item['Value'],
                             'neighborhood_id': neighborhood_id,
                             'rank': item.get('Rank', 0)
                         })
+        
+        # Sort by rank and return top results
+        results.sort(key=lambda x: x.get('rank', 0))
+        return results[:limit]
 
-                # Process SETTLEMENT results (cities, towns)
-                if 'res' in data and 'SETTLEMENT' in data['res']:
-                    for item in data['res']['SETTLEMENT'][:limit//2]:
-                        # Try to extract neighborhood information from settlement name
-                        neighborhood_id = self._extract_neighborhood_id_from_poi(item)
-                        results.append({
-                            'type': 'settlement',
-                            'key': item['Key'],
-                            'value': item['Value'],
-                            'neighborhood_id': neighborhood_id,
-                            'rank': item.get('Rank', 0)
-                        })
+    def _extract_neighborhood_id_from_poi(self, poi_item: Dict[str, Any]) -> Optional[str]:
+        """Extract neighborhood ID from POI (Point of Interest) data.
 
-                # Process BUILDING results (buildings, addresses)
-                if 'res' in data and 'BUILDING' in data['res']:
-                    for item in data['res']['BUILDING'][:limit//2]:
-                        # Try to extract neighborhood information from building address
-                        neighborhood_id = self._extract_neighborhood_id_from_poi(item)
-                        results.append({
-                            'type': 'building',
-                            'key': item['Key'],
-                            'value': item['Value'],
-                            'neighborhood_id': neighborhood_id,
-                            'rank': item.get('Rank', 0)
-                        })
+        Looks the POI name up in the neighborhood index and, failing that,
+        resolves its coordinates against the known neighborhood polygons.
+        """
+        return self.resolver.resolve_poi(poi_item)
 
-                # Process ADDRESS results (specific addresses)
-                if 'res' in data and 'ADDRESS' in data['res']:
-                    for item in data['res']['ADDRESS'][:limit//2]:
-                        # Try to extract neighborhood information from address
-                        neighborhood_id = self._extract_neighborhood_id_from_poi(item)
-                        results.append({
-                            'type': 'address',
-                            'key': item['Key'],
-                            'value': item['Value'],
-                            'neighborhood_id': neighborhood_id,
-                            'rank': item.get('Rank', 0)
-                        })
+    async def _fetch_deals_by_neighborhood(self, neigh_id: str, since: Optional[str] = None) -> List[Deal]:
+        """Fetch deals by neighborhood.
 
-                # Process any other result types that might exist
-                for key in data.get('res', {}).keys():
-                    if key not in ['NEIGHBORHOOD', 'POI_MID_POINT', 'STREET', 'TRANS_NAME', 'SETTLEMENT', 'BUILDING', 'ADDRESS']:
-                        if key in data['res']:
-                            for item in data['res'][key][:limit//4]:  # Limit other types to avoid overwhelming results
-                                # Try to extract neighborhood information
-                                neighborhood_id = self._extract_neighborhood_id_from_poi(item)
-                                results.append({
-                                    'type': key.lower(),
-                                    'key': item['Key'],
-                                    'value': item['Value'],
-                                    'neighborhood_id': neighborhood_id,
-                                    'rank': item.get('Rank', 0)
-                                })
-                
-                # Sort by rank and return top results
-                results.sort(key=lambda x: x.get('rank', 0))
-                return results[:limit]
-                
-            finally:
-                await browser.close()
+        Uses the cached bootstrap to call the deals API directly when possible
+        and falls back to the browser to (re)capture it otherwise.
+        """
+        bootstrap = self.bootstraps.get() if self.fast_path else None
+        if bootstrap is not None:
+            try:
+                return await asyncio.to_thread(
+                    self.api.fetch_deals, bootstrap, neigh_id, self.timeout, None, since
+                )
+            except NadlanAuthError as e:
+                logger.info(f"Deals API rejected cached bootstrap ({e}); refreshing through the browser")
+                self.bootstraps.invalidate()
+            except NadlanAPIError as e:
+                logger.warning(f"Direct deals request failed ({e}); falling back to the browser")
+
+        bootstrap, first_page = await self._capture_deals_request(neigh_id)
+        if bootstrap is None or not self.fast_path:
+            return filter_since([Deal.from_item(x) for x in first_page[0]], since)
+
+        self.bootstraps.set(bootstrap)
+        return await asyncio.to_thread(
+            self.api.fetch_deals, bootstrap, neigh_id, self.timeout, first_page, since
+        )
+
+    async def _capture_deals_request(
+        self, neigh_id: str
+    ) -> Tuple[Optional[ApiBootstrap], Tuple[List[Dict[str, Any]], Optional[int]]]:
+        """Load the neighborhood page and capture its first /api/deal exchange.
 
-    def _extract_neighborhood_id_from_poi(self, poi_item: Dict[str, Any]) -> Optional[str]:
-        """Extract neighborhood ID from POI (Point of Interest) data.
-        
-        This is a simplified mapping - in practice you might want to use
-        a more comprehensive database or API to map POIs to neighborhood IDs.
+        Returns:
+            Tuple of (bootstrap for replaying the request or ``None`` if the
+            request cannot be replayed, (first page items, advertised total))
         """
-        value = poi_item.get('Value', '')
-        
-        # Known neighborhood mappings (can be expanded)
-        known_mappings = {
-            'רמת החייל': '65210036',
-            'רמת החיל': '65210036',  # Alternative spelling for רמת החייל
-            'החיל תל אביב-יפו': '65210036',  # Street in רמת החייל
-            'רמת אביב': '65210001',
-            'נווה צדק': '65210002',
-            'פלורנטין': '65210003',
-            'יפו': '65210004',
-            'התקווה': '65210005',
-            'שכונת שפירא': '65210006',
-            'קריית שלום': '65210007',
-            'קריית יובל': '65210008',
-            'קריית הממשלה': '65210009',
-            'קריית הלאום': '65210010',
-        }
-        
-        # City/Settlement mappings (when searching for entire cities)
-        city_mappings = {
-            'תל אביב': '5000',  # תל אביב-יפו settlement ID
-            'תל אביב-יפו': '5000',
-            'ירושלים': '3000',
-            'חיפה': '4000',
-            'באר שבע': '6000',
-            'ראשון לציון': '8300',
-            'פתח תקווה': '7900',
-            'חולון': '6600',
-            'רמת גן': '5200',
-            'גבעתיים': '5300',
-            'קריית אונו': '5400',
-            'רמת השרון': '5500',
-            'הוד השרון': '5600',
-            'כפר סבא': '5700',
-            'רעננה': '8700',
-        }
-        
-        # Check if the POI contains any known neighborhood names
-        for neighborhood_name, neighborhood_id in known_mappings.items():
-            if neighborhood_name in value:
-                return neighborhood_id
-        
-        # Check if the POI contains any known city names
-        for city_name, city_id in city_mappings.items():
-            if city_name in value:
-                return city_id
-        
-        # If no direct match, return None (will need additional lookup)
-        return None
+        async with self.pool.page() as page:
+            # Capture the first /api/deal response
+            fut = asyncio.get_running_loop().create_future()
 
-    async def _fetch_deals_by_neighborhood(self, neigh_id: str) -> List[Deal]:
-        """Fetch deals by neighborhood using Playwright."""
-        async with async_playwright() as pw:
-            browser = await pw.chromium.launch(headless=self.headless)
-            try:
-                ctx = await browser.new_context()
-                page = await ctx.new_page()
+            def _maybe_res(r: Response) -> None:
+                url = r.url
+                if "/api/deal" in url:
+                    if not fut.done():
+                        fut.set_result(r)
 
-                # Capture the first /api/deal response
-                fut = asyncio.get_event_loop().create_future()
+            page.on("response", _maybe_res)
 
-                def _maybe_res(r: Response) -> None:
-                    url = r.url
-                    if "/api/deal" in url:
-                        if not fut.done():
-                            fut.set_result(r)
+            # Navigate to the neighborhood page
+            url = f"https://www.nadlan.gov.il/?view=neighborhood&id={neigh_id}&page=deals"
+            await page.goto(url, timeout=int(self.timeout * 1000))
 
-                page.on("response", _maybe_res)
+            # Wait for /api/deal response
+            resp: Response = await asyncio.wait_for(fut, timeout=self.timeout + 10)
+            if resp.status != 200:
+                raise NadlanAPIError(f"/api/deal HTTP {resp.status}")
 
-                # Navigate to the neighborhood page
-                url = f"https://www.nadlan.gov.il/?view=neighborhood&id={neigh_id}&page=deals"
-                await page.goto(url, timeout=int(self.timeout * 1000))
+            try:
+                data = decode_payload(await resp.body())
+            except NadlanDecodeError as e:
+                raise NadlanAPIError(str(e))
+            first_page = (list(extract_items(data) or []), extract_total(data))
 
-                # Wait for /api/deal response
-                resp: Response = await asyncio.wait_for(fut, timeout=self.timeout + 10)
-                if resp.status != 200:
-                    raise NadlanAPIError(f"/api/deal HTTP {resp.status}")
+            request = resp.request
+            try:
+                cookies = {c["name"]: c["value"] for c in await page.context.cookies(request.url)}
+                bootstrap = ApiBootstrap.from_request(
+                    url=request.url,
+                    method=request.method,
+                    headers=await request.all_headers(),
+                    post_data=request.post_data,
+                    base_id=neigh_id,
+                    cookies=cookies,
+                )
+            except NadlanAPIError as e:
+                logger.warning(f"Deals request cannot be replayed directly: {e}")
+                bootstrap = None
 
-                body_bytes = await resp.body()
-                deals = self._decode_deals_payload(body_bytes)
-                return deals
-            finally:
-                await browser.close()
+            return bootstrap, first_page
 
     def _decode_deals_payload(self, body: bytes) -> List[Deal]:
         """
         Decode the deals payload from the API response.
         Handles various formats: plain JSON, API Gateway envelopes, base64+gzip.
         """
-        # 1) try plain JSON
-        try:
-            data = json.loads(body.decode("utf-8"))
-            items = self._extract_items_from_json(data)
-            if items is not None:
-                return [Deal.from_item(x) for x in items]
-            # maybe {"body": "..."}
-            if isinstance(data, dict) and "body" in data and isinstance(data["body"], str):
-                decoded = self._decode_base64_gzip(data["body"])
-                items = self._extract_items_from_json(decoded)
-                if items is not None:
-                    return [Deal.from_item(x) for x in items]
-        except Exception:
-            # fallthrough to base64 decode
-            pass
-
-        # 2) try raw base64+gzip text
         try:
-            txt = body.decode("utf-8")
-            if txt.startswith("H4sI") or txt.strip().startswith('"H4sI'):
-                txt = txt.strip().strip('"')
-                decoded = self._decode_base64_gzip(txt)
-                items = self._extract_items_from_json(decoded)
-                if items is not None:
-                    return [Deal.from_item(x) for x in items]
-        except Exception:
-            pass
-
-        raise NadlanAPIError("Unrecognized /api/deal payload format")
-
-    @staticmethod
-    def _extract_items_from_json(obj: Any) -> Optional[Sequence[Dict[str, Any]]]:
-        """Extract items from JSON response."""
-        if not isinstance(obj, dict):
-            return None
-        # happy path: {"data":{"items":[...]}}
-        data = obj.get("data") if isinstance(obj.get("data"), dict) else obj
-        items = data.get("items") if isinstance(data, dict) else None
-        if isinstance(items, list):
-            return items
-        return None
-
-    @staticmethod
-    def _decode_base64_gzip(b64_text: str) -> Dict[str, Any]:
-        """Decode base64+gzipped data."""
-        import base64
-        import gzip
-        
-        raw = base64.b64decode(b64_text)
-        decomp = gzip.decompress(raw)
-        return json.loads(decomp.decode("utf-8"))
+            data = decode_payload(body)
+        except NadlanDecodeError as e:
+            raise NadlanAPIError(str(e))
+        return [Deal.from_item(x) for x in extract_items(data) or []]
+
+    _extract_items_from_json = staticmethod(extract_items)
+    _decode_base64_gzip = staticmethod(decode_base64_gzip)
 
 
 # Simple convenience function
@@ -0,0 +1,322 @@
+"""Concurrent, resumable and de-duplicating downloads of RAMI plan documents.
+
+:class:`RamiDownloader` schedules document downloads on a thread pool with a
+per-host concurrency limit and a token-bucket rate limit (instead of a fixed
+sleep between files).  Partial files are kept as ``*.part`` and resumed with
+HTTP ``Range`` requests, and a :class:`DownloadManifest` records the SHA-256
+of every stored file so identical documents shared by several plans (a
+common takanon or tashrit) are stored once and hard-linked into each plan
+directory.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Union
+from urllib.parse import urlparse
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+DOWNLOAD_HEADERS: Dict[str, str] = {
+    "Accept": "application/pdf,application/octet-stream,*/*",
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
+    "Referer": "https://apps.land.gov.il/TabaSearch/"
+}
+
+MANIFEST_NAME = ".rami_manifest.json"
+CHUNK_SIZE = 64 * 1024
+
+
+class TokenBucket:
+    """Thread-safe token bucket: ``rate`` tokens per second, up to ``capacity``."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available and take it."""
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class DownloadManifest:
+    """Content-hash manifest of downloaded files, persisted as JSON.
+
+    Maps each document URL to the SHA-256 of its content and each hash to
+    the file that stores it (relative to the manifest's directory).
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        self.root = self.path.parent
+        self._lock = threading.Lock()
+        self.files: Dict[str, str] = {}
+        self.urls: Dict[str, str] = {}
+        if self.path.exists():
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                self.files = dict(data.get("files", {}))
+                self.urls = dict(data.get("urls", {}))
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable download manifest {self.path}: {e}")
+
+    def stored_path(self, sha256: str) -> Optional[Path]:
+        """Return the existing file holding content ``sha256``, if any."""
+        with self._lock:
+            relative = self.files.get(sha256)
+        if relative is None:
+            return None
+        path = self.root / relative
+        return path if path.exists() else None
+
+    def path_for_url(self, url: str) -> Optional[Path]:
+        """Return the existing file previously downloaded from ``url``, if any."""
+        with self._lock:
+            sha256 = self.urls.get(url)
+        return self.stored_path(sha256) if sha256 else None
+
+    def record(self, url: str, sha256: str, path: Path) -> Path:
+        """Record a download and return the canonical file for its content."""
+        with self._lock:
+            self.urls[url] = sha256
+            relative = self.files.get(sha256)
+            if relative is None or not (self.root / relative).exists():
+                relative = os.path.relpath(path, self.root)
+                self.files[sha256] = relative
+            self._save()
+            return self.root / relative
+
+    def _save(self) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps({"files": self.files, "urls": self.urls}, ensure_ascii=False, indent=1),
+                       encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+@dataclass
+class DownloadJob:
+    """A document to download."""
+
+    url: str
+    save_path: Path
+    group: str = ""
+
+
+@dataclass
+class DownloadResult:
+    """Outcome of a single download."""
+
+    job: DownloadJob
+    ok: bool
+    bytes: int = 0
+    skipped: bool = False
+    deduplicated: bool = False
+    sha256: Optional[str] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class DownloadProgress:
+    """Progress snapshot passed to the progress callback after each job."""
+
+    completed: int
+    total: int
+    failed: int
+    bytes_downloaded: int
+    last: DownloadResult
+
+
+ProgressCallback = Callable[[DownloadProgress], None]
+
+
+def _link_or_copy(source: Path, target: Path) -> None:
+    """Make ``target`` refer to ``source``'s content, sharing storage if possible."""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    if target.exists():
+        target.unlink()
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copyfile(source, target)
+
+
+class RamiDownloader:
+    """Download scheduler with per-host concurrency, rate limiting, resume and de-duplication."""
+
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        *,
+        max_workers: int = 8,
+        max_per_host: int = 4,
+        rate: float = 5.0,
+        burst: Optional[float] = None,
+        timeout: float = 120,
+        manifest: Optional[DownloadManifest] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> None:
+        """Initialize the downloader.
+
+        Args:
+            session: HTTP session to download with
+            max_workers: Downloads running concurrently overall
+            max_per_host: Downloads running concurrently against one host
+            rate: Requests per second allowed (0 disables rate limiting)
+            burst: Token bucket capacity (defaults to ``rate``)
+            timeout: Per-request timeout in seconds
+            manifest: Content-hash manifest used for de-duplication
+            progress: Called with a :class:`DownloadProgress` after each job
+        """
+        self.session = session or requests.Session()
+        self.max_workers = max(1, max_workers)
+        self.max_per_host = max(1, max_per_host)
+        self.bucket = TokenBucket(rate, burst)
+        self.timeout = timeout
+        self.manifest = manifest
+        self.progress = progress
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._host_slots_lock = threading.Lock()
+
+    def download(self, url: str, save_path: Union[str, Path], overwrite: bool = False) -> DownloadResult:
+        """Download a single document."""
+        return self._run_job(DownloadJob(url=url, save_path=Path(save_path)), overwrite)
+
+    def download_all(self, jobs: Iterable[DownloadJob], overwrite: bool = False) -> List[DownloadResult]:
+        """Download all jobs concurrently.
+
+        Returns:
+            One result per job, in job order
+        """
+        jobs = list(jobs)
+        if not jobs:
+            return []
+        state = {"completed": 0, "failed": 0, "bytes": 0}
+        state_lock = threading.Lock()
+
+        def run(job: DownloadJob) -> DownloadResult:
+            result = self._run_job(job, overwrite)
+            with state_lock:
+                state["completed"] += 1
+                state["failed"] += 0 if result.ok else 1
+                state["bytes"] += result.bytes
+                snapshot = DownloadProgress(
+                    completed=state["completed"],
+                    total=len(jobs),
+                    failed=state["failed"],
+                    bytes_downloaded=state["bytes"],
+                    last=result,
+                )
+            if self.progress is not None:
+                try:
+                    self.progress(snapshot)
+                except Exception as e:
+                    logger.debug(f"Download progress callback failed: {e}")
+            return result
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(jobs))) as executor:
+            return list(executor.map(run, jobs))
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _host_slot(self, url: str) -> threading.BoundedSemaphore:
+        host = urlparse(url).netloc
+        with self._host_slots_lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self.max_per_host)
+            return self._host_slots[host]
+
+    def _run_job(self, job: DownloadJob, overwrite: bool) -> DownloadResult:
+        save_path = job.save_path
+        if not overwrite:
+            if save_path.exists():
+                logger.debug(f"File already exists, skipping: {save_path}")
+                return DownloadResult(job, ok=True, skipped=True)
+            known = self.manifest.path_for_url(job.url) if self.manifest else None
+            if known is not None:
+                _link_or_copy(known, save_path)
+                return DownloadResult(job, ok=True, skipped=True, deduplicated=True)
+        try:
+            with self._host_slot(job.url):
+                self.bucket.acquire()
+                return self._fetch(job)
+        except Exception as e:
+            logger.error(f"Failed to download {job.url}: {e}")
+            return DownloadResult(job, ok=False, error=str(e))
+
+    def _fetch(self, job: DownloadJob) -> DownloadResult:
+        save_path = job.save_path
+        save_path.parent.mkdir(parents=True, exist_ok=True)
+        part_path = save_path.with_name(save_path.name + ".part")
+        offset = part_path.stat().st_size if part_path.exists() else 0
+
+        headers = dict(DOWNLOAD_HEADERS)
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+        response = self.session.get(job.url, headers=headers, timeout=self.timeout, stream=True)
+        written = 0
+        try:
+            if response.status_code == 416 and offset:
+                # The partial file is already complete
+                pass
+            elif response.status_code not in (200, 206):
+                return DownloadResult(job, ok=False, error=f"HTTP {response.status_code}")
+            elif "text/html" in response.headers.get("content-type", "").lower():
+                return DownloadResult(job, ok=False, error="HTML response instead of document")
+            else:
+                if response.status_code == 200:
+                    # Server ignored the Range header: start over
+                    offset = 0
+                with open(part_path, "ab" if offset else "wb") as f:
+                    for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                        if chunk:
+                            f.write(chunk)
+                            written += len(chunk)
+        finally:
+            response.close()
+
+        sha256 = self._hash_file(part_path)
+        result = DownloadResult(job, ok=True, bytes=written, sha256=sha256)
+        os.replace(part_path, save_path)
+        if self.manifest is not None:
+            canonical = self.manifest.record(job.url, sha256, save_path)
+            if canonical.resolve() != save_path.resolve():
+                # Same content already stored for another plan: share it
+                _link_or_copy(canonical, save_path)
+                result.deduplicated = True
+        logger.debug(f"Downloaded: {save_path} ({result.bytes} bytes)")
+        return result
+
+    @staticmethod
+    def _hash_file(path: Path) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
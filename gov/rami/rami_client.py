@@ -1,21 +1,33 @@
 """Client for fetching planning (Taba) data from land.gov.il.
 
-This class wraps the ``TabaSearch`` API endpoint and exposes a ``fetch_plans``
-method that paginates through results and returns them as a
-:class:`pandas.DataFrame`.
+This class wraps the ``TabaSearch`` API endpoint.  ``iter_plans`` and
+``fetch_plans_records`` return the plans as plain dictionaries (the JSON rows
+of the API, including their nested ``documentsSet``); ``fetch_plans`` builds a
+:class:`pandas.DataFrame` from them for the CLI and notebooks.  pandas is only
+imported when a DataFrame is requested.
 """
 
 from __future__ import annotations
 
-import time
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Union
 
-import pandas as pd
 import requests
 
 from utils.retry import request_with_retry
 
+from .downloader import (
+    MANIFEST_NAME,
+    DownloadJob,
+    DownloadManifest,
+    DownloadResult,
+    ProgressCallback,
+    RamiDownloader,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    import pandas as pd
+
 
 class RamiClient:
     """Simple client for the RAMI TabaSearch API."""
@@ -45,6 +57,8 @@ class RamiClient:
         delay: float = 0.2,
         session: Optional[requests.Session] = None,
         endpoint: Optional[str] = None,
+        max_concurrent_downloads: int = 4,
+        download_rate: Optional[float] = None,
     ) -> None:
         self.session = session or requests.Session()
         self.headers = dict(self.DEFAULT_HEADERS)
@@ -57,6 +71,12 @@ class RamiClient:
         self.max_pages = max_pages
         self.delay = delay
         self.endpoint = endpoint or self.ENDPOINT
+        # Downloads run concurrently per host; ``delay`` becomes the default
+        # rate limit (one request per ``delay`` seconds) instead of a fixed sleep
+        self.max_concurrent_downloads = max_concurrent_downloads
+        if download_rate is None:
+            download_rate = 1.0 / delay if delay > 0 else 0.0
+        self.download_rate = download_rate
         # Ensure a User-Agent header exists on the session for some picky APIs
         self.session.headers.update({"User-Agent": self.headers.get("User-Agent", "Mozilla/5.0")})
 
@@ -156,8 +176,8 @@ class RamiClient:
             "planTypesUsed": plan_types_used
         }
 
-    def fetch_plans(self, search_params: Dict[str, Any]) -> pd.DataFrame:
-        """Fetch all plan results for a given search parameters."""
+    def iter_plans(self, search_params: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Yield the plans matching the search parameters as dictionaries."""
         # For RAMI API, pagination doesn't work as expected
         # The API returns all results in a single request
         response = request_with_retry(
@@ -171,9 +191,23 @@ class RamiClient:
         if response.status_code == 401:
             raise RuntimeError("401 Unauthorized – missing Cookie/Authorization headers?")
 
-        data = response.json()
-        rows = list(self._extract_results(data))
-        return pd.DataFrame(rows)
+        for row in self._extract_results(response.json()):
+            if isinstance(row, dict):
+                yield row
+
+    def fetch_plans_records(self, search_params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Fetch all plans for the given search parameters as a list of dictionaries."""
+        return list(self.iter_plans(search_params))
+
+    def fetch_plans(self, search_params: Dict[str, Any]) -> "pd.DataFrame":
+        """Fetch all plan results for a given search parameters as a DataFrame.
+
+        Prefer :meth:`fetch_plans_records` in library code; this is meant for
+        the CLI and notebooks.
+        """
+        import pandas as pd
+
+        return pd.DataFrame(self.fetch_plans_records(search_params))
 
     def _extract_document_urls(self, plan: Dict[str, Any]) -> List[Dict[str, str]]:
         """Extract document URLs from a plan's documentsSet."""
@@ -242,9 +276,26 @@ class RamiClient:
         
         return documents
 
+    def _downloader(
+        self,
+        manifest: Optional[DownloadManifest] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> RamiDownloader:
+        """Create a download scheduler sharing this client's session."""
+        return RamiDownloader(
+            self.session,
+            max_workers=self.max_concurrent_downloads,
+            max_per_host=self.max_concurrent_downloads,
+            rate=self.download_rate,
+            manifest=manifest,
+            progress=progress,
+        )
+
     def download_document(self, url: str, save_path: Union[str, Path], 
                          overwrite: bool = False) -> bool:
         """Download a single document from the given URL.
+
+        Interrupted downloads are resumed from their ``.part`` file.
         
         Args:
             url: The document URL to download
@@ -254,136 +305,111 @@ class RamiClient:
         Returns:
             True if downloaded successfully, False otherwise
         """
-        save_path = Path(save_path)
+        result = self._downloader().download(url, save_path, overwrite)
+        if not result.ok:
+            print(f"Failed to download {url}: {result.error}")
+        return result.ok
+
+    def _plan_download_jobs(self, plan: Dict[str, Any], base_dir: Path,
+                            doc_types: Optional[List[str]] = None) -> List[DownloadJob]:
+        """Build the download jobs for a plan's documents."""
+        plan_number = plan.get('planNumber', 'unknown_plan')
+        plan_id = plan.get('planId', 'unknown_id')
         
-        if save_path.exists() and not overwrite:
-            print(f"File already exists, skipping: {save_path}")
-            return True
-            
-        try:
-            # Create directory if it doesn't exist
-            save_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Simple but effective headers for file downloads
-            download_headers = {
-                "Accept": "application/pdf,application/octet-stream,*/*",
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
-                "Referer": "https://apps.land.gov.il/TabaSearch/"
-            }
-            
-            # Download with a longer timeout for large files
-            response = self.session.get(url, headers=download_headers, timeout=120, stream=True)
-            
-            # Check status code first
-            if response.status_code == 404:
-                print(f"File not found (404): {url}")
-                return False
-            elif response.status_code == 403:
-                print(f"Access forbidden (403): {url}")
-                return False
-            elif response.status_code != 200:
-                print(f"HTTP error {response.status_code} for {url}")
-                return False
-            
-            # Check if it's actually a PDF/document (not HTML error page)
-            content_type = response.headers.get('content-type', '').lower()
-            if 'text/html' in content_type:
-                print(f"Warning: Got HTML response instead of document for {url}")
-                # Log some of the HTML to understand the error
-                html_preview = response.text[:200] if hasattr(response, 'text') else "Cannot read HTML"
-                print(f"HTML preview: {html_preview}...")
-                return False
-            
-            # Write file in chunks
-            total_size = 0
-            with open(save_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-                        total_size += len(chunk)
-                        
-            print(f"Downloaded: {save_path} ({total_size} bytes)")
-            return True
-            
-        except Exception as e:
-            print(f"Failed to download {url}: {e}")
-            return False
+        # Create safe directory name
+        safe_plan_name = "".join(c for c in plan_number if c.isalnum() or c in (' ', '-', '_')).strip()
+        plan_dir = base_dir / f"{safe_plan_name}_{plan_id}"
+        
+        documents = self._extract_document_urls(plan)
+        
+        if doc_types:
+            documents = [doc for doc in documents if doc['type'] in doc_types]
+
+        # Create filename from path
+        return [
+            DownloadJob(
+                url=doc['url'],
+                save_path=plan_dir / doc['type'] / Path(doc['path']).name,
+                group=plan_number,
+            )
+            for doc in documents
+        ]
+
+    @staticmethod
+    def _collect_results(results: Iterable[DownloadResult]) -> Dict[str, List[str]]:
+        collected: Dict[str, List[str]] = {'success': [], 'failed': []}
+        for result in results:
+            if result.ok:
+                collected['success'].append(str(result.job.save_path))
+            else:
+                collected['failed'].append(result.job.url)
+        return collected
 
     def download_plan_documents(self, plan: Dict[str, Any], base_dir: Union[str, Path] = "plans",
                               doc_types: Optional[List[str]] = None, 
-                              overwrite: bool = False) -> Dict[str, List[str]]:
+                              overwrite: bool = False,
+                              progress: Optional[ProgressCallback] = None) -> Dict[str, List[str]]:
         """Download all documents for a single plan.
+
+        Documents are downloaded concurrently and de-duplicated through a
+        content-hash manifest in ``base_dir``.
         
         Args:
             plan: Plan dictionary containing documentsSet
             base_dir: Base directory to save documents
             doc_types: List of document types to download (default: all)
             overwrite: Whether to overwrite existing files
+            progress: Called with a DownloadProgress after each document
             
         Returns:
             Dict with 'success' and 'failed' lists of file paths
         """
         base_dir = Path(base_dir)
-        plan_number = plan.get('planNumber', 'unknown_plan')
-        plan_id = plan.get('planId', 'unknown_id')
-        
-        # Create safe directory name
-        safe_plan_name = "".join(c for c in plan_number if c.isalnum() or c in (' ', '-', '_')).strip()
-        plan_dir = base_dir / f"{safe_plan_name}_{plan_id}"
-        
-        documents = self._extract_document_urls(plan)
-        
-        if doc_types:
-            documents = [doc for doc in documents if doc['type'] in doc_types]
-            
-        results = {'success': [], 'failed': []}
-        
-        for doc in documents:
-            # Create filename from path
-            file_path = Path(doc['path'])
-            filename = file_path.name
-            save_path = plan_dir / doc['type'] / filename
-            
-            if self.download_document(doc['url'], save_path, overwrite):
-                results['success'].append(str(save_path))
-            else:
-                results['failed'].append(doc['url'])
-                
-            # Small delay between downloads
-            time.sleep(self.delay)
-        
-        return results
+        jobs = self._plan_download_jobs(plan, base_dir, doc_types)
+        downloader = self._downloader(DownloadManifest(base_dir / MANIFEST_NAME), progress)
+        return self._collect_results(downloader.download_all(jobs, overwrite))
 
     def download_multiple_plans_documents(self, plans: List[Dict[str, Any]], 
                                         base_dir: Union[str, Path] = "plans",
                                         doc_types: Optional[List[str]] = None,
-                                        overwrite: bool = False) -> Dict[str, Any]:
+                                        overwrite: bool = False,
+                                        progress: Optional[ProgressCallback] = None) -> Dict[str, Any]:
         """Download documents for multiple plans.
+
+        The documents of all plans are scheduled together, so the per-host
+        concurrency and rate limits apply across the whole batch.
         
         Args:
             plans: List of plan dictionaries
             base_dir: Base directory to save documents
             doc_types: List of document types to download (default: all)
             overwrite: Whether to overwrite existing files
+            progress: Called with a DownloadProgress after each document
             
         Returns:
             Summary of download results
         """
-        total_success = 0
-        total_failed = 0
-        plan_results = {}
-        
+        base_dir = Path(base_dir)
+        plan_numbers = []
+        jobs: List[DownloadJob] = []
         for i, plan in enumerate(plans, 1):
             plan_number = plan.get('planNumber', f'plan_{i}')
-            print(f"Downloading documents for plan {i}/{len(plans)}: {plan_number}")
-            
-            results = self.download_plan_documents(plan, base_dir, doc_types, overwrite)
-            plan_results[plan_number] = results
-            
-            total_success += len(results['success'])
-            total_failed += len(results['failed'])
-            
-            print(f"  ✓ {len(results['success'])} files downloaded, ✗ {len(results['failed'])} failed")
+            plan_numbers.append(plan_number)
+            for job in self._plan_download_jobs(plan, base_dir, doc_types):
+                job.group = plan_number
+                jobs.append(job)
+
+        print(f"Downloading {len(jobs)} documents for {len(plans)} plans")
+        downloader = self._downloader(DownloadManifest(base_dir / MANIFEST_NAME), progress)
+        results = downloader.download_all(jobs, overwrite)
+
+        plan_results = {
+            plan_number: self._collect_results(r for r in results if r.job.group == plan_number)
+            for plan_number in plan_numbers
+        }
+        
+        total_success = sum(len(r['success']) for r in plan_results.values())
+        total_failed = sum(len(r['failed']) for r in plan_results.values())
         
         summary = {
             'total_plans': len(plans),
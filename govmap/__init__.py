@@ -3,6 +3,7 @@ GovMap module for national-level parcel and layer data collection.
 """
 
 from .api_client import GovMapClient
+from .cache import GovMapCache
 from .scraper import GovMapAutocomplete
 
-__all__ = ["GovMapClient", "GovMapAutocomplete"]
+__all__ = ["GovMapClient", "GovMapCache", "GovMapAutocomplete"]
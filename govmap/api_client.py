@@ -13,11 +13,18 @@ Notes
 * WFS querying uses CQL filters. Geometry field names vary by layer ("the_geom", "geom").
   We allow providing candidate names to try.
 * Keep layers configurable via constructor args (no environment variables).
+* All requests share one pooled session whose adapter retries 429/5xx responses
+  (honoring ``Retry-After``). JSON responses are cached per client: static
+  catalogs for ``catalog_ttl`` seconds, address and parcel lookups for
+  ``lookup_ttl`` seconds. Pass a :class:`~govmap.cache.GovMapCache` with a path
+  to persist them on disk.
 """
 import json
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 import requests
 from pyproj import Transformer
@@ -25,12 +32,26 @@ import urllib3
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from .cache import GovMapCache
+from .parcel_index import BBox, ParcelIndex
+
 logger = logging.getLogger(__name__)
 
 # Default endpoints (no env usage)
 DEFAULT_WMS = "https://open.govmap.gov.il/geoserver/opendata/wms"
 DEFAULT_WFS = "https://open.govmap.gov.il/geoserver/opendata/ows"
 DEFAULT_AUTOCOMPLETE = "https://www.govmap.gov.il/api/search-service/autocomplete"
+DEFAULT_PARCEL_LAYER = "opendata:PARCEL_ALL"
+DEFAULT_WFS_PAGE_SIZE = 1000
+
+# Transport and cache defaults
+DEFAULT_CATALOG_TTL = 24 * 3600
+DEFAULT_LOOKUP_TTL = 600
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_POOL_SIZE = 16
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+_MISSING = object()
 
 # Reusable transformers
 _TO_WGS84 = Transformer.from_crs(2039, 4326, always_xy=True)
@@ -78,6 +99,12 @@ class GovMapClient:
         user_token: Optional[str] = None,
         domain: Optional[str] = None,
         auth_token: Optional[str] = None,  # pre-existing session token if you have it
+        cache: Optional[GovMapCache] = None,
+        catalog_ttl: float = DEFAULT_CATALOG_TTL,
+        lookup_ttl: float = DEFAULT_LOOKUP_TTL,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        parcel_index: Optional[ParcelIndex] = None,
     ) -> None:
         self.wms_url = wms_url.rstrip("?")
         self.wfs_url = wfs_url.rstrip("?")
@@ -98,9 +125,24 @@ class GovMapClient:
 
         # Disable SSL warnings (you can set self.http.verify=True if you want strict TLS)
         urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-        self.http.mount('https://', requests.adapters.HTTPAdapter())
+        adapter = HTTPAdapter(
+            max_retries=self._retry_policy(max_retries),
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+        )
+        self.http.mount('http://', adapter)
+        self.http.mount('https://', adapter)
         self.http.verify = False
 
+        # Response cache
+        self.cache = cache or GovMapCache()
+        self.catalog_ttl = catalog_ttl
+        self.lookup_ttl = lookup_ttl
+        self._auth_lock = threading.RLock()
+
+        # Parcels prefetched from WFS, for local point-to-parcel resolution
+        self.parcel_index = parcel_index or ParcelIndex()
+
         # Auth state (no env usage)
         self.auth_data: Dict[str, str] = {}
         if api_token:
@@ -112,33 +154,50 @@ class GovMapClient:
         if auth_token:
             self.auth_data["token"] = auth_token
 
+    # ----------------------------- Transport -----------------------------
+    @staticmethod
+    def _retry_policy(max_retries: int) -> Retry:
+        """Retry 429/5xx responses with exponential backoff.
+
+        GovMap reads are idempotent (including the POST search endpoints), so all
+        methods are retried. ``Retry-After`` is honored, and once retries are
+        exhausted the last response is returned so callers see its status code.
+        Failed connections are retried once, immediately: an unreachable host
+        rarely recovers within the backoff window.
+        """
+        return Retry(
+            total=max_retries,
+            connect=min(1, max_retries),
+            backoff_factor=1,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=None,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+
+    def _cached(self, key: Tuple[Any, ...], ttl: float, fetch: Callable[[], Any]) -> Any:
+        """Return the cached response for ``key`` or call ``fetch`` and cache its result."""
+        cache_key = json.dumps(key, ensure_ascii=False, sort_keys=True, default=str)
+        cached = self.cache.get(cache_key, _MISSING)
+        if cached is not _MISSING:
+            return cached
+        value = fetch()
+        self.cache.set(cache_key, value, ttl)
+        return value
+
     # ----------------------------- Search -----------------------------
     def autocomplete(self, query: str, language: str = "he", max_results: int = 10) -> Dict[str, Any]:
         """Call the public autocomplete endpoint (no token required).
         Returns the raw JSON response from the new GovMap API.
         """
-        # Create an isolated session for this request (keeps retries independent)
-        session = requests.Session()
-        session.verify = False
-
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-
-        session.headers.update({
+        headers = {
             "Accept": "application/json",
             "Accept-Language": "en-US,en;q=0.9,he-IL;q=0.8,he;q=0.7",
             "Content-Type": "application/json",
             "Sec-Fetch-Dest": "empty",
             "Sec-Fetch-Mode": "cors",
             "Sec-Fetch-Site": "same-origin",
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120 Safari/537.36",
-        })
+        }
 
         payload = {
             "searchText": query,
@@ -147,11 +206,14 @@ class GovMapClient:
             "maxResults": max_results
         }
 
-        try:
-            r = session.post(self.autocomplete_url, json=payload, timeout=self.timeout, verify=False)
+        def fetch() -> Dict[str, Any]:
+            r = self.http.post(self.autocomplete_url, json=payload, headers=headers, timeout=self.timeout, verify=False)
             if r.status_code != 200:
                 raise GovMapError(f"Autocomplete HTTP {r.status_code}")
             return r.json()
+
+        try:
+            return self._cached(("autocomplete", self.autocomplete_url, payload), self.lookup_ttl, fetch)
         except Exception as e:
             logger.error(f"GovMap autocomplete failed: {e}")
             raise GovMapError(f"Autocomplete failed: {e}")
@@ -174,46 +236,58 @@ class GovMapClient:
         return None
 
     def get_layers_catalog(self, language: str = "he") -> Dict[str, Any]:
-        """Get the layers catalog from GovMap."""
-        try:
-            headers = {
-                "Accept": "application/json, text/plain, */*",
-                "Accept-Language": "en-US,en;q=0.9,he-IL;q=0.8,he;q=0.7",
-                "Sec-Fetch-Dest": "empty",
-                "Sec-Fetch-Mode": "cors",
-                "Sec-Fetch-Site": "same-origin",
-            }
-            params = {"lang": language}
+        """Get the layers catalog from GovMap (cached for ``catalog_ttl`` seconds)."""
+        headers = {
+            "Accept": "application/json, text/plain, */*",
+            "Accept-Language": "en-US,en;q=0.9,he-IL;q=0.8,he;q=0.7",
+            "Sec-Fetch-Dest": "empty",
+            "Sec-Fetch-Mode": "cors",
+            "Sec-Fetch-Site": "same-origin",
+        }
+        params = {"lang": language}
+
+        def fetch() -> Dict[str, Any]:
             r = self.http.get(self.layers_catalog_url, params=params, headers=headers, timeout=self.timeout, verify=False)
             if r.status_code != 200:
                 raise GovMapError(f"Layers catalog HTTP {r.status_code}")
             return r.json()
+
+        try:
+            return self._cached(("layers_catalog", self.layers_catalog_url, params), self.catalog_ttl, fetch)
         except Exception as e:
             logger.error(f"GovMap layers catalog failed: {e}")
             raise GovMapError(f"Layers catalog failed: {e}")
 
     def get_search_types(self, language: str = "he") -> Dict[str, Any]:
-        """Get search types from GovMap."""
-        try:
-            headers = {
-                "Accept": "application/json",
-                "Accept-Language": "en-US,en;q=0.9,he-IL;q=0.8,he;q=0.7",
-                "Content-Type": "application/json",
-                "Sec-Fetch-Dest": "empty",
-                "Sec-Fetch-Mode": "cors",
-                "Sec-Fetch-Site": "same-origin",
-            }
-            payload = {"language": language}
+        """Get search types from GovMap (cached for ``catalog_ttl`` seconds)."""
+        headers = {
+            "Accept": "application/json",
+            "Accept-Language": "en-US,en;q=0.9,he-IL;q=0.8,he;q=0.7",
+            "Content-Type": "application/json",
+            "Sec-Fetch-Dest": "empty",
+            "Sec-Fetch-Mode": "cors",
+            "Sec-Fetch-Site": "same-origin",
+        }
+        payload = {"language": language}
+
+        def fetch() -> Dict[str, Any]:
             r = self.http.post(self.search_types_url, json=payload, headers=headers, timeout=self.timeout, verify=False)
             if r.status_code != 200:
                 raise GovMapError(f"Search types HTTP {r.status_code}")
             return r.json()
+
+        try:
+            return self._cached(("search_types", self.search_types_url, payload), self.catalog_ttl, fetch)
         except Exception as e:
             logger.error(f"GovMap search types failed: {e}")
             raise GovMapError(f"Search types failed: {e}")
 
     def get_parcel_data(self, x: float, y: float) -> Dict[str, Any]:
-        """Get parcel data for specific coordinates."""
+        """Get parcel data for specific coordinates (cached for ``lookup_ttl`` seconds).
+
+        Transient failures (429/5xx, connection errors) are retried by the
+        transport before an error is raised.
+        """
         headers = {
             "Accept": "application/json, text/plain, */*",
             "Accept-Language": "en-US,en;q=0.9,he-IL;q=0.8,he;q=0.7",
@@ -224,41 +298,179 @@ class GovMapClient:
         coord_string = f"({x}%20{y})"
         url = f"{self.parcel_search_url}/{coord_string}"
 
-        for attempt in range(3):
-            try:
-                r = self.http.get(url, headers=headers, timeout=self.timeout, verify=False)
-                if r.status_code == 200:
-                    return r.json()
-                elif r.status_code == 500:
-                    if attempt < 2:
-                        import time; time.sleep(2 ** attempt)
-                        logger.warning(f"GovMap parcel search HTTP 500, retrying attempt {attempt + 2}/3 for ({x}, {y})")
-                        continue
-                    raise GovMapError(f"Parcel search HTTP {r.status_code}")
-                else:
-                    logger.warning(f"GovMap parcel search returned HTTP {r.status_code} for ({x}, {y})")
-                    raise GovMapError(f"Parcel search HTTP {r.status_code}")
-            except Exception as e:
-                if attempt < 2:
-                    import time; time.sleep(2 ** attempt)
-                    logger.warning(f"GovMap parcel search failed, retrying attempt {attempt + 2}/3 for ({x}, {y}): {e}")
-                    continue
-                logger.warning(f"GovMap parcel search failed after 3 attempts for ({x}, {y}): {e}")
-                raise GovMapError(f"Parcel search failed: {e}")
+        def fetch() -> Dict[str, Any]:
+            r = self.http.get(url, headers=headers, timeout=self.timeout, verify=False)
+            if r.status_code != 200:
+                logger.warning(f"GovMap parcel search returned HTTP {r.status_code} for ({x}, {y})")
+                raise GovMapError(f"Parcel search HTTP {r.status_code}")
+            return r.json()
 
-        raise GovMapError("Parcel search failed after all retry attempts")
+        try:
+            return self._cached(("parcel", url), self.lookup_ttl, fetch)
+        except GovMapError:
+            raise
+        except Exception as e:
+            logger.warning(f"GovMap parcel search failed for ({x}, {y}): {e}")
+            raise GovMapError(f"Parcel search failed: {e}")
 
     def get_base_layers(self) -> Dict[str, Any]:
-        """Get base layers from GovMap API."""
-        try:
+        """Get base layers from GovMap API (cached for ``catalog_ttl`` seconds)."""
+        def fetch() -> Dict[str, Any]:
             r = self.http.get(self.base_layers_url, timeout=self.timeout)
             if r.status_code != 200:
                 raise GovMapError(f"Base layers HTTP {r.status_code}")
             return r.json()
+
+        try:
+            return self._cached(("base_layers", self.base_layers_url), self.catalog_ttl, fetch)
         except Exception as e:
             logger.error(f"GovMap base layers failed: {e}")
             raise GovMapError(f"Base layers failed: {e}")
 
+    # ----------------------------- OpenData WFS -----------------------------
+    def wfs_get_features(
+        self,
+        layer: str,
+        cql_filter: Optional[str] = None,
+        max_features: int = 50,
+        *,
+        bbox: Optional[BBox] = None,
+        start_index: int = 0,
+        geometry_field: str = "the_geom",
+    ) -> Dict[str, Any]:
+        """WFS GetFeature on an OpenData layer, returned as a GeoJSON FeatureCollection (ITM).
+
+        Parameters
+        ----------
+        layer : Layer type name, e.g. "opendata:PARCEL_ALL"
+        cql_filter : Optional CQL filter
+        max_features : Page size (WFS ``count``)
+        bbox : Optional (min_x, min_y, max_x, max_y) in EPSG:2039
+        start_index : Index of the first feature to return (paging)
+        geometry_field : Geometry column used when ``bbox`` is combined with ``cql_filter``
+        """
+        params: Dict[str, Any] = {
+            "service": "WFS",
+            "version": "2.0.0",
+            "request": "GetFeature",
+            "typeNames": layer,
+            "outputFormat": "application/json",
+            "srsName": "EPSG:2039",
+            "count": max_features,
+            "startIndex": start_index,
+        }
+        if bbox is not None and cql_filter:
+            # GeoServer rejects bbox and CQL_FILTER together
+            min_x, min_y, max_x, max_y = bbox
+            params["CQL_FILTER"] = f"BBOX({geometry_field},{min_x},{min_y},{max_x},{max_y}) AND ({cql_filter})"
+        elif bbox is not None:
+            params["bbox"] = ",".join(str(v) for v in bbox) + ",EPSG:2039"
+        elif cql_filter:
+            params["CQL_FILTER"] = cql_filter
+
+        try:
+            r = self.http.get(self.wfs_url, params=params, timeout=self.timeout, verify=False)
+            if r.status_code != 200:
+                raise GovMapError(f"WFS HTTP {r.status_code}")
+            return r.json()
+        except GovMapError:
+            raise
+        except Exception as e:
+            logger.error(f"GovMap WFS request for {layer} failed: {e}")
+            raise GovMapError(f"WFS request failed: {e}")
+
+    def iter_wfs_features(
+        self,
+        layer: str,
+        bbox: Optional[BBox] = None,
+        cql_filter: Optional[str] = None,
+        page_size: int = DEFAULT_WFS_PAGE_SIZE,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield every feature of a WFS query, one ``page_size`` page at a time."""
+        start = 0
+        while True:
+            page = self.wfs_get_features(layer, cql_filter, page_size, bbox=bbox, start_index=start)
+            features = page.get("features") or []
+            yield from features
+            start += len(features)
+            matched = page.get("numberMatched")
+            if len(features) < page_size or (isinstance(matched, int) and start >= matched):
+                return
+
+    def prefetch_parcels(
+        self,
+        bbox: BBox,
+        layer: str = DEFAULT_PARCEL_LAYER,
+        page_size: int = DEFAULT_WFS_PAGE_SIZE,
+        max_workers: int = 4,
+    ) -> int:
+        """Load every parcel intersecting ``bbox`` into :attr:`parcel_index`.
+
+        The first page reports how many parcels match; the remaining pages are
+        fetched concurrently. Afterwards :meth:`get_parcel_at_point` answers any
+        point inside ``bbox`` locally.
+
+        Parameters
+        ----------
+        bbox : (min_x, min_y, max_x, max_y) in EPSG:2039
+        layer : Parcel layer type name
+        page_size : Features per WFS page
+        max_workers : Pages fetched concurrently
+
+        Returns
+        -------
+        Number of parcels added to the index
+        """
+        def fetch(start: int) -> List[Dict[str, Any]]:
+            return self.wfs_get_features(layer, None, page_size, bbox=bbox, start_index=start).get("features") or []
+
+        first = self.wfs_get_features(layer, None, page_size, bbox=bbox)
+        features = first.get("features") or []
+        added = self.parcel_index.add_features(features)
+
+        matched = first.get("numberMatched")
+        if len(features) >= page_size and isinstance(matched, int):
+            starts = range(len(features), matched, page_size)
+            if starts:
+                with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(starts)))) as executor:
+                    for page in executor.map(fetch, starts):
+                        added += self.parcel_index.add_features(page)
+        else:
+            # Server did not report a total: page sequentially until a short page
+            start, page = len(features), features
+            while len(page) >= page_size:
+                page = fetch(start)
+                added += self.parcel_index.add_features(page)
+                start += len(page)
+
+        self.parcel_index.mark_covered(bbox)
+        logger.info(f"Prefetched {added} parcels from {layer} for bbox {bbox}")
+        return added
+
+    def get_parcel_at_point(
+        self,
+        x: float,
+        y: float,
+        layer: str = DEFAULT_PARCEL_LAYER,
+        buffer_m: float = 1.0,
+    ) -> Optional[Dict[str, Any]]:
+        """Return the parcel feature containing an ITM point.
+
+        Points inside a prefetched bbox are resolved locally; otherwise the
+        parcels around the point are fetched from WFS (and indexed for reuse).
+        """
+        if self.parcel_index.covers(x, y):
+            return self.parcel_index.locate(x, y)
+
+        feature = self.parcel_index.locate(x, y)
+        if feature is not None:
+            return feature
+
+        bbox = (x - buffer_m, y - buffer_m, x + buffer_m, y + buffer_m)
+        features = self.wfs_get_features(layer, None, 10, bbox=bbox).get("features") or []
+        self.parcel_index.add_features(features)
+        return self.parcel_index.locate(x, y) or (features[0] if features else None)
+
     # ----------------------------- Address insights -----------------------------
     def search_and_locate_address(self, address: str, search_type: int = 0) -> Dict[str, Any]:
         """
@@ -266,9 +478,12 @@ class GovMapClient:
         Adds a last-chance unauthenticated attempt (some edges accept it).
         """
         payload = {"type": search_type, "address": address}
+        # Token sent by the last header-auth attempt, to tell whether a refresh is still needed
+        sent: Dict[str, Optional[str]] = {}
 
         def _attempt_header_auth() -> requests.Response:
             headers = self._build_auth_headers()
+            sent["token"] = json.loads(headers["auth_data"]).get("token")
             return self.http.post(
                 self.search_and_locate_url,
                 json=payload,
@@ -304,43 +519,58 @@ class GovMapClient:
         def _is_auth_failure(response: requests.Response) -> bool:
             return response.status_code in {401, 403}
 
-        # Try header-auth. If bootstrap needed, _build_auth_headers() will call _refresh_auth_token().
-        try:
-            resp = _attempt_header_auth()
-        except GovMapAuthError:
-            raise
-        except Exception as e:
-            raise GovMapError(f"SearchAndLocate failed (auth attempt): {e}")
-
-        if _is_auth_failure(resp):
+        def _locate() -> Any:
+            # Try header-auth. If bootstrap needed, _build_auth_headers() will call _refresh_auth_token().
             try:
-                self._refresh_auth_token()
+                resp = _attempt_header_auth()
             except GovMapAuthError:
                 raise
             except Exception as e:
-                raise GovMapError(f"SearchAndLocate auth refresh failed: {e}")
+                raise GovMapError(f"SearchAndLocate failed (auth attempt): {e}")
 
-            resp = _attempt_header_auth()
             if _is_auth_failure(resp):
-                raise GovMapAuthError("SearchAndLocate authentication rejected credentials (HTTP 401).")
-
-        if resp.status_code != 200:
-            raise GovMapError(f"SearchAndLocate HTTP {resp.status_code}")
+                try:
+                    self._refresh_stale_token(sent.get("token"))
+                except GovMapAuthError:
+                    raise
+                except Exception as e:
+                    raise GovMapError(f"SearchAndLocate auth refresh failed: {e}")
 
-        data = _parse_json(resp)
+                resp = _attempt_header_auth()
+                if _is_auth_failure(resp):
+                    raise GovMapAuthError("SearchAndLocate authentication rejected credentials (HTTP 401).")
 
-        # Handle tokenExpired in JSON payloads (rare when we got 200)
-        if isinstance(data, dict) and data.get("tokenExpired") is True:
-            self._refresh_auth_token()
-            resp = _attempt_header_auth()
             if resp.status_code != 200:
-                resp = _attempt_body_auth()
-            if resp.status_code != 200:
-                raise GovMapError(f"SearchAndLocate after token refresh failed: HTTP {resp.status_code}")
+                raise GovMapError(f"SearchAndLocate HTTP {resp.status_code}")
+
             data = _parse_json(resp)
 
-        return data
+            # Handle tokenExpired in JSON payloads (rare when we got 200)
+            if isinstance(data, dict) and data.get("tokenExpired") is True:
+                self._refresh_stale_token(sent.get("token"))
+                resp = _attempt_header_auth()
+                if resp.status_code != 200:
+                    resp = _attempt_body_auth()
+                if resp.status_code != 200:
+                    raise GovMapError(f"SearchAndLocate after token refresh failed: HTTP {resp.status_code}")
+                data = _parse_json(resp)
+
+            return data
+
+        return self._cached(("search_and_locate", self.search_and_locate_url, payload), self.lookup_ttl, _locate)
     # ----------------------------- Auth helpers -----------------------------
+    def _refresh_stale_token(self, stale_token: Optional[str]) -> None:
+        """
+        Refresh the session token unless another thread already replaced ``stale_token``.
+
+        Concurrent requests that fail with the same expired token trigger a single
+        re-authentication; the others reuse the token it obtained.
+        """
+        with self._auth_lock:
+            if (self.auth_data.get("token") or None) != (stale_token or None):
+                return
+            self._refresh_auth_token()
+
     def _build_auth_headers(self) -> Dict[str, str]:
         """
         Return sanitized auth headers for GovMap private controllers.
@@ -357,9 +587,9 @@ class GovMapClient:
         elif clean.get("token"):
             clean = {"token": clean["token"]}
         else:
-            # Bootstrap token
+            # Bootstrap token (once, even if several threads get here together)
             try:
-                self._refresh_auth_token()
+                self._refresh_stale_token(None)
             except GovMapAuthError:
                 raise
             except Exception as e:
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+Response cache for GovMap JSON endpoints.
+
+Entries are kept in a bounded in-memory LRU and, when a path is given, in a
+SQLite file so they survive restarts.  Each entry carries its own expiry, which
+lets static catalogs live for a day while autocomplete and parcel lookups
+expire after minutes.
+
+Values are stored as JSON text, so every ``get`` returns a fresh copy that the
+caller may mutate freely.
+"""
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class GovMapCache:
+    """Thread-safe memory + optional SQLite cache of JSON-serializable values."""
+
+    def __init__(self, path: Optional[Union[str, Path]] = None, max_entries: int = 2048) -> None:
+        """
+        Parameters
+        ----------
+        path : SQLite file for persistent entries (memory only if None)
+        max_entries : Number of entries kept in memory
+        """
+        self.path = Path(path) if path else None
+        self.max_entries = max(1, max_entries)
+        self._memory: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._conn.commit()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached value for ``key``, or ``default`` if missing or expired."""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._memory.move_to_end(key)
+                    return json.loads(entry[1])
+                del self._memory[key]
+
+            if self._conn is None:
+                return default
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return default
+            value, expires_at = row
+            if expires_at <= now:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                return default
+            self._remember(key, expires_at, value)
+            return json.loads(value)
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store ``value`` for ``ttl`` seconds (values that cannot be serialized are skipped)."""
+        if ttl <= 0:
+            return
+        try:
+            text = json.dumps(value, ensure_ascii=False)
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Not caching GovMap response for {key}: {e}")
+            return
+        expires_at = time.time() + ttl
+        with self._lock:
+            self._remember(key, expires_at, text)
+            if self._conn is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, text, expires_at),
+                )
+                self._conn.commit()
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def clear(self) -> None:
+        """Drop every entry, including persisted ones."""
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM responses")
+                self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _remember(self, key: str, expires_at: float, text: str) -> None:
+        self._memory[key] = (expires_at, text)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
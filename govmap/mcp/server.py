@@ -71,6 +71,23 @@ async def govmap_parcel_at_point(ctx: Context, x: float, y: float, type_name: st
     return {"feature": f}
 
 
+@mcp.tool()
+async def govmap_prefetch_parcels(
+    ctx: Context,
+    min_x: float,
+    min_y: float,
+    max_x: float,
+    max_y: float,
+    type_name: str = "opendata:PARCEL_ALL",
+) -> Dict[str, Any]:
+    """Prefetch all parcels in an ITM bounding box so later point lookups inside it are local."""
+    client = _get_client()
+    bbox = (min_x, min_y, max_x, max_y)
+    await ctx.info(f"Prefetching parcels from {type_name} for bbox {bbox}")
+    added = client.prefetch_parcels(bbox, layer=type_name)
+    return {"bbox": list(bbox), "parcels_added": added, "parcels_indexed": len(client.parcel_index)}
+
+
 @mcp.tool()
 async def govmap_coordinate_conversion(ctx: Context, x: float, y: float, from_crs: str = "ITM", to_crs: str = "WGS84") -> Dict[str, Any]:
     """Convert coordinates between ITM (EPSG:2039) and WGS84 (EPSG:4326)."""
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+Local spatial index of GovMap parcel polygons.
+
+Parcels fetched in bulk from the OpenData WFS (see
+:meth:`govmap.api_client.GovMapClient.prefetch_parcels`) are stored here so that
+point-to-parcel resolution for any address inside a prefetched bounding box
+is a local point-in-polygon test instead of a WFS round trip.
+
+Coordinates are ITM (EPSG:2039). Polygons are bucketed into a uniform grid by
+their bounding boxes; a lookup only tests the polygons in the point's cell.
+"""
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+Point = Tuple[float, float]
+Ring = List[Point]
+BBox = Tuple[float, float, float, float]
+
+# Parcels are tens of meters across; 100 m cells keep buckets small
+DEFAULT_CELL_SIZE = 100.0
+
+
+def point_in_ring(x: float, y: float, ring: Sequence[Point]) -> bool:
+    """Ray-casting point-in-polygon test for a single ring."""
+    inside = False
+    j = len(ring) - 1
+    for i in range(len(ring)):
+        xi, yi = ring[i]
+        xj, yj = ring[j]
+        if (yi > y) != (yj > y) and x < (xj - xi) * (y - yi) / (yj - yi) + xi:
+            inside = not inside
+        j = i
+    return inside
+
+
+def _polygons(geometry: Dict[str, Any]) -> List[List[Ring]]:
+    """Return a GeoJSON (Multi)Polygon as a list of polygons, each a list of rings."""
+    coords = geometry.get("coordinates") or []
+    if geometry.get("type") == "Polygon":
+        parts = [coords]
+    elif geometry.get("type") == "MultiPolygon":
+        parts = coords
+    else:
+        return []
+    return [
+        [[(float(p[0]), float(p[1])) for p in ring] for ring in part if ring]
+        for part in parts
+        if part
+    ]
+
+
+def _contains(x: float, y: float, polygon: List[Ring]) -> bool:
+    # First ring is the shell, the rest are holes
+    return point_in_ring(x, y, polygon[0]) and not any(point_in_ring(x, y, hole) for hole in polygon[1:])
+
+
+class ParcelIndex:
+    """Thread-safe grid index of parcel features with point-in-polygon lookup."""
+
+    def __init__(self, cell_size: float = DEFAULT_CELL_SIZE) -> None:
+        self.cell_size = cell_size
+        self._features: List[Dict[str, Any]] = []
+        self._polygons: List[List[List[Ring]]] = []
+        self._bboxes: List[BBox] = []
+        self._ids: Dict[str, int] = {}
+        self._grid: Dict[Tuple[int, int], List[int]] = {}
+        self._covered: List[BBox] = []
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._features)
+
+    # ----------------------------- Loading -----------------------------
+    def add_feature(self, feature: Dict[str, Any]) -> bool:
+        """Index a GeoJSON parcel feature; features seen before (by ``id``) are skipped.
+
+        Returns True if the feature was added.
+        """
+        polygons = _polygons(feature.get("geometry") or {})
+        if not polygons:
+            return False
+        feature_id = feature.get("id")
+        xs = [p[0] for polygon in polygons for p in polygon[0]]
+        ys = [p[1] for polygon in polygons for p in polygon[0]]
+        bbox = (min(xs), min(ys), max(xs), max(ys))
+
+        with self._lock:
+            if feature_id is not None:
+                if str(feature_id) in self._ids:
+                    return False
+                self._ids[str(feature_id)] = len(self._features)
+            index = len(self._features)
+            self._features.append(feature)
+            self._polygons.append(polygons)
+            self._bboxes.append(bbox)
+            (x0, y0), (x1, y1) = self._cell(bbox[0], bbox[1]), self._cell(bbox[2], bbox[3])
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    self._grid.setdefault((cx, cy), []).append(index)
+        return True
+
+    def add_features(self, features: Iterable[Dict[str, Any]]) -> int:
+        """Index several features; returns the number added."""
+        return sum(1 for feature in features if self.add_feature(feature))
+
+    def mark_covered(self, bbox: BBox) -> None:
+        """Record that every parcel intersecting ``bbox`` has been indexed."""
+        with self._lock:
+            self._covered.append(tuple(bbox))
+
+    # ----------------------------- Queries -----------------------------
+    def covers(self, x: float, y: float) -> bool:
+        """Whether ``(x, y)`` lies in a fully prefetched bounding box."""
+        return any(x0 <= x <= x1 and y0 <= y <= y1 for x0, y0, x1, y1 in self._covered)
+
+    def locate(self, x: float, y: float) -> Optional[Dict[str, Any]]:
+        """Return the indexed parcel feature containing ``(x, y)``, if any."""
+        with self._lock:
+            candidates = list(self._grid.get(self._cell(x, y), ()))
+        for index in candidates:
+            x0, y0, x1, y1 = self._bboxes[index]
+            if not (x0 <= x <= x1 and y0 <= y <= y1):
+                continue
+            if any(_contains(x, y, polygon) for polygon in self._polygons[index]):
+                return self._features[index]
+        return None
+
+    def features_in_bbox(self, bbox: BBox) -> List[Dict[str, Any]]:
+        """Return the indexed features whose bounding boxes intersect ``bbox``."""
+        min_x, min_y, max_x, max_y = bbox
+        (x0, y0), (x1, y1) = self._cell(min_x, min_y), self._cell(max_x, max_y)
+        seen = set()
+        with self._lock:
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    seen.update(self._grid.get((cx, cy), ()))
+        return [
+            self._features[index]
+            for index in sorted(seen)
+            if self._bboxes[index][0] <= max_x and self._bboxes[index][2] >= min_x
+            and self._bboxes[index][1] <= max_y and self._bboxes[index][3] >= min_y
+        ]
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return int(x // self.cell_size), int(y // self.cell_size)
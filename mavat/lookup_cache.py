@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Shared cache and text index for the Mavat lookup tables.
+
+The lookup tables (districts, cities, streets, ...) change rarely but are
+large, so they are fetched once per TTL into a process-wide
+:class:`LookupCache` (optionally persisted to ``MAVAT_LOOKUP_CACHE_PATH``)
+and indexed once per refresh by :class:`LookupIndex`:
+
+::
+
+    cache = get_lookup_cache()
+    index = cache.get(fetch_raw_tables, parse_tables)
+    index.search("תל אביב", table_type="CityCounty")
+
+Descriptions are normalized before indexing: niqqud and quote marks are
+removed, final letters are folded (ם → מ, ...), punctuation becomes
+whitespace and Latin text is casefolded.  Word prefixes are served from a
+trie and longer substrings from a trigram index.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = float(os.getenv("MAVAT_LOOKUP_CACHE_TTL", str(24 * 3600)))
+DEFAULT_CACHE_PATH = os.getenv("MAVAT_LOOKUP_CACHE_PATH") or None
+
+_NIQQUD_RE = re.compile(r"[\u0591-\u05bd\u05bf-\u05c7]")
+_QUOTES_RE = re.compile(r"[\"'`\u05f3\u05f4\u2018\u2019\u201c\u201d]")
+_SEPARATORS_RE = re.compile(r"[^\w]+")
+_FINAL_LETTERS = str.maketrans("ךםןףץ", "כמנפצ")
+
+RawTables = Dict[str, Any]
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """Normalize a lookup description or query for matching.
+
+    Args:
+        text: Text to normalize
+
+    Returns:
+        Casefolded text without niqqud or quotes, with final letters folded and
+        punctuation collapsed to single spaces
+    """
+    if not text:
+        return ""
+    text = _NIQQUD_RE.sub("", str(text))
+    text = _QUOTES_RE.sub("", text)
+    text = text.translate(_FINAL_LETTERS).casefold()
+    return " ".join(_SEPARATORS_RE.sub(" ", text).split())
+
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class _TrieNode:
+    __slots__ = ("children", "ids")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.ids: List[int] = []
+
+
+class LookupIndex:
+    """Immutable text index over parsed lookup tables.
+
+    Items may be any objects with a ``description`` attribute (normally
+    :class:`~mavat.mavat_api_client.MavatLookupItem`).
+    """
+
+    def __init__(self, tables: Dict[str, List[Any]], fetched_at: Optional[float] = None) -> None:
+        """Build the index.
+
+        Args:
+            tables: Lookup items by table type
+            fetched_at: Epoch time at which the tables were fetched
+        """
+        self.tables = tables
+        self.fetched_at = fetched_at if fetched_at is not None else time.time()
+        self._items: List[Any] = []
+        self._tables: List[str] = []
+        self._normalized: List[str] = []
+        self._trie = _TrieNode()
+        self._trigrams: Dict[str, Set[int]] = {}
+
+        for table_type, items in tables.items():
+            for item in items:
+                item_id = len(self._items)
+                normalized = normalize_text(getattr(item, "description", ""))
+                self._items.append(item)
+                self._tables.append(table_type)
+                self._normalized.append(normalized)
+                for word in set(normalized.split()):
+                    self._add_word(word, item_id)
+                for gram in _trigrams(normalized):
+                    self._trigrams.setdefault(gram, set()).add(item_id)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _add_word(self, word: str, item_id: int) -> None:
+        node = self._trie
+        for char in word:
+            node = node.children.setdefault(char, _TrieNode())
+            # Ids are added in increasing order, so each list stays sorted
+            if not node.ids or node.ids[-1] != item_id:
+                node.ids.append(item_id)
+
+    def _word_prefix_ids(self, prefix: str) -> Sequence[int]:
+        node = self._trie
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return ()
+        return node.ids
+
+    def _candidate_ids(self, query: str) -> Iterable[int]:
+        if len(query) < 3:
+            # Too short for trigrams: match the start of any word
+            return self._word_prefix_ids(query)
+        grams = sorted((self._trigrams.get(g, set()) for g in _trigrams(query)), key=len)
+        candidates = set(grams[0])
+        for gram_ids in grams[1:]:
+            candidates &= gram_ids
+            if not candidates:
+                break
+        return candidates
+
+    def search(self, text: str, table_type: Optional[str] = None, limit: Optional[int] = None) -> List[Any]:
+        """Find lookup items whose description contains ``text``.
+
+        Queries shorter than three characters match word prefixes only.
+        Results are ranked exact match first, then descriptions starting with
+        the query, then any word starting with it, then other substrings;
+        ties keep table order.
+
+        Args:
+            text: Text to search for
+            table_type: Restrict the search to a single table
+            limit: Maximum number of results
+
+        Returns:
+            Matching lookup items
+        """
+        query = normalize_text(text)
+        if not query:
+            return []
+
+        ranked: List[Tuple[int, int]] = []
+        for item_id in self._candidate_ids(query):
+            if table_type is not None and self._tables[item_id] != table_type:
+                continue
+            normalized = self._normalized[item_id]
+            position = normalized.find(query)
+            if position < 0:
+                continue
+            if normalized == query:
+                rank = 0
+            elif position == 0:
+                rank = 1
+            elif normalized[position - 1] == " ":
+                rank = 2
+            else:
+                rank = 3
+            ranked.append((rank, item_id))
+
+        ranked.sort()
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [self._items[item_id] for _, item_id in ranked]
+
+    def prefix(self, text: str, table_type: Optional[str] = None, limit: Optional[int] = None) -> List[Any]:
+        """Find lookup items with a word starting with ``text`` (autocomplete)."""
+        query = normalize_text(text)
+        if not query:
+            return []
+        words = query.split()
+        ids: Iterable[int] = self._word_prefix_ids(words[-1])
+        results = []
+        for item_id in ids:
+            if table_type is not None and self._tables[item_id] != table_type:
+                continue
+            if len(words) > 1 and query not in self._normalized[item_id]:
+                continue
+            results.append(self._items[item_id])
+            if limit is not None and len(results) >= limit:
+                break
+        return results
+
+
+class LookupCache:
+    """Thread-safe lookup-table cache with a TTL and optional JSON persistence."""
+
+    def __init__(self, ttl: float = DEFAULT_TTL, path: Optional[Union[str, Path]] = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds after which the tables are fetched again
+            path: JSON file the raw tables are persisted to (memory only if None)
+        """
+        self.ttl = ttl
+        self.path = Path(path) if path else None
+        self._index: Optional[LookupIndex] = None
+        self._lock = threading.Lock()
+
+    @property
+    def index(self) -> Optional[LookupIndex]:
+        """The current index, if the tables were loaded."""
+        return self._index
+
+    def is_fresh(self) -> bool:
+        """Whether cached tables exist and are within the TTL."""
+        index = self._index
+        return index is not None and time.time() - index.fetched_at < self.ttl
+
+    def get(
+        self,
+        fetch: Callable[[], RawTables],
+        parse: Callable[[RawTables], Dict[str, List[Any]]],
+        force_refresh: bool = False,
+    ) -> LookupIndex:
+        """Return the indexed tables, fetching them when missing or expired.
+
+        Args:
+            fetch: Downloads the raw lookup payload
+            parse: Turns the raw payload into lookup items by table type
+            force_refresh: Fetch even if the cached tables are fresh
+
+        Returns:
+            The lookup index
+
+        Raises:
+            Whatever ``fetch`` raises when no cached tables are available
+        """
+        if not force_refresh and self.is_fresh():
+            return self._index
+
+        with self._lock:
+            # Another thread may have refreshed while we waited
+            if not force_refresh and self.is_fresh():
+                return self._index
+
+            if not force_refresh and self._index is None:
+                stored = self._read()
+                if stored is not None:
+                    fetched_at, raw = stored
+                    self._index = LookupIndex(parse(raw), fetched_at)
+                    if self.is_fresh():
+                        return self._index
+
+            try:
+                raw = fetch()
+            except Exception as e:
+                if self._index is None or force_refresh:
+                    raise
+                logger.warning(f"Refreshing Mavat lookup tables failed, serving cached copy: {e}")
+                return self._index
+
+            self._index = LookupIndex(parse(raw))
+            self._write(raw, self._index.fetched_at)
+            return self._index
+
+    def clear(self) -> None:
+        """Drop the cached tables (the persisted copy is kept)."""
+        with self._lock:
+            self._index = None
+
+    def _read(self) -> Optional[Tuple[float, RawTables]]:
+        if self.path is None or not self.path.exists():
+            return None
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            return float(data["fetched_at"]), data["tables"]
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable Mavat lookup cache {self.path}: {e}")
+            return None
+
+    def _write(self, raw: RawTables, fetched_at: float) -> None:
+        if self.path is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(self.path.name + ".tmp")
+            tmp.write_text(json.dumps({"fetched_at": fetched_at, "tables": raw}, ensure_ascii=False),
+                           encoding="utf-8")
+            os.replace(tmp, self.path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not persist Mavat lookup cache to {self.path}: {e}")
+
+
+_shared_cache: Optional[LookupCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_lookup_cache() -> LookupCache:
+    """Return the process-wide lookup cache."""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = LookupCache(path=DEFAULT_CACHE_PATH)
+        return _shared_cache
@@ -12,8 +12,12 @@ API Endpoints:
 """
 
 import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, TypeVar
 from urllib.parse import quote
 
 import requests
@@ -22,6 +26,16 @@ import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '', '..'))
 from utils.retry import request_with_retry
+from mavat.lookup_cache import LookupCache, LookupIndex
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = int(os.getenv("MAVAT_MAX_WORKERS", "4"))
+TOKEN_TTL = float(os.getenv("MAVAT_TOKEN_TTL", "600"))
+SEARCH_PAGE_SIZE = 50
+
+T = TypeVar("T")
+R = TypeVar("R")
 
 
 @dataclass
@@ -80,11 +94,24 @@ class MavatAPIClient:
     ATTACHMENTS_URL = f"{BASE_URL}/Attacments/"
     LOOKUP_URL = f"{BASE_URL}/Luts/4-5-6-7-8-9-10-11-39-48-52-53"
     
-    def __init__(self, session: Optional[requests.Session] = None):
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        lookup_cache: Optional[LookupCache] = None,
+        token_provider: Optional[Callable[[], str]] = None,
+        token_ttl: float = TOKEN_TTL,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ):
         """Initialize the API client.
-        
+
         Args:
             session: Optional requests session for connection pooling
+            lookup_cache: Lookup-table cache to use; pass
+                :func:`mavat.lookup_cache.get_lookup_cache` to share the tables
+                across clients (defaults to a cache private to this client)
+            token_provider: Callable obtaining a fresh search token
+            token_ttl: Seconds a search token is reused before it is refreshed
+            max_workers: Requests running concurrently in the bulk methods
         """
         self.session = session or requests.Session()
         self.session.headers.update({
@@ -104,26 +131,45 @@ class MavatAPIClient:
         self.session.cookies.update({})
         
         # Cache for lookup tables
-        self._lookup_cache = {}
-        self._token = None
+        self.lookup_cache = lookup_cache or LookupCache()
+        self.token_provider = token_provider
+        self.token_ttl = token_ttl
+        self.max_workers = max(1, max_workers)
+        self._token: Optional[str] = None
+        self._token_expires_at = 0.0
+        self._token_lock = threading.Lock()
+    
+    @property
+    def _lookup_cache(self) -> Dict[str, List[MavatLookupItem]]:
+        """Currently cached lookup tables (empty until first loaded)."""
+        index = self.lookup_cache.index
+        return index.tables if index is not None else {}
     
-    def _get_auth_token(self) -> str:
+    def _get_auth_token(self, force_refresh: bool = False) -> str:
         """Get authentication token from Mavat API.
-        
+
         Based on HAR file analysis, tokens are generated via POST requests to the search API.
-        However, the API requires captcha validation, so we'll return a placeholder token
-        and let the search method handle the captcha error properly.
-        
+        However, the API requires captcha validation, so unless a ``token_provider`` is
+        configured we return a placeholder token and let the search method handle the
+        captcha error properly.
+
+        The token is cached until ``token_ttl`` elapses or a search is rejected with 401.
+
+        Args:
+            force_refresh: Obtain a new token even if the cached one has not expired
+
         Returns:
             Authentication token string (empty if captcha is required)
         """
-        if self._token:
+        with self._token_lock:
+            if not force_refresh and self._token is not None and time.monotonic() < self._token_expires_at:
+                return self._token
+
+            # Without a provider use the placeholder token, which the API accepts
+            # whenever it does not demand captcha validation
+            self._token = self.token_provider() if self.token_provider else ""
+            self._token_expires_at = time.monotonic() + self.token_ttl
             return self._token
-            
-        # Use the working token from the fetch request
-        # This token appears to be valid and bypasses captcha validation
-        self._token = ""
-        return self._token
     
     def is_api_accessible(self) -> bool:
         """Check if the Mavat API is accessible without captcha.
@@ -147,38 +193,49 @@ class MavatAPIClient:
         Returns:
             Dictionary containing lookup tables by type
         """
-        if not force_refresh and self._lookup_cache:
-            return self._lookup_cache
+        return self.get_lookup_index(force_refresh).tables
+    
+    def get_lookup_index(self, force_refresh: bool = False) -> LookupIndex:
+        """Get the text index over the lookup tables, fetching them if needed.
         
+        Args:
+            force_refresh: Whether to force refresh the cache
+            
+        Returns:
+            Index over the cached lookup tables
+        """
+        return self.lookup_cache.get(self._fetch_lookup_data, self._parse_lookup_tables, force_refresh)
+    
+    def _fetch_lookup_data(self) -> Dict[str, Any]:
         try:
             response = request_with_retry(self.session.get, self.LOOKUP_URL, timeout=30)
-            
-            data = response.json()
-            lookup_tables = {}
-            
-            # Process lookup data
-            for table_type, table_data in data.items():
-                if isinstance(table_data, list):
-                    items = []
-                    for entry in table_data:
-                        if isinstance(entry, dict):
-                            lookup_item = MavatLookupItem(
-                                code=str(entry.get("CODE", "")),
-                                description=entry.get("DESCRIPTION", ""),
-                                raw=entry
-                            )
-                            items.append(lookup_item)
-                    
-                    lookup_tables[table_type] = items
-            
-            self._lookup_cache = lookup_tables
-            return lookup_tables
-            
+            return response.json()
         except requests.exceptions.RequestException as e:
             raise RuntimeError(f"Failed to fetch lookup tables: {e}")
         except json.JSONDecodeError as e:
             raise RuntimeError(f"Invalid JSON response from lookup tables: {e}")
     
+    @staticmethod
+    def _parse_lookup_tables(data: Dict[str, Any]) -> Dict[str, List[MavatLookupItem]]:
+        lookup_tables = {}
+        
+        # Process lookup data
+        for table_type, table_data in data.items():
+            if isinstance(table_data, list):
+                items = []
+                for entry in table_data:
+                    if isinstance(entry, dict):
+                        lookup_item = MavatLookupItem(
+                            code=str(entry.get("CODE", "")),
+                            description=entry.get("DESCRIPTION", ""),
+                            raw=entry
+                        )
+                        items.append(lookup_item)
+                
+                lookup_tables[table_type] = items
+        
+        return lookup_tables
+    
     def get_districts(self, force_refresh: bool = False) -> List[MavatLookupItem]:
         """Get available districts.
         
@@ -271,28 +328,18 @@ class MavatAPIClient:
     ) -> List[MavatLookupItem]:
         """Search lookup tables by text.
         
+        Matching ignores niqqud, quotes and final letter forms; queries shorter
+        than three characters match the start of a word.
+        
         Args:
             search_text: Text to search for
             table_type: Specific table type to search (optional)
             force_refresh: Whether to force refresh the cache
             
         Returns:
-            List of matching lookup items
+            List of matching lookup items, best matches first
         """
-        if table_type:
-            tables = {table_type: self.get_lookup_tables(force_refresh).get(table_type, [])}
-        else:
-            tables = self.get_lookup_tables(force_refresh)
-        
-        results = []
-        search_text_lower = search_text.lower()
-        
-        for table_name, items in tables.items():
-            for item in items:
-                if search_text_lower in item.description.lower():
-                    results.append(item)
-        
-        return results
+        return self.get_lookup_index(force_refresh).search(search_text, table_type)
     
     def search_plans(
         self,
@@ -327,6 +374,90 @@ class MavatAPIClient:
         Returns:
             List of MavatSearchHit objects
         """
+        search_params = self._build_search_params(
+            query=query,
+            city=city,
+            street=street,
+            block=block or block_number,
+            parcel=parcel or parcel_number,
+            status=status,
+        )
+        search_params.update(self._result_window(limit, page))
+        return self._post_search(search_params, token)[:limit]
+
+    def search_plans_all(
+        self,
+        query: Optional[str] = None,
+        city: Optional[str] = None,
+        street: Optional[str] = None,
+        block: Optional[str] = None,
+        parcel: Optional[str] = None,
+        block_number: Optional[str] = None,
+        parcel_number: Optional[str] = None,
+        status: Optional[str] = None,
+        max_results: int = 200,
+        page_size: int = SEARCH_PAGE_SIZE,
+        token: Optional[str] = None
+    ) -> List[MavatSearchHit]:
+        """Search for plans across several result windows, fetched concurrently.
+
+        The first window is fetched on its own; if it is full, the remaining windows
+        up to ``max_results`` are fetched concurrently. Hits are de-duplicated by
+        plan ID.
+
+        Args:
+            query: Free text search query
+            city: City name or code
+            street: Street name or code
+            block_number: Block number for search
+            parcel_number: Parcel number for search
+            status: Plan status filter
+            max_results: Maximum number of results to return
+            page_size: Results requested per window
+
+        Returns:
+            List of unique MavatSearchHit objects in result order
+        """
+        search_params = self._build_search_params(
+            query=query,
+            city=city,
+            street=street,
+            block=block or block_number,
+            parcel=parcel or parcel_number,
+            status=status,
+        )
+        page_size = max(1, min(page_size, max_results))
+        pages = -(-max_results // page_size)
+
+        def fetch_window(page: int) -> List[MavatSearchHit]:
+            return self._post_search({**search_params, **self._result_window(page_size, page)}, token)
+
+        windows = [fetch_window(1)]
+        if pages > 1 and len(windows[0]) >= page_size:
+            windows.extend(self._map_concurrently(fetch_window, range(2, pages + 1)))
+
+        hits: List[MavatSearchHit] = []
+        seen = set()
+        for window in windows:
+            for hit in window:
+                if hit.plan_id not in seen:
+                    seen.add(hit.plan_id)
+                    hits.append(hit)
+            if len(window) < page_size:
+                # A short window is the last one
+                break
+        return hits[:max_results]
+
+    def _build_search_params(
+        self,
+        query: Optional[str] = None,
+        city: Optional[str] = None,
+        street: Optional[str] = None,
+        block: Optional[str] = None,
+        parcel: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Build the search payload, without the result window and token."""
         city_code = -1
         district_code = -1
         plan_area_code = -1
@@ -336,28 +467,25 @@ class MavatAPIClient:
         # Try to get proper codes from lookup tables if city is provided
         if city:
             try:
-                cities = self.get_cities()
-                for city_item in cities:
-                    if city.lower() in city_item.description.lower():
-                        city_code = int(float(city_item.code))
-                        city_description = city_item.description
-                        # Extract district and plan area codes from raw data
-                        raw_data = city_item.raw or {}
-                        district_code = int(float(raw_data.get('DISTRICT_CODE', -1)))
-                        plan_area_code = int(float(raw_data.get('PLAN_AREA_CODE', -1)))
-                        jurst_area_code = int(float(raw_data.get('JURST_AREA_CODE', -1)))
-                        break
+                for city_item in self.search_lookup_by_text(city, "CityCounty")[:1]:
+                    city_code = int(float(city_item.code))
+                    city_description = city_item.description
+                    # Extract district and plan area codes from raw data
+                    raw_data = city_item.raw or {}
+                    district_code = int(float(raw_data.get('DISTRICT_CODE', -1)))
+                    plan_area_code = int(float(raw_data.get('PLAN_AREA_CODE', -1)))
+                    jurst_area_code = int(float(raw_data.get('JURST_AREA_CODE', -1)))
             except Exception:
                 pass
 
-        search_params = {
+        return {
             "searchEntity": 1,
             "plNumber": "",
             "plName": query or "",
-            "blockNumber": block or block_number or "",
-            "toBlockNumber": block or block_number or "",
-            "parcelNumber": parcel or parcel_number or "",
-            "toParcelNumber": parcel or parcel_number or "",
+            "blockNumber": block or "",
+            "toBlockNumber": block or "",
+            "parcelNumber": parcel or "",
+            "toParcelNumber": parcel or "",
             "modelCity": {
                 "DISTRICT_CODE": district_code,
                 "PLAN_AREA_CODE": plan_area_code,
@@ -403,19 +531,46 @@ class MavatAPIClient:
             "dateToMeetingDate": None,
             "dateFromApproval": None,
             "dateToApproval": None,
+        }
+
+    @staticmethod
+    def _result_window(limit: int, page: int) -> Dict[str, int]:
+        return {
             "fromResult": (page - 1) * limit + 1,
             "toResult": page * limit,
             "_page": page,
-            "token": token or self._get_auth_token()  # Use provided token or get from website
         }
-        
+
+    def _post_search(self, search_params: Dict[str, Any], token: Optional[str] = None) -> List[MavatSearchHit]:
+        """Post a search request, refreshing the cached token once on 401.
+
+        Args:
+            search_params: Search payload including the result window
+            token: Explicit token to use instead of the cached one
+
+        Returns:
+            List of MavatSearchHit objects in the requested window
+        """
+        # Use provided token or the cached one
+        search_params = dict(search_params, token=token or self._get_auth_token())
+
         try:
             response = self.session.post(
                 self.SEARCH_URL,
                 json=search_params,
                 timeout=30
             )
-            
+
+            if response.status_code == 401 and not token:
+                # The cached token may have expired: retry once with a fresh one
+                logger.info("Mavat search rejected with 401, refreshing token")
+                search_params = dict(search_params, token=self._get_auth_token(force_refresh=True))
+                response = self.session.post(
+                    self.SEARCH_URL,
+                    json=search_params,
+                    timeout=30
+                )
+
             # Enhanced error handling for 401
             if response.status_code == 401:
                 try:
@@ -449,11 +604,8 @@ class MavatAPIClient:
                             raw=result
                         )
                         hits.append(hit)
-                        
-                        if len(hits) >= limit:
-                            break
-            
-            return hits[:limit]
+
+            return hits
             
         except requests.exceptions.RequestException as e:
             raise RuntimeError(f"API request failed: {e}")
@@ -528,6 +680,54 @@ class MavatAPIClient:
         except Exception as e:
             raise RuntimeError(f"Failed to get plan attachments: {e}")
 
+    def get_plans_details(self, plan_ids: Iterable[str]) -> Dict[str, MavatPlan]:
+        """Get details for several plans concurrently.
+
+        Args:
+            plan_ids: Plan identifiers (duplicates are fetched once)
+
+        Returns:
+            Dictionary mapping each plan ID to its details; plans that could not
+            be fetched are omitted
+        """
+        unique_ids = list(dict.fromkeys(str(plan_id) for plan_id in plan_ids))
+        plans = self._map_concurrently(self._try(self.get_plan_details), unique_ids)
+        return {plan_id: plan for plan_id, plan in zip(unique_ids, plans) if plan is not None}
+
+    def get_plans_attachments(self, hits: Iterable[MavatSearchHit]) -> Dict[str, List[MavatAttachment]]:
+        """Get attachments for several search hits concurrently.
+
+        Args:
+            hits: Search hits, e.g. from :meth:`search_plans_all`
+
+        Returns:
+            Dictionary mapping each plan ID to its attachments; plans that could
+            not be fetched are omitted
+        """
+        unique_hits = list({hit.plan_id: hit for hit in hits}.values())
+        fetch = self._try(lambda hit: self.get_plan_attachments(hit.plan_id, hit.entity_name or hit.title or ""))
+        attachments = self._map_concurrently(fetch, unique_hits)
+        return {hit.plan_id: items for hit, items in zip(unique_hits, attachments) if items is not None}
+
+    def _map_concurrently(self, func: Callable[[T], R], items: Iterable[T]) -> List[R]:
+        """Apply ``func`` to ``items`` on up to ``max_workers`` threads, keeping order."""
+        items = list(items)
+        if len(items) <= 1:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(items))) as executor:
+            return list(executor.map(func, items))
+
+    @staticmethod
+    def _try(func: Callable[[T], R]) -> Callable[[T], Optional[R]]:
+        """Wrap ``func`` so that failures are logged and yield None."""
+        def wrapper(item: T) -> Optional[R]:
+            try:
+                return func(item)
+            except Exception as e:
+                logger.warning(f"Mavat request for {getattr(item, 'plan_id', item)} failed: {e}")
+                return None
+        return wrapper
+
     def close(self):
         """Close the session."""
         if self.session:
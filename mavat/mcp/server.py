@@ -29,6 +29,7 @@ Usage Examples:
 
 import os
 import sys
+import threading
 from typing import Any, Dict, List, Optional
 
 from fastmcp import Context, FastMCP
@@ -38,6 +39,7 @@ project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
+from mavat.lookup_cache import get_lookup_cache
 from mavat.mavat_api_client import MavatAPIClient, MavatPlan, MavatSearchHit
 
 # Create an MCP server
@@ -45,6 +47,21 @@ mcp = FastMCP("MavatPlanning", dependencies=["requests"])
 
 # Module-level state (persists across tool calls within the same server process)
 _current_client = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> MavatAPIClient:
+    """Return the API client shared by all tools, creating it on first use.
+
+    The client keeps one HTTP session and reads the lookup tables from the
+    process-wide lookup cache, so lookup tools do not hit the Mavat API again
+    until the cache expires.
+    """
+    global _current_client
+    with _client_lock:
+        if _current_client is None:
+            _current_client = MavatAPIClient(lookup_cache=get_lookup_cache())
+        return _current_client
 
 
 @mcp.tool()
@@ -91,17 +108,14 @@ async def search_plans(
     Dict[str, Any]
         A dictionary containing search results and metadata.
     """
-    global _current_client
-    
     try:
         await ctx.info(f"Searching for plans with criteria: query='{query}', city='{city}', limit={limit}")
         
-        # Create API client instance
-        _current_client = MavatAPIClient()
+        client = _get_client()
         
         # Perform search
         await ctx.info("Executing API search...")
-        hits: List[MavatSearchHit] = _current_client.search_plans(
+        hits: List[MavatSearchHit] = client.search_plans(
             query=query,
             city=city,
             district=district,
@@ -179,18 +193,14 @@ async def get_plan_details(
     Dict[str, Any]
         A dictionary containing plan details and metadata.
     """
-    global _current_client
-    
     try:
         await ctx.info(f"Fetching details for plan: {plan_id}")
         
-        # Create API client instance if not exists
-        if _current_client is None:
-            _current_client = MavatAPIClient()
+        client = _get_client()
         
         # Fetch plan details
         await ctx.info("Retrieving plan details from API...")
-        plan: MavatPlan = _current_client.get_plan_details(plan_id)
+        plan: MavatPlan = client.get_plan_details(plan_id)
         
         # Format plan details
         plan_data = {
@@ -253,8 +263,8 @@ async def get_plan_documents(
                 return plan_result
             entity_name = plan_result["plan"].get("entity_name", "Unknown")
         
-        # Create API client
-        client = MavatAPIClient()
+        # Shared API client
+        client = _get_client()
         attachments = client.get_plan_attachments(plan_id, entity_name)
         
         await ctx.info(f"Found {len(attachments)} documents for plan: {plan_id}")
@@ -422,7 +432,7 @@ async def get_lookup_tables(
     try:
         await ctx.info("Fetching lookup tables from Mavat API...")
         
-        client = MavatAPIClient()
+        client = _get_client()
         lookup_tables = client.get_lookup_tables(force_refresh)
         
         # Format the response
@@ -478,7 +488,7 @@ async def get_districts(
     try:
         await ctx.info("Fetching available districts...")
         
-        client = MavatAPIClient()
+        client = _get_client()
         districts = client.get_districts(force_refresh)
         
         formatted_districts = [
@@ -528,7 +538,7 @@ async def get_cities(
     try:
         await ctx.info("Fetching available cities...")
         
-        client = MavatAPIClient()
+        client = _get_client()
         cities = client.get_cities(force_refresh)
         
         formatted_cities = [
@@ -578,7 +588,7 @@ async def get_streets(
     try:
         await ctx.info("Fetching available streets...")
         
-        client = MavatAPIClient()
+        client = _get_client()
         streets = client.get_streets(force_refresh)
         
         formatted_streets = [
@@ -635,7 +645,7 @@ async def search_lookup(
         table_type_desc = table_type if table_type else "all tables"
         await ctx.info(f"Searching lookup tables for '{search_text}' in {table_type_desc}")
         
-        client = MavatAPIClient()
+        client = _get_client()
         results = client.search_lookup_by_text(search_text, table_type, force_refresh)
         
         formatted_results = [
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Long-lived Selenium driver pool for the Mavat scrapers.
+
+Starting Chrome dominates Mavat collection time, so instead of launching a
+browser for every :class:`MavatSeleniumClient` the drivers are kept in a
+process-wide pool:
+
+::
+
+    pool = get_driver_pool()
+    with pool.driver() as driver:
+        driver.get("https://mavat.iplan.gov.il/SV3")
+
+The chromedriver binary is resolved once per process (``CHROMEDRIVER_PATH``
+or webdriver-manager) and reused.  Idle drivers are health-checked before
+they are handed out and recycled after ``max_uses`` leases.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = int(os.getenv("MAVAT_DRIVER_POOL_SIZE", "2"))
+DEFAULT_MAX_USES = int(os.getenv("MAVAT_DRIVER_MAX_USES", "50"))
+DEFAULT_PAGE_LOAD_TIMEOUT = 30.0
+
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36"
+
+_driver_path: Optional[str] = None
+_driver_path_lock = threading.Lock()
+
+
+def get_chromedriver_path() -> str:
+    """Return the chromedriver binary path, resolving it once per process."""
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path is None:
+            path = os.getenv("CHROMEDRIVER_PATH")
+            if not path:
+                from webdriver_manager.chrome import ChromeDriverManager
+
+                path = ChromeDriverManager().install()
+            _driver_path = path
+        return _driver_path
+
+
+def create_chrome_driver(headless: bool = True, page_load_timeout: float = DEFAULT_PAGE_LOAD_TIMEOUT) -> Any:
+    """Start a Chrome WebDriver configured for Mavat."""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+
+    options = webdriver.ChromeOptions()
+    if headless:
+        options.add_argument('--headless')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--disable-gpu')
+    options.add_argument('--window-size=1280,720')
+    options.add_argument(f'--user-agent={USER_AGENT}')
+    options.add_argument('--disable-blink-features=AutomationControlled')
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option('useAutomationExtension', False)
+
+    driver = webdriver.Chrome(service=Service(get_chromedriver_path()), options=options)
+    driver.set_page_load_timeout(page_load_timeout)
+    # Execute script to remove webdriver property
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    return driver
+
+
+@dataclass
+class _PooledDriver:
+    driver: Any
+    uses: int = 0
+
+
+class MavatDriverPool:
+    """A bounded pool of reusable Chrome drivers."""
+
+    def __init__(
+        self,
+        size: int = DEFAULT_POOL_SIZE,
+        max_uses: int = DEFAULT_MAX_USES,
+        headless: bool = True,
+        factory: Optional[Callable[[], Any]] = None,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            size: Maximum number of drivers alive (and leased) at the same time
+            max_uses: Number of leases after which a driver is recycled
+            headless: Whether to run Chrome in headless mode
+            factory: Callable creating a new driver (defaults to :func:`create_chrome_driver`)
+        """
+        self.size = max(1, size)
+        self.max_uses = max(1, max_uses)
+        self.headless = headless
+        self.factory = factory or (lambda: create_chrome_driver(headless=self.headless))
+        self.launches = 0
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._idle: "queue.LifoQueue[_PooledDriver]" = queue.LifoQueue()
+        self._leased: Dict[int, _PooledDriver] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    # ------------------------------------------------------------------
+    # Leasing
+    # ------------------------------------------------------------------
+    def acquire(self, timeout: Optional[float] = None) -> Any:
+        """Lease a healthy driver, blocking while all drivers are in use.
+
+        Raises:
+            RuntimeError: If the pool is closed or no driver frees up in time
+        """
+        if self._closed:
+            raise RuntimeError("Mavat driver pool is closed")
+        if not self._slots.acquire(timeout=timeout):
+            raise RuntimeError("Timed out waiting for a Mavat browser")
+        try:
+            pooled = self._take_idle() or self._launch()
+        except Exception:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._leased[id(pooled.driver)] = pooled
+        return pooled.driver
+
+    def release(self, driver: Any, broken: bool = False) -> None:
+        """Return a leased driver; broken or worn-out drivers are quit."""
+        with self._lock:
+            pooled = self._leased.pop(id(driver), None)
+        if pooled is None:
+            return
+        try:
+            pooled.uses += 1
+            if broken or self._closed or pooled.uses >= self.max_uses:
+                self._quit(pooled)
+            else:
+                self._idle.put(pooled)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def driver(self, timeout: Optional[float] = None) -> Iterator[Any]:
+        """Lease a driver for the duration of a ``with`` block."""
+        driver = self.acquire(timeout)
+        broken = False
+        try:
+            yield driver
+        except Exception:
+            broken = not self.is_healthy(driver)
+            raise
+        finally:
+            self.release(driver, broken=broken)
+
+    def close(self) -> None:
+        """Quit every idle driver; leased drivers are quit when released."""
+        self._closed = True
+        while True:
+            try:
+                self._quit(self._idle.get_nowait())
+            except queue.Empty:
+                break
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    @staticmethod
+    def is_healthy(driver: Any) -> bool:
+        """Check that the browser behind a driver still responds."""
+        try:
+            driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    def _take_idle(self) -> Optional[_PooledDriver]:
+        while True:
+            try:
+                pooled = self._idle.get_nowait()
+            except queue.Empty:
+                return None
+            if self.is_healthy(pooled.driver):
+                return pooled
+            logger.info("Discarding unresponsive Mavat browser")
+            self._quit(pooled)
+
+    def _launch(self) -> _PooledDriver:
+        driver = self.factory()
+        self.launches += 1
+        return _PooledDriver(driver)
+
+    @staticmethod
+    def _quit(pooled: _PooledDriver) -> None:
+        try:
+            pooled.driver.quit()
+        except Exception as e:
+            logger.debug(f"Error quitting Mavat browser: {e}")
+
+
+_pools: Dict[bool, MavatDriverPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_driver_pool(headless: bool = True) -> MavatDriverPool:
+    """Return the process-wide driver pool for the given headless mode."""
+    with _pools_lock:
+        pool = _pools.get(headless)
+        if pool is None:
+            pool = _pools[headless] = MavatDriverPool(headless=headless)
+        return pool
+
+
+@atexit.register
+def _close_pools() -> None:
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
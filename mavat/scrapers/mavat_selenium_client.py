@@ -7,24 +7,27 @@ successful pattern used in the Nadlan scraper. Selenium often handles complex Ja
 interactions better than Playwright for government websites.
 
 Based on the successful approach from: gov/nadlan/scraper_selenium.py
+
+Drivers are leased from the process-wide pool in
+:mod:`mavat.scrapers.driver_pool`, so Chrome is started once and reused
+across clients; page loads are awaited with explicit ``WebDriverWait``
+conditions rather than fixed sleeps.
 """
 
 import json
-import time
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
-from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.action_chains import ActionChains
-from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
 
+from .driver_pool import MavatDriverPool, get_driver_pool
+
 
 @dataclass
 class MavatSearchHit:
@@ -72,17 +75,27 @@ class MavatSeleniumClient:
     BASE_URL = "https://mavat.iplan.gov.il"
     SEARCH_URL = f"{BASE_URL}/SV3"
     
-    def __init__(self, timeout: float = 30.0, headless: bool = True):
+    def __init__(self, timeout: float = 30.0, headless: bool = True, pool: Optional[MavatDriverPool] = None):
         """Initialize the Selenium client.
         
         Args:
             timeout: Request timeout in seconds
             headless: Whether to run browser in headless mode
+            pool: Driver pool to lease browsers from (defaults to the shared pool)
         """
         self.timeout = timeout
         self.headless = headless
+        self._pool = pool
         self.driver = None
         self.wait = None
+        self._broken = False
+
+    @property
+    def pool(self) -> MavatDriverPool:
+        """Driver pool used by this client."""
+        if self._pool is None:
+            self._pool = get_driver_pool(self.headless)
+        return self._pool
 
     def _wait_for_spinner(self, timeout: float = 15.0) -> None:
         """Wait for the loading spinner overlay to disappear."""
@@ -99,36 +112,51 @@ class MavatSeleniumClient:
             # Spinner might remain due to animation glitches; continue anyway
             pass
 
+    def _wait_for_page(self, timeout: Optional[float] = None) -> None:
+        """Wait for the document to finish loading and the spinner to go away."""
+        if not self.driver:
+            return
+        try:
+            WebDriverWait(self.driver, timeout or self.timeout).until(
+                lambda d: d.execute_script("return document.readyState") == "complete"
+            )
+        except TimeoutException:
+            pass
+        self._wait_for_spinner()
+
+    def _wait_for_results(self, timeout: float = 10.0) -> None:
+        """Wait until a table with at least one data row is rendered."""
+        try:
+            WebDriverWait(self.driver, timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "table tr + tr"))
+            )
+        except TimeoutException:
+            # No results (or an unexpected layout); extraction handles both
+            pass
+        self._wait_for_spinner()
+
     def _init_driver(self):
-        """Initialize the Selenium WebDriver."""
+        """Lease a WebDriver from the pool."""
         if self.driver is None:
-            service = Service(ChromeDriverManager().install())
-            options = webdriver.ChromeOptions()
-            if self.headless:
-                options.add_argument('--headless')
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
-            options.add_argument('--disable-gpu')
-            options.add_argument('--window-size=1280,720')
-            options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36')
-            options.add_argument('--disable-blink-features=AutomationControlled')
-            options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            options.add_experimental_option('useAutomationExtension', False)
-            
-            self.driver = webdriver.Chrome(service=service, options=options)
+            self.driver = self.pool.acquire(timeout=self.timeout * 4)
+            self._broken = False
             self.driver.set_page_load_timeout(self.timeout)
             self.wait = WebDriverWait(self.driver, self.timeout)
-            
-            # Execute script to remove webdriver property
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
     
     def _cleanup_driver(self):
-        """Clean up the Selenium WebDriver."""
+        """Return the WebDriver to the pool."""
         if self.driver:
             try:
-                self.driver.quit()
-            except:
-                pass
+                # Leave a single window behind for the next lease (fetch_pdf may open tabs)
+                if not self._broken and len(self.driver.window_handles) > 1:
+                    for handle in self.driver.window_handles[1:]:
+                        self.driver.switch_to.window(handle)
+                        self.driver.close()
+                    self.driver.switch_to.window(self.driver.window_handles[0])
+            except WebDriverException:
+                self._broken = True
+            try:
+                self.pool.release(self.driver, broken=self._broken)
             finally:
                 self.driver = None
                 self.wait = None
@@ -140,6 +168,8 @@ class MavatSeleniumClient:
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
+        if exc_type is not None and issubclass(exc_type, WebDriverException):
+            self._broken = not self.pool.is_healthy(self.driver)
         self._cleanup_driver()
     
     def search_plans(
@@ -183,17 +213,13 @@ class MavatSeleniumClient:
             self.driver.get(self.SEARCH_URL)
 
             # Wait for page to load
-            time.sleep(3)
-            self._wait_for_spinner()
+            self._wait_for_page()
             
             # Look for search form elements
             print("Looking for search form...")
             
             # Try to find and click on the "תכניות" (Plans) button first
             try:
-                # Wait for any loading spinners to disappear first
-                time.sleep(2)
-                
                 # Try multiple selectors for the plans button
                 plans_button = None
                 button_selectors = [
@@ -223,11 +249,9 @@ class MavatSeleniumClient:
                     print("Found plans button, clicking it...")
                     # Scroll to element and click
                     self.driver.execute_script("arguments[0].scrollIntoView(true);", plans_button)
-                    time.sleep(1)
                     self._wait_for_spinner()
                     plans_button.click()
-                    self._wait_for_spinner()
-                    time.sleep(3)  # Wait for content to load
+                    self._wait_for_page()
                 else:
                     print("Could not find plans button, continuing with search...")
             except Exception as e:
@@ -269,7 +293,7 @@ class MavatSeleniumClient:
                     url = f"{self.SEARCH_URL}?{'&'.join(search_params)}"
                     print(f"Trying direct URL: {url}")
                     self.driver.get(url)
-                    time.sleep(3)
+                    self._wait_for_page()
             else:
                 # Fill search input
                 search_text = query or city or "תל אביב"
@@ -302,18 +326,15 @@ class MavatSeleniumClient:
                     self._wait_for_spinner()
                     search_button.click()
                     self._wait_for_spinner()
-                    time.sleep(3)
                 else:
                     print("No search button found, trying Enter key...")
                     self._wait_for_spinner()
                     search_input.send_keys(Keys.RETURN)
                     self._wait_for_spinner()
-                    time.sleep(3)
 
             # Wait for results to load
             print("Waiting for search results...")
-            time.sleep(3)
-            self._wait_for_spinner()
+            self._wait_for_results()
             
             # Extract search results
             hits = []
@@ -420,7 +441,7 @@ class MavatSeleniumClient:
             plan_url = f"{self.SEARCH_URL}?text={plan_number}"
             print(f"Navigating to plan page: {plan_url}")
             self.driver.get(plan_url)
-            time.sleep(3)
+            self._wait_for_page()
             
             # First, try to click on the plans tab to ensure we're looking at plans, not meetings
             try:
@@ -428,7 +449,7 @@ class MavatSeleniumClient:
                 if plans_tab and plans_tab.is_displayed():
                     print("Clicking plans tab to ensure we're viewing plans...")
                     plans_tab.click()
-                    time.sleep(2)
+                    self._wait_for_spinner()
             except:
                 print("Could not find plans tab, continuing...")
             
@@ -489,15 +510,22 @@ class MavatSeleniumClient:
                 try:
                     # Scroll to element and click
                     self.driver.execute_script("arguments[0].scrollIntoView(true);", pdf_button)
-                    time.sleep(1)
+                    handles_before = len(self.driver.window_handles)
+                    url_before = self.driver.current_url
                     pdf_button.click()
-                    time.sleep(5)  # Wait longer for PDF to load
+                    # Wait for the PDF to open in a new tab or replace the page
+                    try:
+                        WebDriverWait(self.driver, 10).until(
+                            lambda d: len(d.window_handles) > handles_before or d.current_url != url_before
+                        )
+                    except TimeoutException:
+                        pass
                     
                     # Check if a new tab/window opened
                     if len(self.driver.window_handles) > 1:
                         print("New tab opened, switching to it...")
                         self.driver.switch_to.window(self.driver.window_handles[-1])
-                        time.sleep(2)
+                        self._wait_for_page()
                     
                     # Get the current URL to see if it's a PDF
                     current_url = self.driver.current_url
@@ -519,7 +547,7 @@ class MavatSeleniumClient:
                             if pdf_links:
                                 print(f"Found {len(pdf_links)} PDF links, trying first one...")
                                 pdf_links[0].click()
-                                time.sleep(3)
+                                self._wait_for_page()
                                 return self.driver.page_source.encode('utf-8')
                             else:
                                 raise RuntimeError("PDF not found after clicking button")
@@ -548,7 +576,7 @@ class MavatSeleniumClient:
             plan_url = f"{self.SEARCH_URL}?text={plan_id}"
             print(f"Navigating to plan details: {plan_url}")
             self.driver.get(plan_url)
-            time.sleep(3)
+            self._wait_for_page()
             
             # Extract plan details from the page
             title_element = None
@@ -3,7 +3,9 @@
 import logging
 from typing import Any, Dict, List, Optional
 
-from gov.decisive import DecisiveAppraisalClient, DecisiveAppraisal
+from gov.decisive import DecisiveAppraisalClient
+from gov.decisive_index import ingest_on_collect
+from gov.nadlan.deals_store import NadlanDealsStore, get_deals_store
 from gov.nadlan.scraper import NadlanDealsScraper
 
 from .base_collector import BaseCollector
@@ -18,10 +20,21 @@ class GovCollector(BaseCollector):
         self,
         deals_client: Optional[NadlanDealsScraper] = None,
         decisive_client: Optional[DecisiveAppraisalClient] = None,
+        deals_store: Optional[NadlanDealsStore] = None,
     ) -> None:
         # Use longer timeout for more reliable results
         self.deals_client = deals_client or NadlanDealsScraper(timeout=120.0)
         self.decisive_client = decisive_client or DecisiveAppraisalClient(timeout=120.0)
+        # Deals are shared by every asset in a neighborhood, so read them
+        # from the local store and only refresh it incrementally
+        self._deals_store = deals_store
+
+    @property
+    def deals_store(self) -> NadlanDealsStore:
+        """Deals store, opened on first sync."""
+        if self._deals_store is None:
+            self._deals_store = get_deals_store()
+        return self._deals_store
 
     def collect(self, block: str, parcel: str, address: str) -> Dict[str, Any]:
         """Collect government data for a given block/parcel and address."""
@@ -33,19 +46,29 @@ class GovCollector(BaseCollector):
     def _collect_decisive(self, block: str, parcel: str) -> List[Dict[str, Any]]:
         """Collect decisive appraisals for a given block/parcel."""
         try:
-            appraisals = self.decisive_client.fetch_appraisals(block=block, plot=parcel)
-            return [appraisal.to_dict() for appraisal in appraisals]
+            appraisals = self.decisive_client.fetch_appraisals(block=block, plot=parcel, max_pages=None)
         except Exception as e:
             logger.error(f"Error collecting decisive appraisals: {e}")
             return []
+        if appraisals and ingest_on_collect():
+            self._queue_decisive_ingest(block)
+        return [appraisal.to_dict() for appraisal in appraisals]
+
+    def _queue_decisive_ingest(self, block: str) -> None:
+        """Queue indexing of the block's decision PDFs on a Celery worker."""
+        try:
+            from core.tasks import ingest_decisive_block
+            ingest_decisive_block.delay(block)
+        except Exception as e:
+            logger.error(f"Failed to queue decisive appraisal ingestion for block {block}: {e}")
 
     def _collect_transactions(self, address: str) -> List[Dict[str, Any]]:
         """Collect transaction history for a given address."""
         try:
             logger.info(f"Fetching Nadlan transactions for: {address}")
-            # Fallback to address approach
-            deals = self.deals_client.get_deals_by_address(address)
-            logger.info(f"Found {len(deals)} transactions via address")
+            neighborhood_id = self.deals_client.resolve_neighborhood_id(address)
+            deals = self.deals_store.sync(neighborhood_id, self.deals_client)
+            logger.info(f"Found {len(deals)} transactions for neighborhood {neighborhood_id}")
             return [deal.to_dict() if hasattr(deal, 'to_dict') else dict(deal) for deal in deals]
         except Exception as e:
             logger.error(f"Nadlan transaction fetch failed: {e}")
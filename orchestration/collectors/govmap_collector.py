@@ -16,11 +16,31 @@ if "x" in result and "y" in result:
 import logging
 from typing import Any, Dict, Optional, Tuple
 
+from govmap.parcel_index import BBox
+
 from orchestration.collectors.base_collector import BaseCollector
 from govmap.api_client import GovMapClient, GovMapAuthError
 
 logger = logging.getLogger(__name__)
 
+# PARCEL_ALL feature properties behind each key of the parcel search result
+_PARCEL_FEATURE_KEYS = {
+    "gush": ("GUSH_NUM", "gush"),
+    "helka": ("PARCEL", "helka"),
+    "land_use": ("LAND_USE", "land_use"),
+}
+
+
+def parcel_from_feature(feature: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Map a PARCEL_ALL feature to the gush/helka/land_use shape of ``get_parcel_data``."""
+    properties = (feature or {}).get("properties") or {}
+    parcel = {}
+    for key, names in _PARCEL_FEATURE_KEYS.items():
+        value = next((properties[name] for name in names if properties.get(name) not in (None, "")), None)
+        if value is not None:
+            parcel[key] = str(value)
+    return parcel
+
 
 class GovMapCollector(BaseCollector):
     """Collects national-level parcel + nearby layers from GovMap OpenData."""
@@ -28,7 +48,22 @@ class GovMapCollector(BaseCollector):
     def __init__(self, client: Optional[GovMapClient] = None) -> None:
         self.client = client or GovMapClient()
 
+    def prefetch(self, bbox: BBox) -> int:
+        """Prefetch every parcel in an ITM bounding box before collecting many addresses.
+
+        Addresses that fall inside a prefetched bbox get their parcel polygon
+        (and its gush/helka) resolved locally instead of through a remote
+        parcel lookup.
 
+        Parameters
+        ----------
+        bbox : (min_x, min_y, max_x, max_y) in EPSG:2039, e.g. around a street or neighborhood
+
+        Returns
+        -------
+        Number of parcels loaded
+        """
+        return self.client.prefetch_parcels(bbox)
 
     def collect(
         self,
@@ -60,12 +95,20 @@ class GovMapCollector(BaseCollector):
                     out["x"] = x
                     out["y"] = y
 
-                    # Get parcel data using the extracted coordinates
-                    try:
-                        parcel_data = self.client.get_parcel_data(x, y)
+                    parcel_data: Dict[str, Any] = {}
+                    if self.client.parcel_index.covers(x, y):
+                        # Inside a prefetched area: resolve the parcel polygon locally
+                        feature = self.client.parcel_index.locate(x, y)
+                        out["api_data"]["parcel_feature"] = feature
+                        parcel_data = parcel_from_feature(feature)
+                    if not (parcel_data.get("gush") and parcel_data.get("helka")):
+                        # Get parcel data using the extracted coordinates
+                        try:
+                            parcel_data = self.client.get_parcel_data(x, y)
+                        except Exception as e:
+                            logger.warning(f"Failed to get parcel data: {e}")
+                    if parcel_data:
                         out["api_data"]["parcel"] = parcel_data
-                    except Exception as e:
-                        logger.warning(f"Failed to get parcel data: {e}")
                 else:
                     logger.warning("Could not extract coordinates from autocomplete result")
             else:
@@ -19,13 +19,8 @@ class RamiCollector(BaseCollector):
             # Create search parameters using the same logic as the test
             search_params = self.client.create_search_params(block=block, parcel=parcel)
             
-            # Fetch plans using the same method as the test
-            plans_df = self.client.fetch_plans(search_params)
-            
-            # Convert DataFrame to list of dictionaries
             formatted_plans = []
-            for _, plan_row in plans_df.iterrows():
-                plan = plan_row.to_dict()
+            for plan in self.client.iter_plans(search_params):
                 formatted_plans.append({
                     "planNumber": plan.get("planNumber", ""),
                     "planId": plan.get("planId", ""),
@@ -804,7 +804,7 @@ def _update_asset_with_collected_data(asset_id: int, block: str, parcel: str, go
         # Update with GIS data
         if gis_data:
             # Store raw GIS data in meta
-            asset.meta['gis_data'] = {
+            asset.set_enrichment('gis_data', {
                 'building_permits': gis_data.get('permits', []),
                 'land_use_rights': gis_data.get('rights', []),
                 'shelters': gis_data.get('shelters', []),
@@ -817,7 +817,7 @@ def _update_asset_with_collected_data(asset_id: int, block: str, parcel: str, go
                     'x': gis_data.get('x'),
                     'y': gis_data.get('y')
                 }
-            }
+            })
             
             # Try to get building privilege page data for real rights calculation
             try:
@@ -835,7 +835,7 @@ def _update_asset_with_collected_data(asset_id: int, block: str, parcel: str, go
                         from gis.parse_zchuyot import parse_zchuyot
                         pdf_path = privilege_data['file_path']
                         parsed_privilege_data = parse_zchuyot(pdf_path)
-                        asset.meta['privilege_page_data'] = parsed_privilege_data
+                        asset.set_enrichment('privilege_page_data', parsed_privilege_data)
                         logger.info(f"Successfully parsed privilege page: {pdf_path}")
                     elif privilege_data:
                         logger.info(f"Downloaded privilege page but content type is {privilege_data.get('content_type')}, not PDF")
@@ -850,7 +850,7 @@ def _update_asset_with_collected_data(asset_id: int, block: str, parcel: str, go
         
         # Update with GovMap autocomplete data
         if govmap_autocomplete_data:
-            asset.meta['govmap_autocomplete_data'] = {
+            asset.set_enrichment('govmap_autocomplete_data', {
                 'autocomplete_result': govmap_autocomplete_data,
                 'coordinates': {
                     'x_itm': x_itm,
@@ -858,12 +858,12 @@ def _update_asset_with_collected_data(asset_id: int, block: str, parcel: str, go
                     'lon_wgs84': lon_wgs84,
                     'lat_wgs84': lat_wgs84
                 }
-            }
+            })
             _process_govmap_autocomplete_data(asset, govmap_autocomplete_data)
         
         # Update with GovMap parcel data
         if govmap_data:
-            asset.meta['govmap_data'] = {
+            asset.set_enrichment('govmap_data', {
                 'parcel': govmap_data.get('api_data', {}).get('parcel', {}),
                 'nearby_layers': govmap_data.get('nearby', {}),
                 'coordinates': {
@@ -871,25 +871,25 @@ def _update_asset_with_collected_data(asset_id: int, block: str, parcel: str, go
                     'y': govmap_data.get('y')
                 },
                 'api_data': govmap_data.get('api_data', {})
-            }
+            })
             _process_govmap_data(asset, govmap_data)
         
         # Update with government data
         if gov_data:
-            asset.meta['government_data'] = {
+            asset.set_enrichment('government_data', {
                 'decisive_appraisals': gov_data.get('decisive', []),
                 'transaction_history': gov_data.get('transactions', [])
-            }
+            })
             _process_government_data(asset, gov_data)
         
         # Update with RAMI plans
         if plans:
-            asset.meta['rami_plans'] = plans
+            asset.set_enrichment('rami_plans', plans)
             _process_rami_plans(asset, plans)
         
         # Update with Mavat plans
         if mavat_plans:
-            asset.meta['mavat_plans'] = mavat_plans
+            asset.set_enrichment('mavat_plans', mavat_plans)
             _process_mavat_plans(asset, mavat_plans)
         
         # Update with Yad2 listings
@@ -898,12 +898,12 @@ def _update_asset_with_collected_data(asset_id: int, block: str, parcel: str, go
             logger.debug("All listings dropped while normalizing Yad2 data for asset %s", asset_id)
 
         if normalized_listings:
-            asset.meta['yad2_listings'] = normalized_listings
+            asset.set_enrichment('yad2_listings', normalized_listings)
 
             prices = [listing.get('price') for listing in normalized_listings if listing.get('price')]
             areas = [listing.get('area') for listing in normalized_listings if listing.get('area')]
 
-            market_data = asset.meta.setdefault('market_data', {})
+            market_data = dict(asset.get_enrichment('market_data', {}))
 
             if prices:
                 market_data.update(
@@ -925,8 +925,8 @@ def _update_asset_with_collected_data(asset_id: int, block: str, parcel: str, go
                     }
                 )
 
-            if not market_data:
-                asset.meta.pop('market_data', None)
+            if market_data:
+                asset.set_enrichment('market_data', market_data)
 
         # Update last enrichment timestamp
         from django.utils import timezone
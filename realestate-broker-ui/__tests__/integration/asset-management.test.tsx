@@ -124,7 +124,7 @@ describe('Asset Management Integration', () => {
     
     // Default fetch responses
     ;(global.fetch as any).mockImplementation((url: string, options?: any) => {
-      if (url === '/api/assets' && (!options || options.method === 'GET')) {
+      if (url === '/api/assets?limit=50' && (!options || options.method === 'GET')) {
         return Promise.resolve({
           ok: true,
           json: async () => ({
@@ -272,7 +272,7 @@ describe('Asset Management Integration', () => {
       })
 
       // Should refresh the list after successful creation
-      expect(global.fetch).toHaveBeenCalledWith('/api/assets', expect.objectContaining({
+      expect(global.fetch).toHaveBeenCalledWith('/api/assets?limit=50', expect.objectContaining({
         headers: expect.objectContaining({
           'Content-Type': 'application/json',
         }),
@@ -110,7 +110,7 @@ export default function AlertsPage() {
   // Fetch assets from API
   const fetchAssets = async () => {
     try {
-      const response = await api.get('/api/assets')
+      const response = await api.get('/api/assets?all=1')
       if (response.ok) {
         setAssets(response.data?.rows || [])
       }
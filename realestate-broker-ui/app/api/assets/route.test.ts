@@ -81,6 +81,73 @@ describe('/api/assets', () => {
       expect(data.rows[0].address).toBe('Backend Asset')
     })
 
+    it('returns one page and its cursor, passing limit and cursor through', async () => {
+      global.fetch = vi.fn().mockResolvedValue({
+        ok: true,
+        json: async () => ({ rows: [{ id: 3, address: 'Third' }], next_cursor: 'c2' })
+      }) as any
+
+      const response = await GET(new Request('http://127.0.0.1:3000/api/assets?limit=1&cursor=c1'))
+      const data = await response.json()
+
+      expect(global.fetch).toHaveBeenCalledTimes(1)
+      expect((global.fetch as any).mock.calls[0][0]).toContain('limit=1')
+      expect((global.fetch as any).mock.calls[0][0]).toContain('cursor=c1')
+      expect(data.next_cursor).toBe('c2')
+    })
+
+    it('does not follow next_cursor unless every asset is asked for', async () => {
+      global.fetch = vi.fn().mockResolvedValue({
+        ok: true,
+        json: async () => ({ rows: [{ id: 1, address: 'First' }], next_cursor: 'c1' })
+      }) as any
+
+      const response = await GET(new Request('http://127.0.0.1:3000/api/assets'))
+      const data = await response.json()
+
+      expect(global.fetch).toHaveBeenCalledTimes(1)
+      expect(data.next_cursor).toBe('c1')
+    })
+
+    it('collects every page for pickers', async () => {
+      global.fetch = vi.fn()
+        .mockResolvedValueOnce({
+          ok: true,
+          json: async () => ({ rows: [{ id: 1, address: 'First' }], next_cursor: 'c1' })
+        })
+        .mockResolvedValueOnce({
+          ok: true,
+          json: async () => ({ rows: [{ id: 2, address: 'Second' }], next_cursor: null })
+        }) as any
+
+      const response = await GET(new Request('http://127.0.0.1:3000/api/assets?all=1'))
+      const data = await response.json()
+
+      expect(global.fetch).toHaveBeenCalledTimes(2)
+      expect((global.fetch as any).mock.calls[0][0]).not.toContain('all=')
+      expect((global.fetch as any).mock.calls[1][0]).toContain('cursor=c1')
+      expect(data.rows.map((row: any) => row.id)).toEqual([1, 2])
+      expect(data.next_cursor).toBeNull()
+    })
+
+    it('stops collecting at the picker limit', async () => {
+      let page = 0
+      global.fetch = vi.fn().mockImplementation(async () => ({
+        ok: true,
+        json: async () => ({
+          rows: Array.from({ length: 200 }, (_, i) => ({ id: page * 200 + i, address: 'A' })),
+          next_cursor: `c${++page}`
+        })
+      })) as any
+
+      const response = await GET(new Request('http://127.0.0.1:3000/api/assets?all=1'))
+      const data = await response.json()
+
+      expect(global.fetch).toHaveBeenCalledTimes(5)
+      expect(data.rows).toHaveLength(1000)
+      expect(data.next_cursor).toBe('c5')
+    })
+
     it('returns error when backend fetch fails', async () => {
       global.fetch = vi.fn().mockRejectedValue(new Error('fail'))
 
@@ -49,23 +49,50 @@ const newAssetSchema = z.object({
   rentEstimate: z.number().optional()
 })
 
-export async function GET() {
+// Rows per backend page when collecting the list for a picker (backend maximum)
+const ASSET_PAGE_SIZE = 200
+// Most assets a picker collects before it is cut off
+const ASSET_COLLECT_LIMIT = 1000
+
+// The backend returns the asset list one keyset page at a time, and the proxy
+// passes `limit`/`cursor` through and returns that page with its
+// `next_cursor`. Small pickers ask for `all=1` to get every asset in one
+// response; that collection stops at ASSET_COLLECT_LIMIT rows, in which case
+// `next_cursor` is where it stopped.
+export async function GET(req?: Request) {
   const backendUrl = process.env.BACKEND_URL || 'http://127.0.0.1:8000'
   const token = cookies().get('access_token')?.value
-  
+  const params = new URL(req?.url ?? 'http://localhost/api/assets').searchParams
+  const collectAll = params.get('all') === '1'
+  params.delete('all')
+  if (collectAll) {
+    params.set('limit', String(ASSET_PAGE_SIZE))
+  }
+
   // Assets endpoint is open to everyone - no authentication required
   try {
-    const res = await fetch(`${backendUrl}/api/assets/`, {
-      headers: {
-        ...(token && { Authorization: `Bearer ${token}` })
+    const rows: any[] = []
+    let nextCursor: string | null = null
+    do {
+      if (nextCursor) {
+        params.set('cursor', nextCursor)
       }
-    })
-    if (!res.ok) {
-      return NextResponse.json({ error: 'Failed to fetch assets' }, { status: res.status })
-    }
-    const data = await res.json()
-    const assets = (data.rows || data || []).map((asset: any) => normalizeFromBackend(asset))
-    return NextResponse.json({ rows: assets })
+      const query = params.toString()
+      const res = await fetch(`${backendUrl}/api/assets/${query ? `?${query}` : ''}`, {
+        headers: {
+          ...(token && { Authorization: `Bearer ${token}` })
+        }
+      })
+      if (!res.ok) {
+        return NextResponse.json({ error: 'Failed to fetch assets' }, { status: res.status })
+      }
+      const data = await res.json()
+      rows.push(...(Array.isArray(data) ? data : data.rows || []))
+      nextCursor = data.next_cursor || null
+    } while (collectAll && nextCursor && rows.length < ASSET_COLLECT_LIMIT)
+
+    const assets = rows.map((asset: any) => normalizeFromBackend(asset))
+    return NextResponse.json({ rows: assets, next_cursor: nextCursor })
   } catch (error) {
     console.error('Error fetching assets from backend:', error)
     return NextResponse.json({ error: 'Failed to fetch assets' }, { status: 500 })
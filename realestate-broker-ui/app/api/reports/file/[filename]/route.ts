@@ -1,24 +1,43 @@
 import { NextResponse } from 'next/server';
+import { cookies } from 'next/headers';
 import fs from 'fs';
 import path from 'path';
 
 const BACKEND_URL = process.env.BACKEND_URL || 'http://127.0.0.1:8000';
 
+// Conditional and range request headers passed through to the backend
+const FORWARDED_REQUEST_HEADERS = ['Range', 'If-Range', 'If-None-Match', 'If-Modified-Since'];
+const FORWARDED_RESPONSE_HEADERS = ['Content-Type', 'Content-Length', 'Content-Range', 'Accept-Ranges', 'ETag', 'Last-Modified'];
+
 export async function GET(
   req: Request,
   { params }: { params: { filename: string } }
 ) {
   const { filename } = params;
+  // Reports are only served to the user who requested them
+  const token = cookies().get('access_token')?.value;
+  const headers: Record<string, string> = token ? { Authorization: `Bearer ${token}` } : {};
+  for (const name of FORWARDED_REQUEST_HEADERS) {
+    const value = req.headers.get(name);
+    if (value) {
+      headers[name] = value;
+    }
+  }
   try {
-    const res = await fetch(`${BACKEND_URL}/api/reports/file/${filename}`, { cache: 'no-store' });
-    if (res.ok) {
-      const buffer = await res.arrayBuffer();
-      return new NextResponse(buffer, {
-        status: res.status,
-        headers: {
-          'Content-Type': res.headers.get('Content-Type') || 'application/pdf',
-        },
-      });
+    const res = await fetch(`${BACKEND_URL}/api/reports/file/${filename}`, { cache: 'no-store', headers });
+    if (res.ok || res.status === 304 || res.status === 416) {
+      const responseHeaders: Record<string, string> = {};
+      for (const name of FORWARDED_RESPONSE_HEADERS) {
+        const value = res.headers.get(name);
+        if (value) {
+          responseHeaders[name] = value;
+        }
+      }
+      // Stream the PDF instead of holding it in memory
+      return new NextResponse(res.status === 304 ? null : res.body, { status: res.status, headers: responseHeaders });
+    }
+    if (res.status === 401 || res.status === 404) {
+      return NextResponse.json({ error: 'Report not found' }, { status: res.status });
     }
   } catch (err) {
     console.error('Backend report fetch failed:', err);
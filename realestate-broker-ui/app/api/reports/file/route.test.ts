@@ -9,6 +9,12 @@ vi.mock('fs', () => ({
   }
 }));
 
+vi.mock('next/headers', () => ({
+  cookies: vi.fn(() => ({
+    get: vi.fn((name: string) => (name === 'access_token' ? { value: 'token' } : undefined)),
+  })),
+}));
+
 vi.mock('path', () => ({
   default: {
     join: vi.fn((...args: string[]) => args.join('/')),
@@ -29,7 +35,7 @@ describe('reports file API', () => {
 
     expect(fetchMock).toHaveBeenCalledWith(
       expect.stringContaining('/api/reports/file/r1.pdf'),
-      expect.any(Object)
+      expect.objectContaining({ headers: expect.objectContaining({ Authorization: 'Bearer token' }) })
     );
     expect(res.status).toBe(200);
     const buf = await res.arrayBuffer();
@@ -37,6 +43,48 @@ describe('reports file API', () => {
     fetchMock.mockRestore();
   });
 
+  it('streams the backend body instead of buffering it', async () => {
+    const upstream = new Response('pdfdata', { status: 200, headers: { 'Content-Type': 'application/pdf' } });
+    const arrayBuffer = vi.spyOn(upstream, 'arrayBuffer');
+    vi.spyOn(global, 'fetch').mockResolvedValueOnce(upstream);
+
+    const res = await GET(new Request('http://test'), { params: { filename: 'r1.pdf' } });
+
+    expect(arrayBuffer).not.toHaveBeenCalled();
+    expect(await res.text()).toBe('pdfdata');
+  });
+
+  it('passes range requests through to the backend', async () => {
+    const fetchMock = vi.spyOn(global, 'fetch').mockResolvedValueOnce(
+      new Response('%PDF', {
+        status: 206,
+        headers: { 'Content-Type': 'application/pdf', 'Content-Range': 'bytes 0-3/100' },
+      })
+    );
+
+    const res = await GET(
+      new Request('http://test', { headers: { Range: 'bytes=0-3' } }),
+      { params: { filename: 'r1.pdf' } }
+    );
+
+    expect(fetchMock).toHaveBeenCalledWith(
+      expect.any(String),
+      expect.objectContaining({ headers: expect.objectContaining({ Range: 'bytes=0-3' }) })
+    );
+    expect(res.status).toBe(206);
+    expect(res.headers.get('Content-Range')).toBe('bytes 0-3/100');
+    fetchMock.mockRestore();
+  });
+
+  it('does not fall back to a local file for reports the user may not see', async () => {
+    vi.spyOn(global, 'fetch').mockResolvedValueOnce(new Response('', { status: 404 }));
+
+    const res = await GET(new Request('http://test'), { params: { filename: 'r1.pdf' } });
+
+    expect(res.status).toBe(404);
+    expect(fs.readFileSync).not.toHaveBeenCalled();
+  });
+
   it('falls back to local file when backend fails', async () => {
     const fetchMock = vi.spyOn(global, 'fetch').mockRejectedValueOnce(new Error('fail'));
     vi.mocked(fs.readFileSync).mockReturnValue(Buffer.from('local'));
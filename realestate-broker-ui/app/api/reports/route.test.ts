@@ -178,6 +178,33 @@ describe('reports API', () => {
     fetchMock.mockRestore()
   })
 
+  it('returns one page of backend reports and its cursor', async () => {
+    const fetchMock = vi.spyOn(global, 'fetch')
+      .mockResolvedValueOnce(new Response(JSON.stringify({ reports: [{ id: 2 }], next_cursor: 'c1' })))
+
+    const res = await GET(new Request('http://127.0.0.1/api/reports?limit=1'))
+    const data = await res.json()
+
+    expect(fetchMock).toHaveBeenCalledTimes(1)
+    expect(fetchMock.mock.calls[0][0]).toContain('limit=1')
+    expect(data.reports[0].id).toBe(2)
+    expect(data.next_cursor).toBe('c1')
+    fetchMock.mockRestore()
+  })
+
+  it('passes the cursor through for later pages', async () => {
+    const fetchMock = vi.spyOn(global, 'fetch')
+      .mockResolvedValueOnce(new Response(JSON.stringify({ reports: [{ id: 1 }], next_cursor: null })))
+
+    const res = await GET(new Request('http://127.0.0.1/api/reports?limit=1&cursor=c1'))
+    const data = await res.json()
+
+    expect(fetchMock.mock.calls[0][0]).toContain('cursor=c1')
+    expect(data.reports.map((r: any) => r.id)).toEqual([1])
+    expect(data.next_cursor).toBeNull()
+    fetchMock.mockRestore()
+  })
+
   it('lists reports', async () => {
     const res = await GET(new Request('http://127.0.0.1/api/reports'));
     const data = await res.json();
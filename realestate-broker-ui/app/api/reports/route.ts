@@ -23,7 +23,18 @@ export async function GET(req: Request) {
       return response;
     }
     
-    const res = await fetch(`${BACKEND_URL}/api/reports/`, { 
+    // The backend pages the user's reports; pass `limit`/`cursor` through
+    // and return that page with its `next_cursor`
+    const requested = new URL(req.url).searchParams;
+    const query = new URLSearchParams();
+    for (const name of ['limit', 'cursor']) {
+      const value = requested.get(name);
+      if (value) {
+        query.set(name, value);
+      }
+    }
+    const queryString = query.toString();
+    const res = await fetch(`${BACKEND_URL}/api/reports/${queryString ? `?${queryString}` : ''}`, {
       cache: 'no-store',
       headers: {
         ...(token && { Authorization: `Bearer ${token}` })
@@ -31,13 +42,17 @@ export async function GET(req: Request) {
     });
     if (res.ok) {
       const data = await res.json();
-      const backendReports = data.reports || [];
-      return NextResponse.json({ reports: [...backendReports, ...mockReports] });
+      // Locally generated reports are listed with the first page
+      const localReports = requested.has('cursor') ? [] : mockReports;
+      return NextResponse.json({
+        reports: [...(data.reports || []), ...localReports],
+        next_cursor: data.next_cursor || null,
+      });
     }
   } catch (err) {
     console.error('Backend reports fetch failed:', err);
   }
-  return NextResponse.json({ reports: mockReports });
+  return NextResponse.json({ reports: mockReports, next_cursor: null });
 }
 
 export async function DELETE(req: Request) {
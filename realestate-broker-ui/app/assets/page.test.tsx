@@ -99,7 +99,7 @@ describe('AssetsPage', () => {
 
     // Default successful fetch mock
     ;(global.fetch as any).mockImplementation((url: string, opts?: any) => {
-      if (url === '/api/assets') {
+      if (url === '/api/assets?limit=50') {
         return Promise.resolve({
           ok: true,
           json: async () => ({
@@ -157,6 +157,41 @@ describe('AssetsPage', () => {
     })
   })
 
+  it('loads the next page of assets on demand', async () => {
+    ;(global.fetch as any).mockImplementation((url: string) => {
+      if (url === '/api/assets?limit=50') {
+        return Promise.resolve({
+          ok: true,
+          json: async () => ({ rows: [{ id: 'asset1', address: 'Test Street 123' }], next_cursor: 'c1' })
+        })
+      }
+      if (url === '/api/assets?limit=50&cursor=c1') {
+        return Promise.resolve({
+          ok: true,
+          json: async () => ({ rows: [{ id: 'asset2', address: 'Another Street 456' }], next_cursor: null })
+        })
+      }
+      return Promise.resolve({ ok: true, json: async () => [] })
+    })
+
+    await act(async () => {
+      render(<AssetsPage />, { wrapper: TestWrapper })
+    })
+
+    await waitFor(() => {
+      expect(screen.getByText('1 assets')).toBeInTheDocument()
+    })
+
+    await act(async () => {
+      fireEvent.click(screen.getByText('טען עוד נכסים'))
+    })
+
+    await waitFor(() => {
+      expect(screen.getByText('2 assets')).toBeInTheDocument()
+    })
+    expect(screen.queryByText('טען עוד נכסים')).not.toBeInTheDocument()
+  })
+
   it('handles fetch errors gracefully', async () => {
     const consoleSpy = vi.spyOn(console, 'error').mockImplementation(() => {})
     ;(global.fetch as any).mockRejectedValue(new Error('Network error'))
@@ -246,7 +281,7 @@ describe('AssetsPage', () => {
           })
         })
       }
-      if (url === '/api/assets') {
+      if (url === '/api/assets?limit=50') {
         return Promise.resolve({ ok: true, json: async () => ({ rows: [] }) })
       }
       return Promise.resolve({ ok: true, json: async () => [] })
@@ -51,6 +51,8 @@ import PlanLimitDialog from "@/components/PlanLimitDialog";
 import { apiClient } from "@/lib/api-client";
 
 const DEFAULT_RADIUS_METERS = 100;
+// Assets fetched per page; further pages load on demand
+const ASSETS_PAGE_SIZE = 50;
 
 const RISK_FILTER_OPTIONS = [
   { value: "flagged", label: "עם דגלי סיכון" },
@@ -65,6 +67,8 @@ const DOCUMENTS_FILTER_OPTIONS = [
 export default function AssetsPage() {
   const [assets, setAssets] = useState<Asset[]>([]);
   const [loading, setLoading] = useState(false);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [open, setOpen] = useState(false);
   const [deleting, setDeleting] = useState<number | null>(null);
   const searchParams = useSearchParams();
@@ -414,13 +418,14 @@ export default function AssetsPage() {
     searchParams,
   ]);
 
-  // Function to fetch assets
+  // Function to fetch the first page of assets
   const fetchAssets = async () => {
     try {
       setLoading(true);
-      const response = await apiClient.get("/api/assets");
+      const response = await apiClient.get(`/api/assets?limit=${ASSETS_PAGE_SIZE}`);
       if (response.ok) {
         setAssets(response.data.rows);
+        setNextCursor(response.data.next_cursor ?? null);
       } else {
         console.error("Failed to fetch assets:", response.error);
       }
@@ -431,6 +436,27 @@ export default function AssetsPage() {
     }
   };
 
+  // Function to append the next page of assets
+  const loadMoreAssets = async () => {
+    if (!nextCursor) return;
+    try {
+      setLoadingMore(true);
+      const response = await apiClient.get(
+        `/api/assets?limit=${ASSETS_PAGE_SIZE}&cursor=${encodeURIComponent(nextCursor)}`
+      );
+      if (response.ok) {
+        setAssets(prev => [...prev, ...response.data.rows]);
+        setNextCursor(response.data.next_cursor ?? null);
+      } else {
+        console.error("Failed to fetch more assets:", response.error);
+      }
+    } catch (error) {
+      console.error("Error fetching more assets:", error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleDeleteAsset = async (assetId: number) => {
     // Check if user is authenticated
     if (!isAuthenticated) {
@@ -1425,6 +1451,11 @@ export default function AssetsPage() {
           <p className="text-sm text-muted-foreground">
             מציג {filteredAssets.length} מתוך {assets.length} נכסים
           </p>
+          {nextCursor && (
+            <Button variant="outline" size="sm" onClick={loadMoreAssets} disabled={loadingMore}>
+              {loadingMore ? "טוען..." : "טען עוד נכסים"}
+            </Button>
+          )}
         </div>
 
         {/* Plan Limit Dialog */}
@@ -191,7 +191,7 @@ export default function DealExpensesPage() {
   async function loadAssets() {
     setLoadingAssets(true)
     try {
-      const response = await fetch('/api/assets')
+      const response = await fetch('/api/assets?all=1')
       if (response.ok) {
         const data = await response.json()
         setAssets(data.rows || [])
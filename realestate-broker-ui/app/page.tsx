@@ -247,7 +247,9 @@ export default function HomePage() {
   // Only show data if user is authenticated
   const displayData = dashboardData || {
     totalassets: 0,
+    hasMoreAssets: false,
     activeAlerts: 0,
+    hasMoreReports: false,
     totalReports: 0,
     averageReturn: 0,
     marketTrend: 'stable' as const,
@@ -349,7 +351,7 @@ export default function HomePage() {
         <div className="grid gap-6 grid-cols-1 md:grid-cols-2 lg:grid-cols-4 items-stretch">
           <KpiCard
             title="סה״כ נכסים"
-            value={fmtNumber(displayData.totalassets)}
+            value={`${fmtNumber(displayData.totalassets)}${displayData.hasMoreAssets ? "+" : ""}`}
             icon={<Building2 className="h-5 w-5" />}
             tone="teal"
             href="/assets"
@@ -393,7 +395,7 @@ export default function HomePage() {
 
           <KpiCard
             title="דוחות"
-            value={isAuthenticated ? fmtNumber(displayData.totalReports) : "0"}
+            value={isAuthenticated ? `${fmtNumber(displayData.totalReports)}${displayData.hasMoreReports ? "+" : ""}` : "0"}
             icon={<FileText className="h-5 w-5" />}
             tone="blue"
             href={isAuthenticated ? "/reports" : undefined}
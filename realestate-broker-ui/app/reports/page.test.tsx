@@ -1,6 +1,6 @@
 /* eslint-env jest */
 import React from 'react';
-import { render, screen } from '@testing-library/react';
+import { render, screen, fireEvent } from '@testing-library/react';
 import '@testing-library/jest-dom';
 import ReportsPage from './page';
 import { vi } from 'vitest';
@@ -33,11 +33,42 @@ describe('ReportsPage', () => {
     expect(reportRow).toBeInTheDocument();
     
     // Verify the API was called
-    expect(fetchMock).toHaveBeenCalledWith('/api/reports', expect.objectContaining({
+    expect(fetchMock).toHaveBeenCalledWith('/api/reports?limit=50', expect.objectContaining({
       headers: expect.objectContaining({
         'Content-Type': 'application/json',
       }),
       method: 'GET',
     }));
   });
+
+  it('loads the next page of reports on request', async () => {
+    const createdAt = new Date().toISOString();
+    const fetchMock = vi.fn()
+      .mockResolvedValueOnce({
+        ok: true,
+        status: 200,
+        json: () => Promise.resolve({
+          reports: [{ id: 2, assetId: 1, address: 'Demo St 2', filename: 'r2.pdf', createdAt }],
+          next_cursor: 'c1',
+        })
+      })
+      .mockResolvedValueOnce({
+        ok: true,
+        status: 200,
+        json: () => Promise.resolve({
+          reports: [{ id: 1, assetId: 1, address: 'Demo St 1', filename: 'r1.pdf', createdAt }],
+          next_cursor: null,
+        })
+      });
+    vi.stubGlobal('fetch', fetchMock);
+
+    render(<ReportsPage />);
+
+    fireEvent.click(await screen.findByRole('button', { name: 'טען עוד דוחות' }));
+
+    expect(await screen.findByRole('button', { name: /צפה בדוח עבור Demo St 1/ })).toBeInTheDocument();
+    expect(screen.getByRole('button', { name: /צפה בדוח עבור Demo St 2/ })).toBeInTheDocument();
+    expect(fetchMock).toHaveBeenLastCalledWith('/api/reports?limit=50&cursor=c1', expect.anything());
+    expect(screen.queryByRole('button', { name: 'טען עוד דוחות' })).not.toBeInTheDocument();
+  });
 });
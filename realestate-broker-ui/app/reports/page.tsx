@@ -31,19 +31,25 @@ const getStatusHebrew = (status: string): string => {
   return statusMap[status] || status
 }
 
+// Reports requested per page of the list
+const REPORTS_PAGE_SIZE = 50
+
 export default function ReportsPage() {
   const [reports, setReports] = useState<Report[]>([])
   const [loading, setLoading] = useState(true)
   const [deleting, setDeleting] = useState<number | null>(null)
   const [clickedRow, setClickedRow] = useState<number | null>(null)
+  const [nextCursor, setNextCursor] = useState<string | null>(null)
+  const [loadingMore, setLoadingMore] = useState(false)
 
   useEffect(() => {
-    apiClient.get('/api/reports')
+    apiClient.get(`/api/reports?limit=${REPORTS_PAGE_SIZE}`)
       .then(res => {
         if (res.ok) {
           // Handle both array and object responses
           const reportsData = Array.isArray(res.data) ? res.data : (res.data.reports || [])
           setReports(reportsData)
+          setNextCursor(Array.isArray(res.data) ? null : (res.data.next_cursor ?? null))
         } else {
           console.error('Failed to load reports:', res.error)
           setReports([])
@@ -58,6 +64,26 @@ export default function ReportsPage() {
       })
   }, [])
 
+  const loadMoreReports = async () => {
+    if (!nextCursor) return
+    try {
+      setLoadingMore(true)
+      const res = await apiClient.get(
+        `/api/reports?limit=${REPORTS_PAGE_SIZE}&cursor=${encodeURIComponent(nextCursor)}`
+      )
+      if (res.ok) {
+        setReports(prev => [...prev, ...(res.data.reports || [])])
+        setNextCursor(res.data.next_cursor ?? null)
+      } else {
+        console.error('Failed to load more reports:', res.error)
+      }
+    } catch (err) {
+      console.error('Failed to load more reports', err)
+    } finally {
+      setLoadingMore(false)
+    }
+  }
+
   // Use only real data from API
   const displayReports = reports
   const isSampleData = false
@@ -230,6 +256,11 @@ export default function ReportsPage() {
           <p className="text-sm text-muted-foreground">
             מציג {displayReports.length} דוחות עם נתונים מלאים
           </p>
+          {nextCursor && (
+            <Button variant="outline" size="sm" onClick={loadMoreReports} disabled={loadingMore}>
+              {loadingMore ? 'טוען...' : 'טען עוד דוחות'}
+            </Button>
+          )}
         </div>
       </DashboardShell>
     </DashboardLayout>
@@ -102,7 +102,7 @@ export default function AlertRulesManager({ assetId, editingRule, onRuleSaved }:
   const loadAssets = async () => {
     try {
       setAssetsLoading(true)
-      const response = await api.get('/api/assets')
+      const response = await api.get('/api/assets?all=1')
       if (response.ok) {
         setAssets(response.data?.rows || [])
       }
@@ -71,7 +71,7 @@ export function AssetSelector({
   const loadAssets = async () => {
     try {
       setIsLoading(true);
-      const response = await apiClient.get('/api/assets');
+      const response = await apiClient.get('/api/assets?all=1');
       if (response.ok) {
         setAssets(response.data.rows || []);
         setFilteredAssets(response.data.rows || []);
@@ -2,9 +2,18 @@ import { useState, useEffect } from 'react'
 import { api } from './api-client'
 import { useAuth } from './auth-context'
 
+// Assets the dashboard summarizes: one page of the asset list
+const DASHBOARD_ASSET_LIMIT = 200
+// Reports the dashboard counts: one page of the report list
+const DASHBOARD_REPORT_LIMIT = 200
+
 export interface DashboardData {
   totalassets: number
+  // More assets exist than the dashboard loaded
+  hasMoreAssets: boolean
   activeAlerts: number
+  // More reports exist than the dashboard loaded
+  hasMoreReports: boolean
   totalReports: number
   averageReturn: number
   marketTrend: 'up' | 'down' | 'stable'
@@ -62,11 +71,11 @@ export function useDashboardData() {
         // For authenticated users, fetch all data
         const apiCalls = isAuthenticated 
           ? [
-              api.get('/api/assets'),
+              api.get(`/api/assets?limit=${DASHBOARD_ASSET_LIMIT}`),
               api.get('/api/alerts'),
-              api.get('/api/reports')
+              api.get(`/api/reports?limit=${DASHBOARD_REPORT_LIMIT}`)
             ]
-          : [api.get('/api/assets')] // Only fetch assets for guests
+          : [api.get(`/api/assets?limit=${DASHBOARD_ASSET_LIMIT}`)] // Only fetch assets for guests
 
         const responses = await Promise.allSettled(apiCalls)
         
@@ -77,6 +86,7 @@ export function useDashboardData() {
 
         // Process assets data
         let totalassets = 0
+        let hasMoreAssets = false
         let propertyTypes: Array<{ type: string; count: number; percentage: number }> = []
         let topAreas: Array<{ area: string; assets: number; avgPrice: number; trend: number }> = []
         let totalPropertyValue = 0
@@ -86,6 +96,7 @@ export function useDashboardData() {
         if (assetsRes.status === 'fulfilled' && assetsRes.value.ok) {
           const assets = assetsRes.value.data?.rows || []
           totalassets = assets.length
+          hasMoreAssets = Boolean(assetsRes.value.data?.next_cursor)
 
           // Analyze property types and calculate individual returns
           const typeCounts: Record<string, number> = {}
@@ -167,9 +178,11 @@ export function useDashboardData() {
 
         // Process reports data (only for authenticated users)
         let totalReports = 0
+        let hasMoreReports = false
         if (isAuthenticated && reportsRes.status === 'fulfilled' && reportsRes.value?.ok) {
           const reports = reportsRes.value.data?.rows || reportsRes.value.data?.reports || []
           totalReports = reports.length
+          hasMoreReports = Boolean(reportsRes.value.data?.next_cursor)
         }
 
         // Fetch comparables for all assets to build market data (only for authenticated users)
@@ -276,7 +289,9 @@ export function useDashboardData() {
 
         const dashboardData: DashboardData = {
           totalassets,
+          hasMoreAssets,
           activeAlerts,
+          hasMoreReports,
           totalReports,
           averageReturn,
           marketTrend,
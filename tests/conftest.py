@@ -103,6 +103,8 @@ def pytest_configure(config):
         os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'broker_backend.settings')
         os.environ.setdefault('SECRET_KEY', 'test-secret-key-for-testing')
         os.environ.setdefault('DEBUG', 'True')
+        os.environ.setdefault('ANALYTICS_SYNC', 'true')
+        os.environ.setdefault('REPORTS_ASYNC', 'false')
         
         # Set DYLD_LIBRARY_PATH for WeasyPrint on Apple Silicon
         if os.name == 'posix' and os.uname().machine == 'arm64':
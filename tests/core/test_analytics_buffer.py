@@ -0,0 +1,96 @@
+import threading
+from datetime import datetime, timedelta, timezone as dt_timezone
+from unittest.mock import patch
+
+import pytest
+from django.utils import timezone
+
+from core import analytics
+from core.analytics import EventBuffer, track
+from core.models import AnalyticsEvent
+
+
+@pytest.mark.django_db
+def test_track_writes_immediately_in_sync_mode(settings):
+    settings.ANALYTICS_SYNC = True
+
+    track("asset_create", asset_id=7, meta={"city": "Haifa"})
+
+    event = AnalyticsEvent.objects.get()
+    assert (event.event, event.asset_id, event.meta) == ("asset_create", 7, {"city": "Haifa"})
+
+
+@pytest.mark.django_db
+def test_track_buffers_until_flushed(settings, django_assert_num_queries):
+    settings.ANALYTICS_SYNC = False
+    buffer = EventBuffer(batch_size=50, flush_interval=60)
+
+    with patch.object(analytics, "_buffer", buffer), patch.object(EventBuffer, "_ensure_worker"):
+        with django_assert_num_queries(0):
+            for i in range(120):
+                track("search_performed", meta={"i": i})
+        assert not AnalyticsEvent.objects.exists()
+
+        # One INSERT per batch
+        with django_assert_num_queries(3):
+            assert analytics.flush_events() == 120
+
+    assert AnalyticsEvent.objects.filter(event="search_performed").count() == 120
+    assert buffer.qsize() == 0
+
+
+@pytest.mark.django_db
+def test_buffered_events_keep_the_time_they_happened(settings):
+    settings.ANALYTICS_SYNC = False
+    buffer = EventBuffer(batch_size=50, flush_interval=60)
+    happened = datetime(2026, 3, 1, 23, 59, 59, tzinfo=dt_timezone.utc)
+
+    with patch.object(analytics, "_buffer", buffer), patch.object(EventBuffer, "_ensure_worker"):
+        with patch.object(timezone, "now", return_value=happened):
+            track("search_performed")
+        # Written after midnight, still counted on the day it happened
+        with patch.object(timezone, "now", return_value=happened + timedelta(minutes=5)):
+            analytics.flush_events()
+
+    assert AnalyticsEvent.objects.get().created_at == happened
+
+
+@patch.object(EventBuffer, "_ensure_worker")
+def test_full_buffer_drops_and_counts(_ensure_worker):
+    buffer = EventBuffer(max_size=2)
+
+    results = [buffer.put(AnalyticsEvent(event="e")) for _ in range(5)]
+
+    assert results == [True, True, False, False, False]
+    assert buffer.dropped == 3
+    assert buffer.qsize() == 2
+
+
+def test_worker_flushes_when_a_batch_is_ready():
+    buffer = EventBuffer(batch_size=3, flush_interval=60)
+    written = threading.Event()
+    batches = []
+
+    def write(batch):
+        batches.append(batch)
+        written.set()
+        return len(batch)
+
+    with patch.object(buffer, "_write", side_effect=write), \
+         patch.object(analytics, "close_old_connections"):
+        for _ in range(3):
+            buffer.put(AnalyticsEvent(event="e"))
+        assert written.wait(5)
+
+    assert [len(batch) for batch in batches] == [3]
+
+
+@patch.object(EventBuffer, "_ensure_worker")
+def test_failed_write_counts_as_dropped(_ensure_worker):
+    buffer = EventBuffer()
+    buffer.put(AnalyticsEvent(event="e"))
+
+    with patch.object(AnalyticsEvent.objects, "bulk_create", side_effect=RuntimeError("db down")):
+        assert buffer.flush() == 0
+
+    assert buffer.dropped == 1
@@ -0,0 +1,66 @@
+import json
+
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIRequestFactory
+
+from core.analytics import record_page_views, track_page_view
+from core.models import PageView, UserSession
+from core.views_analytics import PAGE_VIEW_BATCH_MAX, analytics_page_view
+
+
+def _views(count, session_id="s1"):
+    return [{"session_id": session_id, "page_path": f"/assets/{i}", "load_time": 0.5} for i in range(count)]
+
+
+def _post(payload):
+    request = APIRequestFactory().post(
+        "/api/analytics/page-view", json.dumps(payload), content_type="application/json"
+    )
+    return analytics_page_view(request)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("count", [1, 50])
+def test_batch_uses_a_constant_number_of_queries(count, django_assert_max_num_queries):
+    views = _views(count) + _views(count, session_id="s2")
+
+    # Session insert, session ids, page view insert, counters, savepoints
+    with django_assert_max_num_queries(6):
+        assert record_page_views(views) == 2 * count
+
+    assert PageView.objects.count() == 2 * count
+    assert dict(UserSession.objects.values_list("session_id", "page_view_count")) == {"s1": count, "s2": count}
+
+
+@pytest.mark.django_db
+def test_counts_accumulate_and_session_is_claimed_by_user():
+    user = get_user_model().objects.create_user(username="v", email="v@example.com", password="x")
+    track_page_view("s1", "/", meta={"user_agent": "test", "ip_address": "127.0.0.1"})
+
+    record_page_views(_views(2), user=user)
+
+    session = UserSession.objects.get(session_id="s1")
+    assert session.page_view_count == 3
+    assert session.user == user
+    assert (session.user_agent, session.ip_address) == ("test", "127.0.0.1")
+
+
+@pytest.mark.django_db
+def test_views_without_session_or_path_are_skipped():
+    assert record_page_views([{"session_id": "s1"}, {"page_path": "/"}]) == 0
+    assert not UserSession.objects.exists()
+
+
+@pytest.mark.django_db
+def test_endpoint_accepts_single_view_and_batches():
+    assert _post({"session_id": "s1", "page_path": "/"}).data == {"status": "success", "recorded": 1}
+    assert _post(_views(3)).data["recorded"] == 3
+    assert UserSession.objects.get(session_id="s1").page_view_count == 4
+
+
+@pytest.mark.django_db
+def test_endpoint_rejects_oversized_or_malformed_batches():
+    assert _post(_views(PAGE_VIEW_BATCH_MAX + 1)).status_code == 400
+    assert _post(["/assets"]).status_code == 400
+    assert not PageView.objects.exists()
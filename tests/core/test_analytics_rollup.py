@@ -0,0 +1,99 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+from core import analytics
+from core.analytics import rollup_day, track, track_performance
+from core.models import AnalyticsDaily, AnalyticsEvent, PageView, UserSession
+
+
+@pytest.fixture(autouse=True)
+def no_rollup_lag():
+    with patch.object(analytics, "ROLLUP_LAG", timedelta(0)):
+        yield
+
+
+def _track_day():
+    track("user_signup")
+    track("asset_create", asset_id=1)
+    track("report_success", asset_id=1)
+    track("report_fail", error_code="timeout")
+    track("feature_usage", meta={"feature": "filter"})
+    track("feature_usage", meta={"feature": "marketing_message"})
+    track("marketing_message_create")
+    track_performance("page_load_time", 1.0)
+    track_performance("page_load_time", 2.0)
+    track_performance("api_response_time", 0.5)
+
+
+@pytest.mark.django_db
+def test_full_rollup_uses_a_constant_number_of_queries(django_assert_max_num_queries):
+    _track_day()
+    yesterday = AnalyticsEvent.objects.create(event="user_signup")
+    AnalyticsEvent.objects.filter(id=yesterday.id).update(created_at=timezone.now() - timedelta(days=1))
+
+    # get_or_create and the row lock, one pass each over events, sessions
+    # and page views, the save, and the savepoints around them
+    with django_assert_max_num_queries(11):
+        daily = rollup_day(timezone.localdate())
+
+    assert (daily.users, daily.assets, daily.reports, daily.errors) == (1, 1, 1, 1)
+    assert daily.marketing_messages_created == 2
+    assert daily.filters_applied == 1
+    assert daily.signup_conversions == 1
+    assert daily.avg_page_load_time == pytest.approx(1.5)
+    assert daily.api_response_time_avg == pytest.approx(0.5)
+    assert daily.error_rate == pytest.approx(10.0)
+
+
+@pytest.mark.django_db
+def test_incremental_rollup_only_adds_new_events():
+    today = timezone.localdate()
+    _track_day()
+    rollup_day(today, incremental=True)
+
+    track("user_signup")
+    track_performance("page_load_time", 6.0)
+    daily = rollup_day(today, incremental=True)
+
+    assert daily.users == 2
+    assert daily.event_count == 12
+    assert daily.avg_page_load_time == pytest.approx(3.0)
+    assert daily.events_through is not None
+
+    full = rollup_day(today)
+    assert (full.users, full.event_count, full.avg_page_load_time) == (2, 12, daily.avg_page_load_time)
+    assert AnalyticsDaily.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_incremental_rollup_respects_lag():
+    today = timezone.localdate()
+    track("user_signup")
+
+    with patch.object(analytics, "ROLLUP_LAG", timedelta(minutes=5)):
+        daily = rollup_day(today, incremental=True)
+    assert daily.users == 0
+
+    assert rollup_day(today, incremental=True).users == 1
+
+
+@pytest.mark.django_db
+def test_session_metrics():
+    user = get_user_model().objects.create_user(username="v", email="v@example.com", password="x")
+    for i, (session_user, bounce) in enumerate([(user, False), (user, True), (None, True), (None, False)]):
+        session = UserSession.objects.create(
+            session_id=f"s{i}", user=session_user, is_bounce=bounce,
+            ended_at=timezone.now() if i < 2 else None, duration=10.0 * (i + 1),
+        )
+        PageView.objects.create(session=session, page_path="/")
+
+    daily = rollup_day(timezone.localdate())
+
+    assert daily.page_views == 4
+    assert daily.unique_visitors == 2
+    assert daily.bounce_rate == pytest.approx(50.0)
+    assert daily.session_duration_avg == pytest.approx(15.0)
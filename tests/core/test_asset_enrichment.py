@@ -0,0 +1,85 @@
+import importlib
+
+import pytest
+from django.apps import apps
+
+from core.models import Asset, AssetEnrichment
+
+move_meta_blobs = importlib.import_module("core.migrations.0034_move_meta_blobs_to_assetenrichment")
+
+GIS_DATA = {"land_use_rights": [{"plan": "תא/5000"}], "building_permits": []}
+
+
+@pytest.mark.django_db
+def test_set_property_stores_source_payload_in_side_table():
+    asset = Asset.objects.create(scope_type="address", city="Tel Aviv", meta={"zoning": "residential"})
+
+    asset.set_property("gis_data", GIS_DATA, source="GIS")
+    asset.set_property("zoning", "commercial", source="GIS")
+    asset.save()
+
+    asset = Asset.objects.get(id=asset.id)
+    assert "gis_data" not in asset.meta
+    assert asset.meta["zoning"] == "commercial"
+    assert AssetEnrichment.objects.get(asset=asset, source="gis_data").payload == GIS_DATA
+    assert asset.get_property_value("gis_data.land_use_rights") == [{"plan": "תא/5000"}]
+    assert asset.get_property_value("gis_data.missing", []) == []
+    assert asset.get_property_value("rami_plans", []) == []
+
+
+@pytest.mark.django_db
+def test_enrichments_load_lazily(django_assert_num_queries):
+    asset = Asset.objects.create(scope_type="address")
+    asset.set_enrichment("yad2_listings", [{"price": 1}])
+    asset.set_enrichment("rami_plans", [{"planNumber": "1"}])
+    asset.save()
+
+    with django_assert_num_queries(1):
+        asset = Asset.objects.get(id=asset.id)
+    with django_assert_num_queries(1):
+        assert asset.get_enrichment("yad2_listings") == [{"price": 1}]
+        assert asset.get_enrichment("yad2_listings") == [{"price": 1}]
+
+    asset = Asset.objects.prefetch_related("enrichments").get(id=asset.id)
+    with django_assert_num_queries(0):
+        assert asset.get_property_value("rami_plans") == [{"planNumber": "1"}]
+
+
+@pytest.mark.django_db
+def test_saving_replaces_legacy_meta_copy():
+    asset = Asset.objects.create(scope_type="address", meta={"yad2_listings": [{"price": 1}]})
+    assert asset.get_property_value("yad2_listings") == [{"price": 1}]
+
+    asset.set_enrichment("yad2_listings", [{"price": 2}])
+    asset.save(update_fields=["status"])
+
+    asset = Asset.objects.get(id=asset.id)
+    assert asset.meta == {}
+    assert asset.get_enrichment("yad2_listings") == [{"price": 2}]
+
+
+@pytest.mark.django_db
+def test_data_migration_moves_blobs_and_back():
+    meta = {
+        "gis_data": GIS_DATA,
+        "yad2_listings": [{"price": 1}],
+        "zoning": "residential",
+        "last_enrichment": "2025-01-02T03:04:05+00:00",
+    }
+    asset = Asset.objects.create(scope_type="address", meta=dict(meta))
+    untouched = Asset.objects.create(scope_type="address", meta={"rooms": 3})
+
+    move_meta_blobs.move_blobs_to_side_table(apps, None)
+
+    asset.refresh_from_db()
+    assert asset.meta == {"zoning": "residential", "last_enrichment": "2025-01-02T03:04:05+00:00"}
+    rows = {e.source: e for e in AssetEnrichment.objects.filter(asset=asset)}
+    assert rows["gis_data"].payload == GIS_DATA
+    assert rows["yad2_listings"].fetched_at.year == 2025
+    assert not AssetEnrichment.objects.filter(asset=untouched).exists()
+
+    move_meta_blobs.move_blobs_back_to_meta(apps, None)
+
+    asset.refresh_from_db()
+    assert asset.meta == meta
+    assert not AssetEnrichment.objects.exists()
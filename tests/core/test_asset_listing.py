@@ -0,0 +1,176 @@
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import DatabaseError, transaction
+
+from core.listing_builder import get_listing, list_asset_listings
+from core.models import Asset, AssetContribution, AssetListing, SourceRecord
+
+
+def _make_assets(count, sources_per_asset=3):
+    assets = []
+    for i in range(count):
+        asset = Asset.objects.create(
+            scope_type="address",
+            city="Tel Aviv" if i % 2 == 0 else "Haifa",
+            street=f"Street {i}",
+            price=(i + 1) * 1_000_000 if i % 5 else None,
+            rooms=3 + i % 3,
+        )
+        for j in range(sources_per_asset):
+            SourceRecord.objects.create(
+                asset=asset, source="yad2", external_id=f"{i}-{j}", raw={"total_size": 100 + j}
+            )
+        assets.append(asset)
+    return assets
+
+
+def _all_pages(params):
+    rows, cursor = [], None
+    while True:
+        page = list_asset_listings({**params, "cursor": cursor} if cursor else params)
+        rows.extend(page["rows"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            return rows
+
+
+@pytest.mark.django_db
+def test_page_query_count_is_constant(django_assert_max_num_queries):
+    _make_assets(30)
+
+    with django_assert_max_num_queries(1):
+        page = list_asset_listings({"limit": "25"})
+
+    assert len(page["rows"]) == 25
+    assert page["next_cursor"]
+
+
+@pytest.mark.django_db
+def test_stale_rows_are_rebuilt_in_batch(django_assert_max_num_queries):
+    assets = _make_assets(10)
+    AssetListing.objects.all().delete()
+    assets[0].mark_listing_stale()
+
+    # Page, source records of the stale assets, upsert of their rows
+    with django_assert_max_num_queries(3):
+        rows = list_asset_listings({})["rows"]
+
+    assert [row["totalSqm"] for row in rows] == [102] * 10
+    with django_assert_max_num_queries(1):
+        list_asset_listings({})
+
+
+@pytest.mark.django_db
+def test_saving_the_asset_refreshes_its_listing():
+    asset = _make_assets(1, sources_per_asset=0)[0]
+
+    asset.price = 2_500_000
+    asset.save(update_fields=["price"])
+
+    listing = AssetListing.objects.get(asset=asset)
+    assert listing.data["price"] == 2_500_000
+    assert listing.version == Asset.objects.get(id=asset.id).listing_version
+
+
+@pytest.mark.django_db
+def test_failed_refresh_does_not_break_the_callers_transaction():
+    asset = _make_assets(1, sources_per_asset=0)[0]
+
+    def failing_refresh(asset):
+        with transaction.atomic(savepoint=False):
+            raise DatabaseError("listing row locked")
+
+    with transaction.atomic():
+        with patch("core.listing_builder.refresh_listing", failing_refresh):
+            asset.price = 2_500_000
+            asset.save(update_fields=["price"])
+        assert Asset.objects.get(id=asset.id).price == 2_500_000
+
+
+@pytest.mark.django_db
+def test_contribution_marks_listing_stale():
+    asset = _make_assets(1, sources_per_asset=0)[0]
+    user = get_user_model().objects.create_user(username="u", email="u@example.com", password="x")
+
+    AssetContribution.objects.create(asset=asset, user=user, contribution_type="comment")
+
+    assert Asset.objects.select_related("listing").get(id=asset.id).listing.is_stale
+
+
+@pytest.mark.django_db
+def test_queryset_update_marks_listing_stale():
+    asset = _make_assets(1, sources_per_asset=0)[0]
+
+    Asset.objects.filter(id=asset.id).update(price=1_234_000)
+
+    asset = Asset.objects.select_related("listing").get(id=asset.id)
+    assert asset.listing.is_stale
+    assert get_listing(asset)["price"] == 1_234_000
+    assert not AssetListing.objects.get(asset=asset).is_stale
+
+
+@pytest.mark.django_db
+def test_bulk_update_marks_listing_stale():
+    assets = _make_assets(2, sources_per_asset=0)
+    for asset in assets:
+        asset.price = 2_000_000
+
+    Asset.objects.bulk_update(assets, ["price"])
+
+    rows = Asset.objects.select_related("listing").filter(id__in=[a.id for a in assets])
+    assert all(asset.listing.is_stale for asset in rows)
+
+
+@pytest.mark.django_db
+def test_rows_use_latest_source_record():
+    asset = _make_assets(1)[0]
+
+    row = list_asset_listings({})["rows"][0]
+
+    assert row["id"] == asset.id
+    # The last record created is the most recent one
+    assert row["totalSqm"] == 102
+
+
+@pytest.mark.django_db
+def test_cursor_walks_every_asset_once():
+    assets = _make_assets(12, sources_per_asset=0)
+
+    rows = _all_pages({"limit": "5"})
+
+    assert [row["id"] for row in rows] == [a.id for a in reversed(assets)]
+
+
+@pytest.mark.django_db
+def test_sort_by_nullable_field_puts_nulls_last():
+    assets = _make_assets(11, sources_per_asset=0)
+
+    rows = _all_pages({"limit": "3", "sort": "-price"})
+
+    prices = [row["price"] for row in rows]
+    priced = [p for p in prices if p is not None]
+    assert len(rows) == len(assets)
+    assert priced == sorted(priced, reverse=True)
+    assert prices[len(priced):] == [None] * (len(prices) - len(priced))
+
+
+@pytest.mark.django_db
+def test_filters_are_applied():
+    _make_assets(10, sources_per_asset=0)
+
+    rows = _all_pages({"city": "Haifa", "min_rooms": "4", "limit": "2"})
+
+    assert rows
+    assert all(row["city"] == "Haifa" and row["rooms"] >= 4 for row in rows)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "params",
+    [{"sort": "meta"}, {"limit": "many"}, {"cursor": "not-a-cursor"}, {"min_price": "cheap"}],
+)
+def test_invalid_parameters_raise(params):
+    with pytest.raises(ValueError):
+        list_asset_listings(params)
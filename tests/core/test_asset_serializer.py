@@ -0,0 +1,77 @@
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIRequestFactory
+
+from core.api import AssetViewSet
+from core.models import Asset, Document
+from core.serializers import AssetSerializer
+
+asset_list = AssetViewSet.as_view({"get": "list"})
+
+
+def _make_assets(count, documents_per_asset=3):
+    user = get_user_model().objects.create_user(username="uploader", email="up@example.com", password="x")
+    assets = []
+    for i in range(count):
+        asset = Asset.objects.create(
+            scope_type="address",
+            city="Tel Aviv",
+            price=1_000_000 + i,
+            meta={
+                "zoning": {"value": "residential", "source": "GIS", "fetched_at": "2025-09-01"},
+                "documents": [{"id": "permit-0", "title": "dup"}, {"id": f"meta-{i}", "title": "only in meta"}],
+            },
+        )
+        for j in range(documents_per_asset):
+            Document.objects.create(
+                asset=asset, user=user, title=f"doc {j}", filename="f.pdf", file_path="/nonexistent/f.pdf",
+                file_size=1, mime_type="application/pdf", external_id=f"permit-{j}",
+            )
+        assets.append(asset)
+    return assets
+
+
+def _get(path):
+    return asset_list(APIRequestFactory().get(path))
+
+
+@pytest.mark.django_db
+def test_list_query_count_does_not_grow_with_assets(django_assert_max_num_queries):
+    _make_assets(10)
+
+    with django_assert_max_num_queries(2):
+        response = _get("/api/assets/")
+
+    assert response.status_code == 200
+    assert len(response.data) == 10
+    assert all(len(row["documents"]) == 4 for row in response.data)
+
+
+@pytest.mark.django_db
+def test_sparse_fieldset_skips_documents_and_meta(django_assert_num_queries):
+    _make_assets(5)
+
+    with django_assert_num_queries(1):
+        response = _get("/api/assets/?fields=id,price")
+
+    assert all(set(row) == {"id", "price"} for row in response.data)
+
+
+@pytest.mark.django_db
+def test_sparse_fieldset_can_select_meta_entries():
+    _make_assets(1, documents_per_asset=0)
+
+    row = _get("/api/assets/?fields=id,zoning,_meta").data[0]
+
+    assert row["zoning"] == "residential"
+    assert row["_meta"] == {"zoning": {"source": "GIS", "fetched_at": "2025-09-01"}}
+    assert "city" not in row
+
+
+@pytest.mark.django_db
+def test_meta_documents_are_deduplicated_against_document_rows():
+    asset = _make_assets(1, documents_per_asset=2)[0]
+
+    documents = AssetSerializer(asset).data["documents"]
+
+    assert sorted(d.get("external_id") or d["id"] for d in documents) == ["meta-0", "permit-0", "permit-1"]
@@ -0,0 +1,167 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from django.core.cache import cache
+from django.utils import timezone
+
+from core import comps
+from core.comps import (
+    COMPS_MAX_MONTHS, COMPS_MAX_RADIUS_M, CompsIndex, comps_stats, find_comparables,
+    parse_comps_params, trimmed_mean,
+)
+from core.models import Asset, RealEstateTransaction
+
+# Points roughly 0, 500 m and 3 km north of the subject asset
+TEL_AVIV = (32.0800, 34.7800)
+NEAR = (32.0845, 34.7800)
+FAR = (32.1070, 34.7800)
+
+
+@pytest.fixture(autouse=True)
+def fresh_comps_state():
+    cache.clear()
+    with patch.object(comps, "_index", None):
+        yield
+    cache.clear()
+
+
+def _asset(latlon=None, block="6638", area=100.0):
+    lat, lon = latlon or (None, None)
+    return Asset.objects.create(scope_type="address", city="Tel Aviv", lat=lat, lon=lon, block=block, area=area)
+
+
+def _deal(asset, deal_id, price, area=100.0, days_ago=30, raw=None):
+    return RealEstateTransaction.objects.create(
+        asset=asset, deal_id=deal_id, price=price, area=area,
+        date=timezone.now() - timedelta(days=days_ago), raw=raw or {},
+    )
+
+
+def test_trimmed_mean_ignores_outliers():
+    values = np.array([1.0] * 8 + [1000.0, -1000.0])
+    assert trimmed_mean(values, 0.1) == pytest.approx(1.0)
+    assert trimmed_mean(np.array([])) is None
+
+
+def test_request_params_are_validated_and_capped():
+    assert parse_comps_params({}) == (comps.COMPS_DEFAULT_RADIUS_M, comps.COMPS_DEFAULT_MONTHS)
+    assert parse_comps_params({"radius": "1e9", "months": "99999999"}) == (COMPS_MAX_RADIUS_M, COMPS_MAX_MONTHS)
+
+
+@pytest.mark.parametrize("params", [
+    {"radius": "nan"}, {"radius": "inf"}, {"radius": "-5"}, {"radius": "0"},
+    {"radius": "wide"}, {"months": "0"}, {"months": "1.5"},
+])
+def test_bad_request_params_raise(params):
+    with pytest.raises(ValueError):
+        parse_comps_params(params)
+
+
+def test_stats_are_robust():
+    stats = comps_stats(np.array([1e6, 2e6, 3e6]), np.array([10_000.0, 20_000.0, 90_000.0]))
+
+    assert stats["transaction_count"] == 3
+    assert stats["median_price"] == 2e6
+    assert stats["median_price_per_sqm"] == 20_000.0
+    assert comps_stats(np.array([]), np.array([])) == {"transaction_count": 0}
+
+
+@pytest.mark.django_db
+def test_comparables_come_from_every_nearby_asset():
+    subject = _asset(TEL_AVIV)
+    _deal(subject, "own", 3_000_000)
+    _deal(_asset(NEAR), "near", 2_500_000)
+    _deal(_asset(FAR), "far", 1_000_000)
+    _deal(_asset(NEAR), "old", 2_000_000, days_ago=5 * 365)
+    _deal(_asset(NEAR), "small", 900_000, area=40.0)
+
+    result = find_comparables(subject)
+
+    assert [row["deal_id"] for row in result["comparables"]] == ["own", "near"]
+    assert result["comparables"][1]["distance_m"] == pytest.approx(500, abs=10)
+    assert result["stats"]["median_price_per_sqm"] == pytest.approx(27_500)
+    assert result["query"]["by"] == "radius"
+    assert result["query"]["distance_from"] == "collecting_asset"
+
+    wide = find_comparables(subject, radius_m=5000, months=120, area_tolerance=None)
+    assert wide["stats"]["transaction_count"] == 5
+
+
+@pytest.mark.django_db
+def test_assets_without_coordinates_use_their_block():
+    subject = _asset(block="6638")
+    _deal(_asset(NEAR, block="6638"), "same-block", 2_000_000)
+    _deal(_asset(NEAR, block="7000"), "other-block", 2_000_000)
+
+    result = find_comparables(subject)
+
+    assert [row["deal_id"] for row in result["comparables"]] == ["same-block"]
+    assert result["comparables"][0]["distance_m"] is None
+
+
+@pytest.mark.django_db
+def test_deals_are_located_by_their_own_block():
+    collector = _asset(NEAR, block="6638")
+    _deal(collector, "same-block", 2_000_000, raw={"parcel_block": "6638"})
+    _deal(collector, "elsewhere", 2_000_000, raw={"parcel_block": "7000"})
+
+    by_radius = find_comparables(_asset(TEL_AVIV, block="6638"))
+    by_block = find_comparables(_asset(block="7000"))
+
+    assert [row["deal_id"] for row in by_radius["comparables"]] == ["same-block"]
+    assert [row["deal_id"] for row in by_block["comparables"]] == ["elsewhere"]
+
+
+@pytest.mark.django_db
+def test_asset_without_matches_lists_its_own_transactions():
+    subject = _asset(block=None)
+    _deal(subject, "recent", 2_000_000)
+    _deal(subject, "old", 1_000_000, days_ago=10 * 365)
+    _deal(subject, "small", 900_000, area=40.0, days_ago=60)
+
+    result = find_comparables(subject)
+
+    assert [row["deal_id"] for row in result["comparables"]] == ["recent", "small", "old"]
+    assert result["stats"]["transaction_count"] == 3
+    assert result["query"]["by"] == "own_transactions"
+
+
+@pytest.mark.django_db
+def test_stale_index_is_rebuilt_in_the_background():
+    stale = CompsIndex([])
+    stale.built_at -= comps.COMPS_INDEX_TTL + 1
+
+    with patch.object(comps, "_index", stale), patch.object(comps.threading, "Thread") as thread:
+        assert comps.get_comps_index() is stale
+        assert comps.get_comps_index() is stale
+        thread.assert_called_once()
+        thread.return_value.start.assert_called_once_with()
+
+        thread.call_args.kwargs["target"]()
+        assert comps.get_comps_index() is not stale
+    assert not comps._index_lock.locked()
+
+
+@pytest.mark.django_db
+def test_repeated_deals_are_counted_once():
+    first, second = _asset(TEL_AVIV), _asset(NEAR)
+    _deal(first, "shared", 2_000_000)
+    _deal(second, "shared", 2_000_000)
+
+    assert len(CompsIndex.from_db()) == 1
+
+
+@pytest.mark.django_db
+def test_results_are_cached_until_the_asset_changes(django_assert_num_queries):
+    subject = _asset(TEL_AVIV)
+    _deal(subject, "own", 3_000_000)
+    find_comparables(subject)
+
+    with django_assert_num_queries(0):
+        assert find_comparables(subject)["stats"]["transaction_count"] == 1
+
+    subject.area = 50.0
+    subject.save()
+    assert find_comparables(subject)["query"]["max_area"] == pytest.approx(65.0)
@@ -1,11 +1,24 @@
 import pytest
 from django.test import Client
+from rest_framework_simplejwt.tokens import RefreshToken
 
 from core.models import Report
 
 
+@pytest.fixture
+def owner(django_user_model):
+    return django_user_model.objects.create_user(username="owner", email="owner@example.com", password="x")
+
+
+@pytest.fixture
+def client(owner):
+    client = Client()
+    client.force_login(owner)
+    return client
+
+
 @pytest.mark.django_db
-def test_report_file_endpoint_serves_pdf(tmp_path):
+def test_report_file_endpoint_serves_pdf(tmp_path, owner, client):
     reports_dir = tmp_path / "reports"
     reports_dir.mkdir()
     filename = "dummy.pdf"
@@ -13,13 +26,13 @@ def test_report_file_endpoint_serves_pdf(tmp_path):
     file_path.write_bytes(b"%PDF-1.4 test")
 
     report = Report.objects.create(
+        user=owner,
         filename=filename,
         file_path=str(file_path),
         report_type="asset",
         status="completed",
     )
 
-    client = Client()
     resp = client.get(f"/api/reports/file/{filename}")
     assert resp.status_code == 200
     assert resp["Content-Type"] == "application/pdf"
@@ -27,3 +40,69 @@ def test_report_file_endpoint_serves_pdf(tmp_path):
     assert body.startswith(b"%PDF")
     assert report.file_url == f"/api/reports/file/{filename}"
 
+
+@pytest.fixture
+def report_file(tmp_path, owner):
+    file_path = tmp_path / "r1.pdf"
+    file_path.write_bytes(b"%PDF-1.4 " + b"x" * 100)
+    Report.objects.create(
+        user=owner, filename="r1.pdf", file_path=str(file_path), report_type="asset", status="completed"
+    )
+    return file_path
+
+
+@pytest.mark.django_db
+def test_report_file_is_only_served_to_its_owner(report_file, owner, django_user_model):
+    assert Client().get("/api/reports/file/r1.pdf").status_code == 401
+
+    stranger = django_user_model.objects.create_user(username="s", email="s@example.com", password="x")
+    client = Client()
+    client.force_login(stranger)
+    assert client.get("/api/reports/file/r1.pdf").status_code == 404
+
+    token = str(RefreshToken.for_user(owner).access_token)
+    resp = Client().get("/api/reports/file/r1.pdf", HTTP_AUTHORIZATION=f"Bearer {token}")
+    assert resp.status_code == 200
+
+
+@pytest.mark.django_db
+def test_report_file_answers_conditional_requests(report_file, client):
+    first = client.get("/api/reports/file/r1.pdf")
+
+    assert client.get("/api/reports/file/r1.pdf", HTTP_IF_NONE_MATCH=first["ETag"]).status_code == 304
+    assert client.get(
+        "/api/reports/file/r1.pdf", HTTP_IF_MODIFIED_SINCE=first["Last-Modified"]
+    ).status_code == 304
+
+    report_file.write_bytes(b"%PDF-1.4 changed")
+    assert client.get("/api/reports/file/r1.pdf", HTTP_IF_NONE_MATCH=first["ETag"]).status_code == 200
+
+
+@pytest.mark.django_db
+def test_report_file_serves_byte_ranges(report_file, client):
+    resp = client.get("/api/reports/file/r1.pdf", HTTP_RANGE="bytes=0-7")
+    assert resp.status_code == 206
+    assert resp["Content-Range"] == "bytes 0-7/109"
+    assert b"".join(resp.streaming_content) == b"%PDF-1.4"
+
+    resp = client.get("/api/reports/file/r1.pdf", HTTP_RANGE="bytes=-4")
+    assert b"".join(resp.streaming_content) == b"xxxx"
+
+    resp = client.get("/api/reports/file/r1.pdf", HTTP_RANGE="bytes=500-")
+    assert (resp.status_code, resp["Content-Range"]) == (416, "bytes */109")
+
+    resp = client.get("/api/reports/file/r1.pdf", HTTP_RANGE="bytes=0-7", HTTP_IF_RANGE='"stale"')
+    assert resp.status_code == 200
+
+
+@pytest.mark.django_db
+def test_report_file_can_be_handed_to_the_web_server(report_file, client, settings):
+    settings.REPORTS_SENDFILE = "x-accel-redirect"
+    settings.REPORTS_ACCEL_PREFIX = "/protected-reports/"
+
+    resp = client.get("/api/reports/file/r1.pdf")
+
+    assert resp.status_code == 200
+    assert resp["X-Accel-Redirect"] == "/protected-reports/r1.pdf"
+    assert resp.content == b""
+    assert resp["ETag"]
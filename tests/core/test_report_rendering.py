@@ -0,0 +1,217 @@
+import importlib
+import os
+from datetime import timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from django.apps import apps
+from django.contrib.auth.models import AnonymousUser
+from reportlab.pdfgen import canvas
+
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core import pdf_generator, tasks, views
+from core.models import AnalyticsEvent, Asset, OnboardingProgress, PlanningMetrics, Report
+from core.report_service import ReportService
+
+BASE_DIR = Path(__file__).resolve().parents[2] / "backend-django"
+backfill = importlib.import_module("core.migrations.0038_backfill_report_owners")
+
+
+def _write_pdf(path, pages=2):
+    c = canvas.Canvas(path)
+    for _ in range(pages):
+        c.showPage()
+    c.save()
+
+
+def _fake_render(asset, report, file_path, sections, use_template=True):
+    _write_pdf(file_path)
+    report.mark_completed(file_size=os.path.getsize(file_path), pages=2, generation_time=1.0)
+    return True
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    monkeypatch.setenv("REPORTS_DIR", str(tmp_path))
+    service = ReportService(BASE_DIR)
+    with patch("core.report_service.get_report_service", return_value=service):
+        yield service
+
+
+@pytest.fixture
+def asset():
+    return Asset.objects.create(scope_type="address", city="Tel Aviv", street="Herzl", number=1)
+
+
+@pytest.mark.django_db
+def test_render_key_follows_listing_version_and_sections(service, asset):
+    key = service.render_key(asset, ["summary"])
+
+    assert key.startswith(f"a{asset.id}-v{asset.listing_version}-")
+    assert service.render_key(asset, ["summary", "plans"]) != key
+    asset.mark_listing_stale()
+    asset.refresh_from_db()
+    assert service.render_key(asset, ["summary"]) != key
+
+
+@pytest.mark.django_db
+def test_render_key_follows_planning_metrics(service, asset):
+    before = service.render_key(asset, ["summary"])
+    metrics = PlanningMetrics.objects.create(asset=asset, coverage_pct=40.0)
+    asset = Asset.objects.select_related("planning_metrics").get(id=asset.id)
+    created = service.render_key(asset, ["summary"])
+
+    metrics.coverage_pct = 55.0
+    metrics.save()
+    asset = Asset.objects.select_related("planning_metrics").get(id=asset.id)
+
+    assert len({before, created, service.render_key(asset, ["summary"])}) == 3
+
+
+@pytest.mark.django_db
+def test_bulk_request_creates_every_report_before_failing_any(service, asset, settings, django_user_model):
+    settings.REPORTS_ASYNC = True
+    user = django_user_model.objects.create_user(username="u", email="u@example.com", password="x")
+    other = Asset.objects.create(scope_type="address", city="Haifa", street="Herzl", number=2)
+    create = service.create_report
+
+    def create_or_fail(asset_id, sections, user=None):
+        return None if asset_id == -1 else create(asset_id, sections, user=user)
+
+    request = APIRequestFactory().post(
+        "/api/reports/", {"assetIds": [asset.id, -1, other.id]}, format="json"
+    )
+    force_authenticate(request, user=user)
+    with patch.object(views, "report_service", service), \
+         patch.object(service, "create_report", side_effect=create_or_fail), \
+         patch.object(views, "dispatch_report_renders") as dispatch:
+        response = views.reports(request)
+
+    assert response.status_code == 202
+    assert [row["assetId"] for row in response.data["reports"]] == [asset.id, other.id]
+    assert response.data["errors"] == [{"assetId": -1, "error": "Failed to create report"}]
+    dispatch.assert_called_once_with([row["id"] for row in response.data["reports"]])
+
+
+@pytest.mark.django_db
+def test_identical_report_is_copied_from_cache(service, asset):
+    with patch.object(service.pdf_generator, "generate_report", side_effect=_fake_render) as render:
+        first = service.create_report(asset.id, ["summary"])
+        assert service.generate_pdf(first)
+        second = service.create_report(asset.id, ["summary"])
+        assert service.generate_pdf(second)
+
+    assert render.call_count == 1
+    second.refresh_from_db()
+    assert (second.status, second.pages, second.meta["cached"]) == ("completed", 2, True)
+    assert os.path.getsize(second.file_path) == os.path.getsize(first.file_path)
+
+
+@pytest.mark.django_db
+def test_renders_of_older_listing_versions_are_dropped(service, asset):
+    with patch.object(service.pdf_generator, "generate_report", side_effect=_fake_render):
+        service.generate_pdf(service.create_report(asset.id, ["summary"]))
+        asset.mark_listing_stale()
+        service.generate_pdf(service.create_report(asset.id, ["summary"]))
+
+    asset.refresh_from_db()
+    cached = os.listdir(service.cache_dir)
+    assert len(cached) == 1
+    assert cached[0].startswith(f"a{asset.id}-v{asset.listing_version}-")
+
+
+@pytest.mark.django_db
+def test_task_renders_and_credits_onboarding(service, asset, django_user_model):
+    user = django_user_model.objects.create_user(username="u", email="u@example.com", password="x")
+    report = service.create_report(asset.id, ["summary"], user=user)
+
+    with patch.object(service.pdf_generator, "generate_report", side_effect=_fake_render):
+        assert tasks.generate_report_pdf(report.id)
+
+    assert Report.objects.get(id=report.id).status == "completed"
+    assert OnboardingProgress.objects.get(user=user).generate_first_report
+
+
+def test_dispatch_prefers_celery_then_thread_pool(settings):
+    settings.REPORTS_ASYNC = True
+    settings.CELERY_BROKER_URL = "redis://broker"
+    with patch.object(tasks.generate_report_pdf, "delay") as delay:
+        tasks.dispatch_report_renders([1, 2])
+    assert [c.args for c in delay.call_args_list] == [(1,), (2,)]
+
+    settings.CELERY_BROKER_URL = None
+    with patch.object(tasks, "_get_render_pool") as pool:
+        tasks.dispatch_report_renders([3])
+    pool.return_value.submit.assert_called_once_with(tasks._render_in_pool, 3)
+
+
+@pytest.mark.django_db
+def test_report_list_is_paginated_and_scoped_to_the_user(service, asset, django_user_model):
+    user = django_user_model.objects.create_user(username="u", email="u@example.com", password="x")
+    other = django_user_model.objects.create_user(username="o", email="o@example.com", password="x")
+    mine = [service.create_report(asset.id, ["summary"], user=user).id for _ in range(5)]
+    theirs = service.create_report(asset.id, ["summary"], user=other)
+    service.create_report(asset.id, ["summary"])
+
+    seen, cursor = [], None
+    while True:
+        page = service.get_reports_list(user, {"limit": 2, "cursor": cursor})
+        seen += [row["id"] for row in page["reports"]]
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+
+    assert seen == mine[::-1]
+    assert service.get_reports_list(AnonymousUser()) == {"reports": [], "next_cursor": None}
+    assert service.get_report_by_id(theirs.id, user) is None
+    assert service.get_report_by_filename(theirs.filename, other) == theirs
+    assert not service.delete_report(theirs.id, user)
+    with pytest.raises(ValueError):
+        service.get_reports_list(user, {"cursor": "garbage"})
+
+
+@pytest.mark.django_db
+def test_legacy_reports_are_given_the_user_who_requested_them(service, asset, django_user_model):
+    user = django_user_model.objects.create_user(username="u", email="u@example.com", password="x")
+    requested = service.create_report(asset.id, ["summary"])
+    unmatched = service.create_report(asset.id, ["summary"])
+    AnalyticsEvent.objects.create(
+        event="report_request", user=user, asset_id=asset.id,
+        created_at=requested.generated_at - timedelta(seconds=1),
+    )
+    Report.objects.filter(id=unmatched.id).update(generated_at=requested.generated_at + timedelta(hours=1))
+
+    backfill.backfill_report_owners(apps, None)
+
+    assert Report.objects.get(id=requested.id).user == user
+    assert Report.objects.get(id=unmatched.id).user is None
+
+
+@pytest.mark.django_db
+def test_legacy_reports_requested_by_several_users_stay_ownerless(service, asset, django_user_model, capsys):
+    first = django_user_model.objects.create_user(username="a", email="a@example.com", password="x")
+    second = django_user_model.objects.create_user(username="b", email="b@example.com", password="x")
+    report = service.create_report(asset.id, ["summary"])
+    for user, seconds in ((first, 20), (second, 5)):
+        AnalyticsEvent.objects.create(
+            event="report_request", user=user, asset_id=asset.id,
+            created_at=report.generated_at - timedelta(seconds=seconds),
+        )
+
+    backfill.backfill_report_owners(apps, None)
+
+    assert Report.objects.get(id=report.id).user is None
+    assert "1 legacy reports ownerless" in capsys.readouterr().out
+
+
+def test_hebrew_font_is_registered_once_per_process():
+    pdf_generator.register_hebrew_font.cache_clear()
+    with patch.object(pdf_generator.pdfmetrics, "registerFont") as register:
+        first = pdf_generator.HebrewPDFGenerator(BASE_DIR)
+        second = pdf_generator.HebrewPDFGenerator(BASE_DIR)
+
+    assert register.call_count == 1
+    assert first.report_font == second.report_font == "HebrewFont"
+    pdf_generator.register_hebrew_font.cache_clear()
@@ -3,8 +3,10 @@ import json
 import shutil
 import tempfile
 
+from django.contrib.auth import get_user_model
 from django.test import TestCase, RequestFactory
 from PyPDF2 import PdfReader
+from rest_framework.test import force_authenticate
 
 from core import views
 from core.models import Report, Asset
@@ -13,6 +15,9 @@ from core.constants import DEFAULT_REPORT_SECTIONS, SECTION_TITLES_HE
 class HebrewPDFGenerationTest(TestCase):
     def setUp(self):
         self.factory = RequestFactory()
+        self.user = get_user_model().objects.create_user(
+            username="reports", email="reports@example.com", password="x"
+        )
         self.tmpdir = tempfile.mkdtemp(prefix="reports_test_")
         views.report_service.reports_dir = self.tmpdir
 
@@ -76,6 +81,7 @@ class HebrewPDFGenerationTest(TestCase):
             data=json.dumps({"assetId": self.asset.id}),
             content_type="application/json",
         )
+        force_authenticate(req, user=self.user)
         resp = views.reports(req)
         self.assertEqual(resp.status_code, 201, resp.data)
         filename = resp.data["report"]["filename"]
@@ -100,6 +106,7 @@ class HebrewPDFGenerationTest(TestCase):
             data=json.dumps({"assetId": self.asset.id, "sections": ["summary", "plans"]}),
             content_type="application/json",
         )
+        force_authenticate(req, user=self.user)
         resp = views.reports(req)
         self.assertEqual(resp.status_code, 201, resp.data)
         filename = resp.data["report"]["filename"]
@@ -119,6 +126,7 @@ class HebrewPDFGenerationTest(TestCase):
             data=json.dumps({"assetId": self.asset.id, "sections": []}),
             content_type="application/json",
         )
+        force_authenticate(req, user=self.user)
         resp = views.reports(req)
         self.assertEqual(resp.status_code, 400)
 
@@ -129,6 +137,7 @@ class HebrewPDFGenerationTest(TestCase):
             data=json.dumps({"assetId": 999}),
             content_type="application/json",
         )
+        force_authenticate(req, user=self.user)
         resp = views.reports(req)
         self.assertEqual(resp.status_code, 201, resp.data)
 
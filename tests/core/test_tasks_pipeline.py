@@ -27,3 +27,10 @@ def test_run_data_pipeline_task(monkeypatch):
 
     assert result == [42]
     assert dummy.calls == [('Main', 5, 1, 1)]
+
+
+def test_ingest_decisive_block_task():
+    with patch('gov.decisive_index.ingest_block', return_value=3) as ingest_block:
+        assert tasks.ingest_decisive_block.run('6638') == 3
+
+    ingest_block.assert_called_once_with('6638')
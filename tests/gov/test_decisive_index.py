@@ -0,0 +1,163 @@
+"""Tests for the decisive appraisal PDF ingestion pipeline and index."""
+
+import io
+from unittest import mock
+
+import pytest
+import responses
+
+from gov.decisive import DecisiveAppraisal
+from gov.decisive_index import (
+    DecisiveIndex,
+    DecisiveIngestor,
+    ingest_block,
+    parse_decision_fields,
+)
+from orchestration.collectors.gov_collector import GovCollector
+
+DECISION_TEXT = """
+שמאי מכריע - הכרעה
+שווי המקרקעין במצב החדש: 2,450,000 ש"ח
+שווי למ"ר 18,500 ₪ למ"ר
+היטל השבחה לתשלום 612,500
+מקדם דחייה: 0.92
+מקדם גודל = 0.95
+"""
+
+
+def _appraisal(urls, block="6638", plot="96", date="15.03.2024"):
+    return DecisiveAppraisal(
+        title="הכרעה",
+        date=date,
+        appraiser="שמאי",
+        committee="תל אביב",
+        pdf_url="; ".join(urls),
+        block=block,
+        plot=plot,
+    )
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = DecisiveIndex(path=str(tmp_path / "decisive.sqlite3"))
+    yield index
+    index.close()
+
+
+class TestParseDecisionFields:
+    def test_parses_values_and_coefficients(self):
+        fields = parse_decision_fields(DECISION_TEXT)
+
+        assert fields["appraised_value"] == 2450000
+        assert fields["value_per_sqm"] == 18500
+        assert fields["levy_amount"] == 612500
+        assert fields["coefficients"] == {"דחייה": 0.92, "גודל": 0.95}
+
+    def test_missing_fields_are_none(self):
+        fields = parse_decision_fields("no numbers here")
+
+        assert fields["appraised_value"] is None
+        assert fields["coefficients"] == {}
+
+
+class TestDecisiveIngestor:
+    @responses.activate
+    def test_ingest_deduplicates_by_hash(self, index):
+        for name in ("a", "b"):
+            responses.add(responses.GET, f"https://example.com/{name}.pdf", body=b"%PDF same bytes")
+        responses.add(responses.GET, "https://example.com/c.pdf", body=b"%PDF other bytes")
+        appraisals = [
+            _appraisal(["https://example.com/a.pdf", "https://example.com/b.pdf"]),
+            _appraisal(["https://example.com/c.pdf"], plot="97", date="01.02.2023"),
+        ]
+
+        with mock.patch("gov.decisive_index.extract_text", return_value=DECISION_TEXT) as extract:
+            assert DecisiveIngestor(index, max_workers=3).ingest(appraisals) == 3
+
+        assert extract.call_count == 2
+        rows = index.query(block="6638")
+        assert [r["decision_date"] for r in rows] == ["2024-03-15", "2024-03-15", "2023-02-01"]
+        assert rows[0]["appraised_value"] == 2450000
+        assert rows[0]["coefficients"]["גודל"] == 0.95
+        assert rows[0]["sha256"] == rows[1]["sha256"]
+
+    @responses.activate
+    def test_ingest_skips_indexed_urls_and_failures(self, index):
+        responses.add(responses.GET, "https://example.com/a.pdf", body=b"%PDF a")
+        responses.add(responses.GET, "https://example.com/missing.pdf", status=404)
+        appraisal = _appraisal(["https://example.com/a.pdf", "https://example.com/missing.pdf"])
+        ingestor = DecisiveIngestor(index)
+
+        with mock.patch("gov.decisive_index.extract_text", return_value=DECISION_TEXT):
+            assert ingestor.ingest([appraisal]) == 1
+            assert ingestor.ingest([appraisal]) == 0
+
+        assert len(responses.calls) == 3
+        assert index.has_url("https://example.com/a.pdf")
+        assert not index.has_url("https://example.com/missing.pdf")
+
+    @responses.activate
+    def test_ingest_extracts_real_pdf_text(self, index):
+        canvas = pytest.importorskip("reportlab.pdfgen.canvas")
+        buffer = io.BytesIO()
+        pdf = canvas.Canvas(buffer)
+        pdf.drawString(72, 720, "Decision 6638/96 " + "x" * 80)
+        pdf.save()
+        responses.add(responses.GET, "https://example.com/a.pdf", body=buffer.getvalue())
+
+        assert DecisiveIngestor(index).ingest([_appraisal(["https://example.com/a.pdf"])]) == 1
+        assert index.search_text("6638/96") == ["https://example.com/a.pdf"]
+
+
+class TestGovCollectorIngestion:
+    def _collector(self, appraisal):
+        decisive_client = mock.Mock(**{"fetch_appraisals.return_value": [appraisal]})
+        return GovCollector(deals_client=mock.Mock(), decisive_client=decisive_client, deals_store=mock.Mock())
+
+    def test_ingestion_is_off_by_default(self, monkeypatch):
+        monkeypatch.delenv("DECISIVE_INDEX_INGEST", raising=False)
+        appraisal = _appraisal(["https://example.com/a.pdf"])
+
+        with mock.patch("core.tasks.ingest_decisive_block") as task:
+            assert self._collector(appraisal)._collect_decisive("6638", "96") == [appraisal.to_dict()]
+        task.delay.assert_not_called()
+
+    def test_collected_blocks_are_queued_for_ingestion(self, monkeypatch):
+        monkeypatch.setenv("DECISIVE_INDEX_INGEST", "true")
+        appraisal = _appraisal(["https://example.com/a.pdf"])
+
+        with mock.patch("core.tasks.ingest_decisive_block") as task:
+            assert self._collector(appraisal)._collect_decisive("6638", "96") == [appraisal.to_dict()]
+        task.delay.assert_called_once_with("6638")
+
+    def test_queue_failure_does_not_lose_decisions(self, monkeypatch):
+        monkeypatch.setenv("DECISIVE_INDEX_INGEST", "true")
+        appraisal = _appraisal(["https://example.com/a.pdf"])
+
+        with mock.patch("core.tasks.ingest_decisive_block") as task:
+            task.delay.side_effect = ConnectionError("broker down")
+            assert self._collector(appraisal)._collect_decisive("6638", "96") == [appraisal.to_dict()]
+
+
+def test_ingest_block_indexes_every_decision_of_the_block():
+    appraisals = [_appraisal(["https://example.com/a.pdf"]), _appraisal(["https://example.com/b.pdf"], plot="12")]
+    client = mock.Mock(**{"fetch_appraisals.return_value": appraisals})
+    ingestor = mock.Mock(**{"ingest.return_value": 2})
+
+    assert ingest_block("6638", client=client, ingestor=ingestor) == 2
+    client.fetch_appraisals.assert_called_once_with(block="6638", max_pages=None)
+    ingestor.ingest.assert_called_once_with(appraisals)
+
+
+class TestDecisiveIndexQueries:
+    def test_query_filters_by_parcel_and_date(self, index):
+        fields = parse_decision_fields(DECISION_TEXT)
+        index.add_document("h1", DECISION_TEXT, fields)
+        index.add_decision(_appraisal([], plot="96", date="01.01.2020"), "u1", "h1", fields)
+        index.add_decision(_appraisal([], plot="96", date="01.01.2024"), "u2", "h1", fields)
+        index.add_decision(_appraisal([], plot="12", date="01.01.2024"), "u3", "h1", fields)
+
+        assert [r["pdf_url"] for r in index.query(block="6638", plot="96", since="2021-01-01")] == ["u2"]
+        assert len(index.query(block="6638", limit=2)) == 2
+        assert set(index.search_text("היטל השבחה")) == {"u1", "u2", "u3"}
+        assert index.search_text("לא קיים") == []
@@ -6,6 +6,7 @@ from typing import Dict, List
 
 import pytest
 import requests
+import responses
 
 from gov.decisive import (
     DecisiveAppraisal, 
@@ -248,7 +249,7 @@ class TestDecisiveAppraisalClient:
         assert client.parser is custom_parser
         assert client.timeout == 30
     
-    @mock.patch('requests.post')
+    @mock.patch('requests.Session.post')
     def test_fetch_appraisals_success(self, mock_post):
         """Test successful fetch of appraisals."""
         # Mock response
@@ -294,7 +295,7 @@ class TestDecisiveAppraisalClient:
         assert call_args.kwargs["json"]["Plot"] == "456"
         assert call_args.kwargs["json"]["skip"] == 0
     
-    @mock.patch('requests.post')
+    @mock.patch('requests.Session.post')
     def test_fetch_appraisals_http_error(self, mock_post):
         """Test handling of HTTP errors."""
         mock_post.side_effect = requests.exceptions.RequestException("Connection error")
@@ -304,7 +305,7 @@ class TestDecisiveAppraisalClient:
         
         assert result == []
     
-    @mock.patch('requests.post')
+    @mock.patch('requests.Session.post')
     def test_fetch_appraisals_json_error(self, mock_post):
         """Test handling of JSON parsing errors."""
         mock_response = mock.Mock()
@@ -317,3 +318,79 @@ class TestDecisiveAppraisalClient:
         
         assert result == []
 
+
+def _decisions_page(skip: int, total: int) -> Dict:
+    return {
+        "Results": [
+            {"Data": {"AppraisalHeader": f"Decision {i}", "Block": "6638", "Plot": "96"}}
+            for i in range(skip, min(skip + 10, total))
+        ],
+        "TotalResults": total,
+    }
+
+
+class TestDecisiveAppraisalClientPaging:
+    """Test concurrent paging and retries against a mocked API."""
+
+    @pytest.fixture
+    def api(self):
+        with responses.RequestsMock() as rsps:
+            yield rsps
+
+    def _serve(self, api, total, skips_seen, fail_skip=None):
+        def callback(request):
+            skip = json.loads(request.body)["skip"]
+            skips_seen.append(skip)
+            if skip == fail_skip:
+                return 500, {}, "boom"
+            return 200, {}, json.dumps(_decisions_page(skip, total))
+
+        api.add_callback("POST", DecisiveAppraisalClient().api_endpoint, callback=callback)
+
+    def test_fetches_all_pages_in_order(self, api):
+        skips = []
+        self._serve(api, total=45, skips_seen=skips)
+
+        result = DecisiveAppraisalClient(max_workers=3).fetch_appraisals(block="6638", max_pages=None)
+
+        assert [a.title for a in result] == [f"Decision {i}" for i in range(45)]
+        assert skips[0] == 0
+        assert sorted(skips) == [0, 10, 20, 30, 40]
+
+    def test_max_pages_limits_requests(self, api):
+        skips = []
+        self._serve(api, total=45, skips_seen=skips)
+
+        result = DecisiveAppraisalClient().fetch_appraisals(block="6638", max_pages=2)
+
+        assert len(result) == 20
+        assert sorted(skips) == [0, 10]
+
+    def test_failed_page_truncates_results(self, api):
+        skips = []
+        self._serve(api, total=45, skips_seen=skips, fail_skip=20)
+
+        with mock.patch("gov.decisive.time.sleep"):
+            result = DecisiveAppraisalClient(max_retries=0).fetch_appraisals(block="6638", max_pages=None)
+
+        assert len(result) == 20
+
+    def test_retries_honor_retry_after(self, api):
+        endpoint = DecisiveAppraisalClient().api_endpoint
+        api.add("POST", endpoint, status=429, headers={"Retry-After": "2"})
+        api.add("POST", endpoint, json=_decisions_page(0, 3))
+
+        with mock.patch("gov.decisive.time.sleep") as sleep:
+            result = DecisiveAppraisalClient().fetch_appraisals(block="6638")
+
+        sleep.assert_called_once_with(2.0)
+        assert len(result) == 3
+
+    def test_session_is_reused(self):
+        client = DecisiveAppraisalClient()
+        with mock.patch.object(client.session, "post") as post:
+            post.return_value.status_code = 200
+            post.return_value.json.return_value = _decisions_page(0, 25)
+            client.fetch_appraisals(block="6638", max_pages=3)
+
+        assert post.call_count == 3
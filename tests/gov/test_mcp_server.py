@@ -0,0 +1,153 @@
+"""Tests for the gov.il MCP server: shared clients, caching and concurrency limits."""
+
+import asyncio
+import threading
+import time
+import weakref
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from fastmcp import Context
+
+from gov.mcp import server
+
+
+@pytest.fixture(autouse=True)
+def fresh_server_state():
+    """Start every test without shared clients, cached results or limiters."""
+    with patch.object(server, "_clients", {}), \
+         patch.object(server, "_upstream_limits", weakref.WeakKeyDictionary()), \
+         patch.object(server, "_tool_cache", server.ToolCache(ttl=60)):
+        yield
+
+
+@pytest.fixture
+def ctx():
+    context = Mock(spec=Context)
+    context.info = AsyncMock()
+    context.warning = AsyncMock()
+    return context
+
+
+def test_shared_clients_are_created_once():
+    assert server._get_rami_client() is server._get_rami_client()
+    assert server._get_decisive_client() is server._get_decisive_client()
+
+
+def test_decisive_appraisal_runs_off_the_event_loop_and_is_cached(ctx):
+    calls = []
+
+    def fetch_appraisals(block, plot, max_pages=1):
+        calls.append(threading.current_thread())
+        return [{"block": block, "plot": plot}]
+
+    server._clients["decisive"] = Mock(fetch_appraisals=fetch_appraisals)
+
+    async def scenario():
+        first = await server.decisive_appraisal.fn(ctx, block="6638", plot="96")
+        second = await server.decisive_appraisal.fn(ctx, block="6638", plot="96")
+        other = await server.decisive_appraisal.fn(ctx, block="6638", plot="97")
+        return first, second, other, threading.current_thread()
+
+    first, second, other, loop_thread = asyncio.run(scenario())
+
+    assert first == second == [{"block": "6638", "plot": "96"}]
+    assert other == [{"block": "6638", "plot": "97"}]
+    assert len(calls) == 2
+    assert loop_thread not in calls
+
+
+def test_upstream_concurrency_is_limited(ctx):
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def fetch_appraisals(block, plot, max_pages=1):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        return []
+
+    server._clients["decisive"] = Mock(fetch_appraisals=fetch_appraisals)
+
+    async def scenario():
+        await asyncio.gather(*(
+            server.decisive_appraisal.fn(ctx, block=str(block)) for block in range(6)
+        ))
+
+    with patch.dict(server.UPSTREAM_CONCURRENCY, {"decisive": 2}):
+        asyncio.run(scenario())
+
+    assert peak == 2
+
+
+def test_upstream_limits_survive_a_new_event_loop(ctx):
+    def fetch_appraisals(block, plot, max_pages=1):
+        time.sleep(0.01)
+        return []
+
+    server._clients["decisive"] = Mock(fetch_appraisals=fetch_appraisals)
+
+    async def scenario(offset):
+        await asyncio.gather(*(
+            server.decisive_appraisal.fn(ctx, block=str(offset + block)) for block in range(4)
+        ))
+
+    # Both runs wait on the limiter; a semaphore shared across loops would fail the second
+    with patch.dict(server.UPSTREAM_CONCURRENCY, {"decisive": 1}):
+        asyncio.run(scenario(0))
+        asyncio.run(scenario(10))
+
+
+def test_nadlan_refresh_bypasses_cache(ctx):
+    deal = Mock(to_dict=Mock(return_value={"price": 1}))
+    store = Mock(sync=Mock(return_value=[deal]))
+    scraper = Mock()
+    server._clients["nadlan"] = scraper
+
+    async def scenario():
+        await server.fetch_nadlan_transactions.fn(ctx, neighborhood_id="65210036")
+        await server.fetch_nadlan_transactions.fn(ctx, neighborhood_id="65210036")
+        return await server.fetch_nadlan_transactions.fn(ctx, neighborhood_id="65210036", refresh=True)
+
+    with patch.object(server, "get_deals_store", return_value=store):
+        result = asyncio.run(scenario())
+
+    assert result["deals"] == [{"price": 1}]
+    assert store.sync.call_count == 2
+    store.sync.assert_called_with("65210036", scraper, 20, True)
+
+
+def test_download_rami_plan_documents_passes_the_plan_record(ctx):
+    plan = {"planId": 1234, "planNumber": "תא/5000", "documentsSet": {}}
+    client = Mock()
+    client.fetch_plans_records.return_value = [{"planId": 999}, plan]
+    client.download_plan_documents.return_value = {"success": ["a.pdf"], "failed": []}
+    server._clients["rami"] = client
+
+    result = asyncio.run(server.download_rami_plan_documents.fn(
+        ctx, plan_id=1234, plan_number="תא/5000", base_dir="out", doc_types=["takanon"]
+    ))
+
+    client.fetch_plans_records.assert_called_once_with({"planNumber": "תא/5000"})
+    client.download_plan_documents.assert_called_once_with(
+        plan, base_dir="out", doc_types=["takanon"], overwrite=False
+    )
+    assert result["success"] is True
+    assert result["downloaded"] == ["a.pdf"]
+
+
+def test_download_rami_plan_documents_unknown_plan(ctx):
+    client = Mock()
+    client.fetch_plans_records.return_value = []
+    server._clients["rami"] = client
+
+    result = asyncio.run(server.download_rami_plan_documents.fn(ctx, plan_id=1, plan_number="x"))
+
+    assert result["success"] is False
+    assert "not found" in result["error"]
+    client.download_plan_documents.assert_not_called()
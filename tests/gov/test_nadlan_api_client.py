@@ -0,0 +1,236 @@
+"""
+Tests for the direct-HTTP Nadlan deals client against a local stub server.
+"""
+
+import base64
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from gov.nadlan import NadlanAuthError, NadlanDealsScraper
+from gov.nadlan.api_client import (
+    ApiBootstrap,
+    BootstrapCache,
+    NadlanApiClient,
+    decode_payload,
+)
+from gov.nadlan.browser_pool import NadlanBrowserPool
+
+
+def _gzip_b64(obj):
+    return base64.b64encode(gzip.compress(json.dumps(obj).encode("utf-8"))).decode("ascii")
+
+
+class StubDealsServer:
+    """Emulates the nadlan.gov.il deals endpoint in both payload encodings."""
+
+    def __init__(self, total=7, page_size=3, encoding="json", advertise_total=True):
+        self.total = total
+        self.page_size = page_size
+        self.encoding = encoding
+        self.advertise_total = advertise_total
+        self.valid_token = "good-token"
+        self.requests = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                stub.requests.append(body)
+                if self.headers.get("x-token") != stub.valid_token:
+                    self.send_response(401)
+                    self.end_headers()
+                    return
+                self._reply(stub.render(body))
+
+            def _reply(self, payload):
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server.server_port}/api/deal"
+
+    def render(self, body):
+        page = int(body.get("fetch_number", 1))
+        start = (page - 1) * self.page_size
+        items = [
+            {
+                "address": f"{body['base_id']} street {i}",
+                "dealDate": "2024-01-01",
+                "dealAmount": 1000000 + i,
+                "parcelNum": f"6638-{i}-0",
+            }
+            for i in range(start, min(start + self.page_size, self.total))
+        ]
+        data = {"items": items}
+        if self.advertise_total:
+            data["total_rows"] = self.total
+        obj = {"statusCode": 200, "data": data}
+        if self.encoding == "gzip":
+            return json.dumps(_gzip_b64(obj)).encode("utf-8")
+        if self.encoding == "envelope":
+            return json.dumps({"body": _gzip_b64(obj)}).encode("utf-8")
+        return json.dumps(obj).encode("utf-8")
+
+    def bootstrap(self, token="good-token"):
+        return ApiBootstrap.from_request(
+            url=self.url,
+            method="post",
+            headers={"content-type": "application/json", "x-token": token, ":authority": "x", "host": "x"},
+            post_data=json.dumps({"base_name": "neigh_id", "base_id": "65210036", "fetch_number": 1}),
+            base_id="65210036",
+        )
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class TestPayloadDecoding:
+    @pytest.mark.parametrize("encoding", ["json", "gzip", "envelope"])
+    def test_decode_payload_encodings(self, encoding):
+        stub = StubDealsServer(encoding=encoding)
+        data = decode_payload(stub.render({"base_id": "1", "fetch_number": 1}))
+        assert len(data["data"]["items"]) == 3
+
+
+class TestApiBootstrap:
+    def test_from_request_parameterizes_body(self):
+        stub = StubDealsServer()
+        bootstrap = stub.bootstrap()
+
+        assert bootstrap.method == "POST"
+        assert bootstrap.id_key == "base_id"
+        assert bootstrap.page_key == "fetch_number"
+        assert "host" not in bootstrap.headers and ":authority" not in bootstrap.headers
+        assert bootstrap.build_body("123", 4) == {"base_name": "neigh_id", "base_id": "123", "fetch_number": 4}
+
+    def test_from_request_rejects_non_json_body(self):
+        with pytest.raises(Exception, match="not JSON"):
+            ApiBootstrap.from_request("http://x/api/deal", "POST", {}, "opaque", base_id="1")
+
+    def test_cache_expires(self):
+        cache = BootstrapCache(ttl=0)
+        cache.set(StubDealsServer().bootstrap())
+        assert cache.get() is None
+
+
+class TestNadlanApiClient:
+    @pytest.mark.parametrize("encoding", ["json", "gzip"])
+    def test_fetch_deals_pages_concurrently_in_order(self, encoding):
+        with StubDealsServer(total=7, page_size=3, encoding=encoding) as stub:
+            deals = NadlanApiClient(max_workers=3).fetch_deals(stub.bootstrap(), "65210036", timeout=5)
+
+        assert [d.deal_amount for d in deals] == [1000000 + i for i in range(7)]
+        assert sorted(r["fetch_number"] for r in stub.requests) == [1, 2, 3]
+        assert deals[0].parcel_block == "6638"
+
+    def test_fetch_deals_without_total_stops_on_short_page(self):
+        with StubDealsServer(total=7, page_size=3, advertise_total=False) as stub:
+            deals = NadlanApiClient().fetch_deals(stub.bootstrap(), "65210036", timeout=5)
+
+        assert len(deals) == 7
+        assert [r["fetch_number"] for r in stub.requests] == [1, 2, 3]
+
+    def test_fetch_deals_respects_max_pages(self):
+        with StubDealsServer(total=30, page_size=3) as stub:
+            deals = NadlanApiClient(max_pages=2).fetch_deals(stub.bootstrap(), "65210036", timeout=5)
+
+        assert len(deals) == 6
+
+    def test_fetch_deals_since_stops_at_older_page(self):
+        with StubDealsServer(total=9, page_size=3) as stub:
+            dates = ["2024-03-01", "2024-02-20", "2024-02-10", "2024-02-01", "2024-01-20",
+                     "2024-01-10", "2023-12-01", "2023-11-01", "2023-10-01"]
+            render = stub.render
+
+            def dated(body):
+                payload = json.loads(render(body))
+                for item in payload["data"]["items"]:
+                    item["dealDate"] = dates[item["dealAmount"] - 1000000]
+                return json.dumps(payload).encode("utf-8")
+
+            stub.render = dated
+            deals = NadlanApiClient().fetch_deals(stub.bootstrap(), "65210036", timeout=5, since="2024-02-01")
+
+        assert [d.deal_date for d in deals] == dates[:4]
+        assert [r["fetch_number"] for r in stub.requests] == [1, 2]
+
+    def test_rejected_token_raises_auth_error(self):
+        with StubDealsServer() as stub:
+            with pytest.raises(NadlanAuthError):
+                NadlanApiClient().fetch_page(stub.bootstrap(token="stale"), "65210036", timeout=5)
+
+
+class TestScraperFastPath:
+    def _scraper(self, cache):
+        return NadlanDealsScraper(
+            timeout=5,
+            pool=NadlanBrowserPool(),
+            api_client=NadlanApiClient(),
+            bootstrap_cache=cache,
+        )
+
+    def test_cached_bootstrap_skips_browser(self):
+        with StubDealsServer(total=4, page_size=2) as stub:
+            cache = BootstrapCache()
+            cache.set(stub.bootstrap())
+            scraper = self._scraper(cache)
+
+            with patch.object(NadlanDealsScraper, "_capture_deals_request") as capture:
+                deals = scraper.get_deals_by_neighborhood_id("65210036")
+
+        capture.assert_not_called()
+        assert len(deals) == 4
+        scraper.pool.close()
+
+    def test_rejected_bootstrap_is_refreshed_through_browser(self):
+        with StubDealsServer(total=4, page_size=2) as stub:
+            cache = BootstrapCache()
+            cache.set(stub.bootstrap(token="stale"))
+            scraper = self._scraper(cache)
+            fresh = stub.bootstrap()
+            first_page = ([{"address": "from browser", "dealAmount": 1}, {"address": "b", "dealAmount": 2}], 4)
+
+            async def capture(self, neigh_id):
+                return fresh, first_page
+
+            with patch.object(NadlanDealsScraper, "_capture_deals_request", capture):
+                deals = scraper.get_deals_by_neighborhood_id("65210036")
+
+        assert cache.get() is fresh
+        assert deals[0].address == "from browser"
+        assert len(deals) == 4
+        scraper.pool.close()
+
+    def test_unreplayable_request_returns_browser_page(self):
+        cache = BootstrapCache()
+        scraper = self._scraper(cache)
+
+        async def capture(self, neigh_id):
+            return None, ([{"address": "only page"}], None)
+
+        with patch.object(NadlanDealsScraper, "_capture_deals_request", capture):
+            deals = scraper.get_deals_by_neighborhood_id("65210036")
+
+        assert [d.address for d in deals] == ["only page"]
+        assert cache.get() is None
+        scraper.pool.close()
@@ -0,0 +1,171 @@
+"""
+Tests for the shared Nadlan browser pool.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+import requests
+import responses
+
+from gov.nadlan import NadlanAPIError, NadlanDealsScraper
+from gov.nadlan.browser_pool import NadlanBrowserPool, get_browser_pool
+
+
+class FakePage:
+    pass
+
+
+class FakeContext:
+    def __init__(self):
+        self.closed = False
+
+    async def new_page(self):
+        return FakePage()
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.connected = True
+        self.closed = False
+        self.contexts = []
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self, **kwargs):
+        ctx = FakeContext()
+        self.contexts.append(ctx)
+        return ctx
+
+    async def close(self):
+        self.closed = True
+        self.connected = False
+
+
+@pytest.fixture
+def pool():
+    pool = NadlanBrowserPool(max_pages=2, max_uses=3)
+    browsers = []
+
+    async def fake_launch():
+        browser = FakeBrowser()
+        browsers.append(browser)
+        pool.launches += 1
+        return browser
+
+    with patch.object(pool, "_launch", side_effect=fake_launch):
+        pool.browsers = browsers
+        yield pool
+    pool.close()
+
+
+def _use_page(pool):
+    async def go():
+        async with pool.page() as page:
+            return page
+
+    return pool.run(go(), timeout=5)
+
+
+class TestNadlanBrowserPool:
+    def test_browser_is_reused_across_calls(self, pool):
+        for _ in range(3):
+            assert isinstance(_use_page(pool), FakePage)
+
+        assert pool.launches == 1
+        assert all(ctx.closed for ctx in pool.browsers[0].contexts)
+
+    def test_browser_recycled_after_max_uses(self, pool):
+        for _ in range(4):
+            _use_page(pool)
+
+        assert pool.launches == 2
+        assert pool.browsers[0].closed is True
+        assert pool.browsers[1].closed is False
+
+    def test_browser_relaunched_after_crash(self, pool):
+        _use_page(pool)
+        pool.browsers[0].connected = False
+
+        _use_page(pool)
+
+        assert pool.launches == 2
+
+    def test_concurrent_pages_are_bounded(self, pool):
+        active = 0
+        peak = 0
+
+        async def go():
+            nonlocal active, peak
+            async with pool.page():
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        async def many():
+            await asyncio.gather(*(go() for _ in range(6)))
+
+        pool.run(many(), timeout=5)
+
+        assert peak == 2
+
+    def test_run_timeout_raises(self, pool):
+        with pytest.raises(NadlanAPIError, match="timed out"):
+            pool.run(asyncio.sleep(1), timeout=0.05)
+
+    def test_shared_pool_per_headless_mode(self):
+        assert get_browser_pool(True) is get_browser_pool(True)
+        assert get_browser_pool(True) is not get_browser_pool(False)
+        assert NadlanDealsScraper().pool is get_browser_pool(True)
+
+
+class TestAddressSearchOverHttp:
+    @responses.activate
+    def test_search_address_does_not_use_browser(self):
+        responses.add(
+            responses.GET,
+            "https://es.govmap.gov.il/TldSearch/api/AutoComplete",
+            json={
+                "res": {
+                    "NEIGHBORHOOD": [{"Key": "n1", "Value": "רמת החייל", "Rank": 1}],
+                    "STREET": [{"Key": "s1", "Value": "הברזל תל אביב-יפו", "Rank": 2}],
+                }
+            },
+        )
+        scraper = NadlanDealsScraper(pool=NadlanBrowserPool())
+
+        with patch.object(NadlanBrowserPool, "run") as mock_run:
+            results = scraper.search_address("רמת החייל")
+
+        mock_run.assert_not_called()
+        assert results[0]["neighborhood_id"] == "65210036"
+        assert results[1]["type"] == "street"
+
+    def test_search_address_leaves_the_callers_session_alone(self):
+        session = requests.Session()
+        scraper = NadlanDealsScraper(pool=NadlanBrowserPool(), session=session)
+
+        with patch.object(session, "get") as mock_get:
+            mock_get.return_value.status_code = 200
+            mock_get.return_value.json.return_value = {"res": {}}
+            scraper.search_address("רמת החייל")
+
+        assert session.verify is True
+        assert mock_get.call_args.kwargs["verify"] is False
+
+    @responses.activate
+    def test_search_address_http_error(self):
+        responses.add(
+            responses.GET,
+            "https://es.govmap.gov.il/TldSearch/api/AutoComplete",
+            status=503,
+        )
+
+        with pytest.raises(NadlanAPIError, match="status 503"):
+            NadlanDealsScraper().search_address("רמת החייל")
@@ -143,7 +143,7 @@ class TestNadlanDealsScraper:
         assert len(deals) == 1
         assert deals[0].address == "רחוב הרצל 1"
         assert deals[0].deal_amount == 1500000.0
-        mock_fetch.assert_called_once_with("12345")
+        mock_fetch.assert_called_once_with("12345", since=None)
     
     @patch('gov.nadlan.scraper.NadlanDealsScraper._fetch_deals_by_neighborhood')
     def test_get_deals_by_neighborhood_id_failure(self, mock_fetch):
@@ -0,0 +1,111 @@
+"""
+Tests for the neighborhood-level Nadlan deals store.
+"""
+
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from gov.nadlan import Deal
+from gov.nadlan.deals_store import NadlanDealsStore
+from orchestration.collectors.gov_collector import GovCollector
+
+
+def _deal(date, amount, block="6638", parcel="96"):
+    return Deal(
+        address="רחוב הברזל 1",
+        deal_date=date,
+        deal_amount=amount,
+        parcel_block=block,
+        parcel_parcel=parcel,
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = NadlanDealsStore(path=str(tmp_path / "deals.sqlite3"), max_age=3600)
+    yield store
+    store.close()
+
+
+class TestDealIdentity:
+    def test_iso_date_normalization(self):
+        assert _deal("2024-03-05T00:00:00", 1).iso_date() == "2024-03-05"
+        assert _deal("5/3/2024", 1).iso_date() == "2024-03-05"
+        assert _deal(None, 1).iso_date() is None
+
+    def test_identity_ignores_formatting(self):
+        assert _deal("05/03/2024", 1500000.0).identity() == _deal("2024-03-05", 1500000).identity()
+
+
+class TestNadlanDealsStore:
+    def test_add_deals_deduplicates(self, store):
+        assert store.add_deals("1", [_deal("2024-01-01", 100), _deal("2024-01-01", 100)]) == 1
+        assert store.add_deals("1", [_deal("2024-01-01", 100), _deal("2024-02-01", 200)]) == 1
+        assert store.count("1") == 2
+        assert store.count("2") == 0
+
+    def test_get_deals_newest_first_with_limit(self, store):
+        store.add_deals("1", [_deal("2023-01-01", 1), _deal("2024-01-01", 2), _deal("2022-01-01", 3)])
+
+        deals = store.get_deals("1", limit=2)
+
+        assert [d.deal_date for d in deals] == ["2024-01-01", "2023-01-01"]
+        assert isinstance(deals[0], Deal)
+        assert store.latest_deal_date("1") == "2024-01-01"
+
+    def test_sync_fetches_incrementally(self, store):
+        scraper = Mock()
+        scraper.get_deals_by_neighborhood_id.return_value = [_deal("2024-01-01", 1), _deal("2024-02-01", 2)]
+
+        deals = store.sync("65210036", scraper)
+        assert len(deals) == 2
+        scraper.get_deals_by_neighborhood_id.assert_called_once_with("65210036", since=None)
+
+        # Fresh neighborhoods are served from the store
+        store.sync("65210036", scraper)
+        assert scraper.get_deals_by_neighborhood_id.call_count == 1
+
+        # A forced refresh only asks for deals since the newest stored date
+        scraper.get_deals_by_neighborhood_id.return_value = [_deal("2024-02-01", 2), _deal("2024-03-01", 3)]
+        deals = store.sync("65210036", scraper, force=True)
+        scraper.get_deals_by_neighborhood_id.assert_called_with("65210036", since="2024-02-01")
+        assert [d.deal_date for d in deals] == ["2024-03-01", "2024-02-01", "2024-01-01"]
+
+    def test_sync_refreshes_when_stale(self, store):
+        scraper = Mock()
+        scraper.get_deals_by_neighborhood_id.return_value = []
+        store.mark_refreshed("1", when=time.time() - 7200)
+
+        store.sync("1", scraper)
+
+        scraper.get_deals_by_neighborhood_id.assert_called_once()
+        assert not store.is_stale("1")
+
+
+class TestGovCollectorReadsStore:
+    def test_collector_uses_store_per_neighborhood(self, store):
+        scraper = Mock()
+        scraper.resolve_neighborhood_id.return_value = "65210036"
+        scraper.get_deals_by_neighborhood_id.return_value = [_deal("2024-01-01", 1)]
+        collector = GovCollector(deals_client=scraper, decisive_client=Mock(), deals_store=store)
+
+        first = collector._collect_transactions("הברזל 1 תל אביב")
+        second = collector._collect_transactions("הברזל 3 תל אביב")
+
+        assert first == second
+        assert first[0]["deal_amount"] == 1
+        assert scraper.get_deals_by_neighborhood_id.call_count == 1
+
+    def test_collector_opens_the_store_on_first_sync(self, store):
+        scraper = Mock()
+        scraper.resolve_neighborhood_id.return_value = "65210036"
+        scraper.get_deals_by_neighborhood_id.return_value = []
+
+        with patch("orchestration.collectors.gov_collector.get_deals_store", return_value=store) as get_store:
+            collector = GovCollector(deals_client=scraper, decisive_client=Mock())
+            get_store.assert_not_called()
+            collector._collect_transactions("הברזל 1 תל אביב")
+
+        get_store.assert_called_once_with()
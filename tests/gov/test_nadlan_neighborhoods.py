@@ -0,0 +1,112 @@
+"""
+Tests for the offline Nadlan neighborhood resolver.
+"""
+
+import json
+
+import pytest
+
+from gov.nadlan import NadlanDealsScraper
+from gov.nadlan.neighborhoods import (
+    DEFAULT_SEED_PATH,
+    Neighborhood,
+    NeighborhoodResolver,
+    get_neighborhood_resolver,
+    normalize_name,
+)
+
+# A square neighborhood in ITM coordinates
+SQUARE = [(180000.0, 660000.0), (184000.0, 660000.0), (184000.0, 664000.0), (180000.0, 664000.0)]
+
+
+@pytest.fixture
+def seed_file(tmp_path):
+    path = tmp_path / "neighborhoods.json"
+    path.write_text(json.dumps({
+        "neighborhoods": [
+            {"id": "65210036", "name": "רמת החייל", "aliases": ["רמת החיל"], "polygon": SQUARE},
+            {"id": "65210004", "name": "יפו"},
+            {"id": "5000", "name": "תל אביב-יפו", "kind": "settlement", "aliases": ["תל אביב"]},
+        ]
+    }, ensure_ascii=False), encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def resolver(seed_file):
+    return NeighborhoodResolver.from_file(seed_file)
+
+
+class TestNormalizeName:
+    def test_strips_niqqud_quotes_and_punctuation(self):
+        assert normalize_name("  רָמַת   הַחַיָּל, ") == "רמת החיל"
+        assert normalize_name('קרית א"ונו') == "קרית אונו"
+
+    def test_keeps_hyphenated_tokens(self):
+        assert normalize_name("תל אביב - יפו") == "תל אביב-יפו"
+
+
+class TestNeighborhoodResolver:
+    def test_resolves_names_and_aliases(self, resolver):
+        assert resolver.resolve_name("רמת החייל") == "65210036"
+        assert resolver.resolve_name("הברזל 30 רמת החיל תל אביב") == "65210036"
+        assert resolver.resolve_name("Unknown Location") is None
+
+    def test_settlement_matches_whole_words_only(self, resolver):
+        # "יפו" must not match inside "תל אביב-יפו"
+        assert resolver.resolve_name("הברזל תל אביב-יפו") == "5000"
+        assert resolver.resolve_name("יפו העתיקה") == "65210004"
+
+    def test_resolves_points_inside_polygons(self, resolver):
+        assert resolver.resolve_point(182000.0, 662000.0) == "65210036"
+        assert resolver.resolve_point(185000.0, 662000.0) is None
+        assert resolver.resolve_poi({"Value": "בית ספר", "shape": "POINT(181000 661000)"}) == "65210036"
+
+    def test_learns_from_nadlan_info(self, resolver):
+        resolver.add_nadlan_info({
+            "neigh_id": "65210099", "neigh_name": "נאות אפקה", "setl_id": 5000, "setl_name": "תל אביב-יפו",
+        })
+
+        assert resolver.resolve_name("נאות אפקה א") == "65210099"
+        assert resolver.get("65210099").setl_id == "5000"
+
+    def test_loads_govmap_features(self):
+        resolver = NeighborhoodResolver()
+        loaded = resolver.add_govmap_features([
+            {
+                "type": "Feature",
+                "properties": {"neigh_id": 7, "neigh_name": "מרכז"},
+                "geometry": {"type": "Polygon", "coordinates": [[list(p) for p in SQUARE]]},
+            },
+            {"type": "Feature", "properties": {}, "geometry": None},
+        ])
+
+        assert loaded == 1
+        assert resolver.resolve_point(183000.0, 663000.0) == "7"
+
+    def test_suggest_by_prefix(self, resolver):
+        assert [n.id for n in resolver.suggest("רמת")] == ["65210036"]
+        assert resolver.suggest("") == []
+
+    def test_save_round_trip(self, resolver, tmp_path):
+        path = str(tmp_path / "out" / "seed.json")
+        resolver.save(path)
+
+        reloaded = NeighborhoodResolver.from_file(path)
+        assert len(reloaded) == len(resolver)
+        assert reloaded.resolve_point(182000.0, 662000.0) == "65210036"
+
+
+class TestSharedResolver:
+    def test_seed_file_covers_previous_mappings(self):
+        resolver = NeighborhoodResolver.from_file(DEFAULT_SEED_PATH)
+
+        assert resolver.resolve_name("החיל תל אביב-יפו") == "65210036"
+        assert resolver.resolve_name("פלורנטין") == "65210003"
+        assert resolver.resolve_name("רעננה") == "8700"
+
+    def test_scraper_uses_resolver(self, resolver):
+        scraper = NadlanDealsScraper(resolver=resolver)
+
+        assert scraper._extract_neighborhood_id_from_poi({"Value": "רמת החייל"}) == "65210036"
+        assert NadlanDealsScraper().resolver is get_neighborhood_resolver()
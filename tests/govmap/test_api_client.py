@@ -188,3 +188,97 @@ def test_extract_block_parcel_invalid():
     assert GovMapClient.extract_block_parcel({"data": []}) is None
     assert GovMapClient.extract_block_parcel({"data": [{"Values": ["abc"]}]}) is None
 
+
+
+def test_catalogs_are_cached():
+    """Static catalogs are fetched once per client."""
+    client = GovMapClient()
+    catalog = {"layers": [{"id": 1}]}
+
+    with mock.patch.object(client.http, "get", return_value=_make_response(json_payload=catalog)) as get_mock, \
+         mock.patch.object(client.http, "post", return_value=_make_response(json_payload={"types": []})) as post_mock:
+        assert client.get_layers_catalog() == catalog
+        assert client.get_layers_catalog() == catalog
+        client.get_base_layers()
+        client.get_base_layers()
+        client.get_search_types()
+        client.get_search_types()
+
+    assert get_mock.call_count == 2
+    assert post_mock.call_count == 1
+
+
+def test_lookups_are_cached_with_lookup_ttl():
+    """Autocomplete and parcel lookups are cached until lookup_ttl expires."""
+    client = GovMapClient(lookup_ttl=60)
+    parcel = {"parcel": 222}
+
+    with mock.patch.object(client.http, "get", return_value=_make_response(json_payload=parcel)) as get_mock:
+        first = client.get_parcel_data(100.0, 200.0)
+        first["parcel"] = "mutated by caller"
+        assert client.get_parcel_data(100.0, 200.0) == parcel
+        client.get_parcel_data(101.0, 200.0)
+
+    assert get_mock.call_count == 2
+
+    client = GovMapClient(lookup_ttl=0)
+    with mock.patch.object(client.http, "post", return_value=_make_response(json_payload={"results": []})) as post_mock:
+        client.autocomplete("query")
+        client.autocomplete("query")
+    assert post_mock.call_count == 2
+
+
+def test_errors_are_not_cached():
+    client = GovMapClient()
+    replies = [_make_response(status=404, text="missing"), _make_response(json_payload={"parcel": 1})]
+
+    with mock.patch.object(client.http, "get", side_effect=replies):
+        with pytest.raises(GovMapError, match="HTTP 404"):
+            client.get_parcel_data(1.0, 2.0)
+        assert client.get_parcel_data(1.0, 2.0) == {"parcel": 1}
+
+
+def test_transport_retries_and_honors_retry_after():
+    """All requests share one session whose adapter retries transient failures."""
+    client = GovMapClient(max_retries=5)
+    retry = client.http.get_adapter(client.autocomplete_url).max_retries
+
+    assert retry.total == 5
+    assert 429 in retry.status_forcelist and 503 in retry.status_forcelist
+    assert retry.respect_retry_after_header is True
+    assert retry.is_retry("POST", 503)
+
+
+def test_disk_cache_survives_clients(tmp_path):
+    from govmap.cache import GovMapCache
+
+    path = tmp_path / "govmap.sqlite"
+    client = GovMapClient(cache=GovMapCache(path))
+    with mock.patch.object(client.http, "get", return_value=_make_response(json_payload={"layers": []})):
+        client.get_layers_catalog()
+
+    other = GovMapClient(cache=GovMapCache(path))
+    with mock.patch.object(other.http, "get", side_effect=AssertionError("should be cached")):
+        assert other.get_layers_catalog() == {"layers": []}
+
+
+def test_expired_token_is_refreshed_once_across_threads():
+    """Threads failing with the same token share a single re-authentication."""
+    import threading
+
+    client = GovMapClient(auth_token="old")
+    calls = []
+
+    def refresh():
+        calls.append(1)
+        client.auth_data["token"] = "new"
+
+    with mock.patch.object(client, "_refresh_auth_token", side_effect=refresh):
+        threads = [threading.Thread(target=client._refresh_stale_token, args=("old",)) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert len(calls) == 1
+    assert client.auth_data["token"] == "new"
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+import json
+from unittest import mock
+
+import requests
+
+from govmap.api_client import GovMapClient
+from govmap.parcel_index import ParcelIndex
+from orchestration.collectors.govmap_collector import GovMapCollector
+from orchestration.data_pipeline import _process_govmap_data
+
+
+def _json_response(payload):
+    r = requests.Response()
+    r.status_code = 200
+    r._content = json.dumps(payload).encode("utf-8")
+    r.headers["Content-Type"] = "application/json"
+    return r
+
+
+def _square(feature_id, x0, y0, size=10.0, hole=None):
+    ring = [[x0, y0], [x0 + size, y0], [x0 + size, y0 + size], [x0, y0 + size], [x0, y0]]
+    rings = [ring] + ([hole] if hole else [])
+    return {
+        "type": "Feature",
+        "id": feature_id,
+        "geometry": {"type": "Polygon", "coordinates": rings},
+        "properties": {"GUSH_NUM": 6638, "PARCEL": int(feature_id.split(".")[-1])},
+    }
+
+
+# A 4x5 grid of 10m parcels starting at (180000, 660000)
+PARCELS = [_square(f"PARCEL_ALL.{i}", 180000 + 10 * (i % 4), 660000 + 10 * (i // 4)) for i in range(20)]
+BBOX = (180000.0, 660000.0, 180040.0, 660050.0)
+
+
+def _fake_wfs(features, report_total=True):
+    calls = []
+
+    def fake_get(url, params=None, **kwargs):
+        calls.append(params)
+        start, count = params["startIndex"], params["count"]
+        payload = {"type": "FeatureCollection", "features": features[start:start + count]}
+        if report_total:
+            payload["numberMatched"] = len(features)
+        return _json_response(payload)
+
+    return fake_get, calls
+
+
+class TestParcelIndex:
+    def test_locate_point_in_polygon(self):
+        index = ParcelIndex()
+        assert index.add_features(PARCELS) == 20
+
+        assert index.locate(180015.0, 660005.0)["id"] == "PARCEL_ALL.1"
+        assert index.locate(180035.0, 660045.0)["id"] == "PARCEL_ALL.19"
+        assert index.locate(179990.0, 660005.0) is None
+
+    def test_holes_and_duplicates(self):
+        hole = [[2, 2], [8, 2], [8, 8], [2, 8], [2, 2]]
+        index = ParcelIndex()
+        index.add_feature(_square("P.1", 0, 0, hole=hole))
+
+        assert index.locate(1, 1)["id"] == "P.1"
+        assert index.locate(5, 5) is None
+        assert index.add_feature(_square("P.1", 0, 0)) is False
+        assert len(index) == 1
+
+    def test_multipolygon_and_bbox_query(self):
+        index = ParcelIndex()
+        index.add_feature({
+            "id": "M.1",
+            "geometry": {"type": "MultiPolygon", "coordinates": [
+                [[[0, 0], [5, 0], [5, 5], [0, 5], [0, 0]]],
+                [[[500, 500], [505, 500], [505, 505], [500, 505], [500, 500]]],
+            ]},
+        })
+
+        assert index.locate(502, 502)["id"] == "M.1"
+        assert index.locate(250, 250) is None
+        assert [f["id"] for f in index.features_in_bbox((490, 490, 510, 510))] == ["M.1"]
+
+    def test_coverage(self):
+        index = ParcelIndex()
+        index.mark_covered(BBOX)
+
+        assert index.covers(180020.0, 660020.0)
+        assert not index.covers(181000.0, 660020.0)
+
+
+class TestPrefetch:
+    def test_prefetch_pages_bbox_into_index(self):
+        client = GovMapClient()
+        fake_get, calls = _fake_wfs(PARCELS)
+
+        with mock.patch.object(client.http, "get", side_effect=fake_get):
+            assert client.prefetch_parcels(BBOX, page_size=6) == 20
+
+        assert sorted(call["startIndex"] for call in calls) == [0, 6, 12, 18]
+        assert calls[0]["bbox"] == "180000.0,660000.0,180040.0,660050.0,EPSG:2039"
+        assert calls[0]["typeNames"] == "opendata:PARCEL_ALL"
+
+    def test_prefetch_without_total_pages_sequentially(self):
+        client = GovMapClient()
+        fake_get, calls = _fake_wfs(PARCELS, report_total=False)
+
+        with mock.patch.object(client.http, "get", side_effect=fake_get):
+            assert client.prefetch_parcels(BBOX, page_size=10) == 20
+
+        assert [call["startIndex"] for call in calls] == [0, 10, 20]
+
+    def test_points_in_prefetched_bbox_resolve_locally(self):
+        client = GovMapClient()
+        fake_get, calls = _fake_wfs(PARCELS)
+        with mock.patch.object(client.http, "get", side_effect=fake_get):
+            client.prefetch_parcels(BBOX)
+
+        with mock.patch.object(client.http, "get", side_effect=AssertionError("no remote lookup")):
+            assert client.get_parcel_at_point(180025.0, 660015.0)["id"] == "PARCEL_ALL.6"
+
+    def test_point_outside_prefetch_queries_wfs(self):
+        client = GovMapClient()
+        fake_get, calls = _fake_wfs([_square("PARCEL_ALL.99", 190000, 670000)])
+
+        with mock.patch.object(client.http, "get", side_effect=fake_get):
+            assert client.get_parcel_at_point(190005.0, 670005.0)["id"] == "PARCEL_ALL.99"
+            # Now indexed: the second lookup is local
+            assert client.get_parcel_at_point(190006.0, 670006.0)["id"] == "PARCEL_ALL.99"
+
+        assert len(calls) == 1
+        assert calls[0]["bbox"].startswith("190004.0,670004.0,190006.0,670006.0")
+
+    def test_collector_skips_remote_parcel_lookup_after_prefetch(self):
+        collector = GovMapCollector()
+        fake_get, _ = _fake_wfs(PARCELS)
+        with mock.patch.object(collector.client.http, "get", side_effect=fake_get):
+            collector.prefetch(BBOX)
+
+        autocomplete_result = {"results": [{"shape": "POINT(180005.0 660005.0)"}]}
+        with mock.patch.object(collector.client, "autocomplete", return_value=autocomplete_result), \
+             mock.patch.object(collector.client, "get_parcel_data") as parcel_mock, \
+             mock.patch.object(collector.client, "search_and_locate_address", return_value={}):
+            result = collector.collect(address="Test Address")
+
+        parcel_mock.assert_not_called()
+        assert result["api_data"]["parcel_feature"]["id"] == "PARCEL_ALL.0"
+        assert result["api_data"]["parcel"] == {"gush": "6638", "helka": "0"}
+
+    def test_prefetched_parcel_reaches_the_pipeline(self):
+        collector = GovMapCollector()
+        fake_get, _ = _fake_wfs(PARCELS)
+        with mock.patch.object(collector.client.http, "get", side_effect=fake_get):
+            collector.prefetch(BBOX)
+
+        autocomplete_result = {"results": [{"shape": "POINT(180015.0 660005.0)"}]}
+        with mock.patch.object(collector.client, "autocomplete", return_value=autocomplete_result), \
+             mock.patch.object(collector.client, "search_and_locate_address", return_value={}):
+            result = collector.collect(address="Test Address")
+
+        asset = mock.Mock()
+        _process_govmap_data(asset, result)
+        props = {c.args[0]: c.args[1] for c in asset.set_property.call_args_list}
+        assert props == {"govmapGush": "6638", "govmapHelka": "1"}
+
+    def test_prefetched_feature_without_parcel_numbers_falls_back_to_remote(self):
+        collector = GovMapCollector()
+        bare = [dict(feature, properties={}) for feature in PARCELS]
+        fake_get, _ = _fake_wfs(bare)
+        with mock.patch.object(collector.client.http, "get", side_effect=fake_get):
+            collector.prefetch(BBOX)
+
+        autocomplete_result = {"results": [{"shape": "POINT(180005.0 660005.0)"}]}
+        remote = {"gush": "6638", "helka": "0", "land_use": "residential"}
+        with mock.patch.object(collector.client, "autocomplete", return_value=autocomplete_result), \
+             mock.patch.object(collector.client, "get_parcel_data", return_value=remote) as parcel_mock, \
+             mock.patch.object(collector.client, "search_and_locate_address", return_value={}):
+            result = collector.collect(address="Test Address")
+
+        parcel_mock.assert_called_once()
+        assert result["api_data"]["parcel"] == remote
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the shared Mavat Selenium driver pool."""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from mavat.scrapers import driver_pool
+from mavat.scrapers.driver_pool import MavatDriverPool, get_chromedriver_path, get_driver_pool
+from mavat.scrapers.mavat_selenium_client import MavatSeleniumClient
+from orchestration.collectors.mavat_collector import MavatCollector
+
+
+class FakeDriver:
+    def __init__(self):
+        self.alive = True
+        self.quit_called = False
+        self.window_handles = ["main"]
+
+    def execute_script(self, script, *args):
+        if not self.alive:
+            raise RuntimeError("browser crashed")
+        return 1
+
+    def set_page_load_timeout(self, timeout):
+        pass
+
+    def quit(self):
+        self.quit_called = True
+        self.alive = False
+
+
+@pytest.fixture
+def pool():
+    drivers = []
+
+    def factory():
+        drivers.append(FakeDriver())
+        return drivers[-1]
+
+    pool = MavatDriverPool(size=2, max_uses=3, factory=factory)
+    pool.drivers = drivers
+    yield pool
+    pool.close()
+
+
+class TestMavatDriverPool:
+    def test_driver_is_reused(self, pool):
+        for _ in range(2):
+            with pool.driver() as driver:
+                assert isinstance(driver, FakeDriver)
+
+        assert pool.launches == 1
+
+    def test_driver_recycled_after_max_uses(self, pool):
+        for _ in range(4):
+            with pool.driver():
+                pass
+
+        assert pool.launches == 2
+        assert pool.drivers[0].quit_called is True
+
+    def test_unhealthy_driver_is_replaced(self, pool):
+        with pool.driver():
+            pass
+        pool.drivers[0].alive = False
+
+        with pool.driver() as driver:
+            assert driver is pool.drivers[1]
+
+        assert pool.drivers[0].quit_called is True
+
+    def test_driver_broken_during_use_is_discarded(self, pool):
+        with pytest.raises(RuntimeError):
+            with pool.driver() as driver:
+                driver.alive = False
+                raise RuntimeError("page crashed")
+
+        with pool.driver():
+            pass
+        assert pool.launches == 2
+
+    def test_pool_size_bounds_leases(self, pool):
+        first = pool.acquire()
+        second = pool.acquire()
+
+        with pytest.raises(RuntimeError, match="Timed out"):
+            pool.acquire(timeout=0.05)
+
+        threading.Timer(0.05, pool.release, args=(first,)).start()
+        start = time.monotonic()
+        assert pool.acquire(timeout=2) is first
+        assert time.monotonic() - start >= 0.04
+        pool.release(first)
+        pool.release(second)
+
+    def test_shared_pool_per_headless_mode(self):
+        assert get_driver_pool(True) is get_driver_pool(True)
+        assert get_driver_pool(True) is not get_driver_pool(False)
+
+
+class TestChromedriverPath:
+    def test_resolved_once(self, monkeypatch):
+        monkeypatch.setattr(driver_pool, "_driver_path", None)
+        monkeypatch.delenv("CHROMEDRIVER_PATH", raising=False)
+
+        with patch("webdriver_manager.chrome.ChromeDriverManager") as manager:
+            manager.return_value.install.return_value = "/opt/chromedriver"
+            assert get_chromedriver_path() == "/opt/chromedriver"
+            assert get_chromedriver_path() == "/opt/chromedriver"
+
+        manager.return_value.install.assert_called_once()
+
+
+class TestClientsUsePool:
+    def test_client_leases_and_returns_driver(self, pool):
+        client = MavatSeleniumClient(pool=pool)
+
+        with client:
+            leased = client.driver
+        with client:
+            assert client.driver is leased
+
+        assert client.driver is None
+        assert pool.launches == 1
+        assert leased.quit_called is False
+
+    def test_collector_reuses_browser_across_collects(self, pool):
+        collector = MavatCollector(client=MavatSeleniumClient(pool=pool))
+
+        with patch.object(MavatSeleniumClient, "search_plans", return_value=[]):
+            collector.collect(block="6638", parcel="96")
+            collector.collect(block="6638", parcel="97")
+
+        assert pool.launches == 1
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the shared Mavat lookup-table cache and text index."""
+
+import json
+import os
+import sys
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from mavat.lookup_cache import LookupCache, LookupIndex, get_lookup_cache, normalize_text
+from mavat.mavat_api_client import MavatAPIClient, MavatLookupItem
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'mavat', 'mcp'))
+import server  # noqa: E402
+
+RAW_TABLES = {
+    "District": [
+        {"CODE": "5", "DESCRIPTION": "תל-אביב"},
+        {"CODE": "6", "DESCRIPTION": "חיפה"},
+    ],
+    "CityCounty": [
+        {"CODE": "5000", "DESCRIPTION": "תל אביב-יפו"},
+        {"CODE": "2640", "DESCRIPTION": "ראש העין"},
+        {"CODE": "1139", "DESCRIPTION": "כרמיאל"},
+        {"CODE": "6000", "DESCRIPTION": "חיפה"},
+    ],
+    "Street": [
+        {"CODE": "461", "DESCRIPTION": "הירקון"},
+        {"CODE": "7", "DESCRIPTION": "שדרות רוטשילד"},
+    ],
+}
+
+
+def _index():
+    return LookupIndex(MavatAPIClient._parse_lookup_tables(RAW_TABLES))
+
+
+def _client_with_cache(cache):
+    session = Mock()
+    session.headers = {}
+    session.get.return_value.json.return_value = RAW_TABLES
+    return MavatAPIClient(session=session, lookup_cache=cache), session
+
+
+class TestNormalizeText:
+    def test_strips_niqqud_and_folds_final_letters(self):
+        assert normalize_text("תֵּל־אָבִיב-יָפוֹ") == "תל אביב יפו"
+        assert normalize_text("ראש העין") == "ראש העינ"
+
+    def test_removes_quotes_and_casefolds(self):
+        assert normalize_text('ק"ש Street') == "קש street"
+        assert normalize_text("  ") == ""
+
+
+class TestLookupIndex:
+    def test_substring_search_uses_normalized_text(self):
+        results = _index().search("ראש העין")
+
+        assert [item.code for item in results] == ["2640"]
+
+    def test_query_with_final_letter_matches_mid_word(self):
+        # The final mem of the query folds to the regular mem of "כרמיאל"
+        assert [item.code for item in _index().search("כרם")] == ["1139"]
+
+    def test_ranks_exact_matches_first(self):
+        results = _index().search("חיפה")
+
+        assert [item.code for item in results] == ["6", "6000"]
+        assert [item.code for item in _index().search("אביב")] == ["5", "5000"]
+
+    def test_short_queries_match_word_prefixes(self):
+        index = _index()
+
+        assert [item.code for item in index.search("תל")] == ["5", "5000"]
+        assert index.search("יב") == []
+
+    def test_table_filter_and_limit(self):
+        index = _index()
+
+        assert [item.code for item in index.search("תל", table_type="CityCounty")] == ["5000"]
+        assert len(index.search("תל", limit=1)) == 1
+
+    def test_prefix_autocomplete(self):
+        index = _index()
+
+        assert [item.code for item in index.prefix("רוט")] == ["7"]
+        assert [item.code for item in index.prefix("תל אב", table_type="CityCounty")] == ["5000"]
+
+
+class TestLookupCache:
+    def test_fetches_once_within_ttl(self):
+        fetch = Mock(return_value=RAW_TABLES)
+        cache = LookupCache(ttl=60)
+
+        first = cache.get(fetch, MavatAPIClient._parse_lookup_tables)
+        second = cache.get(fetch, MavatAPIClient._parse_lookup_tables)
+
+        assert first is second
+        fetch.assert_called_once()
+
+    def test_refetches_after_ttl(self):
+        fetch = Mock(return_value=RAW_TABLES)
+        cache = LookupCache(ttl=60)
+        cache.get(fetch, MavatAPIClient._parse_lookup_tables)
+
+        with patch("mavat.lookup_cache.time.time", return_value=time.time() + 120):
+            cache.get(fetch, MavatAPIClient._parse_lookup_tables)
+
+        assert fetch.call_count == 2
+
+    def test_serves_stale_tables_when_refresh_fails(self):
+        cache = LookupCache(ttl=60)
+        index = cache.get(Mock(return_value=RAW_TABLES), MavatAPIClient._parse_lookup_tables)
+        failing = Mock(side_effect=RuntimeError("Failed to fetch lookup tables"))
+
+        with patch("mavat.lookup_cache.time.time", return_value=time.time() + 120):
+            assert cache.get(failing, MavatAPIClient._parse_lookup_tables) is index
+        with pytest.raises(RuntimeError):
+            cache.get(failing, MavatAPIClient._parse_lookup_tables, force_refresh=True)
+
+    def test_persists_tables_to_disk(self, tmp_path):
+        path = tmp_path / "luts.json"
+        LookupCache(path=path).get(Mock(return_value=RAW_TABLES), MavatAPIClient._parse_lookup_tables)
+        fetch = Mock()
+
+        index = LookupCache(path=path).get(fetch, MavatAPIClient._parse_lookup_tables)
+
+        fetch.assert_not_called()
+        assert [item.code for item in index.tables["Street"]] == ["461", "7"]
+        assert json.loads(path.read_text(encoding="utf-8"))["tables"] == RAW_TABLES
+
+
+class TestSharedLookupTables:
+    def test_clients_share_cache(self):
+        cache = LookupCache()
+        first, first_session = _client_with_cache(cache)
+        second, second_session = _client_with_cache(cache)
+
+        first.get_cities()
+        results = second.search_lookup_by_text("הירקון")
+
+        assert results == [MavatLookupItem(code="461", description="הירקון", raw=RAW_TABLES["Street"][0])]
+        first_session.get.assert_called_once()
+        second_session.get.assert_not_called()
+
+    def test_mcp_tools_share_one_client(self):
+        with patch('server._current_client', None):
+            assert server._get_client() is server._get_client()
+            assert server._get_client().lookup_cache is get_lookup_cache()
@@ -7,7 +7,7 @@ from unittest.mock import Mock
 
 import pytest
 
-from mavat.mavat_api_client import MavatAPIClient, MavatLookupItem
+from mavat.mavat_api_client import MavatAPIClient, MavatLookupItem, MavatSearchHit
 
 
 class TestMavatLookupItem:
@@ -599,6 +599,99 @@ class TestMavatAPIClient:
         client.close()
 
 
+def _search_response(plan_ids, status_code=200):
+    response = Mock()
+    response.status_code = status_code
+    response.json.return_value = [
+        {"type": "1", "result": {"dtResults": [{"PLAN_ID": plan_id, "ENTITY_NAME": f"Plan {plan_id}"}
+                                               for plan_id in plan_ids]}}
+    ]
+    return response
+
+
+class TestMavatAPIClientBulkSearch:
+    """Test token caching and concurrent multi-window searches."""
+
+    @pytest.fixture
+    def api_client(self):
+        session = Mock()
+        session.headers = {}
+        return MavatAPIClient(session=session)
+
+    def test_token_is_cached_across_searches(self, api_client):
+        provider = Mock(return_value="token-1")
+        api_client.token_provider = provider
+        api_client.session.post.return_value = _search_response(["1"])
+
+        api_client.search_plans(query="a")
+        api_client.search_plans(query="b")
+
+        provider.assert_called_once()
+        assert api_client.session.post.call_args[1]["json"]["token"] == "token-1"
+
+    def test_token_refreshed_after_ttl(self, api_client):
+        api_client.token_provider = Mock(side_effect=["token-1", "token-2"])
+        api_client.token_ttl = 0
+
+        assert api_client._get_auth_token() == "token-1"
+        assert api_client._get_auth_token() == "token-2"
+
+    def test_token_refreshed_on_401(self, api_client):
+        api_client.token_provider = Mock(side_effect=["stale", "fresh"])
+        api_client.session.post.side_effect = [_search_response([], status_code=401), _search_response(["7"])]
+
+        hits = api_client.search_plans(query="test")
+
+        assert [hit.plan_id for hit in hits] == ["7"]
+        tokens = [call[1]["json"]["token"] for call in api_client.session.post.call_args_list]
+        assert tokens == ["stale", "fresh"]
+
+    def test_search_plans_all_fetches_windows_and_deduplicates(self, api_client):
+        windows = {1: ["1", "2"], 2: ["2", "3"], 3: ["4"]}
+
+        def post(url, json, timeout):
+            return _search_response(windows.get(json["_page"], []))
+
+        api_client.session.post.side_effect = post
+
+        hits = api_client.search_plans_all(block="6638", max_results=10, page_size=2)
+
+        assert [hit.plan_id for hit in hits] == ["1", "2", "3", "4"]
+        pages = sorted(call[1]["json"]["_page"] for call in api_client.session.post.call_args_list)
+        assert pages == [1, 2, 3, 4, 5]
+        assert all(call[1]["json"]["blockNumber"] == "6638" for call in api_client.session.post.call_args_list)
+
+    def test_search_plans_all_stops_after_short_first_window(self, api_client):
+        api_client.session.post.return_value = _search_response(["1"])
+
+        hits = api_client.search_plans_all(query="test", max_results=100, page_size=50)
+
+        assert [hit.plan_id for hit in hits] == ["1"]
+        api_client.session.post.assert_called_once()
+
+    def test_get_plans_details_fans_out(self, api_client):
+        def post(url, json, timeout):
+            if json["plName"] == "missing":
+                return _search_response([])
+            return _search_response([json["plName"]])
+
+        api_client.session.post.side_effect = post
+
+        plans = api_client.get_plans_details(["10", "20", "10", "missing"])
+
+        assert sorted(plans) == ["10", "20"]
+        assert plans["20"].plan_name == "Plan 20"
+        assert api_client.session.post.call_count == 3
+
+    def test_get_plans_attachments(self, api_client):
+        attachments = api_client.get_plans_attachments(
+            [MavatSearchHit(plan_id="1", entity_name="א"), MavatSearchHit(plan_id="2", title="ב")]
+        )
+
+        assert set(attachments) == {"1", "2"}
+        assert attachments["2"][0].filename == "ב"
+
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
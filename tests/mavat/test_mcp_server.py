@@ -31,6 +31,13 @@ search_by_block_parcel_func = search_by_block_parcel.fn
 get_plan_summary_func = get_plan_summary.fn
 
 
+@pytest.fixture(autouse=True)
+def reset_shared_client():
+    """Start every test without the server's shared API client."""
+    with patch('server._current_client', None):
+        yield
+
+
 @pytest.fixture
 def mock_context():
     """Create a mock context for testing."""
@@ -0,0 +1,55 @@
+"""Tests for the native (dictionary-based) RAMI plans API."""
+
+from unittest import mock
+
+import responses
+
+from gov.rami.rami_client import RamiClient
+from orchestration.collectors.rami_collector import RamiCollector
+
+PLANS_RESPONSE = {
+    "totalRecords": 2,
+    "plansSmall": [
+        {
+            "planNumber": "תא/5000",
+            "planId": 1001,
+            "title": "תכנית מתאר",
+            "status": "בתוקף",
+            "documentsSet": {"takanon": {"path": "\\takanonim\\1001.pdf", "info": "תקנון"}},
+        },
+        {"planNumber": "תא/4000", "planId": 1002, "title": "תכנית", "status": "הופקדה"},
+    ],
+}
+
+
+class TestRamiPlanRecords:
+    @responses.activate
+    def test_iter_plans_yields_dicts(self):
+        responses.add(responses.POST, RamiClient.ENDPOINT, json=PLANS_RESPONSE)
+        client = RamiClient()
+
+        plans = list(client.iter_plans(client.create_search_params(block="6638", parcel="96")))
+
+        assert [p["planId"] for p in plans] == [1001, 1002]
+        assert plans[0]["documentsSet"]["takanon"]["info"] == "תקנון"
+        assert "documentsSet" not in plans[1]
+
+    @responses.activate
+    def test_fetch_plans_builds_dataframe_on_request(self):
+        responses.add(responses.POST, RamiClient.ENDPOINT, json=PLANS_RESPONSE)
+
+        df = RamiClient().fetch_plans({"block": "6638"})
+
+        assert list(df["planNumber"]) == ["תא/5000", "תא/4000"]
+
+    def test_collector_uses_native_records(self):
+        client = RamiClient()
+        collector = RamiCollector(client=client)
+
+        with mock.patch.object(client, "iter_plans", return_value=iter(PLANS_RESPONSE["plansSmall"])), \
+                mock.patch.object(client, "fetch_plans") as fetch_plans:
+            plans = collector.collect(block="6638", parcel="96")
+
+        fetch_plans.assert_not_called()
+        assert [p["planId"] for p in plans] == [1001, 1002]
+        assert plans[0]["raw"]["documentsSet"]["takanon"]["path"] == "\\takanonim\\1001.pdf"
@@ -0,0 +1,125 @@
+"""Tests for concurrent, resumable and de-duplicating RAMI document downloads."""
+
+import json
+import os
+import time
+
+import pytest
+import responses
+
+from gov.rami.downloader import (
+    MANIFEST_NAME,
+    DownloadManifest,
+    RamiDownloader,
+    TokenBucket,
+)
+from gov.rami.rami_client import RamiClient
+
+BASE = "https://apps.land.gov.il"
+SHARED = b"%PDF shared takanon " * 100
+
+
+def _plan(plan_id, *paths):
+    return {
+        "planNumber": f"plan-{plan_id}",
+        "planId": plan_id,
+        "documentsSet": {"tasritim": [{"path": path, "info": "tasrit"} for path in paths]},
+    }
+
+
+def _serve(url, body, calls=None):
+    def callback(request):
+        if calls is not None:
+            calls.append(request.headers.get("Range"))
+        range_header = request.headers.get("Range")
+        if range_header:
+            start = int(range_header.split("=")[1].rstrip("-"))
+            return 206, {"Content-Type": "application/pdf"}, body[start:]
+        return 200, {"Content-Type": "application/pdf"}, body
+
+    responses.add_callback(responses.GET, url, callback=callback)
+
+
+class TestRamiDownloads:
+    @responses.activate
+    def test_identical_documents_are_stored_once(self, tmp_path):
+        _serve(f"{BASE}/a/1.pdf", SHARED)
+        _serve(f"{BASE}/b/2.pdf", SHARED)
+        _serve(f"{BASE}/b/3.pdf", b"%PDF other")
+        progress = []
+        client = RamiClient(download_rate=0)
+
+        summary = client.download_multiple_plans_documents(
+            [_plan(1, "/a/1.pdf"), _plan(2, "/b/2.pdf", "/b/3.pdf")],
+            base_dir=tmp_path,
+            progress=progress.append,
+        )
+
+        assert summary["total_files_downloaded"] == 3
+        assert summary["plan_results"]["plan-2"]["failed"] == []
+        first = tmp_path / "plan-1_1" / "tasrit" / "1.pdf"
+        second = tmp_path / "plan-2_2" / "tasrit" / "2.pdf"
+        assert first.read_bytes() == second.read_bytes() == SHARED
+        assert os.stat(first).st_ino == os.stat(second).st_ino
+        manifest = json.loads((tmp_path / MANIFEST_NAME).read_text())
+        assert len(manifest["files"]) == 2 and len(manifest["urls"]) == 3
+        assert [p.completed for p in sorted(progress, key=lambda p: p.completed)] == [1, 2, 3]
+        assert progress[-1].total == 3
+
+    @responses.activate
+    def test_known_url_is_not_downloaded_again(self, tmp_path):
+        _serve(f"{BASE}/a/1.pdf", SHARED)
+        client = RamiClient(download_rate=0)
+        client.download_plan_documents(_plan(1, "/a/1.pdf"), base_dir=tmp_path)
+
+        # The same document referenced by another plan is linked from the manifest
+        result = client.download_plan_documents(_plan(9, "/a/1.pdf"), base_dir=tmp_path)
+
+        assert len(responses.calls) == 1
+        assert (tmp_path / "plan-9_9" / "tasrit" / "1.pdf").read_bytes() == SHARED
+        assert result["success"]
+
+    @responses.activate
+    def test_partial_download_is_resumed(self, tmp_path):
+        calls = []
+        _serve(f"{BASE}/a/1.pdf", SHARED, calls)
+        target = tmp_path / "doc.pdf"
+        (tmp_path / "doc.pdf.part").write_bytes(SHARED[:500])
+
+        result = RamiDownloader(rate=0).download(f"{BASE}/a/1.pdf", target)
+
+        assert result.ok and result.bytes == len(SHARED) - 500
+        assert calls == ["bytes=500-"]
+        assert target.read_bytes() == SHARED
+        assert not (tmp_path / "doc.pdf.part").exists()
+
+    @responses.activate
+    def test_html_error_page_fails(self, tmp_path):
+        responses.add(responses.GET, f"{BASE}/a/1.pdf", body="<html>blocked</html>",
+                      content_type="text/html")
+
+        assert RamiClient(download_rate=0).download_document(f"{BASE}/a/1.pdf", tmp_path / "1.pdf") is False
+        assert not (tmp_path / "1.pdf").exists()
+
+    def test_manifest_persists(self, tmp_path):
+        stored = tmp_path / "x.pdf"
+        stored.write_bytes(b"x")
+        DownloadManifest(tmp_path / MANIFEST_NAME).record("u", "h", stored)
+
+        assert DownloadManifest(tmp_path / MANIFEST_NAME).path_for_url("u") == stored
+
+
+class TestTokenBucket:
+    def test_rate_limits_after_burst(self):
+        bucket = TokenBucket(rate=20, capacity=1)
+        start = time.monotonic()
+        for _ in range(3):
+            bucket.acquire()
+
+        assert time.monotonic() - start >= 0.09
+
+    @pytest.mark.parametrize("rate", [0, -1])
+    def test_non_positive_rate_disables_limit(self, rate):
+        bucket = TokenBucket(rate=rate)
+        for _ in range(100):
+            bucket.acquire()
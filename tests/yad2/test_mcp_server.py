@@ -9,6 +9,7 @@ Test suite for the enhanced Yad2 MCP server functionality.
 import asyncio
 import os
 import sys
+import time
 
 import pytest
 from unittest.mock import Mock, patch
@@ -19,10 +20,13 @@ if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
 # Import MCP server functions (only the ones that actually exist)
+from yad2.mcp import server as mcp_server
 from yad2.mcp.server import (
+    SearchResultCache,
     build_search_url,
     get_all_property_types,
     get_search_parameters_reference,
+    get_search_results_page,
     search_locations,
     search_real_estate,
 )
@@ -33,6 +37,7 @@ search_locations_func = search_locations.fn
 get_search_parameters_reference_func = get_search_parameters_reference.fn
 build_search_url_func = build_search_url.fn
 search_real_estate_func = search_real_estate.fn
+get_search_results_page_func = get_search_results_page.fn
 
 # Mock context for testing
 class MockContext:
@@ -51,6 +56,29 @@ def mock_ctx():
     return MockContext()
 
 
+@pytest.fixture(autouse=True)
+def clear_search_cache():
+    """Isolate tests from each other's cached search results."""
+    mcp_server._search_cache.clear()
+    yield
+    mcp_server._search_cache.clear()
+
+
+def _make_assets(count):
+    assets = []
+    for i in range(count):
+        asset = Mock()
+        asset.title = f"Test Property {i}"
+        asset.price = 1000000 + i
+        asset.address = f"Test Address {i}"
+        asset.rooms = "3"
+        asset.size = "80"
+        asset.floor = "2"
+        asset.url = f"https://example.com/property{i}"
+        assets.append(asset)
+    return assets
+
+
 class TestPropertyTypeFunctionality:
     """Test property type related functions."""
     
@@ -210,6 +238,94 @@ class TestSearchFunctionality:
             mock_scraper.scrape_all_pages.assert_called_once_with(max_pages=1, delay=1)
 
 
+class TestSearchResultPaging:
+    """Test cached, cursor-based paging of search results."""
+
+    def _mock_scraper(self, mock_scraper_class, assets):
+        mock_scraper = Mock()
+        mock_scraper.get_search_summary.return_value = {
+            "search_url": "https://www.yad2.co.il/realestate/forsale?city=5000",
+            "parameters": {"city": "5000"},
+            "parameter_descriptions": {},
+        }
+        mock_scraper.scrape_all_pages.return_value = assets
+        mock_scraper_class.return_value = mock_scraper
+        return mock_scraper
+
+    @pytest.mark.asyncio
+    async def test_cursor_pages_through_all_results(self, mock_ctx):
+        with patch('yad2.mcp.server.Yad2Scraper') as mock_scraper_class:
+            self._mock_scraper(mock_scraper_class, _make_assets(25))
+
+            first = await search_real_estate_func(mock_ctx, city="5000", max_pages=1, page_size=10)
+            assert first["total_assets"] == 25
+            assert len(first["assets_preview"]) == 10
+            assert first["next_cursor"]
+
+            second = await get_search_results_page_func(mock_ctx, cursor=first["next_cursor"], page_size=10)
+            assert second["success"] is True
+            assert second["search_id"] == first["search_id"]
+            assert [a["title"] for a in second["assets"]] == [f"Test Property {i}" for i in range(10, 20)]
+
+            third = await get_search_results_page_func(mock_ctx, cursor=second["next_cursor"], page_size=10)
+            assert len(third["assets"]) == 5
+            assert third["next_cursor"] is None
+
+    @pytest.mark.asyncio
+    async def test_identical_search_is_served_from_cache(self, mock_ctx):
+        with patch('yad2.mcp.server.Yad2Scraper') as mock_scraper_class:
+            mock_scraper = self._mock_scraper(mock_scraper_class, _make_assets(3))
+
+            first = await search_real_estate_func(mock_ctx, city="5000", max_pages=1)
+            second = await search_real_estate_func(mock_ctx, city="5000", max_pages=1)
+            assert first["search_id"] == second["search_id"]
+            assert mock_scraper.scrape_all_pages.call_count == 1
+
+            await search_real_estate_func(mock_ctx, city="5000", max_pages=1, refresh=True)
+            assert mock_scraper.scrape_all_pages.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_searches_keep_separate_results(self, mock_ctx):
+        def scraper_factory(search_params):
+            scraper = Mock()
+            city = search_params.get_active_parameters().get("city")
+            scraper.get_search_summary.return_value = {"search_url": f"https://example.com/{city}"}
+            scraper.scrape_all_pages.return_value = _make_assets(2 if city == 5000 else 4)
+            return scraper
+
+        with patch('yad2.mcp.server.Yad2Scraper', side_effect=scraper_factory):
+            tel_aviv, haifa = await asyncio.gather(
+                search_real_estate_func(mock_ctx, city="5000", max_pages=1),
+                search_real_estate_func(mock_ctx, city="4000", max_pages=1),
+            )
+
+        assert tel_aviv["search_id"] != haifa["search_id"]
+        assert tel_aviv["total_assets"] == 2
+        assert haifa["total_assets"] == 4
+
+    @pytest.mark.asyncio
+    async def test_unknown_or_invalid_cursor(self, mock_ctx):
+        missing = await get_search_results_page_func(mock_ctx, cursor="deadbeef:10")
+        assert missing["success"] is False
+
+        invalid = await get_search_results_page_func(mock_ctx, cursor="not-a-cursor")
+        assert invalid["success"] is False
+
+    def test_cache_evicts_least_recently_used_and_expired(self):
+        cache = SearchResultCache(maxsize=2, ttl=60)
+        cache.put("a", {"assets": []})
+        cache.put("b", {"assets": []})
+        cache.get("a")
+        cache.put("c", {"assets": []})
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+
+        expired = SearchResultCache(maxsize=2, ttl=0)
+        expired.put("a", {"assets": []})
+        time.sleep(0.01)
+        assert expired.get("a") is None
+
+
 class TestIntegration:
     """Integration tests for complex workflows."""
     
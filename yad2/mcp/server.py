@@ -10,6 +10,7 @@ Available Tools:
 
 CORE SEARCH FUNCTIONALITY:
 - search_real_estate: Search for real estate assets with filters
+- get_search_results_page: Page through cached results of a previous search
 - build_search_url: Build search URLs with parameters
 - get_search_parameters_reference: Get reference of all search parameters
 
@@ -26,11 +27,23 @@ Usage Examples:
 2. Convert Hebrew to code: hebrew_to_property_code(hebrew_name="בית פרטי")
 3. Search locations: search_locations(search_text="רמת החייל")
 4. Search real estate: search_real_estate(property="5", city="5000", neighborhood="203")
+5. Next page of results: get_search_results_page(cursor="<next_cursor>")
+
+Scraping runs in a worker thread so a long crawl never blocks the event loop.
+Results are stored per search ID in an LRU cache with a TTL, which lets
+several agents share one server without overwriting each other's results.
 """
 
+import asyncio
+import hashlib
+import json
 import os
 import sys
-from typing import Optional
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
 from fastmcp import Context, FastMCP
 
@@ -45,9 +58,120 @@ from yad2.scrapers import Yad2Scraper
 # Create an MCP server
 mcp = FastMCP("Yad2RealEstate", dependencies=["requests", "beautifulsoup4", "lxml", "pandas"]) 
 
+# Cache and paging configuration (overridable through the environment)
+SEARCH_CACHE_SIZE = int(os.getenv("YAD2_MCP_CACHE_SIZE", "64"))
+SEARCH_CACHE_TTL = float(os.getenv("YAD2_MCP_CACHE_TTL", "900"))
+DEFAULT_PAGE_SIZE = int(os.getenv("YAD2_MCP_PAGE_SIZE", "10"))
+MAX_PAGE_SIZE = 100
+MAX_CONCURRENT_SCRAPES = int(os.getenv("YAD2_MCP_MAX_CONCURRENT_SCRAPES", "4"))
+
+
+class SearchResultCache:
+    """Thread-safe LRU cache of search results with a per-entry TTL."""
+
+    def __init__(self, maxsize: int = SEARCH_CACHE_SIZE, ttl: float = SEARCH_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, search_id: str) -> Optional[Dict[str, Any]]:
+        """Return the cached entry for ``search_id`` or ``None`` if missing or expired."""
+        with self._lock:
+            item = self._entries.get(search_id)
+            if item is None:
+                return None
+            stored_at, entry = item
+            if time.monotonic() - stored_at > self.ttl:
+                del self._entries[search_id]
+                return None
+            self._entries.move_to_end(search_id)
+            return entry
+
+    def put(self, search_id: str, entry: Dict[str, Any]) -> None:
+        """Store ``entry`` under ``search_id``, evicting the least recently used entry."""
+        with self._lock:
+            self._entries[search_id] = (time.monotonic(), entry)
+            self._entries.move_to_end(search_id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
 # Module-level state (persists across tool calls within the same server process)
-_current_scraper = None
-_last_search_results = []
+_search_cache = SearchResultCache()
+_scrape_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_scrape_semaphore() -> asyncio.Semaphore:
+    """Return the semaphore bounding concurrent scrapes on the running loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _scrape_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _scrape_semaphores[loop] = asyncio.Semaphore(MAX_CONCURRENT_SCRAPES)
+    return semaphore
+
+
+def _make_search_id(params: Dict[str, Any], max_pages: int) -> str:
+    """Derive a stable search ID from the normalized search parameters."""
+    payload = json.dumps(
+        {"params": {k: str(v) for k, v in params.items()}, "max_pages": max_pages},
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _encode_cursor(search_id: str, offset: int) -> str:
+    return f"{search_id}:{offset}"
+
+
+def _decode_cursor(cursor: str) -> Tuple[str, int]:
+    search_id, _, offset = str(cursor).rpartition(":")
+    if not search_id:
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return search_id, max(int(offset), 0)
+
+
+def _format_asset(asset: Any) -> Dict[str, Any]:
+    return {
+        "title": asset.title,
+        "price": asset.price,
+        "address": asset.address,
+        "rooms": asset.rooms,
+        "size": asset.size,
+        "floor": asset.floor,
+        "url": asset.url,
+    }
+
+
+def _page_results(search_id: str, assets: List[Any], offset: int, page_size: int) -> Dict[str, Any]:
+    """Slice a page of formatted assets and compute the cursor for the next page."""
+    page_size = max(1, min(int(page_size), MAX_PAGE_SIZE))
+    end = offset + page_size
+    return {
+        "assets": [_format_asset(a) for a in assets[offset:end]],
+        "offset": offset,
+        "page_size": page_size,
+        "next_cursor": _encode_cursor(search_id, end) if end < len(assets) else None,
+    }
+
+
+def _run_search(search_params: Yad2SearchParameters, max_pages: int) -> Tuple[Dict[str, Any], List[Any]]:
+    """Blocking part of a search; executed in a worker thread."""
+    scraper = Yad2Scraper(search_params)
+    summary = scraper.get_search_summary()
+    assets = scraper.scrape_all_pages(max_pages=max_pages, delay=1)
+    return summary, assets
 
 
 @mcp.tool()
@@ -68,8 +192,14 @@ async def search_real_estate(
     balcony: Optional[int | str] = None,
     renovated: Optional[int | str] = None,
     max_pages: int | str = 3,
+    page_size: int | str = DEFAULT_PAGE_SIZE,
+    refresh: bool = False,
 ):
     """Search for real estate assets on Yad2 with optional filters.
+
+    Returns the first ``page_size`` assets together with a ``search_id`` and a
+    ``next_cursor``; pass the cursor to get_search_results_page for more
+    results. Identical searches are served from cache unless ``refresh`` is set.
     
     The 'property' parameter accepts both Yad2 codes (e.g., "5") and Hebrew names (e.g., "בית פרטי").
     Hebrew names are automatically converted to their corresponding Yad2 codes.
@@ -81,8 +211,6 @@ async def search_real_estate(
     - "וילה" or "5" = Villa
     - "נטהאוס" or "6" = Penthouse
     """
-    global _current_scraper, _last_search_results
-
     params = {
         k: v
         for k, v in dict(
@@ -139,46 +267,86 @@ async def search_real_estate(
     except (TypeError, ValueError):
         max_pages = 3
 
-    await ctx.info("Initializing scraper and generating search summary...")
-    _current_scraper = Yad2Scraper(search_params)
-    summary = _current_scraper.get_search_summary()
+    try:
+        page_size = int(page_size)
+    except (TypeError, ValueError):
+        page_size = DEFAULT_PAGE_SIZE
+
+    search_id = _make_search_id(params, max_pages)
+    entry = None if refresh else _search_cache.get(search_id)
+    if entry is not None:
+        await ctx.info(f"Using cached results for search {search_id}")
+    else:
+        await ctx.info(f"Scraping up to {max_pages} page(s)...")
+        async with _get_scrape_semaphore():
+            summary, assets = await asyncio.to_thread(_run_search, search_params, max_pages)
+        entry = {
+            "summary": summary,
+            "assets": assets,
+            "price_stats": DataUtils.calculate_price_stats(assets) if assets else None,
+        }
+        _search_cache.put(search_id, entry)
 
-    await ctx.info(f"Scraping up to {max_pages} page(s)...")
-    assets = _current_scraper.scrape_all_pages(max_pages=max_pages, delay=1)
-    _last_search_results = assets
+    summary = entry["summary"]
+    assets = entry["assets"]
 
     if not assets:
         return {
             "success": False,
             "message": "No assets found for the specified criteria.",
+            "search_id": search_id,
             "search_url": summary["search_url"],
             "parameters": summary.get("parameters"),
             "parameter_descriptions": summary.get("parameter_descriptions"),
         }
 
-    # Format assets for output (limit to first 10 for brevity)
-    formatted = []
-    for l in assets[:10]:
-        formatted.append({
-            "title": l.title,
-            "price": l.price,
-            "address": l.address,
-            "rooms": l.rooms,
-            "size": l.size,
-            "floor": l.floor,
-            "url": l.url,
-        })
-
-    price_stats = DataUtils.calculate_price_stats(assets)
+    page = _page_results(search_id, assets, 0, page_size)
 
     return {
         "success": True,
+        "search_id": search_id,
         "total_assets": len(assets),
         "search_url": summary["search_url"],
         "parameters": summary.get("parameters"),
         "parameter_descriptions": summary.get("parameter_descriptions"),
-        "assets_preview": formatted,
-        "price_stats": price_stats,
+        "assets_preview": page["assets"],
+        "next_cursor": page["next_cursor"],
+        "price_stats": entry["price_stats"],
+    }
+
+
+@mcp.tool()
+async def get_search_results_page(
+    ctx: Context,
+    cursor: str,
+    page_size: int | str = DEFAULT_PAGE_SIZE,
+):
+    """Return the next page of a previous search_real_estate call.
+
+    Pass the ``next_cursor`` value returned by search_real_estate (or by a
+    previous call to this tool). Results expire from the server cache after
+    a while; in that case run the search again.
+    """
+    try:
+        search_id, offset = _decode_cursor(cursor)
+        page_size = int(page_size)
+    except (TypeError, ValueError) as e:
+        return {"success": False, "error": str(e)}
+
+    entry = _search_cache.get(search_id)
+    if entry is None:
+        return {
+            "success": False,
+            "error": f"Search {search_id} expired or not found; run search_real_estate again.",
+        }
+
+    assets = entry["assets"]
+    page = _page_results(search_id, assets, offset, page_size)
+    return {
+        "success": True,
+        "search_id": search_id,
+        "total_assets": len(assets),
+        **page,
     }
 
 